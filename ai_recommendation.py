@@ -1,8 +1,9 @@
 """
 AI recommendation alert entry point.
 
-Reads the current transfer market from Supabase, applies profit/budget/timing
-filters, and prints the top opportunities.
+Reads the listings closing soon from Supabase (the deadline range is queried
+on the server), applies profit/budget/timing filters, and prints the top
+opportunities.
 
 Filter criteria (constants in :mod:`src.constants`):
 - Asking price ≤ :data:`~src.constants.MAX_BUDGET` AND ≤ available team funds
@@ -10,18 +11,22 @@ Filter criteria (constants in :mod:`src.constants`):
 - Auction deadline within :data:`~src.constants.ALERT_HORIZON_HOURS` hours
 - Top :data:`~src.constants.TOP_ALERTS_LIMIT` results sorted by forecast profit
 
+:func:`run_alerts` is also called by ``main_all_transfer.py`` as soon as the
+listings closing within the horizon have been scraped, before the rest of
+the market scan finishes.
+
 Usage::
 
     python ai_recommendation.py
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Any
 
 from src import constants
 from src.config import config
 from src.core.logger import logger
-from src.core.utils import clean_currency, parse_deadline
+from src.core.utils import GAME_TZ, clean_currency, normalise_deadline
 from src.services.supabase_client import SupabaseManager
 
 
@@ -33,7 +38,8 @@ def _filter_candidates(
     """Apply budget, profit, and timing filters to transfer listings.
 
     Args:
-        transfer_data: All rows from the ``transfer_listings`` table.
+        transfer_data: ``transfer_listings`` rows (already limited to the
+            horizon by the query; the timing check is repeated here).
         current_funds: Available team funds (game currency).
         now_th: Current local time (UTC+7) used to evaluate deadlines.
 
@@ -65,17 +71,8 @@ def _filter_candidates(
                 dropped["profit"] += 1
                 continue
 
-            deadline_str = str(p.get("deadline", ""))
-            deadline_dt = None
-            if deadline_str and deadline_str not in ("None", "N/A"):
-                try:
-                    # DB stores deadlines as ISO strings (e.g. "2026-04-10T09:25:00+00:00").
-                    # Strip timezone info and treat as naive Bangkok time — consistent with
-                    # how parse_deadline() and now_th are both computed in UTC+7.
-                    deadline_dt = datetime.fromisoformat(deadline_str).replace(tzinfo=None)
-                except ValueError:
-                    deadline_dt = parse_deadline(deadline_str)
-
+            # timestamptz from the DB (e.g. "2026-04-10T02:25:00+00:00") → UTC+7
+            deadline_dt = normalise_deadline(p.get("deadline"))
             if not deadline_dt:
                 dropped["parse_error"] += 1
                 continue
@@ -140,18 +137,23 @@ def generate_message(
     return msg
 
 
-def main() -> None:
-    """Fetch transfer data, filter top opportunities, and print results."""
-    config.validate()
+def run_alerts(db: SupabaseManager) -> str | None:
+    """Filter the current market in Supabase and log the alert message.
 
-    now_th = datetime.utcnow() + timedelta(hours=constants.UTC_OFFSET_HOURS)
+    Args:
+        db: Supabase manager.
 
-    db = SupabaseManager()
+    Returns:
+        The alert message, or ``None`` if no listing closes within the horizon.
+    """
+    now_th = datetime.now(tz=GAME_TZ).replace(tzinfo=None)
 
-    transfer_data = db.get_all_transfer_listings()
+    transfer_data = db.get_transfer_listings_ending_within(constants.ALERT_HORIZON_HOURS)
     if not transfer_data:
-        logger.warning("No transfer data found.")
-        return
+        logger.warning(
+            "No transfer listings close within %sh.", constants.ALERT_HORIZON_HOURS
+        )
+        return None
 
     # Get team funds for budget filter
     team_info = db.get_team_info()
@@ -174,6 +176,13 @@ def main() -> None:
 
     msg = generate_message(candidates, funds_str, now_th)
     logger.info("\n%s", msg)
+    return msg
+
+
+def main() -> None:
+    """Fetch transfer data, filter top opportunities, and print results."""
+    config.validate()
+    run_alerts(SupabaseManager())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""
+Anonymise a saved PManager page before adding it to the benchmark corpus.
+
+Real pages carry usernames, team and player names, and ids.  This script
+replaces them with stable placeholders (``Player 17``, ``Team 04``, ids from
+a fixed offset) while keeping the markup — tag structure, classes, table
+shapes and number formats — untouched, so parser timings on the corpus stay
+representative of the live site.
+
+Usage::
+
+    python -m benchmarks.anonymise saved_page.html benchmarks/corpus/v2/profile.html
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+#: Link query parameters that identify a player or a team.
+PLAYER_ID_PARAMS = ("jog_id", "jogador", "id_jog")
+TEAM_ID_PARAMS = ("equipa", "id_equipa", "team_id")
+
+_ID_RE = re.compile(r"([?&]({})=)(\d+)".format("|".join(PLAYER_ID_PARAMS + TEAM_ID_PARAMS)))
+
+
+class Anonymiser:
+    """Maps every distinct real name / id to a stable placeholder."""
+
+    def __init__(self) -> None:
+        self._names: dict[tuple[str, str], str] = {}
+        self._ids: dict[tuple[str, str], str] = {}
+
+    def name(self, kind: str, real: str) -> str:
+        key = (kind, real)
+        if key not in self._names:
+            count = sum(1 for k in self._names if k[0] == kind) + 1
+            self._names[key] = f"{kind} {count:02d}"
+        return self._names[key]
+
+    def ident(self, param: str, real: str) -> str:
+        kind = "player" if param in PLAYER_ID_PARAMS else "team"
+        key = (kind, real)
+        if key not in self._ids:
+            base = 1_000_000 if kind == "player" else 3_000
+            self._ids[key] = str(base + sum(1 for k in self._ids if k[0] == kind) + 1)
+        return self._ids[key]
+
+    def anonymise(self, html: str) -> str:
+        soup = BeautifulSoup(html, "html.parser")
+
+        for a in soup.find_all("a", href=True):
+            href = a["href"]
+            kind = None
+            if any(f"{p}=" in href for p in PLAYER_ID_PARAMS):
+                kind = "Player"
+            elif any(f"{p}=" in href for p in TEAM_ID_PARAMS):
+                kind = "Team"
+            if kind and a.string:
+                a.string.replace_with(self.name(kind, a.string.strip()))
+            a["href"] = _ID_RE.sub(lambda m: m.group(1) + self.ident(m.group(2), m.group(3)), href)
+
+        # Session-bound scripts and the login box are never parsed; drop them.
+        for tag in soup.find_all(["script", "noscript"]):
+            if "fsReady" not in (tag.string or ""):
+                tag.decompose()
+        for form in soup.find_all("form"):
+            if form.find("input", attrs={"type": "password"}):
+                form.decompose()
+
+        return str(soup)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Anonymise a saved PManager page.")
+    parser.add_argument("source", type=Path)
+    parser.add_argument("dest", type=Path)
+    args = parser.parse_args(argv)
+
+    html = args.source.read_text(encoding="utf-8", errors="replace")
+    args.dest.parent.mkdir(parents=True, exist_ok=True)
+    args.dest.write_text(Anonymiser().anonymise(html), encoding="utf-8")
+    print(f"Wrote {args.dest}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+Benchmark for the vectorised market metrics engine.
+
+Builds a synthetic market of ``--rows`` listings (100k by default) with the
+value ranges and raw field formats the scraper produces, then times the
+per-listing :func:`per_listing_metrics` loop (the implementation the
+pipeline used before the engine) against
+:func:`~src.services.market_metrics.apply_market_metrics` on the same rows.
+Both results are checked against each other before timing.
+
+The run exits with status 1 when the engine is less than ``--min-speedup``
+times faster than the per-listing loop; a ratio is used rather than absolute
+times so the gate holds on any machine.
+
+Usage::
+
+    python -m benchmarks.bench_metrics
+    python -m benchmarks.bench_metrics --rows 250000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from src import constants
+from src.core.utils import clean_currency, format_deadline
+from src.services.market_metrics import apply_market_metrics
+
+DEFAULT_ROWS = 100_000
+DEFAULT_REPEAT = 3
+DEFAULT_MIN_SPEEDUP = 10.0
+
+_DEADLINES = ["Today at 14:30", "Tomorrow at 08:00", "Today at 23:59", "5/4/26 at 09:15", "N/A"]
+
+
+def per_listing_metrics(details: dict[str, Any]) -> dict[str, Any]:
+    """Add ROI / profit metrics and normalise the deadline of one listing.
+
+    The per-listing reference the engine is checked and timed against.
+
+    Args:
+        details: Record from :func:`~src.scrapers.transfer.parse_player_page`
+            (modified in place).
+
+    Returns:
+        The same dict with ``value_diff``, ``roi``, ``forecast_sell`` and
+        ``forecast_profit`` added when the financials were found, and
+        ``deadline`` converted to a ``timestamptz`` string (or ``None``).
+    """
+    if "estimated_value" in details and "asking_price" in details:
+        est = details["estimated_value"]
+        ask = details["asking_price"]
+        details["value_diff"] = est - ask
+        details["roi"] = round(((est - ask) / ask) * 100, 2) if ask > 0 else 0
+        details["forecast_sell"] = (
+            (est / constants.FORECAST_SELL_DIVISOR) * constants.FORECAST_SELL_MULTIPLIER
+        )
+        bids_avg = clean_currency(str(details["bids_avg"])) if "bids_avg" in details else 0.0
+        details["forecast_profit"] = details["forecast_sell"] - max(ask, bids_avg)
+    details["deadline"] = format_deadline(details.get("deadline"))
+    return details
+
+
+def synthetic_market(rows: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Listings shaped like :func:`~src.scrapers.transfer.parse_player_page` output."""
+    rng = np.random.default_rng(seed)
+    est = rng.integers(100_000, 80_000_000, rows)
+    ask = (est * rng.uniform(0.2, 1.5, rows)).astype(np.int64)
+    bids = (ask * rng.uniform(0.0, 1.3, rows)).astype(np.int64)
+    deadlines = rng.choice(_DEADLINES, rows)
+    return [
+        {
+            "id": str(1_000_000 + i),
+            "estimated_value": int(est[i]),
+            "asking_price": int(ask[i]),
+            "bids_avg": f"{bids[i]:,}".replace(",", ".") + " baht",
+            "deadline": str(deadlines[i]),
+        }
+        for i in range(rows)
+    ]
+
+
+def _best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark; return a process exit code (1 below the speedup floor)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-speedup", type=float, default=DEFAULT_MIN_SPEEDUP,
+                        help="Required engine speedup over the per-listing loop (default 10)")
+    args = parser.parse_args(argv)
+
+    records = synthetic_market(args.rows)
+
+    per_row = pd.DataFrame([per_listing_metrics(dict(r)) for r in records])
+    engine = apply_market_metrics(pd.DataFrame(records))
+    for col in ("value_diff", "roi", "forecast_sell", "forecast_profit"):
+        np.testing.assert_allclose(engine[col].to_numpy(), per_row[col].to_numpy(), err_msg=col)
+    assert engine["deadline"].fillna("").tolist() == per_row["deadline"].fillna("").tolist(), "deadline"
+
+    loop_s = _best_of(args.repeat, lambda: [per_listing_metrics(dict(r)) for r in records])
+    frame = pd.DataFrame(records)
+    engine_s = _best_of(args.repeat, lambda: apply_market_metrics(frame.copy()))
+    speedup = loop_s / engine_s
+
+    print(f"{'implementation':<28} {'rows':>8} {'seconds':>9} {'rows/s':>12}")
+    for name, seconds in (("per-listing loop", loop_s), ("apply_market_metrics", engine_s)):
+        print(f"{name:<28} {args.rows:>8} {seconds:>9.3f} {args.rows / seconds:>12,.0f}")
+    print(f"\nSpeedup: x{speedup:.1f} (floor x{args.min_speedup:.1f})")
+
+    return 0 if speedup >= args.min_speedup else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,429 @@
+"""
+Regression-gated micro-benchmarks for the HTML parsers in ``src/scrapers``.
+
+Every case runs a real scraper method against a :class:`ReplayPage` backed by
+the anonymised corpus, and records time per page and peak traced memory per
+page.  Results are compared with ``benchmarks/baseline.json``; any case that
+is slower or allocates more than the allowed threshold fails the run.
+
+Times are the fastest of ``--repeat`` runs (the least noisy statistic on a
+shared CI runner) divided by the fastest of an interleaved pure-Python
+calibration loop, so a baseline recorded on one machine stays meaningful on
+another.  Cases that take under ``MIN_SAMPLE_SECONDS`` are looped within each
+run.
+
+Usage::
+
+    python -m benchmarks.bench_parsers                  # compare with baseline
+    python -m benchmarks.bench_parsers --update-baseline
+    python -m benchmarks.bench_parsers --only transfer --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import math
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.replay import CORPUS_ROOT, ReplayPage
+from src.core.logger import logger
+from src.scrapers.base import BaseScraper
+from src.scrapers.bot_team import BotTeamScraper
+from src.scrapers.instant_match import InstantMatchScraper
+from src.scrapers.league_fixtures import LeagueFixturesScraper
+from src.scrapers.league_stats import LeagueStatsScraper
+from src.scrapers.match_prep import MatchPrepScraper
+from src.scrapers.match_report import MatchReportScraper
+from src.scrapers.opponent import OpponentScraper
+from src.scrapers.squad import SquadScraper
+from src.scrapers.tables import table_timings
+from src.scrapers.team import TeamInfoScraper
+from src.scrapers.transfer import TransferScraper, crawl_listing_pages, listing_page_url
+
+CORPUS_VERSION = "v1"
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+DEFAULT_REPEAT = 20
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEM_THRESHOLD = 0.10
+#: Cases faster than this are looped within each timed sample, so that
+#: sub-millisecond parsers are not dominated by timer and scheduler noise.
+MIN_SAMPLE_SECONDS = 0.02
+
+_FIXTURE = {
+    "match_type": "League",
+    "result": "2-1",
+    "season": "99",
+    "home_team_id": "3001",
+    "away_team_id": "3002",
+    "home_team_name": "Team 01",
+    "away_team_name": "Team 02",
+}
+
+_CUP_FIXTURE = {**_FIXTURE, "match_type": "National Cup", "home_team_name": "Team 40"}
+
+
+def _replay_fetch(scraper: BaseScraper, search_url: str) -> Callable[[int], str]:
+    """A listing-page fetcher served by the scraper's replay page."""
+
+    def fetch(page_num: int) -> str:
+        scraper.page.goto(listing_page_url(search_url, page_num))
+        return scraper.page.content()
+
+    return fetch
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmark: a scraper method plus the corpus pages it reads."""
+
+    name: str
+    scraper: type[BaseScraper]
+    routes: list[tuple[str, str]]
+    run: Callable[[Any], Any]
+
+
+CASES: list[Case] = [
+    # --- transfer.py ---
+    Case(
+        "transfer.crawl_listing_pages",
+        TransferScraper,
+        [(r"procurar\.asp.*[?&]pid=1\b", "listing_p1.html"), (r"procurar\.asp", "listing_p2.html")],
+        lambda s: list(crawl_listing_pages(_replay_fetch(s, s.SEARCH_URL_TEMPLATE), max_pages=3)),
+    ),
+    Case(
+        "transfer.get_player_details",
+        TransferScraper,
+        [(r"comprar_jog_lista\.asp", "negotiation.html"), (r"ver_jogador\.asp", "profile.html")],
+        lambda s: s.get_player_details("1000001"),
+    ),
+    Case(
+        "transfer.get_bid_info",
+        TransferScraper,
+        [(r"comprar_jog_lista\.asp", "negotiation.html")],
+        lambda s: s.get_bid_info("1000001"),
+    ),
+    Case(
+        "transfer.get_player_history",
+        TransferScraper,
+        [(r"marcos_jog\.asp", "history.html")],
+        lambda s: s.get_player_history("1000001"),
+    ),
+    # --- opponent.py ---
+    Case(
+        "opponent.get_team_players",
+        OpponentScraper,
+        [(r"vjog=1", "roster.html"), (r"ver_equipa\.asp", "team_page.html")],
+        lambda s: s.get_team_players("https://www.pmanager.org/ver_equipa.asp?equipa=3007&vjog=1"),
+    ),
+    Case(
+        "opponent.get_player_skills",
+        OpponentScraper,
+        [(r"ver_jogador\.asp", "profile.html")],
+        lambda s: s.get_player_skills("1000001", "https://www.pmanager.org"),
+    ),
+    # --- squad.py ---
+    Case(
+        "squad._parse_squad",
+        SquadScraper,
+        [(r"filtro=1", "plantel_skills.html"), (r"filtro=5", "plantel_quality.html")],
+        lambda s: s._parse_squad(),
+    ),
+    # --- league_stats.py ---
+    Case(
+        "league_stats._scrape_standings",
+        LeagueStatsScraper,
+        [(r"classificacao\.asp", "classificacao.html")],
+        lambda s: s._scrape_standings(),
+    ),
+    Case(
+        "league_stats._scrape_table",
+        LeagueStatsScraper,
+        [(r"m_marcadores\.asp", "marcadores.html")],
+        lambda s: s._scrape_table("m_marcadores.asp", "Goals"),
+    ),
+    Case(
+        "league_stats._scrape_top_eleven",
+        LeagueStatsScraper,
+        [(r"onze_ideal\.asp", "onze_ideal.html")],
+        lambda s: s._scrape_top_eleven(),
+    ),
+    # --- match_prep.py ---
+    Case(
+        "match_prep.scrape_my_fixtures",
+        MatchPrepScraper,
+        [(r"calendario\.asp", "calendario_equipa.html")],
+        lambda s: s.scrape_my_fixtures("99"),
+    ),
+    Case(
+        "match_prep.scrape_match_stats",
+        MatchPrepScraper,
+        [(r"relatorio\.asp", "relatorio.html")],
+        lambda s: s.scrape_match_stats("19501121"),
+    ),
+    Case(
+        "match_prep.scrape_opponent_roster",
+        MatchPrepScraper,
+        [(r"plantel\.asp", "plantel_skills.html")],
+        lambda s: s.scrape_opponent_roster("3007"),
+    ),
+    # --- match_report.py ---
+    Case(
+        "match_report.scrape",
+        MatchReportScraper,
+        [(r"relatorio\.asp", "relatorio.html"), (r"calendario\.asp", "calendario_global.html")],
+        lambda s: s.scrape("19501121", _FIXTURE),
+    ),
+    Case(
+        "match_report._scrape_cup_results",
+        MatchReportScraper,
+        [(r"calendario_taca\.asp|res_taca\.asp", "res_taca.html")],
+        lambda s: s._scrape_cup_results(_CUP_FIXTURE),
+    ),
+    # --- league_fixtures.py ---
+    Case(
+        "league_fixtures.get_season_fixtures",
+        LeagueFixturesScraper,
+        [(r"calendario\.asp", "calendario_global.html")],
+        lambda s: s.get_season_fixtures(season=99, pages=1),
+    ),
+    Case(
+        "league_fixtures.get_match_report",
+        LeagueFixturesScraper,
+        [(r"relatorio\.asp", "relatorio.html")],
+        lambda s: s.get_match_report("19501121"),
+    ),
+    # --- bot_team.py ---
+    Case(
+        "bot_team.get_all_countries",
+        BotTeamScraper,
+        [(r"ver_mundo\.asp", "ver_mundo.html")],
+        lambda s: s.get_all_countries(),
+    ),
+    Case(
+        "bot_team.get_bot_teams_and_next_league",
+        BotTeamScraper,
+        [(r"classificacao\.asp", "classificacao.html")],
+        lambda s: s.get_bot_teams_and_next_league(
+            "Country 07", "https://www.pmanager.org/classificacao.asp?dv=1&sr=1&vf=1&sg=XX"
+        ),
+    ),
+    Case(
+        "bot_team.get_team_roster",
+        BotTeamScraper,
+        [(r"ver_equipa\.asp", "roster.html")],
+        lambda s: s.get_team_roster("3007"),
+    ),
+    Case(
+        "bot_team.evaluate_player",
+        BotTeamScraper,
+        [(r"comprar_jog_lista\.asp", "negotiation.html"), (r"ver_jogador\.asp", "profile.html")],
+        lambda s: s.evaluate_player("1000001", "Team 07"),
+    ),
+    # --- team.py ---
+    Case(
+        "team.get_team_info",
+        TeamInfoScraper,
+        [(r"info\.asp", "info.html")],
+        lambda s: s.get_team_info(),
+    ),
+    # --- instant_match.py ---
+    Case(
+        "instant_match.get_open_matches",
+        InstantMatchScraper,
+        [(r"pvp_geral\.asp", "pvp_geral.html")],
+        lambda s: s.get_open_matches(),
+    ),
+]
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+def _calibration_workload() -> float:
+    """Time a fixed pure-Python loop (seconds); the unit for normalised times."""
+    t0 = time.perf_counter()
+    total = 0
+    for i in range(100_000):
+        total += i * i % 7
+    return time.perf_counter() - t0
+
+
+def measure(case: Case, corpus_dir: Path, repeat: int) -> dict[str, float]:
+    """Run one case and return per-page timing and memory figures.
+
+    Each timed run is paired with a calibration run so that CPU throttling or
+    a noisy neighbour slows both sides of the ratio equally.
+    """
+    page = ReplayPage(corpus_dir, case.routes)
+    scraper = case.scraper()
+    scraper.page = page
+
+    t0 = time.perf_counter()
+    case.run(scraper)  # warm-up, also counts pages per call
+    loops = max(1, math.ceil(MIN_SAMPLE_SECONDS / max(time.perf_counter() - t0, 1e-6)))
+    pages = max(page.loads, 1)
+
+    samples, calibration = [], []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            calibration.append(_calibration_workload())
+            t0 = time.perf_counter()
+            for _ in range(loops):
+                case.run(scraper)
+            samples.append((time.perf_counter() - t0) / loops)
+    finally:
+        gc.enable()
+
+    tracemalloc.start()
+    case.run(scraper)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_page = min(samples) / pages
+    return {
+        "pages": pages,
+        "time_per_page_ms": round(per_page * 1000, 3),
+        "norm_time_per_page": round(per_page / min(calibration), 4),
+        "peak_kib_per_page": round(peak / pages / 1024, 1),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Baseline comparison
+# ---------------------------------------------------------------------------
+
+
+def _ratios(res: dict[str, float], base: dict[str, float]) -> tuple[float, float]:
+    return (
+        res["norm_time_per_page"] / base["norm_time_per_page"],
+        res["peak_kib_per_page"] / base["peak_kib_per_page"],
+    )
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, Any],
+    time_threshold: float,
+    mem_threshold: float,
+) -> list[str]:
+    """Return a human-readable line for every case that regressed."""
+    failures: list[str] = []
+    base_cases = baseline.get("cases", {})
+
+    for name, res in results.items():
+        base = base_cases.get(name)
+        if not base:
+            continue
+        time_ratio, mem_ratio = _ratios(res, base)
+        if time_ratio > 1 + time_threshold:
+            failures.append(f"{name}: time/page x{time_ratio:.2f} (limit x{1 + time_threshold:.2f})")
+        if mem_ratio > 1 + mem_threshold:
+            failures.append(f"{name}: peak mem/page x{mem_ratio:.2f} (limit x{1 + mem_threshold:.2f})")
+    return failures
+
+
+def _print_table(results: dict[str, dict[str, float]], baseline: dict[str, Any]) -> None:
+    base_cases = baseline.get("cases", {})
+    print(f"{'case':<44} {'pages':>5} {'ms/page':>9} {'KiB/page':>9} {'time':>6} {'mem':>6}")
+    for name, res in results.items():
+        base = base_cases.get(name)
+        if base:
+            time_ratio, mem_ratio = _ratios(res, base)
+            rel = f"x{time_ratio:>5.2f} x{mem_ratio:>5.2f}"
+        else:
+            rel = f"{'new':>6} {'new':>6}"
+        print(
+            f"{name:<44} {res['pages']:>5} {res['time_per_page_ms']:>9.3f} "
+            f"{res['peak_kib_per_page']:>9.1f} {rel}"
+        )
+
+
+def _print_table_timings() -> None:
+    print(f"\n{'table plan':<44} {'calls':>6} {'rows':>7} {'ms/call':>9}")
+    for name, stats in sorted(table_timings().items()):
+        per_call = stats["seconds"] / stats["calls"] * 1000
+        print(f"{name:<44} {stats['calls']:>6} {stats['rows']:>7} {per_call:>9.3f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks; return a process exit code (1 on regression)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--only", help="Run only cases whose name contains this text")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_TIME_THRESHOLD,
+                        help="Allowed time/page regression as a fraction (default 0.25)")
+    parser.add_argument("--mem-threshold", type=float, default=DEFAULT_MEM_THRESHOLD,
+                        help="Allowed peak-memory/page regression as a fraction (default 0.10)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Overwrite baseline.json with this run's results")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    parser.add_argument("--tables", action="store_true",
+                        help="Also print cumulative per-table parse timings")
+    args = parser.parse_args(argv)
+
+    # Scrapers log every page at INFO; keep benchmark output readable.
+    logger.setLevel(logging.WARNING)
+
+    corpus_dir = CORPUS_ROOT / CORPUS_VERSION
+    cases = [c for c in CASES if not args.only or args.only in c.name]
+
+    results = {case.name: measure(case, corpus_dir, args.repeat) for case in cases}
+
+    baseline: dict[str, Any] = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text())
+    if baseline.get("corpus") not in (None, CORPUS_VERSION):
+        print(f"Baseline was recorded on corpus {baseline['corpus']}; ignoring it.")
+        baseline = {}
+
+    _print_table(results, baseline)
+    if args.tables:
+        _print_table_timings()
+
+    if args.json:
+        args.json.write_text(json.dumps({"corpus": CORPUS_VERSION, "cases": results}, indent=2))
+
+    if args.update_baseline:
+        merged = dict(baseline.get("cases", {})) if args.only else {}
+        merged.update(results)
+        BASELINE_PATH.write_text(json.dumps(
+            {"corpus": CORPUS_VERSION, "cases": merged},
+            indent=2, sort_keys=True,
+        ) + "\n")
+        print(f"Baseline written to {BASELINE_PATH}")
+        return 0
+
+    failures = compare(results, baseline, args.threshold, args.mem_threshold)
+    if failures:
+        # A single noisy sample should not fail CI: re-measure the suspects
+        # with more repeats and keep only regressions that reproduce.
+        suspects = {line.split(":", 1)[0] for line in failures}
+        retry = {
+            case.name: measure(case, corpus_dir, args.repeat * 2)
+            for case in cases if case.name in suspects
+        }
+        failures = compare(retry, baseline, args.threshold, args.mem_threshold)
+    if failures:
+        print("\nRegressions:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
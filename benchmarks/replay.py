@@ -0,0 +1,60 @@
+"""
+Offline stand-in for a Playwright ``Page`` that serves saved corpus HTML.
+
+Assigning a :class:`ReplayPage` to ``scraper.page`` lets the real scraper
+methods run unchanged — navigation becomes a lookup, so what remains to be
+measured is the HTML parsing and extraction work.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+
+CORPUS_ROOT = Path(__file__).parent / "corpus"
+
+
+class ReplayPage:
+    """Serves corpus files for URLs matching an ordered list of regex routes."""
+
+    def __init__(self, corpus_dir: Path, routes: list[tuple[str, str]]) -> None:
+        """Load every routed file once.
+
+        Args:
+            corpus_dir: Directory holding the corpus HTML files.
+            routes: ``(url_regex, filename)`` pairs; the first match wins.
+        """
+        self._routes = [
+            (re.compile(pattern), (corpus_dir / filename).read_text(encoding="utf-8"))
+            for pattern, filename in routes
+        ]
+        self._html = ""
+        self.loads = 0
+
+    def goto(self, url: str, **_: object) -> None:
+        for pattern, html in self._routes:
+            if pattern.search(url):
+                self._html = html
+                self.loads += 1
+                return
+        raise KeyError(f"No corpus route for {url}")
+
+    def content(self) -> str:
+        return self._html
+
+    # Waits, clicks and screenshots are no-ops offline.
+
+    def wait_for_selector(self, *_: object, **__: object) -> None:
+        return None
+
+    def wait_for_load_state(self, *_: object, **__: object) -> None:
+        return None
+
+    def click(self, *_: object, **__: object) -> None:
+        return None
+
+    def query_selector(self, *_: object, **__: object) -> None:
+        return None
+
+    def screenshot(self, *_: object, **__: object) -> bytes:
+        return b""
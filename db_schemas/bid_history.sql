@@ -0,0 +1,27 @@
+-- bid_history: bid trajectories of running auctions
+-- Run this in the Supabase SQL Editor.
+-- Populated by update_final_prices.py (src/services/bid_history.py).
+--
+-- Delta encoded: the first observation of a player in an updater run carries
+-- every value; later rows carry only the values that changed (NULL = same as
+-- before), and unchanged refreshes are not recorded.
+
+CREATE TABLE IF NOT EXISTS bid_history (
+    player_id        TEXT NOT NULL,
+    observed_at      TIMESTAMPTZ NOT NULL,
+    bids_count       INTEGER,
+    bids_avg         BIGINT,
+    estimated_value  BIGINT,
+    deadline         TIMESTAMPTZ,
+    PRIMARY KEY (player_id, observed_at)
+);
+
+-- Full trajectory of one auction (NULLs filled from earlier rows):
+-- SELECT observed_at,
+--        (array_remove(array_agg(bids_count) OVER w, NULL))[count(bids_count) OVER w] AS bids_count,
+--        (array_remove(array_agg(bids_avg)   OVER w, NULL))[count(bids_avg)   OVER w] AS bids_avg,
+--        (array_remove(array_agg(deadline)   OVER w, NULL))[count(deadline)   OVER w] AS deadline
+--   FROM bid_history
+--  WHERE player_id = '1000001'
+-- WINDOW w AS (ORDER BY observed_at)
+--  ORDER BY observed_at;
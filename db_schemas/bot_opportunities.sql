@@ -6,6 +6,7 @@ CREATE TABLE IF NOT EXISTS bot_opportunities (
     position TEXT,
     age INTEGER,
     quality TEXT,
+    quality_rank SMALLINT,
     team_name TEXT,
     estimated_value BIGINT DEFAULT 0,
     asking_price BIGINT DEFAULT 0,
@@ -18,6 +19,7 @@ CREATE TABLE IF NOT EXISTS bot_opportunities (
 
 -- Indexes to help the dashboard and worker with fast sorting
 CREATE INDEX IF NOT EXISTS idx_bot_opportunities_quality ON bot_opportunities(quality);
+CREATE INDEX IF NOT EXISTS idx_bot_opportunities_quality_rank ON bot_opportunities(quality_rank);
 CREATE INDEX IF NOT EXISTS idx_bot_opportunities_profit ON bot_opportunities(profit_margin DESC);
 CREATE INDEX IF NOT EXISTS idx_bot_opportunities_diff ON bot_opportunities(value_diff DESC);
 CREATE INDEX IF NOT EXISTS idx_bot_opportunities_evaluated ON bot_opportunities(last_evaluated_at ASC NULLS FIRST);
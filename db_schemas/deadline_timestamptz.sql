@@ -0,0 +1,64 @@
+-- Migration: TEXT deadlines -> TIMESTAMPTZ
+-- Run this once in the Supabase SQL Editor.
+--
+-- players.deadline and transfer_listings.deadline used to be TEXT in mixed
+-- formats: naive "YYYY-MM-DD HH:MM:SS" game time (UTC+7), ISO strings with an
+-- offset, and raw "Today at 14:30" / "Tomorrow at 08:00" / "5/4/26 at 09:15"
+-- page text.  The scrapers now write ISO 8601 with the game's offset
+-- ("2026-03-29T14:30:00+07:00", src/core/utils.py format_deadline); this
+-- converts the existing rows the same way and indexes the columns, so range
+-- queries ("ends in the next 12 hours") run on the server.
+--
+-- Relative texts are resolved against the row's update time.  Values that
+-- cannot be parsed become NULL.
+
+CREATE OR REPLACE FUNCTION pm_deadline_to_timestamptz(txt TEXT, ref TIMESTAMPTZ)
+RETURNS TIMESTAMPTZ
+LANGUAGE plpgsql STABLE AS $$
+DECLARE
+    t TEXT := btrim(txt);
+    hm TEXT := substring(t FROM '(\d{1,2}:\d{2})');
+    dmy TEXT[] := regexp_match(t, '^(\d{1,2})/(\d{1,2})/(\d{2,4})');
+    base DATE := (COALESCE(ref, now()) AT TIME ZONE 'Asia/Bangkok')::date;
+BEGIN
+    IF t IS NULL OR t = '' THEN
+        RETURN NULL;
+    ELSIF t ~ '^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?$' THEN
+        RETURN t::timestamp AT TIME ZONE 'Asia/Bangkok';      -- naive game time
+    ELSIF t ~ '^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}' THEN
+        RETURN t::timestamptz;                                -- has an offset
+    ELSIF hm IS NULL THEN
+        RETURN NULL;
+    ELSIF lower(t) LIKE '%today%' THEN
+        RETURN (base + hm::time) AT TIME ZONE 'Asia/Bangkok';
+    ELSIF lower(t) LIKE '%tomorrow%' THEN
+        RETURN (base + 1 + hm::time) AT TIME ZONE 'Asia/Bangkok';
+    ELSIF dmy IS NOT NULL THEN
+        RETURN (make_date(
+            CASE WHEN dmy[3]::int < 100 THEN dmy[3]::int + 2000 ELSE dmy[3]::int END,
+            dmy[2]::int, dmy[1]::int
+        ) + hm::time) AT TIME ZONE 'Asia/Bangkok';
+    END IF;
+    RETURN NULL;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END;
+$$;
+
+ALTER TABLE players
+    ALTER COLUMN deadline TYPE TIMESTAMPTZ
+    USING pm_deadline_to_timestamptz(deadline, updated_at);
+
+ALTER TABLE transfer_listings
+    ALTER COLUMN deadline TYPE TIMESTAMPTZ
+    USING pm_deadline_to_timestamptz(deadline, last_updated);
+
+-- bid_history created before its columns were TIMESTAMPTZ held game time.
+-- ALTER TABLE bid_history
+--     ALTER COLUMN observed_at TYPE TIMESTAMPTZ USING observed_at AT TIME ZONE 'Asia/Bangkok',
+--     ALTER COLUMN deadline TYPE TIMESTAMPTZ USING deadline AT TIME ZONE 'Asia/Bangkok';
+
+CREATE INDEX IF NOT EXISTS idx_players_deadline ON players(deadline);
+-- idx_transfer_listings_deadline (tables.sql) is rebuilt by the type change.
+
+DROP FUNCTION pm_deadline_to_timestamptz(TEXT, TIMESTAMPTZ);
@@ -0,0 +1,35 @@
+-- Migration: players.changed_at
+-- Run this once in the Supabase SQL Editor.
+--
+-- players.updated_at marks when a player's skills were last scraped (see
+-- get_fresh_player_ids), so bid refreshes and final prices leave it alone.
+-- changed_at is bumped by a trigger whenever a column of the row actually
+-- changes, which lets update_final_prices.py load only the players changed
+-- since its previous schedule sync (get_players_for_price_update).  The
+-- bookkeeping columns are left out of the comparison: every scrape rewrites
+-- updated_at, so a re-scanned player with the same data is not a change.
+
+ALTER TABLE players ADD COLUMN IF NOT EXISTS changed_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+CREATE OR REPLACE FUNCTION pm_players_changed_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- An upsert that rewrites the same values is not a change.
+    IF TG_OP = 'UPDATE'
+        AND to_jsonb(NEW) - 'updated_at' - 'changed_at'
+            = to_jsonb(OLD) - 'updated_at' - 'changed_at' THEN
+        NEW.changed_at := OLD.changed_at;
+        RETURN NEW;
+    END IF;
+    NEW.changed_at := now();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS players_changed_at ON players;
+CREATE TRIGGER players_changed_at
+    BEFORE INSERT OR UPDATE ON players
+    FOR EACH ROW EXECUTE FUNCTION pm_players_changed_at();
+
+CREATE INDEX IF NOT EXISTS players_changed_at_idx ON players (changed_at);
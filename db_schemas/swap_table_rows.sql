@@ -0,0 +1,165 @@
+-- Atomic full-table refreshes (SupabaseManager.swap_table_rows)
+-- Run this in the Supabase SQL Editor.
+--
+-- swap_table_rows(target_table, new_rows, scope) replaces the rows of
+-- target_table that match scope (every row for '{}') with new_rows, in the
+-- single transaction of one RPC call:
+--
+--   1. new_rows is loaded into a temporary staging table, which checks every
+--      value against the column types before anything is deleted;
+--   2. the old rows are deleted and the staged rows inserted.
+--
+-- Readers keep seeing the old rows until the call commits, and any failure
+-- (a bad value, a duplicate key) rolls the whole call back, leaving the table
+-- as it was.  Columns absent from every row of new_rows take their defaults.
+-- Returns the number of rows inserted.
+
+CREATE OR REPLACE FUNCTION swap_table_rows(
+    target_table TEXT,
+    new_rows JSONB,
+    scope JSONB DEFAULT '{}'::jsonb
+) RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    cols TEXT;
+    inserted INTEGER := 0;
+BEGIN
+    IF target_table NOT IN (
+        'transfer_listings', 'bot_opportunities', 'my_squad', 'upcoming_fixtures'
+    ) THEN
+        RAISE EXCEPTION 'swap_table_rows: % is not a swappable table', target_table;
+    END IF;
+    IF jsonb_typeof(new_rows) IS DISTINCT FROM 'array' THEN
+        RAISE EXCEPTION 'swap_table_rows: new_rows must be a JSON array';
+    END IF;
+
+    -- Only the columns the payload sets; the others keep their defaults.
+    SELECT string_agg(quote_ident(a.attname), ', ' ORDER BY a.attnum)
+      INTO cols
+      FROM pg_attribute a
+     WHERE a.attrelid = target_table::regclass
+       AND a.attnum > 0
+       AND NOT a.attisdropped
+       AND EXISTS (SELECT 1 FROM jsonb_array_elements(new_rows) r WHERE r ? a.attname::text);
+
+    IF cols IS NOT NULL THEN
+        DROP TABLE IF EXISTS swap_staging;
+        EXECUTE format(
+            'CREATE TEMP TABLE swap_staging ON COMMIT DROP AS SELECT %s FROM %I WITH NO DATA',
+            cols, target_table
+        );
+        EXECUTE format(
+            'INSERT INTO swap_staging SELECT %s FROM jsonb_populate_recordset(NULL::%I, $1)',
+            cols, target_table
+        ) USING new_rows;
+    END IF;
+
+    EXECUTE format('DELETE FROM %I AS t WHERE to_jsonb(t) @> $1', target_table) USING scope;
+
+    IF cols IS NOT NULL THEN
+        EXECUTE format(
+            'INSERT INTO %I (%s) SELECT %s FROM swap_staging', target_table, cols, cols
+        );
+        GET DIAGNOSTICS inserted = ROW_COUNT;
+        DROP TABLE swap_staging;
+    END IF;
+    RETURN inserted;
+END;
+$$;
+
+
+-- Incremental syncs (SupabaseManager.sync_table_rows)
+--
+-- sync_table_rows(changes) applies row-level changes to the id-keyed tables
+-- (transfer_listings, players) in the single transaction of one RPC call, so
+-- only the rows that differ are written and a failure anywhere rolls every
+-- change back.  changes is a JSON array of
+--
+--   {"table": "transfer_listings", "op": "upsert", "rows": [{"id": ...}, ...]}
+--
+-- applied in order, where op is one of:
+--
+--   upsert  insert the rows, or overwrite the columns they set on existing ids;
+--   update  overwrite the columns the rows set on existing ids only; rows for
+--           unknown ids are ignored;
+--   delete  delete the ids of the rows.
+--
+-- Every row of one change should set the same columns: a key missing from one
+-- row is written as NULL.  Returns the number of rows each change affected.
+
+CREATE OR REPLACE FUNCTION sync_table_rows(changes JSONB) RETURNS JSONB
+LANGUAGE plpgsql AS $$
+DECLARE
+    change JSONB;
+    target_table TEXT;
+    op TEXT;
+    new_rows JSONB;
+    cols TEXT;
+    excluded_sets TEXT;
+    staged_sets TEXT;
+    affected INTEGER;
+    counts JSONB := '[]'::jsonb;
+BEGIN
+    IF jsonb_typeof(changes) IS DISTINCT FROM 'array' THEN
+        RAISE EXCEPTION 'sync_table_rows: changes must be a JSON array';
+    END IF;
+
+    FOR change IN SELECT value FROM jsonb_array_elements(changes) LOOP
+        target_table := change->>'table';
+        op := change->>'op';
+        new_rows := coalesce(change->'rows', '[]'::jsonb);
+        IF target_table IS NULL OR target_table NOT IN ('transfer_listings', 'players') THEN
+            RAISE EXCEPTION 'sync_table_rows: % is not a syncable table', target_table;
+        END IF;
+        IF jsonb_typeof(new_rows) IS DISTINCT FROM 'array' THEN
+            RAISE EXCEPTION 'sync_table_rows: rows must be a JSON array';
+        END IF;
+        affected := 0;
+
+        IF op = 'delete' THEN
+            EXECUTE format(
+                'DELETE FROM %I WHERE id IN (SELECT r->>''id'' FROM jsonb_array_elements($1) r)',
+                target_table
+            ) USING new_rows;
+            GET DIAGNOSTICS affected = ROW_COUNT;
+        ELSIF op IN ('upsert', 'update') THEN
+            SELECT string_agg(quote_ident(a.attname), ', ' ORDER BY a.attnum),
+                   string_agg(format('%1$I = EXCLUDED.%1$I', a.attname), ', ' ORDER BY a.attnum)
+                       FILTER (WHERE a.attname <> 'id'),
+                   string_agg(format('%1$I = s.%1$I', a.attname), ', ' ORDER BY a.attnum)
+                       FILTER (WHERE a.attname <> 'id')
+              INTO cols, excluded_sets, staged_sets
+              FROM pg_attribute a
+             WHERE a.attrelid = target_table::regclass
+               AND a.attnum > 0
+               AND NOT a.attisdropped
+               AND EXISTS (
+                   SELECT 1 FROM jsonb_array_elements(new_rows) r WHERE r ? a.attname::text
+               );
+
+            IF op = 'upsert' AND cols IS NOT NULL THEN
+                EXECUTE format(
+                    'INSERT INTO %1$I (%2$s) '
+                    'SELECT %2$s FROM jsonb_populate_recordset(NULL::%1$I, $1) '
+                    'ON CONFLICT (id) DO %3$s',
+                    target_table, cols,
+                    coalesce('UPDATE SET ' || excluded_sets, 'NOTHING')
+                ) USING new_rows;
+                GET DIAGNOSTICS affected = ROW_COUNT;
+            ELSIF op = 'update' AND staged_sets IS NOT NULL THEN
+                EXECUTE format(
+                    'UPDATE %1$I AS t SET %2$s FROM jsonb_populate_recordset(NULL::%1$I, $1) AS s '
+                    'WHERE t.id = s.id',
+                    target_table, staged_sets
+                ) USING new_rows;
+                GET DIAGNOSTICS affected = ROW_COUNT;
+            END IF;
+        ELSE
+            RAISE EXCEPTION 'sync_table_rows: unknown op %', op;
+        END IF;
+
+        counts := counts || to_jsonb(affected);
+    END LOOP;
+    RETURN counts;
+END;
+$$;
@@ -11,14 +11,17 @@ CREATE TABLE IF NOT EXISTS players (
     quality TEXT,
     potential TEXT,
     affected_quality TEXT,
+    quality_rank SMALLINT,      -- 1 (Terrible) .. 10 (World Class), see src/core/tiers.py
+    potential_rank SMALLINT,
     skills JSONB DEFAULT '{}'::jsonb,
     bids_count TEXT,
     bids_avg TEXT,
-    deadline TEXT,
+    deadline TIMESTAMPTZ,       -- see db_schemas/deadline_timestamptz.sql to migrate
     url TEXT,
     last_transfer_price BIGINT DEFAULT 0,
     sale_to_bid_ratio REAL DEFAULT 0,
-    updated_at TIMESTAMPTZ DEFAULT now()
+    updated_at TIMESTAMPTZ DEFAULT now(),  -- skills last scraped
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT now()  -- see players_changed_at.sql
 );
 
 -- 2. Transfer Listings (replaces "Transfer Info" sheet)
@@ -29,16 +32,27 @@ CREATE TABLE IF NOT EXISTS transfer_listings (
     age INTEGER,
     quality TEXT,
     potential TEXT,
+    quality_rank SMALLINT,
+    potential_rank SMALLINT,
     estimated_value BIGINT DEFAULT 0,
     asking_price BIGINT DEFAULT 0,
+    bids_count INTEGER,  -- bids shown on the search result page
     value_diff BIGINT DEFAULT 0,
     roi REAL DEFAULT 0,
     forecast_sell REAL DEFAULT 0,
     forecast_profit REAL DEFAULT 0,
-    deadline TEXT,
+    deadline TIMESTAMPTZ,       -- see db_schemas/deadline_timestamptz.sql to migrate
     url TEXT,
+    search_profiles TEXT[],  -- --profiles searches that returned the listing
+    content_hash TEXT,  -- sha1 of the row content; lets syncs skip unchanged rows
     last_updated TIMESTAMPTZ DEFAULT now()
 );
+-- Migration: add content_hash if upgrading from an older schema
+-- ALTER TABLE transfer_listings ADD COLUMN IF NOT EXISTS content_hash TEXT;
+-- Migration: add search_profiles if upgrading from an older schema
+-- ALTER TABLE transfer_listings ADD COLUMN IF NOT EXISTS search_profiles TEXT[];
+-- Migration: add bids_count if upgrading from an older schema
+-- ALTER TABLE transfer_listings ADD COLUMN IF NOT EXISTS bids_count INTEGER;
 
 -- 3. Team Info (replaces "Team Info" sheet, single row)
 CREATE TABLE IF NOT EXISTS team_info (
@@ -66,6 +80,7 @@ CREATE TABLE IF NOT EXISTS bot_opportunities (
     position TEXT,
     age INTEGER,
     quality TEXT,
+    quality_rank SMALLINT,
     team_name TEXT,
     estimated_value BIGINT DEFAULT 0,
     asking_price BIGINT DEFAULT 0,
@@ -85,6 +100,7 @@ CREATE TABLE IF NOT EXISTS opponent_scout_results (
     position           TEXT,
     age                INTEGER,
     quality            TEXT,
+    quality_rank       SMALLINT,
     player_link        TEXT,
     is_watchlist_match BOOLEAN DEFAULT FALSE,
     scouted_at         TIMESTAMPTZ DEFAULT NOW(),
@@ -98,5 +114,10 @@ CREATE TABLE IF NOT EXISTS opponent_scout_results (
 -- Indexes for common queries
 CREATE INDEX IF NOT EXISTS idx_players_position ON players(position);
 CREATE INDEX IF NOT EXISTS idx_players_age ON players(age);
+CREATE INDEX IF NOT EXISTS idx_players_deadline ON players(deadline);
 CREATE INDEX IF NOT EXISTS idx_transfer_listings_deadline ON transfer_listings(deadline);
 CREATE INDEX IF NOT EXISTS idx_transfer_listings_roi ON transfer_listings(roi);
+CREATE INDEX IF NOT EXISTS idx_players_quality_rank ON players(quality_rank);
+CREATE INDEX IF NOT EXISTS idx_players_age_quality_rank ON players(age, quality_rank);
+CREATE INDEX IF NOT EXISTS idx_transfer_listings_quality_rank ON transfer_listings(quality_rank, potential_rank);
+CREATE INDEX IF NOT EXISTS idx_bot_opportunities_quality_rank ON bot_opportunities(quality_rank);
@@ -0,0 +1,43 @@
+-- Migration: ordinal quality / potential tiers
+-- Run this in the Supabase SQL Editor on databases created before the
+-- *_rank columns existed.  Ranks match src/core/tiers.py:
+-- 1 Terrible .. 10 World Class; unknown / unscouted tiers stay NULL.
+
+CREATE OR REPLACE FUNCTION tier_rank(label TEXT) RETURNS SMALLINT
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE lower(regexp_replace(trim(replace(label, '-', ' ')), '\s+', ' ', 'g'))
+        WHEN 'terrible'    THEN 1
+        WHEN 'very bad'    THEN 2
+        WHEN 'bad'         THEN 3
+        WHEN 'low'         THEN 4
+        WHEN 'passable'    THEN 5
+        WHEN 'good'        THEN 6
+        WHEN 'very good'   THEN 7
+        WHEN 'excellent'   THEN 8
+        WHEN 'formidable'  THEN 9
+        WHEN 'world class' THEN 10
+    END::SMALLINT
+$$;
+
+ALTER TABLE players ADD COLUMN IF NOT EXISTS quality_rank SMALLINT;
+ALTER TABLE players ADD COLUMN IF NOT EXISTS potential_rank SMALLINT;
+ALTER TABLE transfer_listings ADD COLUMN IF NOT EXISTS quality_rank SMALLINT;
+ALTER TABLE transfer_listings ADD COLUMN IF NOT EXISTS potential_rank SMALLINT;
+ALTER TABLE bot_opportunities ADD COLUMN IF NOT EXISTS quality_rank SMALLINT;
+ALTER TABLE opponent_scout_results ADD COLUMN IF NOT EXISTS quality_rank SMALLINT;
+
+-- Backfill from the existing text columns
+UPDATE players
+   SET quality_rank = tier_rank(quality), potential_rank = tier_rank(potential)
+ WHERE quality_rank IS NULL OR potential_rank IS NULL;
+UPDATE transfer_listings
+   SET quality_rank = tier_rank(quality), potential_rank = tier_rank(potential)
+ WHERE quality_rank IS NULL OR potential_rank IS NULL;
+UPDATE bot_opportunities SET quality_rank = tier_rank(quality) WHERE quality_rank IS NULL;
+UPDATE opponent_scout_results SET quality_rank = tier_rank(quality) WHERE quality_rank IS NULL;
+
+-- Range filters ("Excellent or better" → quality_rank >= 8)
+CREATE INDEX IF NOT EXISTS idx_players_quality_rank ON players(quality_rank);
+CREATE INDEX IF NOT EXISTS idx_players_age_quality_rank ON players(age, quality_rank);
+CREATE INDEX IF NOT EXISTS idx_transfer_listings_quality_rank ON transfer_listings(quality_rank, potential_rank);
+CREATE INDEX IF NOT EXISTS idx_bot_opportunities_quality_rank ON bot_opportunities(quality_rank);
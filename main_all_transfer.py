@@ -2,129 +2,401 @@
 Transfer market scraper entry point.
 
 Scrapes the full PManager transfer market, calculates ROI and profit
-metrics for each listing, then uploads the results to Supabase:
+metrics for each listing, and streams the results to Supabase in batches
+while the scrape runs (see :mod:`src.services.transfer_pipeline`):
 
-- ``transfer_listings`` table: all current market opportunities.
+- ``transfer_listings`` table: all current market opportunities; listings
+  not seen by a complete run are removed at the end.  The run ends with an
+  inserted / updated / deleted / unchanged summary.
 - ``players`` table: player attributes upserted from the same run.
 
-A CSV backup is also written to ``transfer_targets_all.csv``.
+Detail pages load while the search results are still being crawled, each
+window of ``URGENCY_WINDOW_ROWS`` discovered listings in auction deadline
+order, soonest first.  With ``--early-alert`` the market alert
+(:func:`ai_recommendation.run_alerts`) runs as soon as the listings closing
+within ``ALERT_HORIZON_HOURS`` found so far have been written, while the rest
+of the market is still being scanned.
+
+Runs are incremental: listings whose asking price, bids and deadline on the
+search result page match the previous run's ``transfer_listings`` row are
+not reloaded, only their ``last_updated`` is bumped; neither is a reloaded
+listing whose ``content_hash`` matches the stored one rewritten.  Detail page
+loads and listing writes therefore scale with market churn rather than market
+size.  Of the listings that are reloaded, players whose skills were stored
+less than ``SKILL_TTL_HOURS`` ago only get the negotiation page; their
+profile is not visited.
+
+Every listing the run loads is appended batch by batch to the Parquet market
+archive under ``market_history/`` (partitioned by scan date, see
+:mod:`src.services.market_history`), which keeps the price history
+``transfer_listings`` overwrites.  ``--csv`` also writes the old CSV backup,
+``transfer_targets_all.csv``.
+
+Progress is checkpointed to ``transfer_checkpoint.json`` (see
+:mod:`src.services.checkpoint`).  With ``--resume`` an interrupted run carries
+on: result pages are crawled again (cheap, and prices may have moved) but
+listings already written are not reloaded, and the archive and CSV are
+appended to.  A
+completed run marks the checkpoint finished.
+
+The detail loads can be split across N runners with ``--shard i/N``; each
+shard stages its writes under ``transfer_staging/`` instead of writing to
+Supabase, and ``--merge N`` applies all shards at once (see
+:mod:`src.services.shard_staging`).
+
+With ``--targeted`` the scan only pages through the listings the team could
+buy: the search is filtered server side by the available funds (capped at
+``MAX_BUDGET``), the ``TARGETED_MIN_QUALITY`` tier and the ``TARGETED_*_AGE``
+range (see :mod:`src.scrapers.market_search`).  A targeted run covers part
+of the market, so it never removes stale listings and keeps its own
+checkpoint.
+
+With ``--profiles`` the scan sweeps the named market views of
+:data:`~src.scrapers.market_search.SEARCH_PROFILES` (high quality, bargains,
+young potential) concurrently instead of the whole market.  Their listings
+are merged by ID before any detail page is loaded, so a player several
+views return costs one load, and each ``transfer_listings`` row records the
+profiles it matched in ``search_profiles``.  Like a targeted run, a profile
+run never removes stale listings.
+
+With ``--triage`` the detail pages are only loaded for listings that could
+pass the market alert's filters, judged from the result page row (budget,
+quality tier, age and an estimated-profit bound, see
+:mod:`src.services.market_triage`); the others are stored as listing-only
+rows.  Detail loads then scale with the number of viable candidates.
 
 Usage::
 
-    python main_all_transfer.py
+    python main_all_transfer.py             # incremental
+    python main_all_transfer.py --full      # reload every listing
+    python main_all_transfer.py --resume    # continue an interrupted run
+    python main_all_transfer.py --early-alert
+    python main_all_transfer.py --targeted  # only what we can afford
+    python main_all_transfer.py --profiles all
+    python main_all_transfer.py --profiles high_quality,bargains
+    python main_all_transfer.py --csv       # also write the CSV backup
+    python main_all_transfer.py --triage    # details for viable listings only
+    python main_all_transfer.py --shard 2/4 # one of four shards
+    python main_all_transfer.py --merge 4   # apply the four staged shards
 """
 
+import argparse
+from collections.abc import Iterable
 from datetime import datetime
+from typing import Any
 
-import numpy as np
-import pandas as pd
-
+from ai_recommendation import run_alerts
 from src import constants
 from src.config import config
 from src.core.logger import logger
-from src.core.utils import clean_currency, parse_deadline
-from src.scrapers.transfer import TransferScraper
+from src.core.utils import GAME_TZ
+from src.scrapers.market_search import (
+    SEARCH_PROFILES,
+    MarketSearch,
+    parse_profiles,
+    profile_url,
+)
+from src.scrapers.parse_pool import ParsePool
+from src.scrapers.transfer import (
+    TransferScraper,
+    listing_record,
+    parse_listing_financials,
+    parse_player_page,
+)
+from src.services.checkpoint import ScrapeCheckpoint
+from src.services.market_history import MarketHistory
+from src.services.market_triage import Triage, has_details
+from src.services.shard_staging import ShardStage, in_shard, merge_shards, parse_shard
 from src.services.supabase_client import SupabaseManager
+from src.services.transfer_pipeline import TransferPipeline, iter_by_urgency, listing_unchanged
 
+CSV_FILE = "transfer_targets_all.csv"
+CHECKPOINT_FILE = "transfer_checkpoint.json"
+STAGING_DIR = "transfer_staging"
+HISTORY_DIR = "market_history"
 
-def main() -> None:
-    """Run the full transfer market scrape and upload results to Supabase."""
-    config.validate()
-
-    scraper = TransferScraper(base_url="https://www.pmanager.org")
-    scraper.start(headless=config.HEADLESS_MODE)
 
-    all_results = []
+def tags_of(row: dict) -> dict | None:
+    """The search profile tags of a listing row, as extra record fields."""
+    profiles = row.get("search_profiles")
+    return {"search_profiles": profiles} if profiles else None
 
-    try:
-        scraper.login(config.PM_USERNAME, config.PM_PASSWORD)
 
-        logger.info("Starting 'All Players' Scrape...")
-        player_ids = scraper.search_transfer_list(max_pages=150)
-
-        for pid in player_ids:
-            logger.info("Get details: %s", pid)
-            try:
-                details = scraper.get_player_details(pid)
-            except Exception as e:
-                logger.error("Failed to get details for player %s: %s", pid, e)
-                continue
-
-            # Calculate market metrics
-            if "estimated_value" in details and "asking_price" in details:
-                est = details["estimated_value"]
-                ask = details["asking_price"]
-                details["value_diff"] = est - ask
-
-                if ask > 0:
-                    details["roi"] = round(((est - ask) / ask) * 100, 2)
-                else:
-                    details["roi"] = 0
-
-                # Conservative resale forecast:
-                #   forecast_sell = (estimated_value / DIVISOR) * MULTIPLIER
-                details["forecast_sell"] = (
-                    (est / constants.FORECAST_SELL_DIVISOR) * constants.FORECAST_SELL_MULTIPLIER
-                )
+def main() -> None:
+    """Run the transfer market scrape and stream results to Supabase."""
+    parser = argparse.ArgumentParser(description="Scrape the PManager transfer market.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Reload every listing and profile instead of only new, changed and stale ones.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the run recorded in the checkpoint file, skipping listings it finished.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="i/N",
+        help="Load only shard i of N (1-based) and stage the results for --merge.",
+    )
+    parser.add_argument(
+        "--merge",
+        type=int,
+        metavar="N",
+        help="Apply the staged results of an N-shard run to Supabase, then exit.",
+    )
+    parser.add_argument(
+        "--targeted",
+        action="store_true",
+        help="Scan only listings within budget, quality tier and age range (no stale cleanup).",
+    )
+    parser.add_argument(
+        "--profiles",
+        type=parse_profiles,
+        metavar="NAME[,NAME...]",
+        help=f"Scan these search profiles concurrently ({', '.join(SEARCH_PROFILES)} or all) "
+             "instead of the whole market (no stale cleanup).",
+    )
+    parser.add_argument(
+        "--triage",
+        action="store_true",
+        help="Load details only for listings that could pass the alert filters; "
+             "store the rest from their result page row.",
+    )
+    parser.add_argument("--staging-dir", default=STAGING_DIR, help="Shard staging directory.")
+    parser.add_argument("--history-dir", default=HISTORY_DIR, help="Parquet market archive.")
+    parser.add_argument("--csv", action="store_true", help=f"Also write the {CSV_FILE} backup.")
+    parser.add_argument(
+        "--early-alert",
+        action="store_true",
+        help="Run the market alert as soon as listings closing within the alert horizon are "
+             "written, before the rest of the scan (ignored with --shard).",
+    )
+    args = parser.parse_args()
+    early_alert = args.early_alert and not args.shard
 
-                bids_avg = 0.0
-                if "bids_avg" in details:
-                    bids_avg = clean_currency(str(details["bids_avg"]))
+    config.validate()
 
-                cost_price = max(ask, bids_avg)
-                details["forecast_profit"] = details["forecast_sell"] - cost_price
+    db = SupabaseManager()
+    if args.merge is not None:
+        if args.merge < 1:
+            parser.error("--merge needs the number of shards (N >= 1)")
+        merge_shards(db, args.staging_dir, args.merge)
+        return
 
-            # Convert raw deadline text → ISO timestamp string
-            raw_deadline = details.get("deadline", "")
-            parsed = parse_deadline(raw_deadline)
-            details["deadline"] = parsed.strftime("%Y-%m-%d %H:%M:%S") if parsed else None
+    completed = False
+    csv_file, checkpoint_file = CSV_FILE, CHECKPOINT_FILE
+    tags = []
+    if args.shard:
+        tags.append("shard-{}-of-{}".format(*args.shard))
+    if args.targeted:
+        tags.append("targeted")
+    if args.profiles:
+        tags.append("profiles")
+    # A filtered scan never sees the listings outside its searches.
+    partial = bool(args.targeted or args.profiles)
+    for tag in tags:
+        csv_file = csv_file.replace(".csv", f".{tag}.csv")
+        checkpoint_file = checkpoint_file.replace(".json", f".{tag}.json")
+
+    loaded = ScrapeCheckpoint.load(checkpoint_file) if args.resume else None
+    resumed = loaded is not None
+    if loaded is not None:
+        checkpoint = loaded
+        logger.info(
+            "Resuming run started %s: %d of %d discovered listings already processed",
+            checkpoint.run_started, len(checkpoint.processed), len(checkpoint.discovered),
+        )
+    else:
+        checkpoint = ScrapeCheckpoint(checkpoint_file, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    run_started = checkpoint.run_started
+    # run_started is the runner's local time, like the last_updated values it
+    # is compared with; the archive is kept in game time.
+    scan_started = datetime.strptime(run_started, "%Y-%m-%d %H:%M:%S").astimezone(GAME_TZ)
+    history = MarketHistory(
+        args.history_dir, scan_started.strftime("%Y-%m-%d %H:%M:%S"), tag=".".join(tags),
+    )
+
+    # A shard writes to its staging directory; --merge applies it later.
+    stage = (
+        ShardStage(
+            args.staging_dir, args.shard[0], args.shard[1],
+            run_started=run_started, append=resumed, targeted=partial,
+        )
+        if args.shard else None
+    )
+
+    team_info = db.get_team_info() if args.targeted or args.triage else None
+    search = MarketSearch.targeted(team_info) if args.targeted else MarketSearch()
+    if args.targeted:
+        logger.info("Targeted scan: %s", search.describe())
+    searches = {name: profile_url(SEARCH_PROFILES[name]) for name in args.profiles or ()}
+
+    snapshot = db.get_transfer_listing_snapshot()
+    triage = Triage.build(team_info, snapshot) if args.triage else None
+    triaged: dict[str, int] = {"criteria": 0, "profit": 0}
+    fresh_skills = (
+        db.get_fresh_player_ids(config.SKILL_TTL_HOURS)
+        if config.SKILL_TTL_HOURS > 0 and not args.full
+        else set()
+    )
+    logger.info(
+        "Previous snapshot: %d listings; %d players with skills under %gh old",
+        len(snapshot), len(fresh_skills), config.SKILL_TTL_HOURS,
+    )
 
-            all_results.append(details)
+    scraper = TransferScraper(base_url="https://www.pmanager.org")
+    scraper.start(headless=config.HEADLESS_MODE)
 
-    except Exception as e:
-        logger.error("Global scraper error: %s", e, exc_info=True)
-    finally:
-        scraper.stop()
+    # The browser only fetches; parsing runs in worker processes and metrics,
+    # CSV and upserts run on pipeline threads, so listings reach the
+    # dashboard while the scrape is still going.
+    with ParsePool() as pool, TransferPipeline(
+        stage or db, csv_file if args.csv else None,
+        known_hashes={pid: row.get("content_hash") for pid, row in snapshot.items()},
+        checkpoint=checkpoint, append_csv=resumed, history=history,
+    ) as pipeline:
+        try:
+            scraper.login(config.PM_USERNAME, config.PM_PASSWORD)
+
+            logger.info(
+                "Starting %s Scrape...",
+                "profile" if searches else "targeted" if args.targeted else "'All Players'",
+            )
+            # Detail loads start while result pages are still crawled; each
+            # window of discovered listings loads soonest deadline first, so
+            # closing auctions are written (and alerted) early.
+            listing: Iterable[dict[str, Any]]
+            if searches:
+                listing = scraper.search_profiles(searches, max_pages=150)
+            else:
+                search_url = search.url() if args.targeted else None
+                listing = scraper.iter_transfer_list(search_url, max_pages=150)
+            rows = (
+                row for row in listing
+                if (not args.shard or in_shard(row["id"], *args.shard)) and search.matches(row)
+            )
+
+            checked = hot = 0
+            alerted = not early_alert
+            for row, is_hot in iter_by_urgency(rows, snapshot):
+                checked += 1
+                hot += is_hot
+                # The closing auctions seen so far are queued: alert once
+                # they are written.
+                if hot and not is_hot and not alerted:
+                    pipeline.when_flushed(lambda: run_alerts(db))
+                    alerted = True
+                pid = row["id"]
+                checkpoint.discover(pid)
+                if checkpoint.is_processed(pid):
+                    continue
+                previous = snapshot.get(pid)
+                rejected = triage.reject(row, previous) if triage else None
+                # A listing-only row is reconsidered until its details load.
+                if (
+                    not args.full
+                    and listing_unchanged(row, previous)
+                    and (rejected or not triage or has_details(previous))
+                ):
+                    pipeline.touch(pid, {
+                        **listing_record(row, scraper.base_url),
+                        "estimated_value": (previous or {}).get("estimated_value"),
+                    })
+                    continue
+                if rejected:
+                    triaged[rejected] += 1
+                    pipeline.submit_listing(pid, {
+                        **listing_record(row, scraper.base_url),
+                        "estimated_value": (previous or {}).get("estimated_value"),
+                    })
+                    continue
+
+                if pid in fresh_skills:
+                    logger.info("Get financials: %s", pid)
+                    try:
+                        neg_html = scraper.fetch_negotiation_page(pid)
+                    except Exception as e:
+                        logger.error("Failed to get financials for player %s: %s", pid, e)
+                        continue
+                    pipeline.submit(pid, pool.submit(
+                        parse_listing_financials, pid, neg_html, row, scraper.base_url,
+                    ), skills=False, extra=tags_of(row))
+                    continue
+
+                logger.info("Get details: %s", pid)
+                try:
+                    neg_html, profile_html = scraper.fetch_player_pages(pid)
+                except Exception as e:
+                    logger.error("Failed to get details for player %s: %s", pid, e)
+                    continue
+                pipeline.submit(pid, pool.submit(
+                    parse_player_page, pid, neg_html, profile_html, scraper.base_url,
+                ), extra=tags_of(row))
+            # No listing followed the closing ones: alert once the last of
+            # them is written.
+            if hot and not alerted:
+                pipeline.when_flushed(lambda: run_alerts(db))
+            logger.info(
+                "%d listings checked, %d closing within %dh",
+                checked, hot, constants.ALERT_HORIZON_HOURS,
+            )
+            completed = True
+
+        except Exception as e:
+            logger.error("Global scraper error: %s", e, exc_info=True)
+        finally:
+            scraper.stop()
+
+    history.close()
+    if triage:
+        logger.info(
+            "Triage: %d listings stored without details (%d outside budget/tier/age, "
+            "%d below the profit bound)",
+            sum(triaged.values()), triaged["criteria"], triaged["profit"],
+        )
+
+    if stage:
+        # An empty slice almost certainly means the crawl failed; leave the
+        # shard incomplete so the merge keeps the current listings.
+        if completed and checkpoint.discovered and not pipeline.unwritten:
+            stage.finish()
+            checkpoint.finish()
+        logger.info(
+            "Shard %d/%d staged in %s: %d written, %d unchanged",
+            stage.index, stage.total, stage.path, pipeline.written, pipeline.touched,
+        )
+        return
 
-    if not all_results:
+    if not (pipeline.written or pipeline.touched or resumed):
         logger.warning("No results found.")
         return
-
-    # Process data
-    df = pd.DataFrame(all_results)
-    df.replace([np.inf, -np.inf], 0, inplace=True)
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    df[numeric_cols] = df[numeric_cols].fillna(0)
-    # Convert any remaining NaN in non-numeric columns to None (→ SQL NULL)
-    df = df.where(pd.notnull(df), other=None)
-
-    # Save CSV backup
-    csv_file = "transfer_targets_all.csv"
-    df.to_csv(csv_file, index=False)
-    logger.info("Saved CSV to %s", csv_file)
-
-    # Upload to Supabase
-    db = SupabaseManager()
-
-    # Transfer listings
-    market_cols = [
-        "id", "name", "position", "age", "Quality", "Potential",
-        "estimated_value", "asking_price", "value_diff", "roi",
-        "forecast_sell", "forecast_profit", "deadline", "url",
-    ]
-    existing_mcols = [c for c in market_cols if c in df.columns]
-    df_market = df[existing_mcols].copy()
-    df_market["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    db.replace_transfer_listings(df_market.to_dict(orient="records"))
-
-    # All players (attributes only — no financial columns)
-    drop_cols = [
-        "estimated_value", "asking_price", "buy_price", "value_diff",
-        "roi", "bids_count", "forecast_sell", "forecast_profit",
-    ]
-    attr_cols = [c for c in df.columns if c not in drop_cols]
-    db.upsert_players(df[attr_cols].to_dict(orient="records"))
+    if args.csv:
+        logger.info("Saved CSV to %s", csv_file)
+
+    # Listings not refreshed by this run have left the market.  After an
+    # interrupted, targeted or profile run they are kept until the next
+    # complete one, and so they are when a write failed: those listings
+    # still carry an old last_updated although they are listed.
+    deleted = 0
+    if completed and not partial:
+        if pipeline.unwritten:
+            logger.error(
+                "Skipping the stale listing delete: %d listings failed to write",
+                pipeline.unwritten,
+            )
+        else:
+            deleted = db.delete_stale_transfer_listings(before=run_started)
+    # Listings whose write failed are not marked processed; keep the
+    # checkpoint open so the next --resume retries them.
+    if completed and not pipeline.unwritten:
+        checkpoint.finish()
+    logger.info(
+        "transfer_listings: %d inserted, %d updated, %d deleted, %d unchanged",
+        pipeline.inserted, pipeline.updated, deleted, pipeline.touched,
+    )
 
 
 if __name__ == "__main__":
@@ -76,8 +76,7 @@ def main() -> None:
     logger.info("Saved CSV backup to %s", csv_file)
 
     db = SupabaseManager()
-    db.clear_bot_opportunities()
-    db.upsert_bot_opportunities(df.to_dict(orient="records"))
+    db.replace_bot_opportunities(df.to_dict(orient="records"))
 
 
 if __name__ == "__main__":
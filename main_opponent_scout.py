@@ -21,6 +21,7 @@ from urllib.parse import parse_qs, urlparse
 
 from src.config import config
 from src.core.logger import logger
+from src.core.tiers import tier_rank
 from src.scrapers.opponent import OpponentScraper
 from src.services.supabase_client import SupabaseManager
 
@@ -136,6 +137,7 @@ def main() -> None:
                 "position": p["position"] or None,
                 "age": p["age"] or None,
                 "quality": p["quality"] or None,
+                "quality_rank": tier_rank(p["quality"]),
                 "player_link": f"{_BASE_URL}/ver_jogador.asp?jog_id={pid}",
                 "scouted_at": scouted_at,
                 "is_watchlist_match": is_match,
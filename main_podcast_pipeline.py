@@ -27,6 +27,7 @@ from src.config import config
 from src.core.logger import logger
 from src.scrapers.league_stats import LeagueStatsScraper
 from src.scrapers.match_report import MatchReportScraper
+from src.scrapers.parse_pool import ParsePool
 from src.services.podcast_compiler import RoundCompiler
 from src.services.podcast_generator import PodcastGenerator
 from src.services.supabase_client import SupabaseManager
@@ -72,6 +73,7 @@ def _scrape_match(
     scraper: MatchReportScraper,
     sm: SupabaseManager,
     bot: TelegramBot | None,
+    pool: ParsePool | None = None,
 ) -> bool:
     """Scrape one match report and save screenshot. Returns True on success."""
     match_id = str(fixture["match_id"])
@@ -84,7 +86,7 @@ def _scrape_match(
         return True
 
     try:
-        report = scraper.scrape(match_id, fixture)
+        report = scraper.scrape(match_id, fixture, pool)
         screenshot_bytes: bytes | None = report.pop("_screenshot_bytes", None)
         sm.upsert_match_report(report)
 
@@ -162,6 +164,7 @@ def _scrape_round_match(
     scraper: MatchReportScraper,
     sm: SupabaseManager,
     bot: TelegramBot | None,
+    pool: ParsePool | None = None,
 ) -> bool:
     """Scrape a round match (other team). Returns True on success."""
     match_id = str(fixture["match_id"])
@@ -174,7 +177,7 @@ def _scrape_round_match(
         return True
 
     try:
-        report = scraper.scrape(match_id, fixture)
+        report = scraper.scrape(match_id, fixture, pool)
         screenshot_bytes: bytes | None = report.pop("_screenshot_bytes", None)
         report["league_matchday_results"] = fixture.get("_round_results", [])
         sm.upsert_match_report(report)
@@ -356,11 +359,11 @@ def main() -> None:
     failed_scrape = 0
     league_stats: dict | None = None
 
-    with MatchReportScraper() as scraper:
+    with MatchReportScraper() as scraper, ParsePool() as pool:
         scraper.login(config.PM_USERNAME, config.PM_PASSWORD)
 
         for fixture in pending:
-            ok = _scrape_match(fixture, scraper, sm, bot)
+            ok = _scrape_match(fixture, scraper, sm, bot, pool)
             if ok:
                 scraped_fixtures.append(fixture)
             else:
@@ -371,7 +374,7 @@ def main() -> None:
         logger.info("Discovered %d other round match(es).", len(round_matches))
 
         for fixture in round_matches:
-            ok = _scrape_round_match(fixture, scraper, sm, bot)
+            ok = _scrape_round_match(fixture, scraper, sm, bot, pool)
             if ok:
                 scraped_fixtures.append(fixture)
             else:
@@ -381,7 +384,7 @@ def main() -> None:
         try:
             stats_scraper = LeagueStatsScraper()
             stats_scraper.page = scraper.page  # reuse authenticated browser page
-            league_stats = stats_scraper.scrape_all()
+            league_stats = stats_scraper.scrape_all(pool)
             logger.info("League stats scraped successfully.")
         except Exception as exc:
             logger.warning("League stats scrape failed (non-fatal): %s", exc)
@@ -40,6 +40,9 @@ def main() -> None:
             rec["quality"] = r["quality"]
         if r.get("potential") is not None:
             rec["potential"] = r["potential"]
+        for col in ("quality_rank", "potential_rank"):
+            if r.get(col) is not None:
+                rec[col] = r[col]
         for skill in SKILL_COLUMNS:
             if skill in r:
                 rec[skill] = r[skill]
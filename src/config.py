@@ -11,6 +11,8 @@ import sys
 
 from dotenv import load_dotenv
 
+from src import constants
+
 # Load .env file
 load_dotenv()
 
@@ -53,6 +55,16 @@ class Config:
     # Browser
     HEADLESS_MODE: bool = True
 
+    # HTML parsing — worker processes for CPU-bound BeautifulSoup work.
+    # Unset: one per CPU minus the core driving the browser. 0: parse inline.
+    PARSE_WORKERS: int | None = (
+        int(os.environ["PARSE_WORKERS"]) if os.getenv("PARSE_WORKERS") else None
+    )
+
+    # Transfer market — skills written less than this many hours ago are not
+    # re-scraped; only the negotiation page is loaded.  0 always re-scrapes.
+    SKILL_TTL_HOURS: float = float(os.getenv("SKILL_TTL_HOURS") or constants.SKILL_TTL_HOURS)
+
     @classmethod
     def validate(cls) -> None:
         """Validate that all required environment variables are set.
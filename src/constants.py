@@ -6,6 +6,8 @@ rather than scattered through business logic. Import from this module instead
 of duplicating literals.
 """
 
+from src.core.tiers import Tier, tiers_at_least
+
 # ---------------------------------------------------------------------------
 # Timezone
 # ---------------------------------------------------------------------------
@@ -29,6 +31,37 @@ TOP_ALERTS_LIMIT: int = 15
 FINAL_PRICE_GRACE_HOURS: int = 2
 """Skip updating a player's final price if it was updated within this window."""
 
+# ---------------------------------------------------------------------------
+# Final price updater schedule (update_final_prices.py)
+# ---------------------------------------------------------------------------
+
+BID_REFRESH_MINUTES: int = 60
+"""Interval between bid refreshes of a running auction."""
+
+BID_FINAL_REFRESH_MINUTES: int = 5
+"""The last bid refresh runs this long before the auction closes."""
+
+BID_REFRESH_WINDOW_HOURS: int = 3
+"""Bids of a running auction are only refreshed this close to its deadline."""
+
+FINAL_PRICE_RETRY_MINUTES: int = 30
+"""Wait before checking an unsettled auction's final price again."""
+
+FINAL_PRICE_MAX_ATTEMPTS: int = 6
+"""Final price checks per auction before it is given up."""
+
+FINAL_PRICE_LOOKBACK_DAYS: int = 7
+"""Closed auctions older than this are no longer tracked."""
+
+SCHEDULE_SYNC_MINUTES: int = 30
+"""How often the updater loads newly listed players into its schedule."""
+
+SCHEDULE_SYNC_OVERLAP_MINUTES: int = 5
+"""Incremental schedule syncs re-read rows changed this long before the last one."""
+
+PLAYER_UPDATE_FLUSH_SECONDS: float = 60.0
+"""Write buffered ``players`` updates once the oldest is this old."""
+
 # ---------------------------------------------------------------------------
 # Scraper / database settings
 # ---------------------------------------------------------------------------
@@ -42,12 +75,74 @@ BOT_EVAL_BATCH_SIZE: int = 2_200
 MAX_DIVISION: int = 2
 """Only scrape the top N divisions per country during BOT team discovery."""
 
+HISTORY_FETCH_WORKERS: int = 8
+"""Concurrent HTTP requests for transfer history pages (final prices)."""
+
+# ---------------------------------------------------------------------------
+# Transfer market pipeline (main_all_transfer.py)
+# ---------------------------------------------------------------------------
+
+PIPELINE_QUEUE_SIZE: int = 64
+"""Maximum items waiting between two pipeline stages before the producer blocks."""
+
+PIPELINE_FLUSH_ROWS: int = 100
+"""Scraped listings buffered before they are appended to the CSV and upserted."""
+
+PIPELINE_FLUSH_SECONDS: float = 60.0
+"""Flush a partial buffer after this long so the dashboard stays current."""
+
+URGENCY_WINDOW_ROWS: int = 200
+"""Discovered listings ordered by deadline together before their details load."""
+
+LISTING_FETCH_WORKERS: int = 8
+"""Concurrent HTTP requests used to fetch transfer search result pages."""
+
+SWEEP_WORKERS: int = 4
+"""Search slices crawled at once when a search exceeds the page cap."""
+
+SWEEP_SAMPLE_PAGES: int = 16
+"""Result pages, spread over the cap, sampled to split a slice that exceeds it."""
+
+HTTP_TIMEOUT_SECONDS: float = 30.0
+"""Timeout for plain HTTP page fetches made alongside the browser."""
+
+SKILL_TTL_HOURS: float = 72.0
+"""Default age below which a player's stored skills are reused (``SKILL_TTL_HOURS`` env)."""
+
+CHECKPOINT_SAVE_SECONDS: float = 30.0
+"""Minimum interval between writes of the scrape checkpoint file."""
+
+CHECKPOINT_MAX_AGE_HOURS: float = 6.0
+"""``--resume`` ignores checkpoints older than this; listings will have moved on."""
+
 # ---------------------------------------------------------------------------
 # BOT player quality filter
 # ---------------------------------------------------------------------------
 
-BOT_ACCEPTED_QUALITIES: tuple[str, ...] = ("World Class", "Formidable", "Excellent")
-"""Quality tiers that qualify a BOT player for the opportunities table."""
+BOT_MIN_QUALITY: Tier = Tier.EXCELLENT
+"""Lowest quality tier that qualifies a BOT player for the opportunities table."""
+
+BOT_ACCEPTED_QUALITIES: tuple[str, ...] = tiers_at_least(BOT_MIN_QUALITY)
+"""Quality tier labels at or above :data:`BOT_MIN_QUALITY`, best first."""
+
+# ---------------------------------------------------------------------------
+# Targeted market scan (main_all_transfer.py --targeted)
+# ---------------------------------------------------------------------------
+
+TARGETED_MIN_QUALITY: Tier = BOT_MIN_QUALITY
+"""Lowest quality tier a targeted scan asks the market search for."""
+
+TARGETED_MIN_AGE: int = 18
+"""Youngest player a targeted scan keeps (filtered on the listing rows)."""
+
+TARGETED_MAX_AGE: int = 31
+"""Oldest player a targeted scan asks the market search for."""
+
+BARGAIN_MAX_PRICE: int = 5_000_000
+"""Highest asking price of the ``bargains`` search profile (``--profiles``)."""
+
+TRIAGE_VALUE_MARGIN: float = 1.25
+"""Safety factor on the estimated value bound ``--triage`` rejects listings with."""
 
 # ---------------------------------------------------------------------------
 # Business formula coefficients
@@ -0,0 +1,76 @@
+"""
+Ordinal encoding of PManager's quality / potential tiers.
+
+The game shows Quality, Potential, Penalty Skill and Experience as one of ten
+text tiers (manual section 34).  :class:`Tier` gives each an integer rank so
+that tiers can be stored next to their text, indexed, and compared with
+ranges ("Excellent or better") instead of string lists::
+
+    >>> parse_tier("World Class")
+    <Tier.WORLD_CLASS: 10>
+    >>> Tier.FORMIDABLE >= Tier.EXCELLENT
+    True
+    >>> tier_rank("Very Good")
+    7
+
+For vectorised work, :data:`TIER_RANKS` maps every label to its rank, e.g.
+``df["quality"].map(TIER_RANKS)``.
+"""
+
+from enum import IntEnum
+
+
+class Tier(IntEnum):
+    """Quality / potential tier, ordered from worst (1) to best (10)."""
+
+    TERRIBLE = 1
+    VERY_BAD = 2
+    BAD = 3
+    LOW = 4
+    PASSABLE = 5
+    GOOD = 6
+    VERY_GOOD = 7
+    EXCELLENT = 8
+    FORMIDABLE = 9
+    WORLD_CLASS = 10
+
+    @property
+    def label(self) -> str:
+        """Text shown by the game, e.g. ``"World Class"``."""
+        return self.name.replace("_", " ").title()
+
+
+#: Game label → rank, for ``Series.map`` and dict lookups.
+TIER_RANKS: dict[str, int] = {tier.label: int(tier) for tier in Tier}
+
+_NORMALISED: dict[str, Tier] = {tier.label.lower(): tier for tier in Tier}
+
+
+def parse_tier(text: str | None) -> Tier | None:
+    """Parse a scraped tier label into a :class:`Tier`.
+
+    Matching ignores case, surrounding whitespace and hyphens
+    (``"World-Class"`` is accepted).
+
+    Args:
+        text: Raw label from a profile, squad or listing page.
+
+    Returns:
+        The matching tier, or ``None`` for empty, unscouted (``"—"``) or
+        unknown labels.
+    """
+    if not text or not isinstance(text, str):
+        return None
+    key = " ".join(text.replace("-", " ").split()).lower()
+    return _NORMALISED.get(key)
+
+
+def tier_rank(text: str | None) -> int | None:
+    """Return the integer rank of a tier label, or ``None`` if unrecognised."""
+    tier = parse_tier(text)
+    return int(tier) if tier is not None else None
+
+
+def tiers_at_least(minimum: Tier) -> tuple[str, ...]:
+    """Labels of ``minimum`` and every better tier, best first."""
+    return tuple(tier.label for tier in sorted(Tier, reverse=True) if tier >= minimum)
@@ -3,11 +3,24 @@ Shared utility functions for pmanager-scrape.
 
 Provides helpers for parsing game-specific data formats (currency strings,
 auction deadlines) that are used across multiple scrapers and entry scripts.
+
+Deadlines are handled in game time: naive datetimes in UTC+7.  Every value
+read (scraped text, a stored ``timestamptz``, a local file) goes through
+:func:`normalise_deadline`, and every value written to Supabase through
+:func:`format_deadline`, which adds the explicit ``+07:00`` offset.
 """
 
 import re
 from datetime import datetime, timedelta, timezone
 
+from src import constants
+
+#: The game server's timezone.
+GAME_TZ = timezone(timedelta(hours=constants.UTC_OFFSET_HOURS))
+
+#: ``strftime`` format of deadlines written to Supabase (ISO 8601 with offset).
+DEADLINE_TZ_FORMAT = f"%Y-%m-%dT%H:%M:%S{constants.UTC_OFFSET_HOURS:+03d}:00"
+
 
 def parse_deadline(deadline_str: str | None) -> datetime | None:
     """Parse a game deadline string into a timezone-aware datetime.
@@ -43,8 +56,7 @@ def parse_deadline(deadline_str: str | None) -> datetime | None:
     minute = int(time_match.group(2))
     # Use Bangkok time (UTC+7) for the base date so "Today"/"Tomorrow" resolve
     # correctly even when the scraper runs on a UTC server near midnight.
-    _BKK = timezone(timedelta(hours=7))
-    now = datetime.now(tz=_BKK).replace(tzinfo=None)
+    now = datetime.now(tz=GAME_TZ).replace(tzinfo=None)
 
     lower = txt.lower()
     if "today" in lower:
@@ -70,6 +82,55 @@ def parse_deadline(deadline_str: str | None) -> datetime | None:
     return None
 
 
+def normalise_deadline(value: object) -> datetime | None:
+    """Resolve any deadline representation to game time (naive UTC+7).
+
+    Accepts timezone-aware datetimes and ISO 8601 strings with an offset
+    (e.g. a ``timestamptz`` returned by Supabase as
+    ``"2026-03-29T07:30:00+00:00"``), which are converted to UTC+7; naive
+    datetimes and ISO strings, which are taken as game time already; and
+    scraped texts, via :func:`parse_deadline`.
+
+    Args:
+        value: Deadline in any of the forms above, or ``None``.
+
+    Returns:
+        A naive :class:`~datetime.datetime` in UTC+7, or ``None`` if the
+        value cannot be parsed.
+
+    Examples:
+        >>> normalise_deadline("2026-03-29T07:30:00+00:00")
+        datetime(2026, 3, 29, 14, 30)
+    """
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        text = str(value or "").strip()
+        if not text[:1].isdigit() or "/" in text:
+            return parse_deadline(text)
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            return parse_deadline(text)
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(GAME_TZ).replace(tzinfo=None)
+    return dt
+
+
+def format_deadline(value: object) -> str | None:
+    """Format a deadline for a ``timestamptz`` column.
+
+    Args:
+        value: Anything :func:`normalise_deadline` accepts.
+
+    Returns:
+        An ISO 8601 string with the game's offset
+        (``"2026-03-29T14:30:00+07:00"``), or ``None`` if unparseable.
+    """
+    dt = normalise_deadline(value)
+    return dt.strftime(DEADLINE_TZ_FORMAT) if dt else None
+
+
 def clean_currency(value_str: str | None) -> float:
     """Strip non-digit characters from a currency string and return a float.
 
@@ -13,6 +13,7 @@ Usage as a context manager (recommended — ensures browser cleanup on error)::
 
 from __future__ import annotations
 
+import requests
 from playwright.sync_api import Browser, Page, Playwright, sync_playwright
 
 from src.core.logger import logger
@@ -55,6 +56,24 @@ class BaseScraper:
             self.playwright.stop()
         logger.info("Browser stopped.")
 
+    def http_session(self) -> requests.Session:
+        """Return a ``requests`` session carrying the browser's cookies.
+
+        Plain server-rendered pages (search results, listings) can then be
+        fetched concurrently over HTTP instead of one at a time through the
+        single Playwright page.  Call after :meth:`login`.
+        """
+        session = requests.Session()
+        for cookie in self.page.context.cookies():
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/"),
+            )
+        session.headers["User-Agent"] = self.page.evaluate("navigator.userAgent")
+        return session
+
     # ------------------------------------------------------------------
     # Context manager support
     # ------------------------------------------------------------------
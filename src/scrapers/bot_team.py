@@ -13,6 +13,7 @@ from bs4 import BeautifulSoup
 
 from src import constants
 from src.core.logger import logger
+from src.core.tiers import tier_rank
 from src.core.utils import clean_currency
 from src.scrapers.base import BaseScraper
 
@@ -384,6 +385,7 @@ class BotTeamScraper(BaseScraper):
             "position": position,
             "age": age,
             "quality": quality,
+            "quality_rank": tier_rank(quality),
             "team_name": team_name,
             "estimated_value": estimated_value,
             "asking_price": asking_price,
@@ -21,6 +21,36 @@ from bs4 import BeautifulSoup
 
 from src.core.logger import logger
 from src.scrapers.base import BaseScraper
+from src.scrapers.tables import (
+    Column,
+    TablePlan,
+    link_param,
+    rows_with_class,
+    table_soup,
+    table_with_class,
+    text,
+    text_sep,
+)
+
+# ── Fixture list table ───────────────────────────────────────────────────────
+
+
+# Columns: Round | Date | Home | vs | Away | Result | Report link
+FIXTURES_PAGE_PLAN = TablePlan(
+    name="league_fixtures",
+    tables=table_with_class("table_border"),
+    rows=rows_with_class("list1", "list2"),
+    min_cells=7,
+    columns=(
+        Column("round",     0, text),
+        Column("date",      1, text),
+        Column("home_team", 2, text_sep),
+        Column("away_team", 4, text_sep),
+        Column("result",    5, text),
+        Column("game_id",   6, link_param("jogo_id")),
+    ),
+)
+
 
 # ── Stats-tab label → (field_name, value_type) ───────────────────────────────
 _LABEL_MAP: dict[str, tuple[str, str]] = {
@@ -109,7 +139,7 @@ class LeagueFixturesScraper(BaseScraper):
             logger.info("Fixtures page %d/%d ...", pid, pages)
             self.page.goto(url)
             self.page.wait_for_load_state("networkidle")
-            soup = BeautifulSoup(self.page.content(), "html.parser")
+            soup = table_soup(self.page.content())
             batch = self._parse_fixtures_page(soup)
             fixtures.extend(batch)
             logger.info("  page %d: %d played fixtures", pid, len(batch))
@@ -119,40 +149,21 @@ class LeagueFixturesScraper(BaseScraper):
         results: list[dict[str, Any]] = []
         current_round: int | None = None
 
-        table = soup.find("table", class_="table_border")
-        if not table:
-            return results
-
-        for row in table.find_all("tr", class_=["list1", "list2"]):
-            cols = row.find_all("td")
-            if len(cols) < 7:
-                continue
-
-            round_text = cols[0].get_text(strip=True)
-            if round_text.isdigit():
-                current_round = int(round_text)
+        for row in FIXTURES_PAGE_PLAN.extract(soup):
+            # The round number is only printed on its first row.
+            if row["round"].isdigit():
+                current_round = int(row["round"])
 
-            date_raw   = cols[1].get_text(strip=True)
-            home_team  = cols[2].get_text(separator=" ", strip=True)
-            away_team  = cols[4].get_text(separator=" ", strip=True)
-            result_raw = cols[5].get_text(strip=True)
-
-            report_link = cols[6].find("a")
-            if not report_link:
+            game_id = row["game_id"]
+            if not game_id:
                 continue  # not yet played
 
-            href = report_link.get("href", "")
-            gid_m = re.search(r"jogo_id=(\d+)", href)
-            if not gid_m:
-                continue
-            game_id = gid_m.group(1)
-
-            score_m   = re.search(r"(\d+)\s*[-–]\s*(\d+)", result_raw)
+            score_m   = re.search(r"(\d+)\s*[-–]\s*(\d+)", row["result"])
             home_score = int(score_m.group(1)) if score_m else None
             away_score = int(score_m.group(2)) if score_m else None
 
             try:
-                date_iso = _dmy_to_iso(date_raw)
+                date_iso = _dmy_to_iso(row["date"])
             except (ValueError, IndexError):
                 date_iso = None
 
@@ -160,8 +171,8 @@ class LeagueFixturesScraper(BaseScraper):
                 "game_id":    game_id,
                 "round_num":  current_round,
                 "date":       date_iso,
-                "home_team":  home_team,
-                "away_team":  away_team,
+                "home_team":  row["home_team"],
+                "away_team":  row["away_team"],
                 "home_score": home_score,
                 "away_score": away_score,
             })
@@ -8,10 +8,27 @@ All pages are scraped with the same authenticated browser session.
 
 from __future__ import annotations
 
-from bs4 import BeautifulSoup
+from collections.abc import Iterator
+from concurrent.futures import Future
+from functools import cache
+from typing import Any
+
+from bs4 import Tag
 
 from src.core.logger import logger
 from src.scrapers.base import BaseScraper
+from src.scrapers.parse_pool import ParsePool
+from src.scrapers.tables import (
+    Column,
+    TablePlan,
+    nth_table,
+    table_soup,
+    tables_with_header,
+    text_rstrip,
+    text_sep,
+    to_float,
+    to_int,
+)
 
 
 class LeagueStatsScraper(BaseScraper):
@@ -21,9 +38,13 @@ class LeagueStatsScraper(BaseScraper):
     # Main entry                                                           #
     # ------------------------------------------------------------------ #
 
-    def scrape_all(self) -> dict:
+    def scrape_all(self, pool: ParsePool | None = None) -> dict:
         """Scrape all stat pages and return a combined dict.
 
+        Args:
+            pool: Optional parse pool. Each page is handed to it as soon as it
+                is loaded, so parsing overlaps with fetching the next page.
+
         Returns:
             {
               "standings":     list[dict],   # Position, Team, G, W, D, L, GS, GC, GD, Pts
@@ -35,131 +56,138 @@ class LeagueStatsScraper(BaseScraper):
               "top_eleven_season": list[dict],
             }
         """
-        return {
-            "standings":          self._scrape_standings(),
-            "top_scorers":        self._scrape_table("m_marcadores.asp",   "Goals"),
-            "top_assists":        self._scrape_table("m_assistencias.asp", "Top Assists"),
-            "avg_ratings":        self._scrape_table("m_media.asp",        "Average Rating"),
-            "man_of_match":       self._scrape_table("m_campo.asp",        "Occasions"),
-            **self._scrape_top_eleven(),
+        pool = pool or ParsePool(workers=0)
+        futures: dict[str, Future[Any]] = {
+            "standings":    pool.submit(parse_standings, self._fetch("classificacao.asp")),
+            "top_scorers":  pool.submit(parse_stat_table, self._fetch("m_marcadores.asp"), "Goals"),
+            "top_assists":  pool.submit(parse_stat_table, self._fetch("m_assistencias.asp"), "Top Assists"),
+            "avg_ratings":  pool.submit(parse_stat_table, self._fetch("m_media.asp"), "Average Rating"),
+            "man_of_match": pool.submit(parse_stat_table, self._fetch("m_campo.asp"), "Occasions"),
+            "top_eleven":   pool.submit(parse_top_eleven, self._fetch("onze_ideal.asp?action=0")),
         }
+        results = {key: future.result() for key, future in futures.items()}
+        for key in ("standings", "top_scorers", "top_assists", "avg_ratings", "man_of_match"):
+            logger.info("%s: %d rows", key, len(results[key]))
+
+        top_eleven = results.pop("top_eleven")
+        logger.info(
+            "Top Eleven — week: %d, season: %d",
+            len(top_eleven["top_eleven_week"]), len(top_eleven["top_eleven_season"]),
+        )
+        return {**results, **top_eleven}
 
     # ------------------------------------------------------------------ #
     # Page scrapers                                                        #
     # ------------------------------------------------------------------ #
 
-    def _scrape_standings(self) -> list[dict]:
-        url = f"{self.base_url}/classificacao.asp"
-        logger.info("Scraping standings: %s", url)
+    def _fetch(self, path: str) -> str:
+        url = f"{self.base_url}/{path}"
+        logger.info("Scraping %s", url)
         self.page.goto(url, wait_until="domcontentloaded")
-        soup = BeautifulSoup(self.page.content(), "html.parser")
-
-        rows = []
-        for table in soup.find_all("table"):
-            headers = [th.get_text(strip=True) for th in table.find_all("th")]
-            if "Points" not in headers and "Pts" not in headers:
-                continue
-            for tr in table.find_all("tr")[1:]:
-                cells = [td.get_text(separator=" ", strip=True) for td in tr.find_all("td")]
-                if len(cells) < 9:
-                    continue
-                rows.append({
-                    "position": cells[0].rstrip("."),
-                    "team":     cells[1] if len(cells) > 1 else "",
-                    "played":   _safe_int(cells[2]),
-                    "won":      _safe_int(cells[3]),
-                    "drawn":    _safe_int(cells[4]),
-                    "lost":     _safe_int(cells[5]),
-                    "gf":       _safe_int(cells[6]),
-                    "ga":       _safe_int(cells[7]),
-                    "gd":       cells[8],
-                    "points":   _safe_int(cells[9]) if len(cells) > 9 else None,
-                })
-            if rows:
-                break
+        return self.page.content()
 
+    def _scrape_standings(self) -> list[dict]:
+        rows = parse_standings(self._fetch("classificacao.asp"))
         logger.info("Standings: %d rows", len(rows))
         return rows
 
     def _scrape_table(self, path: str, stat_col: str) -> list[dict]:
         """Generic scraper for the 7-column stat tables (scorers, assists, etc.)."""
-        url = f"{self.base_url}/{path}"
-        logger.info("Scraping %s", url)
-        self.page.goto(url, wait_until="domcontentloaded")
-        soup = BeautifulSoup(self.page.content(), "html.parser")
-
-        rows = []
-        for table in soup.find_all("table"):
-            headers = [th.get_text(strip=True) for th in table.find_all("th")]
-            if "Name" not in headers and "name" not in " ".join(headers).lower():
-                continue
-            for tr in table.find_all("tr")[1:]:
-                cells = [td.get_text(separator=" ", strip=True) for td in tr.find_all("td")]
-                if len(cells) < 6:
-                    continue
-                row: dict = {
-                    "rank":     cells[0].rstrip("."),
-                    "name":     cells[1],
-                    "team":     cells[2],
-                    "age":      _safe_int(cells[3]),
-                    "position": cells[4],
-                    "min_played": _safe_int(cells[5]),
-                    stat_col:   _safe_float(cells[6]) if len(cells) > 6 else None,
-                }
-                rows.append(row)
-            if rows:
-                break
-
+        rows = parse_stat_table(self._fetch(path), stat_col)
         logger.info("%s: %d rows", path, len(rows))
         return rows
 
     def _scrape_top_eleven(self) -> dict:
-        url = f"{self.base_url}/onze_ideal.asp?action=0"
-        logger.info("Scraping top eleven: %s", url)
-        self.page.goto(url, wait_until="domcontentloaded")
-        soup = BeautifulSoup(self.page.content(), "html.parser")
-
-        # Page has two tables: Week and Season
-        tables = soup.find_all("table")
-        week_rows:   list[dict] = []
-        season_rows: list[dict] = []
-
-        for i, table in enumerate(tables[:2]):
-            rows = []
-            for tr in table.find_all("tr")[1:]:
-                cells = [td.get_text(separator=" ", strip=True) for td in tr.find_all("td")]
-                if len(cells) < 4:
-                    continue
-                # columns: Name, Team, Age, Position, [MinPlayed], Average Rating
-                rows.append({
-                    "name":     cells[0],
-                    "team":     cells[1],
-                    "age":      _safe_int(cells[2]),
-                    "position": cells[3],
-                    "rating":   _safe_float(cells[-1]),
-                })
-            if i == 0:
-                week_rows = rows
-            else:
-                season_rows = rows
-
-        logger.info("Top Eleven — week: %d, season: %d", len(week_rows), len(season_rows))
-        return {"top_eleven_week": week_rows, "top_eleven_season": season_rows}
+        result = parse_top_eleven(self._fetch("onze_ideal.asp?action=0"))
+        logger.info(
+            "Top Eleven — week: %d, season: %d",
+            len(result["top_eleven_week"]), len(result["top_eleven_season"]),
+        )
+        return result
 
 
 # ------------------------------------------------------------------ #
-# Helpers                                                             #
+# Pure parse functions (safe to run in a ParsePool worker)            #
 # ------------------------------------------------------------------ #
 
-def _safe_int(val: str) -> int | None:
-    try:
-        return int(val.replace(",", "").strip())
-    except (ValueError, AttributeError):
-        return None
-
-
-def _safe_float(val: str) -> float | None:
-    try:
-        return float(val.replace(",", ".").strip())
-    except (ValueError, AttributeError):
-        return None
+def _tables_with_name_header(soup: Tag) -> Iterator[Tag]:
+    for table in soup.find_all("table"):
+        headers = " ".join(th.get_text(strip=True) for th in table.find_all("th"))
+        if "name" in headers.lower():
+            yield table
+
+
+STANDINGS_PLAN = TablePlan(
+    name="standings",
+    tables=tables_with_header("Points", "Pts"),
+    min_cells=9,
+    first_match=True,
+    columns=(
+        Column("position", 0, text_rstrip(".")),
+        Column("team",     1, text_sep),
+        Column("played",   2, to_int),
+        Column("won",      3, to_int),
+        Column("drawn",    4, to_int),
+        Column("lost",     5, to_int),
+        Column("gf",       6, to_int),
+        Column("ga",       7, to_int),
+        Column("gd",       8, text_sep),
+        Column("points",   9, to_int),
+    ),
+)
+
+_TOP_ELEVEN_COLUMNS = (
+    # columns: Name, Team, Age, Position, [MinPlayed], Average Rating
+    Column("name",     0, text_sep),
+    Column("team",     1, text_sep),
+    Column("age",      2, to_int),
+    Column("position", 3, text_sep),
+    Column("rating",  -1, to_float),
+)
+
+# Page has two tables: Week and Season
+TOP_ELEVEN_WEEK_PLAN = TablePlan(
+    name="top_eleven_week", tables=nth_table(0), min_cells=4, columns=_TOP_ELEVEN_COLUMNS,
+)
+TOP_ELEVEN_SEASON_PLAN = TablePlan(
+    name="top_eleven_season", tables=nth_table(1), min_cells=4, columns=_TOP_ELEVEN_COLUMNS,
+)
+
+
+@cache
+def stat_table_plan(stat_col: str) -> TablePlan:
+    """Plan for a 7-column stat leaderboard whose last column is ``stat_col``."""
+    return TablePlan(
+        name=f"stat_table:{stat_col}",
+        tables=_tables_with_name_header,
+        min_cells=6,
+        first_match=True,
+        columns=(
+            Column("rank",       0, text_rstrip(".")),
+            Column("name",       1, text_sep),
+            Column("team",       2, text_sep),
+            Column("age",        3, to_int),
+            Column("position",   4, text_sep),
+            Column("min_played", 5, to_int),
+            Column(stat_col,     6, to_float),
+        ),
+    )
+
+
+def parse_standings(html: str) -> list[dict]:
+    """Parse the league table from ``classificacao.asp``."""
+    return STANDINGS_PLAN.extract(table_soup(html))
+
+
+def parse_stat_table(html: str, stat_col: str) -> list[dict]:
+    """Parse a 7-column stat leaderboard; the last column is stored under ``stat_col``."""
+    return stat_table_plan(stat_col).extract(table_soup(html))
+
+
+def parse_top_eleven(html: str) -> dict:
+    """Parse the week and season Top Eleven tables from ``onze_ideal.asp``."""
+    soup = table_soup(html)
+    return {
+        "top_eleven_week":   TOP_ELEVEN_WEEK_PLAN.extract(soup),
+        "top_eleven_season": TOP_ELEVEN_SEASON_PLAN.extract(soup),
+    }
@@ -0,0 +1,167 @@
+"""
+Filtered transfer market searches.
+
+``procurar.asp`` filters on most listing fields server side: every field has
+an operator parameter (``<field>_op``) and a value parameter (``<field>``),
+with ``Any`` meaning unfiltered (docs/TSD.md §7).  :class:`MarketSearch`
+turns a few buying criteria into such a URL, so a scan only pages through
+listings we could actually buy::
+
+    MarketSearch(max_price=12_000_000, min_quality=Tier.EXCELLENT).url()
+    # https://www.pmanager.org/procurar.asp?...&pre_op=%3C%3D&pre=12000000...&qual_op=%3E%3D&qual=8...
+
+Each field takes one operator, so an age *range* cannot be expressed in one
+search; the upper bound is sent to the server and :meth:`MarketSearch.matches`
+applies the rest to the listing rows.
+
+:meth:`MarketSearch.targeted` builds the search used by
+``main_all_transfer.py --targeted`` from the team's available funds and the
+``TARGETED_*`` constants.
+
+:data:`SEARCH_PROFILES` names the market views of docs/TSD.md §7.1 (high
+quality, bargains, young potential).  ``main_all_transfer.py --profiles``
+sweeps several of them at once and loads each player's details once, tagged
+with every profile it matched.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from typing import Any
+
+from src import constants
+from src.core.tiers import Tier, tier_rank
+from src.core.utils import clean_currency
+from src.scrapers.transfer import TransferScraper, with_search_filter
+
+
+@dataclass(frozen=True)
+class MarketSearch:
+    """Buying criteria for a transfer market search.
+
+    ``None`` leaves a criterion unfiltered.
+
+    Attributes:
+        max_price: Highest asking price (game currency).
+        min_quality: Lowest quality tier rank (1–10, see
+            :class:`~src.core.tiers.Tier`).
+        min_potential: Lowest potential tier rank (1–10).
+        min_age: Youngest age; applied by :meth:`matches` only.
+        max_age: Oldest age.
+    """
+
+    max_price: int | None = None
+    min_quality: int | None = None
+    min_potential: int | None = None
+    min_age: int | None = None
+    max_age: int | None = None
+
+    @classmethod
+    def targeted(cls, team_info: dict[str, Any] | None) -> MarketSearch:
+        """Search for the listings the team could buy right now.
+
+        The price cap is the team's ``available_funds``, capped at
+        :data:`~src.constants.MAX_BUDGET` (the whole ``MAX_BUDGET`` when the
+        funds are unknown).  Quality and age come from the
+        ``TARGETED_*`` constants.
+
+        Args:
+            team_info: The ``team_info`` row, or ``None``.
+        """
+        funds = clean_currency(str((team_info or {}).get("available_funds") or ""))
+        budget = min(int(funds), constants.MAX_BUDGET) if funds > 0 else constants.MAX_BUDGET
+        return cls(
+            max_price=budget,
+            min_quality=int(constants.TARGETED_MIN_QUALITY),
+            min_age=constants.TARGETED_MIN_AGE,
+            max_age=constants.TARGETED_MAX_AGE,
+        )
+
+    def url(self, base_url: str = TransferScraper.SEARCH_URL_TEMPLATE) -> str:
+        """Return ``base_url`` with the server-side filters applied."""
+        url = base_url
+        if self.max_price is not None:
+            url = with_search_filter(url, "pre", "<=", self.max_price)
+        if self.min_quality is not None:
+            url = with_search_filter(url, "qual", ">=", self.min_quality)
+        if self.min_potential is not None:
+            url = with_search_filter(url, "prog", ">=", self.min_potential)
+        if self.max_age is not None:
+            url = with_search_filter(url, "idd", "<=", self.max_age)
+        return url
+
+    def matches(self, row: dict[str, Any]) -> bool:
+        """Return ``True`` if a listing row meets every criterion.
+
+        Covers the filters the search cannot send (``min_age``) and guards
+        against the server ignoring one.  Fields missing from the row pass.
+
+        Args:
+            row: A :func:`~src.scrapers.transfer.parse_listing_page` row.
+        """
+        price = row.get("asking_price")
+        if self.max_price is not None and price is not None and price > self.max_price:
+            return False
+        age = row.get("age")
+        if age is not None:
+            if self.min_age is not None and age < self.min_age:
+                return False
+            if self.max_age is not None and age > self.max_age:
+                return False
+        for label, floor in (("Quality", self.min_quality), ("Potential", self.min_potential)):
+            rank = tier_rank(row.get(label))
+            if floor is not None and rank is not None and rank < floor:
+                return False
+        return True
+
+    def describe(self) -> str:
+        """Short human-readable summary for logs."""
+        parts = []
+        if self.max_price is not None:
+            parts.append(f"price <= {self.max_price:,}")
+        if self.min_quality is not None:
+            parts.append(f"quality >= {self.min_quality}")
+        if self.min_potential is not None:
+            parts.append(f"potential >= {self.min_potential}")
+        if self.min_age is not None or self.max_age is not None:
+            parts.append(f"age {self.min_age or ''}-{self.max_age or ''}")
+        return ", ".join(parts) or "no filters"
+
+
+# ---------------------------------------------------------------------------
+# Search profiles
+# ---------------------------------------------------------------------------
+
+#: Named market views for ``main_all_transfer.py --profiles``: a
+#: :class:`MarketSearch`, or a complete ``procurar.asp`` search URL.
+SEARCH_PROFILES: dict[str, MarketSearch | str] = {
+    "high_quality": MarketSearch(min_quality=int(Tier.EXCELLENT)),
+    "bargains": MarketSearch(max_price=constants.BARGAIN_MAX_PRICE),
+    "young_potential": MarketSearch(max_age=19, min_potential=int(Tier.VERY_GOOD)),
+}
+
+
+def profile_url(profile: MarketSearch | str) -> str:
+    """Search URL of a :data:`SEARCH_PROFILES` entry."""
+    return profile if isinstance(profile, str) else profile.url()
+
+
+def parse_profiles(value: str) -> list[str]:
+    """Parse a comma-separated list of profile names for argparse.
+
+    ``"all"`` selects every profile in :data:`SEARCH_PROFILES`.
+
+    Raises:
+        argparse.ArgumentTypeError: If a name is not a known profile.
+    """
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    if names == ["all"]:
+        return list(SEARCH_PROFILES)
+    unknown = [name for name in names if name not in SEARCH_PROFILES]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(
+            f"unknown search profile(s) {', '.join(unknown) or value!r}; "
+            f"choose from {', '.join(SEARCH_PROFILES)} or all"
+        )
+    return list(dict.fromkeys(names))
@@ -4,10 +4,11 @@ import re
 from datetime import datetime
 from statistics import mean
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from src.core.logger import logger
 from src.scrapers.base import BaseScraper
+from src.scrapers.tables import ROW, Column, TablePlan, link_param, table_soup, text, text_sep
 from src.services.supabase_client import SupabaseManager
 
 SKILL_COLS = [
@@ -31,6 +32,46 @@ AT_COMMENTARY_KEYS = {
 }
 
 
+def _fixture_tables(soup: Tag) -> list[Tag]:
+    # The page has 2 tables: [0] season selector (1 cell), [1] fixtures (class table_border)
+    table = soup.find("table", class_="table_border")
+    if not table:
+        # fallback: try second table if class not found
+        tables = soup.find_all("table")
+        logger.info("Found %d table(s) on fixture page (table_border not found)", len(tables))
+        table = tables[1] if len(tables) > 1 else (tables[0] if tables else None)
+    if not table:
+        logger.warning("No fixture table found on page — check URL/login")
+        return []
+    return [table]
+
+
+def _result_text(cell: Tag) -> str:
+    # &nbsp; in result cell = upcoming match (no score yet)
+    return cell.get_text(strip=True).replace("\xa0", "")
+
+
+# Columns: Match Type | Date | Home | vs | Away | Result | Match
+# Team IDs come from ver_equipa.asp links specifically to avoid matching
+# equipa= parameters on match/calendar links; the match ID comes from the
+# "Match Report" link, wherever its column sits in the row.
+FIXTURE_PLAN = TablePlan(
+    name="fixtures",
+    tables=_fixture_tables,
+    min_cells=5,
+    columns=(
+        Column("match_type",     0, text_sep),
+        Column("date_str",       1, text),
+        Column("home_team_id",   2, link_param("equipa", r"ver_equipa\.asp\?equipa=")),
+        Column("home_team_name", 2, text_sep),
+        Column("away_team_id",   4, link_param("equipa", r"ver_equipa\.asp\?equipa=")),
+        Column("away_team_name", 4, text_sep),
+        Column("result",         5, _result_text, default=""),
+        Column("match_id",       ROW, link_param("jogo_id", r"jogo_id=")),
+    ),
+)
+
+
 class MatchPrepScraper(BaseScraper):
     """Synchronous scraper for match prep data (extends BaseScraper)."""
 
@@ -44,7 +85,7 @@ class MatchPrepScraper(BaseScraper):
         logger.info("Fetching fixture list: %s", url)
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
-        soup = BeautifulSoup(self.page.content(), "html.parser")
+        soup = table_soup(self.page.content())
         return self._parse_fixture_table(soup, season)
 
     def scrape_opponent_fixtures(self, team_id: str, season: str) -> list[dict]:
@@ -53,67 +94,27 @@ class MatchPrepScraper(BaseScraper):
         logger.info("Fetching opponent fixture list: %s", url)
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
-        soup = BeautifulSoup(self.page.content(), "html.parser")
+        soup = table_soup(self.page.content())
         return self._parse_fixture_table(soup, season)
 
     def _parse_fixture_table(self, soup: BeautifulSoup, season: str) -> list[dict]:
         fixtures = []
-        # The page has 2 tables: [0] season selector (1 cell), [1] fixtures (class table_border)
-        table = soup.find("table", class_="table_border")
-        if not table:
-            # fallback: try second table if class not found
-            tables = soup.find_all("table")
-            logger.info("Found %d table(s) on fixture page (table_border not found)", len(tables))
-            table = tables[1] if len(tables) > 1 else (tables[0] if tables else None)
-        if not table:
-            logger.warning("No fixture table found on page — check URL/login")
-            return fixtures
-
-        rows = table.find_all("tr")[1:]
+        rows = FIXTURE_PLAN.extract(soup)
         logger.info("Found %d data rows", len(rows))
 
         for row in rows:
-            cells = row.find_all("td")
-            if len(cells) < 5:
-                logger.debug("Skipping row with %d cells: %s", len(cells), row.get_text(separator="|", strip=True)[:80])
-                continue
-
-            match_type  = cells[0].get_text(separator=" ", strip=True)
-            date_str    = cells[1].get_text(strip=True)
-            home_cell   = cells[2]
-            # Columns: Match Type | Date | Home | vs | Away | Result | Match
-            away_cell   = cells[4] if len(cells) > 4 else cells[2]
-            # &nbsp; in result cell = upcoming match (no score yet)
-            result_text = cells[5].get_text(strip=True).replace("\xa0", "") if len(cells) > 5 else ""
-
-            # Match ID from "Match Report" link — search all cells (column may vary)
-            match_id = None
-            for cell in cells:
-                link = cell.find("a", href=re.compile(r"jogo_id="))
-                if link:
-                    m = re.search(r"jogo_id=(\d+)", link["href"])
-                    match_id = m.group(1) if m else None
-                    break
-
-            # Team IDs from name links — use ver_equipa.asp links specifically
-            # to avoid matching equipa= parameters on match/calendar links.
-            home_link = home_cell.find("a", href=re.compile(r"ver_equipa\.asp\?equipa="))
-            away_link = away_cell.find("a", href=re.compile(r"ver_equipa\.asp\?equipa="))
-            home_id = re.search(r"equipa=(\d+)", home_link["href"]).group(1) if home_link else None
-            away_id = re.search(r"equipa=(\d+)", away_link["href"]).group(1) if away_link else None
-
-            home_name = home_cell.get_text(separator=" ", strip=True)
-            away_name = away_cell.get_text(separator=" ", strip=True)
-
+            date_str  = row["date_str"]
+            home_name = row["home_team_name"]
+            away_name = row["away_team_name"]
             fixtures.append({
-                "match_id":       match_id or f"{season}_{date_str}_{home_name}_{away_name}",
+                "match_id":       row["match_id"] or f"{season}_{date_str}_{home_name}_{away_name}",
                 "match_date":     self._parse_match_date(date_str),
-                "match_type":     match_type,
-                "home_team_id":   home_id,
+                "match_type":     row["match_type"],
+                "home_team_id":   row["home_team_id"],
                 "home_team_name": home_name,
-                "away_team_id":   away_id,
+                "away_team_id":   row["away_team_id"],
                 "away_team_name": away_name,
-                "result":         result_text,
+                "result":         row["result"],
                 "season":         season,
             })
 
@@ -15,6 +15,7 @@ from bs4 import BeautifulSoup
 
 from src.core.logger import logger
 from src.scrapers.base import BaseScraper
+from src.scrapers.parse_pool import ParsePool
 
 # Cup keywords in match_type to distinguish cup from league fixtures
 _CUP_KEYWORDS = ("cup", "taca", "taça", "copa", "national", "knockout")
@@ -27,7 +28,7 @@ class MatchReportScraper(BaseScraper):
     # Main entry                                                           #
     # ------------------------------------------------------------------ #
 
-    def scrape(self, match_id: str, fixture: dict) -> dict:
+    def scrape(self, match_id: str, fixture: dict, pool: ParsePool | None = None) -> dict:
         """Scrape full post-match report for one match.
 
         Args:
@@ -35,6 +36,8 @@ class MatchReportScraper(BaseScraper):
             fixture:  Row from upcoming_fixtures table (provides match_type,
                       result, home/away team IDs, home/away team names, season,
                       match_date).
+            pool:     Optional parse pool. The report page is parsed there
+                      while the browser fetches the matchday context.
 
         Returns:
             Dict matching the match_reports table schema.
@@ -50,10 +53,12 @@ class MatchReportScraper(BaseScraper):
             logger.warning("Screenshot failed for match %s: %s", match_id, exc)
             screenshot_bytes = None
 
-        soup = BeautifulSoup(self.page.content(), "html.parser")
+        pool = pool or ParsePool(workers=0)
+        pending = pool.submit(parse_match_report, self.page.content(), match_id, fixture)
+        matchday_results = self._scrape_matchday_context(fixture)
 
-        report = self._parse_report(soup, match_id, fixture)
-        report["league_matchday_results"] = self._scrape_matchday_context(fixture)
+        report = pending.result()
+        report["league_matchday_results"] = matchday_results
         # Prefixed with _ — pipeline writes this to disk, never upserted to DB
         report["_screenshot_bytes"] = screenshot_bytes
         return report
@@ -503,3 +508,14 @@ class MatchReportScraper(BaseScraper):
                     })
         logger.info("Scraped %d cup round results", len(results))
         return results
+
+
+def parse_match_report(html: str, match_id: str, fixture: dict) -> dict:
+    """Parse a ``relatorio.asp`` page into a match_reports row (no matchday context).
+
+    Pure counterpart of :meth:`MatchReportScraper.scrape`, safe to run in a
+    :class:`~src.scrapers.parse_pool.ParsePool` worker: the parsing helpers
+    never touch the browser, so an unstarted scraper instance is enough.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    return MatchReportScraper()._parse_report(soup, match_id, fixture)
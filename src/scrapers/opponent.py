@@ -7,10 +7,68 @@ profiles can be analysed for scouting purposes.
 
 import re
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from src.core.logger import logger
 from src.scrapers.base import BaseScraper
+from src.scrapers.parsers import parse_skill_table
+from src.scrapers.tables import (
+    ROW,
+    Column,
+    TablePlan,
+    int_or,
+    link_text,
+    table_soup,
+    text,
+    whole_document,
+)
+
+_PLAYER_LINK = re.compile(r"ver_jogador\.asp\?jog_id=\d+")
+
+
+def _roster_rows(soup: Tag) -> list[Tag]:
+    rows = soup.find_all("tr", class_=["list1", "list2"])
+    logger.info("Found %d rows in squad table.", len(rows))
+    if rows:
+        return rows
+
+    # Fallback: some team pages use different row classes. Walk up from
+    # each player link to its parent <tr> instead.
+    logger.info("No list1/list2 rows found — falling back to link-based detection.")
+    for lnk in soup.find_all("a", href=_PLAYER_LINK):
+        parent_tr = lnk.find_parent("tr")
+        if parent_tr and parent_tr not in rows:
+            rows.append(parent_tr)
+    logger.info("Fallback found %d rows via player links.", len(rows))
+    return rows
+
+
+def _player_id(row: Tag) -> str | None:
+    link = row.find("a", href=_PLAYER_LINK)
+    return link["href"].split("jog_id=")[-1] if link else None
+
+
+def _position(cell: Tag) -> str:
+    # Use separator to preserve space between tag text and adjacent text
+    # (e.g. <b>D</b> RLC → "D RLC")
+    return " ".join(cell.get_text(separator=" ", strip=True).split())
+
+
+# Rows with fewer than 12 cells still yield a player, just without details.
+ROSTER_PLAN = TablePlan(
+    name="opponent_roster",
+    tables=whole_document,
+    rows=_roster_rows,
+    unique="player_id",
+    columns=(
+        Column("player_id", ROW, _player_id, required=True),
+        Column("name",      ROW, link_text(_PLAYER_LINK.pattern)),
+        Column("age",       3,   int_or(0), default=0, min_cells=12),
+        Column("position",  1,   _position, default="", min_cells=12),
+        # Quality text follows the bar images in td[11]
+        Column("quality",   11,  text, default="", min_cells=12),
+    ),
+)
 
 
 class OpponentScraper(BaseScraper):
@@ -64,68 +122,7 @@ class OpponentScraper(BaseScraper):
         self.page.goto(team_url)
         self.page.wait_for_load_state("networkidle")
 
-        roster_soup = BeautifulSoup(self.page.content(), "html.parser")
-
-        players: list[dict] = []
-        seen_ids: set[str] = set()
-        rows = roster_soup.find_all("tr", class_=["list1", "list2"])
-        logger.info("Found %d rows in squad table.", len(rows))
-
-        # Fallback: some team pages use different row classes. Walk up from
-        # each player link to its parent <tr> instead.
-        if not rows:
-            logger.info("No list1/list2 rows found — falling back to link-based detection.")
-            all_links = roster_soup.find_all("a", href=re.compile(r"ver_jogador\.asp\?jog_id=\d+"))
-            rows = []
-            for lnk in all_links:
-                parent_tr = lnk.find_parent("tr")
-                if parent_tr and parent_tr not in rows:
-                    rows.append(parent_tr)
-            logger.info("Fallback found %d rows via player links.", len(rows))
-
-        for row in rows:
-            link = row.find("a", href=re.compile(r"ver_jogador\.asp\?jog_id=\d+"))
-            if not link:
-                continue
-            href = link["href"]
-            try:
-                pid = href.split("jog_id=")[-1]
-            except IndexError:
-                continue
-            if pid in seen_ids:
-                continue
-            seen_ids.add(pid)
-
-            name = link.get_text(strip=True)
-
-            tds = row.find_all("td")
-            if len(tds) >= 12:
-                # Position is in td[1]; use separator to preserve space between
-                # tag text and adjacent text (e.g. <b>D</b> RLC → "D RLC")
-                pos_raw = tds[1].get_text(separator=" ", strip=True)
-                position = " ".join(pos_raw.split())
-
-                age_raw = tds[3].get_text(strip=True)
-                try:
-                    age = int(age_raw)
-                except (ValueError, TypeError):
-                    age = 0
-
-                # Quality text follows the bar images in td[11]
-                quality = tds[11].get_text(strip=True)
-            else:
-                position = ""
-                age = 0
-                quality = ""
-
-            players.append({
-                "player_id": pid,
-                "name": name,
-                "age": age,
-                "position": position,
-                "quality": quality,
-            })
-
+        players = ROSTER_PLAN.extract(table_soup(self.page.content()))
         logger.info("Found %d unique players in team.", len(players))
         return team_name, players
 
@@ -152,20 +149,9 @@ class OpponentScraper(BaseScraper):
         soup = BeautifulSoup(self.page.content(), "html.parser")
         data: dict = {"id": player_id}
 
-        # Extract skill rows from the profile table (same pattern as TransferScraper)
-        for td in soup.find_all("td", class_=["list1", "list2"]):
-            b_tag = td.find("b")
-            if not b_tag:
-                continue
-            skill_name = b_tag.get_text(strip=True)
-            for sib in td.find_next_siblings("td"):
-                text = sib.get_text(strip=True)
-                if text.isdigit():
-                    data[skill_name] = int(text)
-                    break
-                if text and ("Fit" in text or "%" in text):
-                    data[skill_name] = text
-                    break
+        # Extract skill rows from the profile table (same parser as TransferScraper,
+        # minus its Fitness fallback)
+        data.update(parse_skill_table(soup, fitness_fallback=False))
 
         logger.debug("Scraped %d skill keys for player %s", len(data) - 1, player_id)
         return data
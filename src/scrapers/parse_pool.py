@@ -0,0 +1,89 @@
+"""
+Process pool for CPU-bound HTML parsing.
+
+BeautifulSoup parsing holds the GIL, so when it runs on the thread that
+drives Playwright every millisecond of parsing is added to wall-clock time.
+:class:`ParsePool` lets a scraper hand raw HTML to *pure* parse functions
+(module-level, picklable, no browser access) running in worker processes and
+keep fetching while they work::
+
+    with ParsePool() as pool:
+        futures = [pool.submit(parse_player_page, pid, *scraper.fetch_player_pages(pid))
+                   for pid in player_ids]
+        details = [f.result() for f in futures]
+
+With one CPU (or ``PARSE_WORKERS=0``) the pool parses inline and returns
+already-completed futures, so callers never need a second code path.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from src.config import config
+from src.core.logger import logger
+
+T = TypeVar("T")
+
+
+def default_workers() -> int:
+    """Return the worker count to use when none is configured.
+
+    One core is left for the browser-driving thread, so a single-CPU runner
+    gets ``0`` workers (inline parsing).
+    """
+    if config.PARSE_WORKERS is not None:
+        return max(config.PARSE_WORKERS, 0)
+    return max((os.cpu_count() or 1) - 1, 0)
+
+
+class ParsePool:
+    """Runs parse functions in worker processes, or inline when there are none."""
+
+    def __init__(self, workers: int | None = None) -> None:
+        """Create the pool; worker processes start lazily on first submit.
+
+        Args:
+            workers: Number of worker processes. ``None`` uses
+                :func:`default_workers`; ``0`` parses inline.
+        """
+        self.workers: int = default_workers() if workers is None else workers
+        self._executor: ProcessPoolExecutor | None = None
+        if self.workers > 0:
+            # "spawn" keeps workers clear of the Playwright threads and driver
+            # pipes that a fork of the scraping process would inherit.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info("Parse pool started with %d worker(s).", self.workers)
+
+    def submit(self, fn: Callable[..., T], *args: Any) -> Future[T]:
+        """Schedule ``fn(*args)`` and return its future immediately.
+
+        ``fn`` must be a module-level function and ``args`` picklable.
+        """
+        if self._executor is not None:
+            return self._executor.submit(fn, *args)
+
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def close(self) -> None:
+        """Wait for outstanding parses and stop the workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> ParsePool:
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        self.close()
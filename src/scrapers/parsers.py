@@ -0,0 +1,153 @@
+"""
+Pure HTML parsing helpers shared by several scrapers.
+
+Functions in this module never touch the browser: they take an already
+parsed :class:`~bs4.BeautifulSoup` tree and return plain Python values, so
+they can be reused across scrapers and exercised offline against saved pages.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+
+#: CSS classes used by PManager for the alternating rows of the profile skill table.
+SKILL_CELL_CLASSES: list[str] = ["list1", "list2"]
+
+#: Profile labels whose value is a text tier rather than a number.
+PROFILE_TIER_LABELS: tuple[str, ...] = ("Quality", "Potential", "Affected Quality")
+
+
+def _is_skill_value(text: str) -> bool:
+    """Return ``True`` if a stripped cell text looks like a skill value.
+
+    Numeric skills (``"15"``) and fitness strings (``"Fit"``, ``"94%"``) both
+    qualify; empty cells and bar-image cells do not.
+    """
+    return text.isdigit() or (bool(text) and ("Fit" in text or "%" in text))
+
+
+class _RowCells:
+    """Per-row cache of ``<td>`` children, their texts and next-value pointers.
+
+    Each ``<tr>`` is indexed at most once: cell texts are extracted a single
+    time and a right-to-left sweep records, for every cell, the position of
+    the first following cell that holds a skill value.  Looking up the value
+    for a label cell is then O(1) instead of rescanning its siblings.
+    """
+
+    __slots__ = ("cells", "texts", "next_value", "_pos")
+
+    def __init__(self, row: Tag) -> None:
+        self.cells: list[Tag] = row.find_all("td", recursive=False)
+        self.texts: list[str] = [cell.get_text(strip=True) for cell in self.cells]
+        self._pos: dict[int, int] = {id(cell): i for i, cell in enumerate(self.cells)}
+
+        self.next_value: list[int] = [-1] * len(self.cells)
+        nxt = -1
+        for i in range(len(self.cells) - 1, -1, -1):
+            self.next_value[i] = nxt
+            if _is_skill_value(self.texts[i]):
+                nxt = i
+
+    def position(self, td: Tag) -> int:
+        return self._pos[id(td)]
+
+
+class RowIndex:
+    """Lazily builds one :class:`_RowCells` per row touched during a parse."""
+
+    def __init__(self) -> None:
+        self._rows: dict[int, _RowCells] = {}
+
+    def row_for(self, td: Tag) -> _RowCells:
+        row = td.parent
+        key = id(row)
+        index = self._rows.get(key)
+        if index is None:
+            index = self._rows[key] = _RowCells(row)
+        return index
+
+
+def parse_skill_table(
+    soup: BeautifulSoup,
+    fitness_fallback: bool = True,
+    index: RowIndex | None = None,
+) -> dict[str, Any]:
+    """Extract skill name → value pairs from a ``ver_jogador.asp`` profile page.
+
+    Every ``list1``/``list2`` cell containing a ``<b>`` label is paired with
+    the first following cell in the same row whose text is a number (stored
+    as ``int``) or a fitness string (stored as-is).  Rows are indexed once,
+    so parsing is linear in the number of cells.
+
+    Args:
+        soup: Parsed profile page.
+        fitness_fallback: When ``True`` (default) a ``*Fitness*`` label with no
+            recognisable value falls back to the text of the next cell, which
+            is what :meth:`TransferScraper.get_player_details` has always done.
+        index: Row cache shared with other parsers run over the same page.
+
+    Returns:
+        Dict of skill name to ``int`` or fitness string.  Later duplicates of
+        the same label overwrite earlier ones, matching document order.
+    """
+    index = index or RowIndex()
+    skills: dict[str, Any] = {}
+
+    for td in soup.find_all("td", class_=SKILL_CELL_CLASSES):
+        b_tag = td.find("b")
+        if not b_tag:
+            continue
+        skill_name = b_tag.get_text(strip=True)
+
+        row = index.row_for(td)
+        i = row.position(td)
+        j = row.next_value[i]
+
+        if j >= 0:
+            text = row.texts[j]
+            skills[skill_name] = int(text) if text.isdigit() else text
+        elif fitness_fallback and "Fitness" in skill_name and i + 1 < len(row.cells):
+            skills[skill_name] = row.texts[i + 1]
+
+    return skills
+
+
+def parse_profile_tiers(
+    soup: BeautifulSoup,
+    skip: dict[str, Any] | None = None,
+    index: RowIndex | None = None,
+) -> dict[str, str]:
+    """Extract the Quality / Potential / Affected Quality tiers from a profile page.
+
+    Each label's value is the first non-empty cell after the label cell.
+
+    Args:
+        soup: Parsed profile page.
+        skip: Already-extracted data; labels present here are not looked up.
+        index: Row cache shared with other parsers run over the same page.
+
+    Returns:
+        Dict of label → tier text for every label found on the page.
+    """
+    index = index or RowIndex()
+    tiers: dict[str, str] = {}
+
+    for label in PROFILE_TIER_LABELS:
+        if skip and label in skip:
+            continue
+        b_tag = soup.find("b", string=label)
+        if not b_tag:
+            continue
+        parent = b_tag.find_parent("td")
+        if not parent:
+            continue
+        row = index.row_for(parent)
+        for text in row.texts[row.position(parent) + 1 :]:
+            if text:
+                tiers[label] = text
+                break
+
+    return tiers
@@ -9,14 +9,25 @@ squad table. Results are used to:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import Tag
 
 from src.config import config
 from src.core.logger import logger
+from src.core.tiers import tier_rank
 from src.scrapers.base import BaseScraper
+from src.scrapers.tables import (
+    Column,
+    TablePlan,
+    int_or,
+    link_param,
+    link_text,
+    rows_with_class,
+    table_soup,
+    text_sep,
+    whole_document,
+)
 
 # Maps the column order in the plantel.asp skills table to DB field names.
 SKILL_COLUMNS: list[str] = [
@@ -35,6 +46,42 @@ SKILL_COLUMNS: list[str] = [
 ]
 
 
+def _tier_or_none(cell: Tag) -> str | None:
+    raw = cell.get_text(strip=True)
+    return raw if raw and raw != "—" else None
+
+
+# filtro=1 layout: icon | position | name | age | country | 12 skills | squad | youth
+SQUAD_SKILLS_PLAN = TablePlan(
+    name="squad_skills",
+    tables=whole_document,
+    rows=rows_with_class("list1", "list2"),
+    min_cells=17,
+    columns=(
+        Column("player_id", 2, link_param("jog_id"), required=True),
+        Column("name",      2, link_text()),
+        # e.g. "GK", "D C", "M RC", "F L" — space-joined so the text after
+        # the bold main position is kept apart from it.
+        Column("position",  1, text_sep),
+        Column("age",       3, int_or(None)),
+        *(Column(skill, 5 + i, int_or(0)) for i, skill in enumerate(SKILL_COLUMNS)),
+    ),
+)
+
+# filtro=5 layout: icon | position | name+link | age | country | quality | potential | ...
+SQUAD_QUALITY_PLAN = TablePlan(
+    name="squad_quality",
+    tables=whole_document,
+    rows=rows_with_class("list1", "list2"),
+    min_cells=7,
+    columns=(
+        Column("player_id", 2, link_param("jog_id"), required=True),
+        Column("quality",   5, _tier_or_none),
+        Column("potential", 6, _tier_or_none),
+    ),
+)
+
+
 class SquadScraper(BaseScraper):
     """Scrapes the user's squad page and returns player + skill data."""
 
@@ -76,16 +123,7 @@ class SquadScraper(BaseScraper):
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
 
-        soup = BeautifulSoup(self.page.content(), "html.parser")
-        rows = soup.select("tr.list1, tr.list2")
-        logger.info("Found %d player rows in squad table", len(rows))
-
-        players: list[dict[str, Any]] = []
-        for row in rows:
-            record = self._parse_row(row)
-            if record:
-                players.append(record)
-
+        players = SQUAD_SKILLS_PLAN.extract(table_soup(self.page.content()))
         logger.info("Parsed %d valid squad players", len(players))
 
         # --- filtro=5: quality & potential ---
@@ -94,6 +132,8 @@ class SquadScraper(BaseScraper):
             extra = qp_map.get(p["player_id"], {})
             p["quality"] = extra.get("quality")
             p["potential"] = extra.get("potential")
+            p["quality_rank"] = tier_rank(p["quality"])
+            p["potential_rank"] = tier_rank(p["potential"])
 
         return players
 
@@ -109,30 +149,10 @@ class SquadScraper(BaseScraper):
         self.page.goto(url)
         self.page.wait_for_load_state("networkidle")
 
-        soup = BeautifulSoup(self.page.content(), "html.parser")
-        rows = soup.select("tr.list1, tr.list2")
-
-        result: dict[str, dict[str, str | None]] = {}
-        for row in rows:
-            cells = row.find_all("td")
-            if len(cells) < 7:
-                continue
-            link = cells[2].find("a")
-            if not link:
-                continue
-            href = link.get("href", "")
-            match = re.search(r"jog_id=(\d+)", href)
-            if not match:
-                continue
-            player_id = match.group(1)
-
-            quality_raw = cells[5].get_text(strip=True)
-            potential_raw = cells[6].get_text(strip=True)
-
-            result[player_id] = {
-                "quality": quality_raw if quality_raw and quality_raw != "—" else None,
-                "potential": potential_raw if potential_raw and potential_raw != "—" else None,
-            }
+        result: dict[str, dict[str, str | None]] = {
+            row.pop("player_id"): row
+            for row in SQUAD_QUALITY_PLAN.extract(table_soup(self.page.content()))
+        }
 
         logger.info("Parsed quality/potential for %d players", len(result))
         return result
@@ -146,45 +166,4 @@ class SquadScraper(BaseScraper):
         Returns:
             Player record dict, or ``None`` if the row is malformed.
         """
-        cells = row.find_all("td")
-        # Expected layout: icon | position | name | age | country | 12 skills | squad | youth
-        if len(cells) < 17:
-            return None
-
-        # Player ID and name (cell index 2)
-        link = cells[2].find("a")
-        if not link:
-            return None
-        href = link.get("href", "")
-        match = re.search(r"jog_id=(\d+)", href)
-        if not match:
-            return None
-        player_id = match.group(1)
-        name = link.get_text(strip=True)
-
-        # Position (cell index 1) — e.g. "GK", "D C", "M RC", "F L"
-        # Use separator=" " so inner whitespace between bold tag and subtype is kept.
-        position = cells[1].get_text(separator=" ", strip=True)
-
-        # Age (cell index 3)
-        try:
-            age = int(cells[3].get_text(strip=True))
-        except ValueError:
-            age = None
-
-        # Skills (cells 5 through 16)
-        skills: dict[str, Any] = {}
-        for i, skill_name in enumerate(SKILL_COLUMNS):
-            raw = cells[5 + i].get_text(strip=True)
-            try:
-                skills[skill_name] = int(raw)
-            except ValueError:
-                skills[skill_name] = 0
-
-        return {
-            "player_id": player_id,
-            "name": name,
-            "position": position,
-            "age": age,
-            **skills,
-        }
+        return SQUAD_SKILLS_PLAN.parse_row(row)
@@ -0,0 +1,333 @@
+"""
+Declarative table extraction for PManager's tabular pages.
+
+Most PManager pages are a table of ``<tr>`` rows whose ``<td>`` cells sit at
+fixed positions.  Rather than hand-coding a ``find_all("tr")`` /
+``find_all("td")`` loop per page, a scraper declares a :class:`TablePlan`
+once — which tables to read, which rows count as data, and a
+:class:`Column` per output key — and calls :meth:`TablePlan.extract`::
+
+    STANDINGS = TablePlan(
+        name="standings",
+        tables=tables_with_header("Points", "Pts"),
+        min_cells=9,
+        first_match=True,
+        columns=(
+            Column("position", 0, text_rstrip(".")),
+            Column("team", 1, text_sep),
+            Column("points", 9, to_int),
+        ),
+    )
+    rows = STANDINGS.extract(soup)
+
+Only the cells a plan names are read, each at most once, and every
+extraction is timed per plan (see :func:`table_timings`).
+
+:func:`table_soup` builds the tree with a :class:`~bs4.SoupStrainer` that
+keeps only ``<table>`` subtrees, so page chrome (menus, scripts, ads) is
+tokenised but never allocated as nodes.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from src.core.logger import logger
+
+#: Parser used for every tabular page.  ``html.parser`` is kept (rather than
+#: lxml) because all existing scrapers depend on its tree-building rules.
+PARSER_BACKEND: str = "html.parser"
+
+_TABLES_ONLY = SoupStrainer("table")
+
+#: Column index meaning "the coercer receives the whole ``<tr>``".
+ROW = None
+
+_timings: dict[str, dict[str, float]] = {}
+
+
+# ---------------------------------------------------------------------------
+# Soup construction
+# ---------------------------------------------------------------------------
+
+
+def table_soup(html: str) -> BeautifulSoup:
+    """Parse only the ``<table>`` subtrees of ``html``."""
+    return BeautifulSoup(html, PARSER_BACKEND, parse_only=_TABLES_ONLY)
+
+
+# ---------------------------------------------------------------------------
+# Cell coercers — each takes a <td> (or the <tr> for ROW columns)
+# ---------------------------------------------------------------------------
+
+
+def text(cell: Tag) -> str:
+    """Stripped cell text."""
+    return cell.get_text(strip=True)
+
+
+def text_sep(cell: Tag) -> str:
+    """Stripped cell text with child strings joined by a space."""
+    return cell.get_text(separator=" ", strip=True)
+
+
+def text_rstrip(chars: str) -> Callable[[Tag], str]:
+    """Space-joined cell text with trailing ``chars`` removed (``"1."`` → ``"1"``)."""
+    return lambda cell: cell.get_text(separator=" ", strip=True).rstrip(chars)
+
+
+def to_int(cell: Tag) -> int | None:
+    """Integer cell value (thousands commas allowed), ``None`` if not numeric."""
+    try:
+        return int(cell.get_text(separator=" ", strip=True).replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def to_float(cell: Tag) -> float | None:
+    """Float cell value (decimal comma allowed), ``None`` if not numeric."""
+    try:
+        return float(cell.get_text(separator=" ", strip=True).replace(",", ".").strip())
+    except ValueError:
+        return None
+
+
+def int_or(default: Any) -> Callable[[Tag], Any]:
+    """Integer cell value, or ``default`` when the text is not a plain integer."""
+
+    def coerce(cell: Tag) -> Any:
+        try:
+            return int(cell.get_text(strip=True))
+        except ValueError:
+            return default
+
+    return coerce
+
+
+def link_param(param: str, href_pattern: str | None = None) -> Callable[[Tag], str | None]:
+    """Numeric ``param`` from the cell's first link.
+
+    Args:
+        param: Query parameter to read, e.g. ``"jog_id"``.
+        href_pattern: Only consider links whose href matches this regex;
+            ``None`` takes the first ``<a>`` whatever it points to.
+    """
+    href_re = re.compile(href_pattern) if href_pattern else None
+    value_re = re.compile(rf"{re.escape(param)}=(\d+)")
+
+    def coerce(cell: Tag) -> str | None:
+        link = cell.find("a", href=href_re) if href_re else cell.find("a")
+        if not link:
+            return None
+        m = value_re.search(link.get("href", ""))
+        return m.group(1) if m else None
+
+    return coerce
+
+
+def link_text(href_pattern: str | None = None) -> Callable[[Tag], str | None]:
+    """Stripped text of the cell's first link (optionally one whose href matches)."""
+    href_re = re.compile(href_pattern) if href_pattern else None
+
+    def coerce(cell: Tag) -> str | None:
+        link = cell.find("a", href=href_re) if href_re else cell.find("a")
+        return link.get_text(strip=True) if link else None
+
+    return coerce
+
+
+# ---------------------------------------------------------------------------
+# Table locators and row selectors
+# ---------------------------------------------------------------------------
+
+
+def all_tables(soup: Tag) -> list[Tag]:
+    return soup.find_all("table")
+
+
+def whole_document(soup: Tag) -> list[Tag]:
+    """Treat the whole page as one table (rows are matched anywhere)."""
+    return [soup]
+
+
+def tables_with_header(*names: str) -> Callable[[Tag], Iterator[Tag]]:
+    """Tables having a ``<th>`` whose text equals one of ``names``."""
+    wanted = set(names)
+
+    def locate(soup: Tag) -> Iterator[Tag]:
+        for table in soup.find_all("table"):
+            if any(th.get_text(strip=True) in wanted for th in table.find_all("th")):
+                yield table
+
+    return locate
+
+
+def table_with_class(css_class: str) -> Callable[[Tag], list[Tag]]:
+    """The first table carrying ``css_class`` (none if absent)."""
+
+    def locate(soup: Tag) -> list[Tag]:
+        table = soup.find("table", class_=css_class)
+        return [table] if table else []
+
+    return locate
+
+
+def nth_table(i: int) -> Callable[[Tag], list[Tag]]:
+    """The ``i``-th table in the document (none if there are fewer)."""
+
+    def locate(soup: Tag) -> list[Tag]:
+        tables = soup.find_all("table")
+        return [tables[i]] if i < len(tables) else []
+
+    return locate
+
+
+def rows_after_header(table: Tag) -> list[Tag]:
+    """Every ``<tr>`` in the table except the first (header) row."""
+    return table.find_all("tr")[1:]
+
+
+def rows_with_class(*classes: str) -> Callable[[Tag], list[Tag]]:
+    """Every ``<tr>`` carrying one of ``classes`` (PManager uses ``list1``/``list2``)."""
+    class_list = list(classes)
+    return lambda table: table.find_all("tr", class_=class_list)
+
+
+# ---------------------------------------------------------------------------
+# Plans
+# ---------------------------------------------------------------------------
+
+
+def _cells_needed(index: int | None) -> int:
+    if index is None:
+        return 0
+    return index + 1 if index >= 0 else -index
+
+
+@dataclass(frozen=True)
+class Column:
+    """One output key read from a fixed cell position.
+
+    Attributes:
+        key: Output dict key.
+        index: Cell position (negative counts from the end), or :data:`ROW`
+            to pass the whole row.
+        coerce: Converts the cell (or row) into the output value.
+        default: Value used when the row has fewer than ``min_cells`` cells.
+        min_cells: Cells the row needs for this column to be read; defaults to
+            the smallest count for which ``index`` exists.
+        required: Skip the row when the coerced value is ``None``.
+    """
+
+    key: str
+    index: int | None
+    coerce: Callable[[Tag], Any] = text
+    default: Any = None
+    min_cells: int | None = None
+    required: bool = False
+
+
+@dataclass(frozen=True)
+class TablePlan:
+    """A compiled description of how to turn a page's table into row dicts.
+
+    Attributes:
+        name: Label used for timings and log lines.
+        columns: Output columns, in output key order.
+        tables: Returns the candidate tables (or the whole soup) to read.
+        rows: Returns the data rows of one table.
+        min_cells: Rows with fewer ``<td>`` cells are skipped.
+        first_match: Stop after the first table that yields any row.
+        unique: Drop later rows repeating this key's value.
+    """
+
+    name: str
+    columns: tuple[Column, ...]
+    tables: Callable[[Tag], Iterable[Tag]] = all_tables
+    rows: Callable[[Tag], Iterable[Tag]] = rows_after_header
+    min_cells: int = 0
+    first_match: bool = False
+    unique: str | None = None
+    _compiled: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        compiled = tuple(
+            (
+                col.key,
+                col.index,
+                col.coerce,
+                col.default,
+                col.min_cells if col.min_cells is not None else _cells_needed(col.index),
+                col.required,
+            )
+            for col in self.columns
+        )
+        object.__setattr__(self, "_compiled", compiled)
+
+    def parse_row(self, row: Tag) -> dict[str, Any] | None:
+        """Apply the column map to one ``<tr>``; ``None`` if the row is skipped."""
+        cells = row.find_all("td")
+        n = len(cells)
+        if n < self.min_cells:
+            return None
+
+        record: dict[str, Any] = {}
+        for key, index, coerce, default, need, required in self._compiled:
+            if index is ROW:
+                value = coerce(row)
+            elif n < need:
+                value = default
+            else:
+                value = coerce(cells[index])
+            if required and value is None:
+                return None
+            record[key] = value
+        return record
+
+    def iter_rows(self, soup: Tag) -> Iterator[dict[str, Any]]:
+        """Yield one dict per accepted data row, in document order."""
+        seen: set[Any] = set()
+        for table in self.tables(soup):
+            produced = False
+            for row in self.rows(table):
+                record = self.parse_row(row)
+                if record is None:
+                    continue
+                if self.unique is not None:
+                    value = record[self.unique]
+                    if value in seen:
+                        continue
+                    seen.add(value)
+                produced = True
+                yield record
+            if produced and self.first_match:
+                return
+
+    def extract(self, soup: Tag) -> list[dict[str, Any]]:
+        """Return all rows as a list, recording the parse time for this plan."""
+        t0 = time.perf_counter()
+        rows = list(self.iter_rows(soup))
+        elapsed = time.perf_counter() - t0
+
+        stats = _timings.setdefault(self.name, {"calls": 0, "rows": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["rows"] += len(rows)
+        stats["seconds"] += elapsed
+        logger.debug("Table %s: %d rows in %.1f ms", self.name, len(rows), elapsed * 1000)
+        return rows
+
+
+def table_timings() -> dict[str, dict[str, float]]:
+    """Return cumulative ``{plan name: {calls, rows, seconds}}`` for this process."""
+    return {name: dict(stats) for name, stats in _timings.items()}
+
+
+def reset_table_timings() -> None:
+    """Clear the cumulative per-plan timings."""
+    _timings.clear()
@@ -5,14 +5,35 @@ Provides :class:`TransferScraper` which walks the global transfer market,
 collects player IDs, and extracts per-player financial and skill data.
 """
 
+import queue
 import re
-from typing import Any
+import threading
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+from urllib.parse import quote
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
+from src import constants
 from src.core.logger import logger
+from src.core.tiers import tier_rank
 from src.core.utils import clean_currency
 from src.scrapers.base import BaseScraper
+from src.scrapers.parsers import RowIndex, parse_profile_tiers, parse_skill_table
+from src.scrapers.tables import (
+    Column,
+    TablePlan,
+    int_or,
+    link_param,
+    link_text,
+    table_soup,
+    text,
+    text_sep,
+    whole_document,
+)
 
 
 class TransferScraper(BaseScraper):
@@ -34,7 +55,8 @@ class TransferScraper(BaseScraper):
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _get_val(self, soup: BeautifulSoup, label: str, is_curr: bool = True) -> Any:
+    @staticmethod
+    def _get_val(soup: BeautifulSoup, label: str, is_curr: bool = True) -> Any:
         """Extract a table-cell value that follows a label cell.
 
         Searches ``soup`` for a text node matching ``label``, then returns the
@@ -77,15 +99,100 @@ class TransferScraper(BaseScraper):
         Returns:
             Deduplicated list of player ID strings found across all pages.
         """
+        unique_players = [row["id"] for row in self.iter_transfer_list(search_url, max_pages)]
+        logger.info("Total unique players found: %d", len(unique_players))
+        return unique_players
+
+    def iter_transfer_list(
+        self, search_url: str | None = None, max_pages: int = 150
+    ) -> Iterator[dict[str, Any]]:
+        """Yield transfer market listing rows as result pages arrive.
+
+        Result pages are fetched concurrently over HTTP with the browser's
+        session (see :func:`crawl_listing_pages`) on a background thread, so
+        the caller can keep using :attr:`page` meanwhile.  A search with more
+        than ``max_pages`` pages is swept in slices that each fit
+        (:func:`sweep_listing_pages`), so no listing is cut off.  If the HTTP
+        session gets no results, the listing is walked page by page in the
+        browser instead, up to ``max_pages``.
+
+        Args:
+            search_url: Custom search URL. Falls back to the full-market
+                :attr:`SEARCH_URL_TEMPLATE` when omitted.
+            max_pages: Page cap of a single search (the site's limit).
+
+        Yields:
+            Each player's :func:`parse_listing_page` row once, in page order
+            within a page.
+        """
         if search_url:
             logger.info("Navigating to Custom Search: %s", search_url)
-            current_url = search_url
         else:
             logger.info("Navigating to ALL players search...")
-            current_url = self.SEARCH_URL_TEMPLATE
+            search_url = self.SEARCH_URL_TEMPLATE
+
+        session = self.http_session()
+
+        def fetch(url: str) -> str:
+            resp = session.get(url, timeout=constants.HTTP_TIMEOUT_SECONDS)
+            resp.raise_for_status()
+            return resp.text
 
+        try:
+            first_html = fetch(listing_page_url(search_url, 1))
+        except Exception as e:
+            logger.warning("HTTP listing fetch failed (%s); walking pages in the browser.", e)
+            first_html = ""
+
+        first_rows, _ = parse_listing_page(first_html)
+        if not first_rows:
+            logger.warning("HTTP listing returned no results; walking pages in the browser.")
+            yield from self._walk_transfer_list(search_url, max_pages)
+            return
+
+        yield from _in_background(
+            sweep_listing_pages(fetch, search_url, max_pages=max_pages, first_html=first_html)
+        )
+
+    def search_profiles(
+        self, searches: dict[str, str], max_pages: int = 150
+    ) -> list[dict[str, Any]]:
+        """Collect the listings of several named searches in one pass.
+
+        The searches are swept concurrently over HTTP with the browser's
+        session (:func:`sweep_search_profiles`) and their rows merged by
+        ``id``, so a player matched by several searches is listed once.  If
+        the HTTP session gets no results, each search is walked in the
+        browser instead, one after the other.
+
+        Args:
+            searches: Search profile name → search URL.
+            max_pages: Page cap of a single search.
+
+        Returns:
+            Listing rows, each with the ``search_profiles`` it matched.
+        """
+        logger.info("Searching profiles: %s", ", ".join(searches))
+        # The session reads the browser's cookies: build it on this thread.
+        session = self.http_session()
+
+        def fetch(url: str) -> str:
+            resp = session.get(url, timeout=constants.HTTP_TIMEOUT_SECONDS)
+            resp.raise_for_status()
+            return resp.text
+
+        rows = sweep_search_profiles(fetch, searches, max_pages=max_pages)
+        if rows:
+            return rows
+        logger.warning("HTTP listing returned no results; walking profiles in the browser.")
+        return merge_profile_rows(
+            {name: self._walk_transfer_list(url, max_pages) for name, url in searches.items()}
+        )
+
+    def _walk_transfer_list(self, current_url: str, max_pages: int) -> Iterator[dict[str, Any]]:
+        """Serial fallback: follow each page's ``&pid=`` link in the browser."""
         page_num = 1
-        all_players: list[str] = []
+        seen: set[str] = set()
 
         while page_num <= max_pages:
             logger.info("Scraping page %d...", page_num)
@@ -93,25 +200,17 @@ class TransferScraper(BaseScraper):
             self.page.wait_for_load_state("networkidle")
 
             content = self.page.content()
-            soup = BeautifulSoup(content, "html.parser")
-
-            links = soup.find_all("a", href=re.compile(r"comprar_jog_lista\.asp\?jg_id="))
-            page_players: list[str] = []
-            for link in links:
-                try:
-                    href = link["href"]
-                    # Use [-1] to safely handle any extra query params after jg_id=
-                    player_id = href.split("jg_id=")[-1]
-                    page_players.append(player_id)
-                except (KeyError, IndexError):
-                    continue
-
-            unique_on_page = list(set(page_players))
-            logger.info("  Found %d players on page %d.", len(unique_on_page), page_num)
-            all_players.extend(unique_on_page)
+            page_rows, _ = parse_listing_page(content)
+            logger.info("  Found %d players on page %d.", len(page_rows), page_num)
+            for row in page_rows:
+                if row["id"] not in seen:
+                    seen.add(row["id"])
+                    yield row
 
             next_page_pid = page_num + 1
-            next_link = soup.find("a", href=re.compile(f"&pid={next_page_pid}"))
+            next_link = BeautifulSoup(content, "html.parser").find(
+                "a", href=re.compile(f"&pid={next_page_pid}")
+            )
 
             if next_link:
                 href = next_link["href"]
@@ -121,144 +220,69 @@ class TransferScraper(BaseScraper):
                 logger.info("No next page found. Stopping.")
                 break
 
-        unique_players = list(set(all_players))
-        logger.info("Total unique players found: %d", len(unique_players))
-        return unique_players
-
-    def get_player_details(self, player_id: str) -> dict[str, Any]:
-        """Scrape comprehensive data for a single player.
+    def fetch_player_pages(self, player_id: str) -> tuple[str, str]:
+        """Load the negotiation and profile pages for a player.
 
-        Visits two pages per player:
-        1. The negotiation page (``comprar_jog_lista.asp``) for financials.
-        2. The profile page (``ver_jogador.asp``) for skills and attributes.
+        Only the browser work of :meth:`get_player_details`; pass the result
+        to :func:`parse_player_page`, possibly in a
+        :class:`~src.scrapers.parse_pool.ParsePool` worker.
 
         Args:
             player_id: Numeric player ID string from PManager.
 
         Returns:
-            Dictionary with keys: ``id``, ``url``, ``estimated_value``,
-            ``asking_price``, ``deadline``, ``bids_count``, ``bids_avg``,
-            ``name``, ``position``, ``age``, ``nationality``, plus any skill
-            names scraped from the profile page.
+            ``(negotiation_html, profile_html)``.
         """
-        data: dict[str, Any] = {
-            "id": player_id,
-            "url": f"{self.base_url}/ver_jogador.asp?jog_id={player_id}",
-        }
+        neg_html = self.fetch_negotiation_page(player_id)
 
-        # --- PART 1: Financials (Negotiation Page) ---
-        neg_url = f"{self.base_url}/comprar_jog_lista.asp?jg_id={player_id}"
-        self.page.goto(neg_url)
+        self.page.goto(f"{self.base_url}/ver_jogador.asp?jog_id={player_id}")
         try:
-            self.page.wait_for_selector("body", timeout=3000)
+            self.page.wait_for_selector("div#infos", timeout=3000)
         except Exception as e:
-            logger.debug("Timeout waiting for negotiation page body (%s): %s", player_id, e)
+            logger.debug("Timeout waiting for profile page infos (%s): %s", player_id, e)
+        profile_html = self.page.content()
 
-        soup_neg = BeautifulSoup(self.page.content(), "html.parser")
+        return neg_html, profile_html
 
-        data["estimated_value"] = 0
-        data["asking_price"] = 0
-        data["deadline"] = "N/A"
-        data["bids_count"] = "0"
-        data["bids_avg"] = "0"
+    def fetch_negotiation_page(self, player_id: str) -> str:
+        """Load only the negotiation page for a player.
 
-        try:
-            data["estimated_value"] = self._get_val(soup_neg, "Estimated Transfer Value") or 0
-            data["asking_price"] = self._get_val(soup_neg, "Asking Price for Bid") or 0
-
-            deadline_node = soup_neg.find(string="Deadline")
-            if deadline_node:
-                deadline_parent = deadline_node.find_parent("td")
-                if deadline_parent:
-                    deadline_td = deadline_parent.find_next_sibling("td")
-                    if deadline_td:
-                        data["deadline"] = deadline_td.get_text(strip=True, separator=" ")
-
-            bids_node = soup_neg.find(string="Bids")
-            if bids_node:
-                bids_parent = bids_node.find_parent("td")
-                if bids_parent:
-                    bids_td = bids_parent.find_next_sibling("td")
-                    if bids_td:
-                        data["bids_count"] = bids_td.get_text(strip=True)
-
-            bids_avg_node = soup_neg.find(string="Bids Average (Scout)")
-            if bids_avg_node:
-                bids_avg_parent = bids_avg_node.find_parent("td")
-                if bids_avg_parent:
-                    bids_avg_td = bids_avg_parent.find_next_sibling("td")
-                    if bids_avg_td:
-                        data["bids_avg"] = bids_avg_td.get_text(strip=True)
+        Enough for a financials-only refresh (see
+        :func:`parse_listing_financials`) when the player's profile skills
+        are already fresh in the database.
 
-        except Exception as e:
-            logger.error("Error scraping financials for %s: %s", player_id, e, exc_info=True)
+        Args:
+            player_id: Numeric player ID string from PManager.
 
-        # --- PART 2: Skills (Profile Page) ---
-        profile_url = data["url"]
-        self.page.goto(profile_url)
+        Returns:
+            The negotiation page HTML.
+        """
+        neg_url = f"{self.base_url}/comprar_jog_lista.asp?jg_id={player_id}"
+        self.page.goto(neg_url)
         try:
-            self.page.wait_for_selector("div#infos", timeout=3000)
+            self.page.wait_for_selector("body", timeout=3000)
         except Exception as e:
-            logger.debug("Timeout waiting for profile page infos (%s): %s", player_id, e)
+            logger.debug("Timeout waiting for negotiation page body (%s): %s", player_id, e)
+        return self.page.content()
 
-        soup = BeautifulSoup(self.page.content(), "html.parser")
+    def get_player_details(self, player_id: str) -> dict[str, Any]:
+        """Scrape comprehensive data for a single player.
 
-        def get_general_info(label: str) -> str:
-            b_tag = soup.find("b", string=label)
-            if b_tag:
-                parent = b_tag.find_parent("td")
-                if parent:
-                    value_td = parent.find_next_sibling("td", class_="team_players")
-                    if value_td:
-                        return value_td.get_text(strip=True)
-                    next_td = parent.find_next_sibling("td")
-                    if next_td and not next_td.get_text(strip=True):
-                        value_td = next_td.find_next_sibling("td")
-                        if value_td:
-                            return value_td.get_text(strip=True)
-            return "N/A"
-
-        name_font = soup.find("font", size="+1")
-        data["name"] = name_font.get_text(strip=True) if name_font else "N/A"
-        data["position"] = get_general_info("Position")
-        data["age"] = get_general_info("Age").replace("Years", "").strip()
-        data["nationality"] = get_general_info("Nationality")
-
-        potential_skill_rows = soup.find_all("td", class_=["list1", "list2"])
-        for td in potential_skill_rows:
-            b_tag = td.find("b")
-            if b_tag:
-                skill_name = b_tag.get_text(strip=True)
-                siblings = td.find_next_siblings("td")
-                skill_value = None
-
-                for sib in siblings:
-                    text = sib.get_text(strip=True)
-                    if text.isdigit():
-                        skill_value = int(text)
-                        break
-                    if not skill_value and text and ("Fit" in text or "%" in text):
-                        skill_value = text
-                        break
-
-                if skill_value is not None:
-                    data[skill_name] = skill_value
-                elif "Fitness" in skill_name and siblings:
-                    data[skill_name] = siblings[0].get_text(strip=True)
-
-        for label in ["Quality", "Potential", "Affected Quality"]:
-            if label not in data:
-                b_tag = soup.find("b", string=label)
-                if b_tag:
-                    parent = b_tag.find_parent("td")
-                    if parent:
-                        for sib in parent.find_next_siblings("td"):
-                            txt = sib.get_text(strip=True)
-                            if txt:
-                                data[label] = txt
-                                break
+        Visits two pages per player:
+        1. The negotiation page (``comprar_jog_lista.asp``) for financials.
+        2. The profile page (``ver_jogador.asp``) for skills and attributes.
 
-        return data
+        Args:
+            player_id: Numeric player ID string from PManager.
+
+        Returns:
+            Dictionary with keys: ``id``, ``url``, ``estimated_value``,
+            ``asking_price``, ``deadline``, ``bids_count``, ``bids_avg``,
+            ``name``, ``position``, ``age``, ``nationality``, plus any skill
+            names scraped from the profile page.
+        """
+        neg_html, profile_html = self.fetch_player_pages(player_id)
+        return parse_player_page(player_id, neg_html, profile_html, self.base_url)
 
     def get_player_history(self, player_id: str) -> float:
         """Scrape the most recent transfer price from the player's history page.
@@ -278,29 +302,56 @@ class TransferScraper(BaseScraper):
                 self.page.wait_for_selector("div#tabela_titulo", timeout=3000)
             except Exception as e:
                 logger.debug("Timeout waiting for history page (%s): %s", player_id, e)
-
-            soup = BeautifulSoup(self.page.content(), "html.parser")
-
-            transfers_header = None
-            for div in soup.find_all("div", id="tabela_titulo"):
-                if "Transfers" in div.get_text(strip=True):
-                    transfers_header = div
-                    break
-
-            if transfers_header:
-                transfers_table = transfers_header.find_next("table", class_="table_border")
-                if transfers_table:
-                    rows = transfers_table.find_all("tr", class_=["list1", "list2"])
-                    if rows:
-                        cols = rows[0].find_all("td")
-                        if len(cols) >= 4:
-                            return clean_currency(cols[3].get_text(strip=True))
-
+            return parse_history_page(self.page.content())
         except Exception as e:
             logger.error("Error scraping history for %s: %s", player_id, e, exc_info=True)
 
         return 0.0
 
+    def iter_final_prices(
+        self, player_ids: Iterable[str], workers: int = constants.HISTORY_FETCH_WORKERS
+    ) -> Iterator[tuple[str, float]]:
+        """Yield the most recent transfer price of many players.
+
+        History pages are fetched concurrently over HTTP with the browser's
+        session and parsed with :func:`parse_history_page` on the worker
+        threads.  A player whose HTTP fetch fails is retried with
+        :meth:`get_player_history` in the browser, on the calling thread.
+
+        Args:
+            player_ids: Players to look up.
+            workers: Concurrent HTTP requests.
+
+        Yields:
+            ``(player_id, price)`` as pages arrive; price is ``0.0`` when the
+            history shows no transfer.
+        """
+        ids = [str(pid) for pid in player_ids]
+        if not ids:
+            return
+        session = self.http_session()
+
+        def fetch(player_id: str) -> float:
+            resp = session.get(
+                f"{self.base_url}/marcos_jog.asp?jog_id={player_id}",
+                timeout=constants.HTTP_TIMEOUT_SECONDS,
+            )
+            resp.raise_for_status()
+            return parse_history_page(resp.text)
+
+        retry: list[str] = []
+        with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="history") as pool:
+            futures = {pool.submit(fetch, pid): pid for pid in ids}
+            for future in as_completed(futures):
+                pid = futures[future]
+                try:
+                    yield pid, future.result()
+                except Exception as e:
+                    logger.debug("HTTP history fetch failed for %s (%s); using the browser", pid, e)
+                    retry.append(pid)
+        for pid in retry:
+            yield pid, self.get_player_history(pid)
+
     def get_bid_info(self, player_id: str) -> dict[str, Any]:
         """Quickly fetch current bid and listing data for a player.
 
@@ -360,3 +411,714 @@ class TransferScraper(BaseScraper):
             logger.error("Error scraping bid info for %s: %s", player_id, e, exc_info=True)
 
         return data
+
+
+# ---------------------------------------------------------------------------
+# Listing pages
+# ---------------------------------------------------------------------------
+
+_PLAYER_LINK = re.compile(r"comprar_jog_lista\.asp\?jg_id=")
+_PAGE_PARAM = re.compile(r"([?&]pid=)(\d+)")
+# Raw page HTML escapes "&" in hrefs as "&amp;".
+_PAGER_PID = re.compile(r"[?&;]pid=(\d+)")
+_DONE = object()
+
+
+def _listing_rows(table: Tag) -> list[Tag]:
+    """Result rows: those whose own first cell links to a negotiation page."""
+    rows = []
+    for tr in table.find_all("tr"):
+        first = tr.find("td", recursive=False)
+        # A layout row wrapping the whole result table also "contains" links.
+        if first and first.find("table") is None and first.find("a", href=_PLAYER_LINK):
+            rows.append(tr)
+    return rows
+
+
+def _currency(cell: Tag) -> float:
+    return clean_currency(cell.get_text(strip=True))
+
+
+def _flag_country(cell: Tag) -> str | None:
+    flag = cell.find("img")
+    if not flag:
+        return None
+    return flag.get("title") or flag.get("alt") or None
+
+
+# Name | Nat | Pos | Age | Quality | Potential | Asking Price | Deadline | Bids
+LISTING_PLAN = TablePlan(
+    name="transfer_listing",
+    tables=whole_document,
+    rows=_listing_rows,
+    unique="id",
+    columns=(
+        Column("id",           0, link_param("jg_id", _PLAYER_LINK.pattern), required=True),
+        Column("name",         0, link_text(_PLAYER_LINK.pattern)),
+        Column("nationality",  1, _flag_country),
+        Column("position",     2, text_sep),
+        Column("age",          3, int_or(None)),
+        Column("Quality",      4, text),
+        Column("Potential",    5, text),
+        Column("asking_price", 6, _currency),
+        Column("deadline",     7, text_sep),
+        Column("bids_count",   8, text),
+    ),
+)
+
+
+def listing_page_url(search_url: str, page_num: int) -> str:
+    """Return ``search_url`` pointing at result page ``page_num``."""
+    if _PAGE_PARAM.search(search_url):
+        return _PAGE_PARAM.sub(rf"\g<1>{page_num}", search_url, count=1)
+    sep = "&" if "?" in search_url else "?"
+    return f"{search_url}{sep}pid={page_num}"
+
+
+def with_search_filter(search_url: str, field: str, op: str, value: Any) -> str:
+    """Return ``search_url`` with ``field`` filtered as ``field <op> value``.
+
+    Args:
+        search_url: A ``procurar.asp`` search URL.
+        field: Search field, e.g. ``"pre"`` (price) or ``"qual"`` (quality).
+        op: Comparison operator: ``<``, ``<=``, ``>`` or ``>=``.
+        value: Filter value; ``"Any"`` removes the filter.
+
+    Returns:
+        The URL with ``<field>_op`` and ``<field>`` replaced, or appended if
+        the URL has no such parameters.
+    """
+    for name, new in ((f"{field}_op", quote(op, safe="")), (field, quote(str(value), safe=""))):
+        param = re.compile(rf"([?&]{re.escape(name)}=)[^&]*")
+        if param.search(search_url):
+            search_url = param.sub(lambda m: m.group(1) + new, search_url, count=1)
+        else:
+            sep = "&" if "?" in search_url else "?"
+            search_url = f"{search_url}{sep}{name}={new}"
+    return search_url
+
+
+def search_filter_value(search_url: str, field: str) -> str | None:
+    """Return ``field``'s value in ``search_url``, or ``None`` if unfiltered (``Any``)."""
+    m = re.search(rf"[?&]{re.escape(field)}=([^&]*)", search_url)
+    return m.group(1) if m and m.group(1) not in ("", "Any") else None
+
+
+def parse_listing_page(html: str) -> tuple[list[dict[str, Any]], int]:
+    """Extract the result rows and the highest linked page from a search page.
+
+    Args:
+        html: Raw ``procurar.asp`` result page HTML.
+
+    Returns:
+        ``(rows, last_page)`` — one dict per listed player in page order
+        (``id``, ``name``, ``nationality``, ``position``, ``age``,
+        ``Quality``, ``Potential``, ``asking_price``, raw ``deadline`` text
+        and ``bids_count``), and the
+        largest ``pid=`` linked from the page (``0`` if there is no pager).
+    """
+    rows = LISTING_PLAN.extract(table_soup(html))
+    last_page = max((int(m) for m in _PAGER_PID.findall(html)), default=0)
+    return rows, last_page
+
+
+def crawl_listing_pages(
+    fetch: Callable[[int], str],
+    max_pages: int = 150,
+    workers: int = constants.LISTING_FETCH_WORKERS,
+    first_html: str | None = None,
+    stats: dict[str, Any] | None = None,
+    pages: Mapping[int, str] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Fetch result pages concurrently and yield each new listing row once.
+
+    Page 1's pager gives the pages known to exist; every page fetched after
+    it can reveal further pages (PManager shows a window of page links), which
+    are scheduled as soon as they are seen.  Pages are built directly with
+    :func:`listing_page_url` rather than followed link by link.
+
+    Args:
+        fetch: Returns the HTML of result page ``n``; called from worker threads.
+        max_pages: Upper bound on the number of result pages to fetch.
+        workers: Concurrent fetches.
+        first_html: Page 1 HTML if the caller already has it.
+        stats: If given, ``stats["truncated"]`` is set to whether a page
+            linked beyond ``max_pages`` (the listing was cut short).
+        pages: HTML of any other pages the caller already has, by number;
+            they are parsed instead of fetched again.
+
+    Yields:
+        :func:`parse_listing_page` row dicts, deduplicated by ``id`` across
+        pages, as pages complete.
+    """
+    seen: set[str] = set()
+
+    def fresh(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        new = [row for row in rows if row["id"] not in seen]
+        seen.update(row["id"] for row in new)
+        return new
+
+    fetched = dict(pages or {})
+    if first_html is not None:
+        fetched[1] = first_html
+
+    def load(page_num: int) -> tuple[list[dict[str, Any]], int]:
+        html = fetched.pop(page_num, None)
+        return parse_listing_page(html if html is not None else fetch(page_num))
+
+    rows, last_page = load(1)
+    logger.info("  Found %d players on page 1.", len(rows))
+    yield from fresh(rows)
+
+    scheduled = 1
+    truncated = last_page > max_pages
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="listing") as pool:
+        pending: dict[Future, int] = {}
+
+        def schedule_up_to(page_num: int) -> None:
+            nonlocal scheduled, truncated
+            truncated = truncated or page_num > max_pages
+            for n in range(scheduled + 1, min(page_num, max_pages) + 1):
+                pending[pool.submit(load, n)] = n
+            scheduled = max(scheduled, min(page_num, max_pages))
+
+        schedule_up_to(last_page)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            # Pages that finished together are handled in page order.
+            for future in sorted(done, key=pending.__getitem__):
+                page_num = pending.pop(future)
+                try:
+                    rows, last_page = future.result()
+                except Exception as e:
+                    logger.error("Failed to fetch listing page %d: %s", page_num, e)
+                    continue
+                logger.info("  Found %d players on page %d.", len(rows), page_num)
+                schedule_up_to(last_page)
+                yield from fresh(rows)
+
+    if stats is not None:
+        stats["truncated"] = truncated
+    logger.info("Fetched %d listing pages, %d unique players.", scheduled, len(seen))
+
+
+#: Search fields a sweep may split on, and how to read each from a listing row.
+_SPLIT_FIELDS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "qual": lambda row: tier_rank(row.get("Quality")),
+    "idd": lambda row: row.get("age"),
+    "pre": lambda row: row.get("asking_price"),
+    "prog": lambda row: tier_rank(row.get("Potential")),
+}
+
+
+@dataclass(frozen=True)
+class SearchPartition:
+    """One slice of a search: extra ``(field, op, value)`` filters on top of it.
+
+    The search form takes one operator per field, so a slice is split in
+    two on a field it does not filter yet: ``field <= t`` and ``field > t``.
+    The two halves are disjoint and together cover the slice.
+    """
+
+    filters: tuple[tuple[str, str, int], ...] = ()
+
+    def url(self, search_url: str) -> str:
+        """``search_url`` restricted to this slice."""
+        for field, op, value in self.filters:
+            search_url = with_search_filter(search_url, field, op, value)
+        return search_url
+
+    def split(
+        self, rows: list[dict[str, Any]], search_url: str
+    ) -> "tuple[SearchPartition, SearchPartition] | None":
+        """Split into two halves, balanced on the rows seen so far.
+
+        Every field neither this slice nor ``search_url`` filters on is tried
+        at the median of its row values; the most even split wins.
+
+        Args:
+            rows: Listing rows fetched from this slice (a sample when it was
+                truncated).
+            search_url: The search being swept.
+
+        Returns:
+            ``(lower, upper)``, or ``None`` if no field can split the rows.
+        """
+        used = {field for field, _, _ in self.filters}
+        best: tuple[int, str, int] | None = None
+        for field, value_of in _SPLIT_FIELDS.items():
+            if field in used or search_filter_value(search_url, field) is not None:
+                continue
+            values = sorted(int(v) for v in map(value_of, rows) if v is not None)
+            if not values:
+                continue
+            threshold = values[(len(values) - 1) // 2]
+            below = bisect_right(values, threshold)
+            balance = min(below, len(values) - below)
+            if balance and (best is None or balance > best[0]):
+                best = (balance, field, threshold)
+        if best is None:
+            return None
+        _, field, threshold = best
+        return (
+            SearchPartition(self.filters + ((field, "<=", threshold),)),
+            SearchPartition(self.filters + ((field, ">", threshold),)),
+        )
+
+    def __str__(self) -> str:
+        return " & ".join(f"{field}{op}{value}" for field, op, value in self.filters) or "all"
+
+
+def sweep_listing_pages(
+    fetch: Callable[[str], str],
+    search_url: str,
+    max_pages: int = 150,
+    workers: int = constants.SWEEP_WORKERS,
+    first_html: str | None = None,
+    requests: threading.BoundedSemaphore | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Crawl a search completely, however many pages it has.
+
+    The search is crawled with :func:`crawl_listing_pages`.  A slice whose
+    results run past ``max_pages`` is split (:meth:`SearchPartition.split`)
+    and both halves are crawled, recursively, until every slice fits.
+    Before crawling a slice, its page ``max_pages`` is fetched: if that
+    page links further, the slice is split straight away on a sample of
+    :data:`~src.constants.SWEEP_SAMPLE_PAGES` pages rather than after
+    fetching every page, all of which its halves fetch again; otherwise the
+    pages already fetched are handed to the crawl.
+    Up to ``workers`` slices are crawled at once; all of them share
+    :data:`~src.constants.LISTING_FETCH_WORKERS` concurrent requests, or
+    ``requests`` when several sweeps run side by side.
+
+    Args:
+        fetch: Returns the HTML at a URL; called from worker threads.
+        search_url: Search to sweep.
+        max_pages: Page cap of one search.
+        workers: Slices crawled concurrently.
+        first_html: Page 1 HTML of ``search_url`` if the caller already has it.
+        requests: Limit on concurrent ``fetch`` calls.
+
+    Yields:
+        Listing rows, deduplicated by ``id`` across slices, as their pages
+        arrive.
+    """
+    if requests is None:
+        requests = threading.BoundedSemaphore(constants.LISTING_FETCH_WORKERS)
+    seen: set[str] = set()
+    # Crawls put their rows here as pages complete, then their own future.
+    out: queue.SimpleQueue = queue.SimpleQueue()
+
+    def crawl(
+        partition: SearchPartition, first: str | None = None
+    ) -> tuple[SearchPartition, list[dict[str, Any]], bool]:
+        url = partition.url(search_url)
+
+        def fetch_page(page_num: int) -> str:
+            with requests:
+                return fetch(listing_page_url(url, page_num))
+
+        def try_fetch(page_num: int) -> str | None:
+            try:
+                return fetch_page(page_num)
+            except Exception as e:
+                logger.error("Failed to fetch listing page %d: %s", page_num, e)
+                return None
+
+        pages = {1: first if first is not None else fetch_page(1)}
+        _, last_page = parse_listing_page(pages[1])
+        if 1 < last_page <= max_pages and (probe := try_fetch(max_pages)) is not None:
+            pages[max_pages] = probe
+            last_page = max(last_page, parse_listing_page(probe)[1])
+        if last_page > max_pages:
+            # Split on a sample of pages spread over the cap rather than on
+            # every page, all of which the halves would fetch again.
+            sample = _spread(max_pages, constants.SWEEP_SAMPLE_PAGES)
+            missing = [n for n in sample if n not in pages]
+            with ThreadPoolExecutor(
+                max_workers=constants.LISTING_FETCH_WORKERS, thread_name_prefix="sample"
+            ) as sampler:
+                fetched = zip(missing, sampler.map(try_fetch, missing))
+                pages.update((n, html) for n, html in fetched if html is not None)
+            rows = [row for n in sorted(pages) for row in parse_listing_page(pages[n])[0]]
+            for row in rows:
+                out.put(row)
+            return partition, rows, True
+
+        stats: dict[str, Any] = {}
+        rows = []
+        for row in crawl_listing_pages(
+            fetch_page, max_pages=max_pages, pages=pages, stats=stats,
+        ):
+            rows.append(row)
+            out.put(row)
+        return partition, rows, stats["truncated"]
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1), thread_name_prefix="sweep") as pool:
+
+        def submit(partition: SearchPartition, first: str | None = None) -> Future:
+            future = pool.submit(crawl, partition, first)
+            future.add_done_callback(out.put)
+            return future
+
+        pending = {submit(SearchPartition(), first_html)}
+        slices = 1
+        while pending:
+            item = out.get()
+            if not isinstance(item, Future):
+                if item["id"] not in seen:
+                    seen.add(item["id"])
+                    yield item
+                continue
+            pending.discard(item)
+            try:
+                partition, rows, truncated = item.result()
+            except Exception as e:
+                logger.error("Failed to sweep search slice: %s", e)
+                continue
+            if not truncated:
+                continue
+            halves = partition.split(rows, search_url)
+            if halves:
+                logger.info("Slice [%s] exceeds %d pages; splitting into [%s] and [%s]",
+                            partition, max_pages, *halves)
+                pending.update(submit(half) for half in halves)
+                slices += 2
+            else:
+                logger.warning("Slice [%s] exceeds %d pages and cannot be split; "
+                               "results are truncated", partition, max_pages)
+
+    logger.info("Swept %d search slice(s), %d unique players.", slices, len(seen))
+
+
+def _spread(last: int, count: int) -> list[int]:
+    """Up to ``count`` page numbers spread evenly over ``1..last``, both ends included."""
+    if count >= last:
+        return list(range(1, last + 1))
+    if count < 2:
+        return [1]
+    return sorted({1 + round(i * (last - 1) / (count - 1)) for i in range(count)})
+
+
+def merge_profile_rows(
+    results: Mapping[str, Iterable[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Merge the listing rows of several searches, tagging each with its searches.
+
+    Args:
+        results: Search profile name → its listing rows.
+
+    Returns:
+        One row per ``id`` (the first search's copy) with a
+        ``search_profiles`` list of every profile that returned it, in
+        ``results`` order.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    for name, rows in results.items():
+        for row in rows:
+            entry = merged.setdefault(row["id"], {**row, "search_profiles": []})
+            if name not in entry["search_profiles"]:
+                entry["search_profiles"].append(name)
+    return list(merged.values())
+
+
+def sweep_search_profiles(
+    fetch: Callable[[str], str],
+    searches: dict[str, str],
+    max_pages: int = 150,
+) -> list[dict[str, Any]]:
+    """Sweep several searches at once and merge their listings.
+
+    Every search is swept (:func:`sweep_listing_pages`) on its own thread;
+    all of them share :data:`~src.constants.LISTING_FETCH_WORKERS`
+    concurrent requests, so overlapping searches cost result pages only.
+    A search that fails is logged and contributes no rows.
+
+    Args:
+        fetch: Returns the HTML at a URL; called from worker threads.
+        searches: Search profile name → search URL.
+        max_pages: Page cap of one search.
+
+    Returns:
+        :func:`merge_profile_rows` of the searches' rows.
+    """
+    requests = threading.BoundedSemaphore(constants.LISTING_FETCH_WORKERS)
+
+    def sweep(url: str) -> list[dict[str, Any]]:
+        return list(sweep_listing_pages(fetch, url, max_pages=max_pages, requests=requests))
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(len(searches), 1), thread_name_prefix="profile"
+    ) as pool:
+        futures = {name: pool.submit(sweep, url) for name, url in searches.items()}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                logger.error("Failed to sweep search profile %s: %s", name, e)
+                continue
+            logger.info("Search profile %s: %d listings", name, len(results[name]))
+
+    rows = merge_profile_rows(results)
+    total = sum(len(r) for r in results.values())
+    logger.info(
+        "%d search profile(s): %d listings, %d unique players (%d overlapping).",
+        len(searches), total, len(rows), total - len(rows),
+    )
+    return rows
+
+
+def _in_background(items: Iterator[Any]) -> Iterator[Any]:
+    """Drain ``items`` on a daemon thread so it never waits for the consumer."""
+    out: queue.Queue = queue.Queue()
+
+    def run() -> None:
+        try:
+            for item in items:
+                out.put(item)
+        except Exception as e:
+            logger.error("Listing crawl failed: %s", e, exc_info=True)
+        finally:
+            out.put(_DONE)
+
+    threading.Thread(target=run, name="listing-crawl", daemon=True).start()
+    while (item := out.get()) is not _DONE:
+        yield item
+
+
+# ---------------------------------------------------------------------------
+# Pure parse functions (safe to run in a ParsePool worker)
+# ---------------------------------------------------------------------------
+
+
+_TRANSFERS_TITLE = re.compile(r'<div id="tabela_titulo">\s*Transfers\s*</div>', re.IGNORECASE)
+_DATA_ROW = re.compile(r'<tr class="list[12]">.*?</tr>', re.IGNORECASE | re.DOTALL)
+
+
+def parse_history_page(html: str) -> float:
+    """Most recent transfer price on a ``marcos_jog.asp`` history page.
+
+    The "Transfers" title is located in the raw HTML and only the first data
+    row of the table after it is parsed; pages that do not match that
+    layout fall back to a full parse.
+
+    Args:
+        html: History page HTML.
+
+    Returns:
+        The price in the first row of the transfers table, or ``0.0`` if
+        the player has no transfers.
+    """
+    title = _TRANSFERS_TITLE.search(html)
+    if title:
+        end = html.find("</table>", title.end())
+        row = _DATA_ROW.search(html, title.end(), end if end != -1 else len(html))
+        if not row:
+            return 0.0
+        cols = BeautifulSoup(row.group(0), "html.parser").find_all("td")
+        return clean_currency(cols[3].get_text(strip=True)) if len(cols) >= 4 else 0.0
+
+    soup = BeautifulSoup(html, "html.parser")
+    for div in soup.find_all("div", id="tabela_titulo"):
+        if "Transfers" in div.get_text(strip=True):
+            table = div.find_next("table", class_="table_border")
+            first = table.find("tr", class_=["list1", "list2"]) if table else None
+            cols = first.find_all("td") if first else []
+            if len(cols) >= 4:
+                return clean_currency(cols[3].get_text(strip=True))
+            break
+    return 0.0
+
+
+def parse_negotiation_page(html: str, player_id: str = "") -> dict[str, Any]:
+    """Extract financials from a ``comprar_jog_lista.asp`` page.
+
+    Args:
+        html: Raw page HTML.
+        player_id: Used only in log messages.
+
+    Returns:
+        Dict with ``estimated_value``, ``asking_price``, ``deadline``,
+        ``bids_count`` and ``bids_avg``; fields that cannot be found keep
+        their defaults.
+    """
+    soup_neg = BeautifulSoup(html, "html.parser")
+
+    data: dict[str, Any] = {
+        "estimated_value": 0,
+        "asking_price": 0,
+        "deadline": "N/A",
+        "bids_count": "0",
+        "bids_avg": "0",
+    }
+
+    try:
+        data["estimated_value"] = TransferScraper._get_val(soup_neg, "Estimated Transfer Value") or 0
+        data["asking_price"] = TransferScraper._get_val(soup_neg, "Asking Price for Bid") or 0
+
+        deadline_node = soup_neg.find(string="Deadline")
+        if deadline_node:
+            deadline_parent = deadline_node.find_parent("td")
+            if deadline_parent:
+                deadline_td = deadline_parent.find_next_sibling("td")
+                if deadline_td:
+                    data["deadline"] = deadline_td.get_text(strip=True, separator=" ")
+
+        bids_node = soup_neg.find(string="Bids")
+        if bids_node:
+            bids_parent = bids_node.find_parent("td")
+            if bids_parent:
+                bids_td = bids_parent.find_next_sibling("td")
+                if bids_td:
+                    data["bids_count"] = bids_td.get_text(strip=True)
+
+        bids_avg_node = soup_neg.find(string="Bids Average (Scout)")
+        if bids_avg_node:
+            bids_avg_parent = bids_avg_node.find_parent("td")
+            if bids_avg_parent:
+                bids_avg_td = bids_avg_parent.find_next_sibling("td")
+                if bids_avg_td:
+                    data["bids_avg"] = bids_avg_td.get_text(strip=True)
+
+    except Exception as e:
+        logger.error("Error scraping financials for %s: %s", player_id, e, exc_info=True)
+
+    return data
+
+
+def parse_player_profile(html: str) -> dict[str, Any]:
+    """Extract name, general info, skills and tiers from a ``ver_jogador.asp`` page.
+
+    Args:
+        html: Raw page HTML.
+
+    Returns:
+        Dict with ``name``, ``position``, ``age``, ``nationality``, one
+        key per skill and tier label found on the page, and the
+        ``quality_rank`` / ``potential_rank`` ordinals (``None`` if unknown).
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    data: dict[str, Any] = {}
+
+    def get_general_info(label: str) -> str:
+        b_tag = soup.find("b", string=label)
+        if b_tag:
+            parent = b_tag.find_parent("td")
+            if parent:
+                value_td = parent.find_next_sibling("td", class_="team_players")
+                if value_td:
+                    return value_td.get_text(strip=True)
+                next_td = parent.find_next_sibling("td")
+                if next_td and not next_td.get_text(strip=True):
+                    value_td = next_td.find_next_sibling("td")
+                    if value_td:
+                        return value_td.get_text(strip=True)
+        return "N/A"
+
+    name_font = soup.find("font", size="+1")
+    data["name"] = name_font.get_text(strip=True) if name_font else "N/A"
+    data["position"] = get_general_info("Position")
+    data["age"] = get_general_info("Age").replace("Years", "").strip()
+    data["nationality"] = get_general_info("Nationality")
+
+    # Skill rows and tier labels share one row index so each <tr> is
+    # scanned once, however many label cells it contains.
+    index = RowIndex()
+    data.update(parse_skill_table(soup, index=index))
+    data.update(parse_profile_tiers(soup, skip=data, index=index))
+    data["quality_rank"] = tier_rank(data.get("Quality"))
+    data["potential_rank"] = tier_rank(data.get("Potential"))
+
+    return data
+
+
+def parse_player_page(
+    player_id: str,
+    neg_html: str,
+    profile_html: str,
+    base_url: str = "https://www.pmanager.org",
+) -> dict[str, Any]:
+    """Build the :meth:`TransferScraper.get_player_details` record from raw HTML.
+
+    Args:
+        player_id: Numeric player ID string from PManager.
+        neg_html: Negotiation page HTML.
+        profile_html: Profile page HTML.
+        base_url: Root URL used to build the player's ``url``.
+
+    Returns:
+        The same dictionary :meth:`TransferScraper.get_player_details` returns.
+    """
+    data: dict[str, Any] = {
+        "id": player_id,
+        "url": f"{base_url}/ver_jogador.asp?jog_id={player_id}",
+    }
+    data.update(parse_negotiation_page(neg_html, player_id))
+    data.update(parse_player_profile(profile_html))
+    return data
+
+
+#: Listing-row fields that stand in for the profile in a financials-only refresh.
+LISTING_PROFILE_FIELDS: tuple[str, ...] = ("name", "position", "age", "Quality", "Potential")
+
+
+def parse_listing_financials(
+    player_id: str,
+    neg_html: str,
+    listing_row: dict[str, Any],
+    base_url: str = "https://www.pmanager.org",
+) -> dict[str, Any]:
+    """Build a listing record from the negotiation page and its search result row.
+
+    Used instead of :func:`parse_player_page` when the profile was not
+    loaded: the identity and tier fields come from the search result row,
+    so the record has everything ``transfer_listings`` needs but no skills.
+
+    Args:
+        player_id: Numeric player ID string from PManager.
+        neg_html: Negotiation page HTML.
+        listing_row: The player's row from :func:`parse_listing_page`.
+        base_url: Root URL used to build the player's ``url``.
+
+    Returns:
+        Dict with ``id``, ``url``, :data:`LISTING_PROFILE_FIELDS`, the
+        negotiation page financials and the tier ranks.
+    """
+    data: dict[str, Any] = {
+        "id": player_id,
+        "url": f"{base_url}/ver_jogador.asp?jog_id={player_id}",
+    }
+    data.update({k: listing_row[k] for k in LISTING_PROFILE_FIELDS if listing_row.get(k) is not None})
+    data.update(parse_negotiation_page(neg_html, player_id))
+    data["quality_rank"] = tier_rank(data.get("Quality"))
+    data["potential_rank"] = tier_rank(data.get("Potential"))
+    return data
+
+
+def listing_record(
+    listing_row: dict[str, Any],
+    base_url: str = "https://www.pmanager.org",
+) -> dict[str, Any]:
+    """Build a listing-only record from a search result row alone.
+
+    Used for listings triaged out before their detail pages are loaded (see
+    :mod:`src.services.market_triage`): the record carries what the result
+    page shows but no estimated value, bids average or skills.
+
+    Args:
+        listing_row: The player's row from :func:`parse_listing_page`.
+        base_url: Root URL used to build the player's ``url``.
+
+    Returns:
+        Dict with ``id``, ``url``, the non-empty row fields and the tier ranks.
+    """
+    player_id = listing_row["id"]
+    data: dict[str, Any] = {
+        "id": player_id,
+        "url": f"{base_url}/ver_jogador.asp?jog_id={player_id}",
+    }
+    data.update({k: v for k, v in listing_row.items() if k != "id" and v is not None})
+    data["quality_rank"] = tier_rank(data.get("Quality"))
+    data["potential_rank"] = tier_rank(data.get("Potential"))
+    return data
@@ -0,0 +1,302 @@
+"""
+Deadline-driven schedule for the final price updater.
+
+Instead of reloading every tracked player each hour, ``update_final_prices.py``
+keeps a priority queue of auctions keyed by their next due time and only
+visits the auctions that are due:
+
+- while an auction runs, nothing is done until
+  :data:`~src.constants.BID_REFRESH_WINDOW_HOURS` before it closes; its
+  bids are then refreshed every :data:`~src.constants.BID_REFRESH_MINUTES`
+  and once more :data:`~src.constants.BID_FINAL_REFRESH_MINUTES` before
+  the close;
+- :data:`~src.constants.FINAL_PRICE_GRACE_HOURS` after the deadline its
+  transfer history is checked for the final price.  An auction that has not
+  settled yet is requeued every :data:`~src.constants.FINAL_PRICE_RETRY_MINUTES`,
+  up to :data:`~src.constants.FINAL_PRICE_MAX_ATTEMPTS` checks.
+
+The queue is saved to a small JSON file between runs (written atomically)::
+
+    {
+      "saved_at": "2026-03-29 11:42:10",
+      "synced_at": "2026-03-29 11:30:00",
+      "auctions": [{"id": "1000001", "deadline": "2026-03-29 14:30:00",
+                    "due": "2026-03-29 13:42:10", "bids_avg": 1200000.0,
+                    "attempts": 0}, ...],
+      "finished": {"1000002": "2026-03-29 09:00:00", ...}
+    }
+
+``finished`` remembers auctions whose final check is over (price found or
+attempts used up), so loading the same player again does not requeue it
+unless it is relisted with a new deadline.  ``synced_at`` is when players
+were last loaded from Supabase, so the next sync only reads the rows changed
+since (a schedule without it starts with a full sync).  All times are naive
+UTC+7; the
+``timestamptz`` deadlines read from Supabase are converted with
+:func:`~src.core.utils.normalise_deadline`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from src import constants
+from src.core.logger import logger
+from src.core.utils import clean_currency, normalise_deadline
+from src.services.market_metrics import DEADLINE_FORMAT
+
+
+@dataclass
+class Auction:
+    """One tracked auction.
+
+    Attributes:
+        player_id: Listed player.
+        deadline: Auction close (UTC+7).
+        due: When the auction is next visited.
+        bids_avg: Latest bids average, for the sale-to-bid ratio.
+        attempts: Final price checks made so far.
+    """
+
+    player_id: str
+    deadline: datetime
+    due: datetime
+    bids_avg: float = 0.0
+    attempts: int = 0
+
+    @property
+    def settling(self) -> bool:
+        """``True`` if the next visit checks the final price, not the bids."""
+        return self.due >= self.deadline
+
+
+class AuctionSchedule:
+    """Persistent priority queue of auctions by due time.
+
+    Args:
+        path: JSON file the schedule is saved to.
+        auctions: Auctions to track.
+        finished: Player ID → deadline of auctions no longer tracked.
+        synced_at: Time of the last load from Supabase, or ``None``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        auctions: Iterable[Auction] = (),
+        finished: dict[str, str] | None = None,
+        synced_at: datetime | None = None,
+    ) -> None:
+        self.path = path
+        self.finished: dict[str, str] = dict(finished or {})
+        self.synced_at = synced_at
+        self._auctions: dict[str, Auction] = {}
+        self._heap: list[tuple[datetime, str]] = []
+        for auction in auctions:
+            self._push(auction)
+
+    @classmethod
+    def load(cls, path: str) -> AuctionSchedule:
+        """Load the schedule at ``path``; an empty one if missing or unreadable."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            auctions = [
+                Auction(
+                    str(a["id"]),
+                    datetime.strptime(a["deadline"], DEADLINE_FORMAT),
+                    datetime.strptime(a["due"], DEADLINE_FORMAT),
+                    float(a.get("bids_avg") or 0.0),
+                    int(a.get("attempts") or 0),
+                )
+                for a in data.get("auctions", [])
+            ]
+            synced_at = (
+                datetime.strptime(data["synced_at"], DEADLINE_FORMAT)
+                if data.get("synced_at") else None
+            )
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable auction schedule %s: %s", path, e)
+            return cls(path)
+        return cls(path, auctions, data.get("finished"), synced_at)
+
+    def __len__(self) -> int:
+        return len(self._auctions)
+
+    def __contains__(self, player_id: object) -> bool:
+        return str(player_id) in self._auctions
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+
+    def sync(self, rows: Iterable[dict[str, Any]], now: datetime) -> int:
+        """Track the auctions of ``get_players_for_price_update`` rows.
+
+        New auctions are queued; a tracked auction whose deadline moved is
+        rescheduled.  Rows without a parseable deadline, closed auctions
+        with a recorded sale price and auctions already finished at the same
+        deadline are skipped.  ``now`` becomes :attr:`synced_at`.
+
+        Args:
+            rows: ``players`` rows.
+            now: Time the rows were requested at (UTC+7).
+
+        Returns:
+            Number of auctions added or rescheduled.
+        """
+        changed = 0
+        for row in rows:
+            pid = str(row.get("id") or "")
+            deadline = normalise_deadline(row.get("deadline"))
+            if not pid or deadline is None:
+                continue
+            if self.finished.get(pid) == deadline.strftime(DEADLINE_FORMAT):
+                continue
+            sold = clean_currency(str(row.get("last_transfer_price") or ""))
+            if pid not in self._auctions and deadline <= now and sold:
+                continue
+            bids_avg = clean_currency(str(row.get("bids_avg") or ""))
+            changed += self.update(pid, deadline, now, bids_avg)
+        self.synced_at = now
+        return changed
+
+    def update(
+        self, player_id: str, deadline: datetime, now: datetime, bids_avg: float | None = None
+    ) -> bool:
+        """Track an auction, or reschedule it if its deadline changed.
+
+        Returns:
+            ``True`` if the auction was added or rescheduled.
+        """
+        pid = str(player_id)
+        auction = self._auctions.get(pid)
+        if auction is not None:
+            if bids_avg:
+                auction.bids_avg = bids_avg
+            if auction.deadline == deadline:
+                return False
+            auction.deadline, auction.attempts = deadline, 0
+        else:
+            auction = Auction(pid, deadline, now, bids_avg or 0.0)
+        self.finished.pop(pid, None)
+        auction.due = self._next_due(auction, now)
+        self._push(auction)
+        return True
+
+    def pop_due(self, now: datetime) -> list[Auction]:
+        """Remove and return every auction due at ``now``, earliest first.
+
+        Popped auctions are no longer tracked until :meth:`requeue` or
+        :meth:`finish` is called for them.
+        """
+        due: list[Auction] = []
+        while self._heap and self._heap[0][0] <= now:
+            when, pid = heapq.heappop(self._heap)
+            auction = self._auctions.get(pid)
+            if auction is None or auction.due != when:
+                continue  # superseded by a later push
+            del self._auctions[pid]
+            due.append(auction)
+        return due
+
+    def requeue(self, auction: Auction, now: datetime, settled_check: bool = False) -> None:
+        """Queue a visited auction again at its next due time.
+
+        Args:
+            auction: Auction returned by :meth:`pop_due`.
+            now: Current time (UTC+7).
+            settled_check: The visit checked the final price and found none;
+                counts one attempt, and the auction is finished once
+                :data:`~src.constants.FINAL_PRICE_MAX_ATTEMPTS` are used up.
+        """
+        if settled_check:
+            auction.attempts += 1
+            if auction.attempts >= constants.FINAL_PRICE_MAX_ATTEMPTS:
+                logger.info(
+                    "No final price for %s after %d checks; giving up",
+                    auction.player_id, auction.attempts,
+                )
+                self.finish(auction)
+                return
+        auction.due = self._next_due(auction, now)
+        self._push(auction)
+
+    def finish(self, auction: Auction) -> None:
+        """Stop tracking an auction (final price recorded or given up)."""
+        self._auctions.pop(auction.player_id, None)
+        self.finished[auction.player_id] = auction.deadline.strftime(DEADLINE_FORMAT)
+
+    def next_due(self) -> datetime | None:
+        """Due time of the earliest tracked auction, or ``None`` if none."""
+        while self._heap:
+            when, pid = self._heap[0]
+            auction = self._auctions.get(pid)
+            if auction is not None and auction.due == when:
+                return when
+            heapq.heappop(self._heap)
+        return None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, now: datetime | None = None) -> None:
+        """Write the schedule atomically, dropping finished entries past the lookback."""
+        now = now or datetime.now()
+        horizon = now - timedelta(days=constants.FINAL_PRICE_LOOKBACK_DAYS)
+        self.finished = {
+            pid: deadline for pid, deadline in self.finished.items()
+            if datetime.strptime(deadline, DEADLINE_FORMAT) >= horizon
+        }
+        data = {
+            "saved_at": now.strftime(DEADLINE_FORMAT),
+            "synced_at": self.synced_at.strftime(DEADLINE_FORMAT) if self.synced_at else None,
+            "auctions": [
+                {
+                    "id": a.player_id,
+                    "deadline": a.deadline.strftime(DEADLINE_FORMAT),
+                    "due": a.due.strftime(DEADLINE_FORMAT),
+                    "bids_avg": a.bids_avg,
+                    "attempts": a.attempts,
+                }
+                for a in sorted(self._auctions.values(), key=lambda a: a.due)
+            ],
+            "finished": self.finished,
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error("Failed to save auction schedule %s: %s", self.path, e)
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _push(self, auction: Auction) -> None:
+        self._auctions[auction.player_id] = auction
+        heapq.heappush(self._heap, (auction.due, auction.player_id))
+
+    @staticmethod
+    def _next_due(auction: Auction, now: datetime) -> datetime:
+        """Next visit: bid refreshes near the close, then the final price checks."""
+        if auction.attempts:
+            return now + timedelta(minutes=constants.FINAL_PRICE_RETRY_MINUTES)
+        window = auction.deadline - timedelta(hours=constants.BID_REFRESH_WINDOW_HOURS)
+        if now < window:
+            return window
+        last_refresh = auction.deadline - timedelta(minutes=constants.BID_FINAL_REFRESH_MINUTES)
+        if now < last_refresh:
+            return min(now + timedelta(minutes=constants.BID_REFRESH_MINUTES), last_refresh)
+        return max(auction.deadline + timedelta(hours=constants.FINAL_PRICE_GRACE_HOURS), now)
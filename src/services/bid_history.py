@@ -0,0 +1,289 @@
+"""
+Bid trajectories of running auctions (Supabase ``bid_history`` + Parquet).
+
+:meth:`~src.scrapers.transfer.TransferScraper.get_bid_info` refreshes
+overwrite ``bids_count`` / ``bids_avg`` on the ``players`` row, so how an
+auction developed is lost.  :class:`BidHistory` appends every refresh to a
+time series keyed by ``(player_id, observed_at)`` instead, delta encoded:
+
+- the first observation of a player in a run is a *keyframe* carrying every
+  value;
+- later observations carry only the values that changed since the previous
+  one (the others are null), and a refresh where nothing changed writes no
+  row at all.
+
+Most refreshes of a quiet auction therefore cost nothing, and a late snipe
+shows up as a row with a new ``bids_count`` / ``bids_avg`` (and often a
+moved ``deadline``) minutes before the close.  :func:`bid_trajectories`
+forward-fills the deltas back into full states.
+
+Rows are buffered and written in bulk to the ``bid_history`` table
+(``db_schemas/bid_history.sql``) and to a local Parquet mirror partitioned
+like the market archive (:mod:`src.services.market_history`)::
+
+    bid_history/
+      date=2026-03-29/
+        run-20260329T100000.parquet            # one compacted file per run
+        run-20260329T140000.part-00004.parquet # a run still going
+
+Times are naive UTC+7, like the rest of the updater; the Supabase columns
+are ``timestamptz`` and get the explicit offset.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import re
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src import constants
+from src.core.logger import logger
+from src.core.utils import clean_currency, format_deadline, normalise_deadline
+
+if TYPE_CHECKING:
+    from src.services.supabase_client import SupabaseManager
+
+#: Values tracked per observation, in file order.
+TRACKED: tuple[str, ...] = ("bids_count", "bids_avg", "estimated_value", "deadline")
+
+#: Columns of the Parquet mirror.
+BID_HISTORY_SCHEMA: pa.Schema = pa.schema(
+    [
+        ("player_id", pa.string()),
+        ("observed_at", pa.timestamp("s")),
+        ("bids_count", pa.int32()),
+        ("bids_avg", pa.int64()),
+        ("estimated_value", pa.int64()),
+        ("deadline", pa.timestamp("s")),
+    ]
+)
+
+_PART = re.compile(r"\.part-(\d+)\.parquet$")
+
+
+def bid_values(bid_info: dict[str, Any]) -> dict[str, Any]:
+    """Typed values of a ``get_bid_info`` result; unknown ones are ``None``.
+
+    ``get_bid_info`` reports ``0`` / ``"0"`` / ``"N/A"`` when a field is
+    missing from the page, so those are treated as unknown rather than as a
+    change to zero.
+    """
+    count = int(bid_info.get("bids_count") or 0)
+    avg = clean_currency(str(bid_info.get("bids_avg") or ""))
+    value = clean_currency(str(bid_info.get("estimated_value") or ""))
+    return {
+        "bids_count": count or None,
+        "bids_avg": int(avg) if avg > 0 else None,
+        "estimated_value": int(value) if value > 0 else None,
+        "deadline": normalise_deadline(bid_info.get("deadline")),
+    }
+
+
+def delta_row(
+    player_id: str,
+    observed_at: datetime,
+    values: dict[str, Any],
+    previous: dict[str, Any] | None,
+) -> dict[str, Any] | None:
+    """Delta-encode one observation against the previous one.
+
+    Args:
+        player_id: Observed player.
+        observed_at: Observation time (UTC+7).
+        values: Typed values, as from :func:`bid_values`.
+        previous: Last known values of the player, or ``None`` for a keyframe.
+
+    Returns:
+        A row with the changed values (nulls elsewhere), or ``None`` if
+        nothing changed.
+    """
+    changed = {
+        key: values.get(key) for key in TRACKED
+        if values.get(key) is not None and (previous is None or previous.get(key) != values[key])
+    }
+    if not changed:
+        return None
+    return {
+        "player_id": str(player_id),
+        "observed_at": observed_at.replace(microsecond=0),
+        **{key: changed.get(key) for key in TRACKED},
+    }
+
+
+class BidHistory:
+    """Records bid refreshes as delta rows and writes them in bulk.
+
+    Args:
+        db: Supabase manager (anything with ``insert_bid_history``), or
+            ``None`` to keep only the Parquet mirror.
+        root: Parquet mirror directory, or ``None`` to skip the mirror.
+        started: Start of the run; names and partitions the mirror files.
+        max_rows: Flush once this many rows are pending.
+
+    Attributes:
+        rows: Rows recorded so far.
+    """
+
+    def __init__(
+        self,
+        db: SupabaseManager | None,
+        root: str | None,
+        started: datetime,
+        max_rows: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.db = db
+        self.root = root
+        self.max_rows = max_rows
+        self.rows = 0
+        self._last: dict[str, dict[str, Any]] = {}
+        self._pending: list[dict[str, Any]] = []
+        self.stem = f"run-{started:%Y%m%dT%H%M%S}"
+        self.path = os.path.join(root, f"date={started:%Y-%m-%d}") if root else None
+        self._next_part = 1
+
+    def __enter__(self) -> BidHistory:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, player_id: str, observed_at: datetime, bid_info: dict[str, Any]) -> bool:
+        """Record one refresh of a player's bids.
+
+        Args:
+            player_id: Refreshed player.
+            observed_at: Refresh time (UTC+7).
+            bid_info: ``get_bid_info`` result (or typed values).
+
+        Returns:
+            ``True`` if a row was recorded (something changed).
+        """
+        pid = str(player_id)
+        values = bid_values(bid_info)
+        row = delta_row(pid, observed_at, values, self._last.get(pid))
+        if row is None:
+            return False
+        last = self._last.setdefault(pid, {})
+        last.update({key: value for key, value in values.items() if value is not None})
+        self._pending.append(row)
+        self.rows += 1
+        if len(self._pending) >= self.max_rows:
+            self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Write the pending rows to Supabase and the Parquet mirror."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        if self.db is not None:
+            self.db.insert_bid_history([
+                {
+                    **row,
+                    "observed_at": format_deadline(row["observed_at"]),
+                    "deadline": format_deadline(row["deadline"]),
+                }
+                for row in pending
+            ])
+        if self.path is not None:
+            os.makedirs(self.path, exist_ok=True)
+            part = os.path.join(self.path, f"{self.stem}.part-{self._next_part:05d}.parquet")
+            _write(pa.Table.from_pylist(pending, schema=BID_HISTORY_SCHEMA), part)
+            self._next_part += 1
+
+    def close(self) -> None:
+        """Flush, then compact this run's Parquet parts into one file."""
+        self.flush()
+        if self.path is None:
+            return
+        pattern = os.path.join(glob.escape(self.path), f"{glob.escape(self.stem)}.part-*.parquet")
+        parts = sorted(p for p in glob.glob(pattern) if _PART.search(p))
+        if not parts:
+            return
+        target = os.path.join(self.path, f"{self.stem}.parquet")
+        tables = [pq.read_table(p, schema=BID_HISTORY_SCHEMA) for p in parts]
+        if os.path.exists(target):
+            tables.insert(0, pq.read_table(target, schema=BID_HISTORY_SCHEMA))
+        _write(pa.concat_tables(tables), target)
+        for p in parts:
+            os.remove(p)
+        logger.info("Recorded %d bid history rows to %s", self.rows, target)
+
+
+def _write(table: pa.Table, path: str) -> None:
+    # Dot-prefixed, so readers skip a file still being written.
+    head, tail = os.path.split(path)
+    tmp_path = os.path.join(head, f".{tail}.tmp")
+    pq.write_table(table, tmp_path, compression="zstd", use_dictionary=True)
+    os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+def read_bid_history(
+    root: str,
+    start: date | str | None = None,
+    end: date | str | None = None,
+    ids: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Load the delta rows of the Parquet mirror.
+
+    Args:
+        root: Mirror directory.
+        start: First run date to include (``date`` or ``"YYYY-MM-DD"``).
+        end: Last run date to include.
+        ids: Only these players.
+
+    Returns:
+        The rows of :data:`BID_HISTORY_SCHEMA`; empty if nothing matches.
+    """
+    if not os.path.isdir(root):
+        return pd.DataFrame(columns=BID_HISTORY_SCHEMA.names)
+    dataset = ds.dataset(
+        root,
+        format="parquet",
+        schema=BID_HISTORY_SCHEMA.append(pa.field("date", pa.string())),
+        partitioning="hive",
+    )
+    conditions = []
+    if start is not None:
+        conditions.append(ds.field("date") >= str(start))
+    if end is not None:
+        conditions.append(ds.field("date") <= str(end))
+    if ids is not None:
+        conditions.append(ds.field("player_id").isin([str(i) for i in ids]))
+    expr = None
+    for condition in conditions:
+        expr = condition if expr is None else expr & condition
+    return dataset.to_table(columns=BID_HISTORY_SCHEMA.names, filter=expr).to_pandas()
+
+
+def bid_trajectories(deltas: pd.DataFrame) -> pd.DataFrame:
+    """Decode delta rows into the full state after every observation.
+
+    Args:
+        deltas: Rows as from :func:`read_bid_history` (or the
+            ``bid_history`` table).
+
+    Returns:
+        The same rows ordered by player and time, with every tracked value
+        forward-filled from the player's earlier observations.
+    """
+    df = deltas.sort_values(["player_id", "observed_at"], kind="stable").reset_index(drop=True)
+    columns = [column for column in TRACKED if column in df.columns]
+    df[columns] = df.groupby("player_id", sort=False)[columns].ffill()
+    return df
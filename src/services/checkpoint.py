@@ -0,0 +1,156 @@
+"""
+Checkpoint / resume support for the transfer market scrape.
+
+The streaming pipeline already writes listings to Supabase as it goes, so a
+cancelled run loses no results — but a plain re-run would start the detail
+loads from the top again.  :class:`ScrapeCheckpoint` records, in a small JSON
+file, which listings the run discovered and which ones have been durably
+written (or touched), so ``main_all_transfer.py --resume`` can skip them::
+
+    {
+      "run_started": "2026-03-29 10:00:00",
+      "saved_at": "2026-03-29 11:42:10",
+      "completed": false,
+      "discovered": ["1000001", ...],
+      "processed": ["1000001", ...]
+    }
+
+IDs are only marked processed after the pipeline has flushed them, so a
+listing that was in flight when the run died is loaded again.  The file is
+written atomically (temp file + rename) at most every
+:data:`~src.constants.CHECKPOINT_SAVE_SECONDS`, and once more on close.  A
+finished run marks its checkpoint ``completed`` rather than deleting it, so a
+copy restored from a CI cache cannot resurrect an older interrupted run.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+
+from src import constants
+from src.core.logger import logger
+
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class ScrapeCheckpoint:
+    """Durable progress of one market scrape.
+
+    Thread-safe: listings are discovered on the scraper thread and marked
+    processed from the pipeline's sink thread.
+
+    Attributes:
+        path: JSON file the checkpoint is saved to.
+        run_started: Start timestamp of the run being checkpointed; a resumed
+            run keeps the original one so stale-listing cleanup still covers
+            rows written before the interruption.
+        discovered: Listing IDs seen on the result pages so far.
+        processed: Listing IDs whose result reached Supabase.
+        completed: Set by :meth:`finish` once the run has completed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        run_started: str,
+        discovered: Iterable[str] = (),
+        processed: Iterable[str] = (),
+        save_seconds: float = constants.CHECKPOINT_SAVE_SECONDS,
+    ) -> None:
+        self.path = path
+        self.run_started = run_started
+        self.discovered: set[str] = set(discovered)
+        self.processed: set[str] = set(processed)
+        self.save_seconds = save_seconds
+        self.completed = False
+
+        self._lock = threading.Lock()
+        self._last_save = float("-inf")
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        max_age_hours: float = constants.CHECKPOINT_MAX_AGE_HOURS,
+    ) -> ScrapeCheckpoint | None:
+        """Load the checkpoint at ``path``.
+
+        Args:
+            path: Checkpoint file.
+            max_age_hours: Checkpoints saved longer ago than this are ignored.
+
+        Returns:
+            The checkpoint, or ``None`` if there is no usable one (missing,
+            unreadable, too old or completed).
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            saved_at = datetime.strptime(data["saved_at"], _TS_FORMAT)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable checkpoint %s: %s", path, e)
+            return None
+
+        if data.get("completed"):
+            return None
+        if datetime.now() - saved_at > timedelta(hours=max_age_hours):
+            logger.info("Ignoring checkpoint %s saved at %s (too old)", path, data["saved_at"])
+            return None
+
+        return cls(
+            path,
+            data["run_started"],
+            discovered=data.get("discovered", []),
+            processed=data.get("processed", []),
+        )
+
+    def discover(self, player_id: str) -> None:
+        """Record a listing seen on a result page."""
+        with self._lock:
+            self.discovered.add(str(player_id))
+
+    def mark_processed(self, ids: Iterable[str]) -> None:
+        """Record listings whose result has been written, then save if due."""
+        with self._lock:
+            self.processed.update(str(i) for i in ids)
+        self.save()
+
+    def is_processed(self, player_id: str) -> bool:
+        """Return ``True`` if the listing was written earlier in this run."""
+        with self._lock:
+            return str(player_id) in self.processed
+
+    def save(self, force: bool = False) -> None:
+        """Write the checkpoint if :attr:`save_seconds` have passed (or ``force``)."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_save < self.save_seconds:
+                return
+            self._last_save = now
+            data = {
+                "run_started": self.run_started,
+                "saved_at": datetime.now().strftime(_TS_FORMAT),
+                "completed": self.completed,
+                "discovered": sorted(self.discovered),
+                "processed": sorted(self.processed),
+            }
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.error("Failed to save checkpoint %s: %s", self.path, e)
+
+    def finish(self) -> None:
+        """Mark the run completed so ``--resume`` starts afresh next time."""
+        with self._lock:
+            self.completed = True
+        self.save(force=True)
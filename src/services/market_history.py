@@ -0,0 +1,242 @@
+"""
+Columnar archive of market scans (Parquet, partitioned by date).
+
+``transfer_listings`` only holds the current market, so the asking prices,
+estimated values and bids a listing went through are lost once it is
+refreshed.  :class:`MarketHistory` appends every listing a scan loads to a
+Parquet dataset instead, laid out as a Hive-style date partition::
+
+    market_history/
+      date=2026-03-29/
+        scan-20260329T100000.parquet          # one compacted file per scan
+        scan-20260329T160000.part-00003.parquet  # a scan still running
+      date=2026-03-30/
+      ...
+
+The schema is fixed (:data:`HISTORY_SCHEMA`): tier and position labels and
+the nationality are dictionary encoded, and the skills are plain columns
+(``handling`` … ``strength``) rather than a JSON blob, so reading one
+column over weeks of scans touches only that column's pages.  A listing is
+recorded every time a scan loads it — new, changed, or with ``--full`` —
+so the consecutive records of one ``id`` trace its price and bids over time.
+
+Scans write one part file per pipeline flush, so an interrupted run keeps
+everything it loaded; :meth:`MarketHistory.close` compacts the scan's parts
+into a single file.  Read the archive with :func:`read_history`.
+
+Times are naive UTC+7 (game time), whatever the runner's time zone, so
+relative deadlines resolve like they do on the site.
+"""
+
+from __future__ import annotations
+
+import glob
+import os
+import re
+from collections.abc import Iterable
+from datetime import date, datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from src.core.logger import logger
+from src.core.utils import GAME_TZ
+from src.scrapers.squad import SKILL_COLUMNS
+from src.services.market_metrics import normalise_deadlines, parse_currency
+
+#: Skill labels (as scraped) → archive column names.
+SKILL_FIELDS: dict[str, str] = {
+    label: label.lower().replace(" ", "_") for label in SKILL_COLUMNS
+}
+
+_DICT = pa.dictionary(pa.int32(), pa.string())
+
+#: Columns of every archived listing, in file order.
+HISTORY_SCHEMA: pa.Schema = pa.schema(
+    [
+        ("scan_started", pa.timestamp("s")),
+        ("observed_at", pa.timestamp("s")),
+        ("id", pa.string()),
+        ("name", pa.string()),
+        ("position", _DICT),
+        ("nationality", _DICT),
+        ("age", pa.int16()),
+        ("quality", _DICT),
+        ("potential", _DICT),
+        ("quality_rank", pa.int8()),
+        ("potential_rank", pa.int8()),
+        ("estimated_value", pa.int64()),
+        ("asking_price", pa.int64()),
+        ("bids_count", pa.int32()),
+        ("bids_avg", pa.int64()),
+        ("value_diff", pa.float64()),
+        ("roi", pa.float64()),
+        ("forecast_sell", pa.float64()),
+        ("forecast_profit", pa.float64()),
+        ("deadline", pa.timestamp("s")),
+    ]
+    + [(column, pa.int16()) for column in SKILL_FIELDS.values()]
+)
+
+#: Scraped field → archive column, where the names differ.
+_RENAMES: dict[str, str] = {"Quality": "quality", "Potential": "potential", **SKILL_FIELDS}
+
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+_PART = re.compile(r"\.part-(\d+)\.parquet$")
+
+
+def history_table(df: pd.DataFrame, scan_started: datetime, observed_at: datetime) -> pa.Table:
+    """Convert a flushed pipeline batch to an archive table.
+
+    Columns outside :data:`HISTORY_SCHEMA` are dropped and missing ones are
+    null.  Currency text (``bids_avg``) and relative deadlines are parsed;
+    numbers that do not fit their column become null rather than failing
+    the batch.
+
+    Args:
+        df: Batch as built by :func:`~src.services.transfer_pipeline.frame_records`.
+        scan_started: Start of the scan the batch belongs to.
+        observed_at: When the batch was loaded.
+    """
+    df = df.rename(columns=_RENAMES).reset_index(drop=True)
+    n = len(df)
+    arrays: list[pa.Array] = []
+    for field in HISTORY_SCHEMA:
+        name, kind = field.name, field.type
+        if name in ("scan_started", "observed_at"):
+            stamp = scan_started if name == "scan_started" else observed_at
+            arrays.append(pa.array([stamp] * n, kind))
+        elif name not in df.columns:
+            arrays.append(pa.nulls(n, kind))
+        elif name == "deadline":
+            deadlines = normalise_deadlines(df[name].tolist(), now=observed_at)
+            arrays.append(pa.array(deadlines, kind, from_pandas=True))
+        elif pa.types.is_dictionary(kind):
+            labels = [None if pd.isna(v) else str(v) for v in df[name]]
+            arrays.append(pa.array(labels, pa.string()).dictionary_encode())
+        elif pa.types.is_string(kind):
+            arrays.append(pa.array([None if pd.isna(v) else str(v) for v in df[name]], kind))
+        else:
+            if name == "bids_avg":
+                values = pd.Series(parse_currency(df[name].to_numpy()))
+            else:
+                values = pd.to_numeric(df[name], errors="coerce").astype("float64")
+            if pa.types.is_integer(kind):
+                limit = 2 ** (kind.bit_width - 1)
+                values = values.where(values.abs() < limit).round().astype("Int64")
+            arrays.append(pa.array(values, kind, from_pandas=True))
+    return pa.Table.from_arrays(arrays, schema=HISTORY_SCHEMA)
+
+
+class MarketHistory:
+    """Appends one scan's listings to the Parquet archive.
+
+    Args:
+        root: Archive directory.
+        scan_started: Start timestamp (``"%Y-%m-%d %H:%M:%S"``, UTC+7) of
+            the scan; a resumed scan passes the original one and continues
+            its parts.
+        tag: Extra file name component keeping concurrent writers of the
+            same scan apart (e.g. ``"shard-2-of-4"``).
+    """
+
+    def __init__(self, root: str, scan_started: str, tag: str = "") -> None:
+        self.root = root
+        self.scan_started = datetime.strptime(scan_started, _TS_FORMAT)
+        self.path = os.path.join(root, f"date={self.scan_started:%Y-%m-%d}")
+        self.stem = f"scan-{self.scan_started:%Y%m%dT%H%M%S}" + (f".{tag}" if tag else "")
+        self.rows = 0
+        os.makedirs(self.path, exist_ok=True)
+        done = [int(m.group(1)) for m in map(_PART.search, self._parts()) if m]
+        self._next_part = max(done, default=0) + 1
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Write one batch as a new part file of this scan."""
+        if df.empty:
+            return
+        observed_at = datetime.now(GAME_TZ).replace(tzinfo=None, microsecond=0)
+        table = history_table(df, self.scan_started, observed_at)
+        part = os.path.join(self.path, f"{self.stem}.part-{self._next_part:05d}.parquet")
+        self._write(table, part)
+        self._next_part += 1
+        self.rows += table.num_rows
+
+    def close(self) -> None:
+        """Compact this scan's part files (including a resumed run's) into one file."""
+        parts = self._parts()
+        if not parts:
+            return
+        target = os.path.join(self.path, f"{self.stem}.parquet")
+        tables = [pq.read_table(p, schema=HISTORY_SCHEMA) for p in parts]
+        if os.path.exists(target):
+            tables.insert(0, pq.read_table(target, schema=HISTORY_SCHEMA))
+        self._write(pa.concat_tables(tables), target)
+        for p in parts:
+            os.remove(p)
+        logger.info("Archived %d listings to %s", self.rows, target)
+
+    def _parts(self) -> list[str]:
+        pattern = os.path.join(glob.escape(self.path), f"{glob.escape(self.stem)}.part-*.parquet")
+        return sorted(glob.glob(pattern))
+
+    @staticmethod
+    def _write(table: pa.Table, path: str) -> None:
+        # Dot-prefixed, so readers skip a file still being written.
+        head, tail = os.path.split(path)
+        tmp_path = os.path.join(head, f".{tail}.tmp")
+        pq.write_table(table, tmp_path, compression="zstd", use_dictionary=True)
+        os.replace(tmp_path, path)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+
+def read_history(
+    root: str,
+    columns: Iterable[str] | None = None,
+    start: date | str | None = None,
+    end: date | str | None = None,
+    ids: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Load archived listings as a DataFrame.
+
+    Only the requested columns and the date partitions in range are read,
+    so e.g. ``read_history(root, ["id", "observed_at", "asking_price"])``
+    over months of scans stays cheap.
+
+    Args:
+        root: Archive directory.
+        columns: Columns to load (default: all of :data:`HISTORY_SCHEMA`).
+        start: First scan date to include (``date`` or ``"YYYY-MM-DD"``).
+        end: Last scan date to include.
+        ids: Only these listing IDs.
+
+    Returns:
+        One row per archived listing, ordered by ``observed_at`` within a
+        file; empty (with the requested columns) if nothing matches.
+    """
+    columns = list(columns) if columns is not None else HISTORY_SCHEMA.names
+    if not os.path.isdir(root):
+        return pd.DataFrame(columns=columns)
+
+    dataset = ds.dataset(
+        root,
+        format="parquet",
+        schema=HISTORY_SCHEMA.append(pa.field("date", pa.string())),
+        partitioning="hive",
+    )
+    conditions = []
+    if start is not None:
+        conditions.append(ds.field("date") >= str(start))
+    if end is not None:
+        conditions.append(ds.field("date") <= str(end))
+    if ids is not None:
+        conditions.append(ds.field("id").isin([str(i) for i in ids]))
+    expr = None
+    for condition in conditions:
+        expr = condition if expr is None else expr & condition
+    return dataset.to_table(columns=columns, filter=expr).to_pandas()
@@ -0,0 +1,110 @@
+"""
+Two-phase market scan: triage listing rows before loading detail pages.
+
+A result page row already shows the price, age, tiers and deadline of each
+listing, but its estimated value (and so its profit) is only on the
+negotiation page, which costs two page loads per player.  :class:`Triage`
+decides from the row alone whether a listing could still pass
+``ai_recommendation``'s filters:
+
+- the search criteria of :meth:`MarketSearch.targeted
+  <src.scrapers.market_search.MarketSearch.targeted>` — asking price within
+  the available funds and ``MAX_BUDGET``, quality tier and age range;
+- an upper bound on the forecast profit.  The estimated value is bounded by
+  the listing's own value from the previous run or, for a new listing, by
+  the highest value seen for its quality tier, either times
+  :data:`~src.constants.TRIAGE_VALUE_MARGIN`.  Listings whose bound is not
+  positive cannot be profitable.  Tiers with no history are never rejected.
+
+``main_all_transfer.py --triage`` only loads the details of listings that
+pass; the rest are written to ``transfer_listings`` as listing-only rows
+(no estimated value or metrics), and reconsidered on every run.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from src import constants
+from src.core.tiers import tier_rank
+from src.scrapers.market_search import MarketSearch
+
+
+def value_ceilings(snapshot: dict[str, dict[str, Any]]) -> dict[int, float]:
+    """Highest stored estimated value per quality rank.
+
+    Args:
+        snapshot: ``get_transfer_listing_snapshot()`` rows.
+    """
+    ceilings: dict[int, float] = {}
+    for row in snapshot.values():
+        rank, value = row.get("quality_rank"), row.get("estimated_value")
+        if rank is None or not value:
+            continue
+        rank = int(rank)
+        ceilings[rank] = max(ceilings.get(rank, 0.0), float(value))
+    return ceilings
+
+
+def has_details(previous: dict[str, Any] | None) -> bool:
+    """Return ``True`` if a snapshot row came from a loaded detail page."""
+    return previous is not None and previous.get("estimated_value") is not None
+
+
+@dataclass(frozen=True)
+class Triage:
+    """Row-level pre-filter for detail page loads.
+
+    Attributes:
+        search: Budget, tier and age criteria.
+        ceilings: Highest known estimated value per quality rank.
+        margin: Safety factor applied to every value bound.
+    """
+
+    search: MarketSearch
+    ceilings: dict[int, float] = field(default_factory=dict)
+    margin: float = constants.TRIAGE_VALUE_MARGIN
+
+    @classmethod
+    def build(
+        cls,
+        team_info: dict[str, Any] | None,
+        snapshot: dict[str, dict[str, Any]],
+    ) -> Triage:
+        """Triage for the team's current funds and the previous run's values."""
+        return cls(MarketSearch.targeted(team_info), value_ceilings(snapshot))
+
+    def profit_bound(
+        self, row: dict[str, Any], previous: dict[str, Any] | None = None
+    ) -> float | None:
+        """Upper bound on a listing's forecast profit, or ``None`` if unknown.
+
+        Args:
+            row: :func:`~src.scrapers.transfer.parse_listing_page` row.
+            previous: The listing's snapshot row, if it was listed last run.
+        """
+        value = (previous or {}).get("estimated_value")
+        if not value:
+            rank = tier_rank(row.get("Quality"))
+            value = self.ceilings.get(rank) if rank is not None else None
+        if not value:
+            return None
+        forecast = (
+            float(value) * self.margin
+            / constants.FORECAST_SELL_DIVISOR * constants.FORECAST_SELL_MULTIPLIER
+        )
+        return forecast - float(row.get("asking_price") or 0)
+
+    def reject(self, row: dict[str, Any], previous: dict[str, Any] | None = None) -> str | None:
+        """Return why a listing is not worth loading, or ``None`` to load it.
+
+        Returns:
+            ``"criteria"`` (budget, tier or age), ``"profit"`` or ``None``.
+        """
+        if not self.search.matches(row):
+            return "criteria"
+        bound = self.profit_bound(row, previous)
+        if bound is not None and bound <= 0:
+            return "profit"
+        return None
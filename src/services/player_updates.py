@@ -0,0 +1,96 @@
+"""
+Buffered partial updates of ``players`` rows.
+
+``update_final_prices.py`` refreshes bids and records final prices one
+player at a time.  Sending each change as its own PATCH costs a round-trip
+per player; :class:`PlayerUpdateBuffer` collects the changes instead and
+writes them with :meth:`SupabaseManager.update_players
+<src.services.supabase_client.SupabaseManager.update_players>` once
+:data:`~src.constants.DEFAULT_BATCH_SIZE` players are pending or the oldest
+change is :data:`~src.constants.PLAYER_UPDATE_FLUSH_SECONDS` old::
+
+    with PlayerUpdateBuffer(db) as updates:
+        updates.add(pid, {"bids_count": "3", "bids_avg": 1_200_000})
+        ...
+    # everything left is flushed on exit
+
+Changes to the same player before a flush are merged (later values win).
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+from src import constants
+from src.core.logger import logger
+
+if TYPE_CHECKING:
+    from src.services.supabase_client import SupabaseManager
+
+
+class PlayerUpdateBuffer:
+    """Collects partial ``players`` updates and writes them in bulk.
+
+    Args:
+        db: Supabase manager (anything with ``update_players``).
+        max_rows: Flush once this many players have pending changes.
+        max_seconds: Flush once the oldest pending change is this old.
+
+    Attributes:
+        written: Players updated so far.
+        failed: IDs of players whose update failed even row by row.
+    """
+
+    def __init__(
+        self,
+        db: SupabaseManager,
+        max_rows: int = constants.DEFAULT_BATCH_SIZE,
+        max_seconds: float = constants.PLAYER_UPDATE_FLUSH_SECONDS,
+    ) -> None:
+        self.db = db
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self.written = 0
+        self.failed: set[str] = set()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._since: float | None = None
+
+    def __enter__(self) -> PlayerUpdateBuffer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, player_id: str, data: dict[str, Any]) -> None:
+        """Queue changes to one player; flushes if the buffer is full or old."""
+        if not data:
+            return
+        self._pending.setdefault(str(player_id), {}).update(data)
+        if self._since is None:
+            self._since = time.monotonic()
+        if self.due():
+            self.flush()
+
+    def due(self) -> bool:
+        """Return ``True`` if the pending changes should be written now."""
+        if not self._pending:
+            return False
+        return (
+            len(self._pending) >= self.max_rows
+            or time.monotonic() - (self._since or 0.0) >= self.max_seconds
+        )
+
+    def flush(self) -> None:
+        """Write every pending change."""
+        if not self._pending:
+            return
+        pending, self._pending, self._since = self._pending, {}, None
+        failed = self.db.update_players(pending)
+        self.failed.update(failed)
+        self.written += len(pending) - len(failed)
+        logger.info("Updated %d players in 'players' (%d failed)", len(pending) - len(failed),
+                    len(failed))
@@ -0,0 +1,241 @@
+"""
+Sharded market scraping: per-shard staging and the final merge.
+
+``main_all_transfer.py --shard i/N`` splits the detail loads of one market
+scrape across N runners.  Every shard crawls the (cheap) result pages but
+only loads the listings whose ID falls in its slice (:func:`in_shard`), so
+the slices are disjoint however listings move between pages mid-scrape.
+
+Shards never write to Supabase.  A :class:`ShardStage` stands in for
+:class:`~src.services.supabase_client.SupabaseManager` as the pipeline's
+sink and appends each write to JSON Lines files::
+
+    transfer_staging/
+      shard-1-of-4/
+        manifest.json        # shard, total, run_started, completed, targeted
+        listings.jsonl       # upsert_transfer_listings batches
+        players.jsonl        # upsert_players batches
+        financials.jsonl     # update_player_financials batches
+        touched.jsonl        # unchanged listing IDs
+      shard-2-of-4/
+      ...
+
+``main_all_transfer.py --merge`` then runs :func:`merge_shards`, which
+dedupes the staged rows and applies them to ``transfer_listings`` and
+``players`` in one transaction
+(:meth:`~src.services.supabase_client.SupabaseManager.sync_market_rows`).
+Stale listings are only removed when every shard reported a complete,
+untargeted run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import zlib
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from src.core.logger import logger
+from src.services.supabase_client import SupabaseManager
+
+_FILES = ("listings", "players", "financials", "touched")
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a ``"i/N"`` shard spec (1-based) for argparse.
+
+    Raises:
+        argparse.ArgumentTypeError: If the spec is malformed or out of range.
+    """
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/N, got {value!r}") from None
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"shard {value!r} out of range (1 <= i <= N)")
+    return index, total
+
+
+def in_shard(player_id: str, index: int, total: int) -> bool:
+    """Return ``True`` if ``player_id`` belongs to shard ``index`` of ``total``."""
+    pid = str(player_id)
+    key = int(pid) if pid.isdigit() else zlib.crc32(pid.encode("utf-8"))
+    return key % total == index - 1
+
+
+def shard_dir(staging_dir: str, index: int, total: int) -> str:
+    """Directory holding one shard's staged writes."""
+    return os.path.join(staging_dir, f"shard-{index}-of-{total}")
+
+
+class ShardStage:
+    """Records one shard's writes in its staging directory.
+
+    Implements the subset of the ``SupabaseManager`` interface that
+    :class:`~src.services.transfer_pipeline.TransferPipeline` writes
+    through, so the pipeline runs unchanged in shard mode.
+
+    Args:
+        staging_dir: Root staging directory shared by all shards.
+        index: 1-based shard number.
+        total: Number of shards.
+        run_started: Start timestamp of this shard's run.
+        append: Keep previously staged rows (a resumed shard).
+        targeted: The shard scanned a filtered search
+            (:class:`~src.scrapers.market_search.MarketSearch`), not the
+            whole market.
+    """
+
+    def __init__(
+        self,
+        staging_dir: str,
+        index: int,
+        total: int,
+        run_started: str,
+        append: bool = False,
+        targeted: bool = False,
+    ) -> None:
+        self.index = index
+        self.total = total
+        self.run_started = run_started
+        self.targeted = targeted
+        self.path = shard_dir(staging_dir, index, total)
+        os.makedirs(self.path, exist_ok=True)
+        if not append:
+            for name in _FILES:
+                open(self._file(name), "w", encoding="utf-8").close()
+        self._write_manifest(completed=False)
+
+    def upsert_transfer_listings(self, records: list[dict[str, Any]]) -> list[str]:
+        """Stage a batch of ``transfer_listings`` rows; a failed write raises."""
+        self._append("listings", records)
+        return []
+
+    def upsert_players(self, records: list[dict[str, Any]]) -> None:
+        """Stage a batch of ``players`` rows."""
+        self._append("players", records)
+
+    def update_player_financials(self, records: list[dict[str, Any]]) -> None:
+        """Stage a batch of financials-only player updates."""
+        self._append("financials", records)
+
+    def touch_transfer_listings(self, ids: list[str], last_updated: str) -> list[str]:
+        """Stage the IDs of unchanged listings; a failed write raises."""
+        self._append("touched", [{"id": str(i)} for i in ids])
+        return []
+
+    def finish(self) -> None:
+        """Mark the shard complete so the merge may delete stale listings."""
+        self._write_manifest(completed=True)
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.jsonl")
+
+    def _append(self, name: str, records: list[dict[str, Any]]) -> None:
+        lines = "".join(
+            json.dumps({k: SupabaseManager._to_native(v) for k, v in rec.items()}, default=str) + "\n"
+            for rec in records
+        )
+        with open(self._file(name), "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def _write_manifest(self, completed: bool) -> None:
+        manifest = {
+            "shard": self.index,
+            "total": self.total,
+            "run_started": self.run_started,
+            "completed": completed,
+            "targeted": self.targeted,
+        }
+        tmp_path = os.path.join(self.path, "manifest.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, os.path.join(self.path, "manifest.json"))
+
+
+# ---------------------------------------------------------------------------
+# Merge
+# ---------------------------------------------------------------------------
+
+
+def _read_jsonl(path: str) -> Iterator[dict[str, Any]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    except FileNotFoundError:
+        return
+
+
+def _dedupe(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Keep the last row staged for each ID."""
+    return list({str(row["id"]): row for row in rows}.values())
+
+
+def merge_shards(db: SupabaseManager, staging_dir: str, total: int) -> dict[str, int]:
+    """Apply every shard's staged writes to Supabase.
+
+    Listings and players are deduplicated by ID (the last staged row wins)
+    and written in one transaction, so a failed merge changes nothing and
+    can simply be rerun; all merged and unchanged listings get the same
+    ``last_updated``.  Listings not staged by any shard are deleted only if
+    all ``total`` shards finished a full-market run; a targeted scan never
+    sees the listings outside its search.
+
+    Args:
+        db: Supabase manager.
+        staging_dir: Root staging directory.
+        total: Number of shards the run was split into.
+
+    Returns:
+        Counts of ``listings``, ``players``, ``financials``, ``unchanged``
+        and ``deleted`` rows written (all zero if the merge failed), plus
+        ``shards_complete``.
+    """
+    merged_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    staged: dict[str, list[dict[str, Any]]] = {name: [] for name in _FILES}
+    complete = 0
+    targeted = False
+
+    for index in range(1, total + 1):
+        path = shard_dir(staging_dir, index, total)
+        try:
+            with open(os.path.join(path, "manifest.json"), encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("Shard %d/%d has no usable manifest: %s", index, total, e)
+            continue
+        targeted = targeted or bool(manifest.get("targeted"))
+        if manifest.get("completed"):
+            complete += 1
+        else:
+            logger.warning("Shard %d/%d did not complete; keeping stale listings", index, total)
+        for name in _FILES:
+            staged[name].extend(_read_jsonl(os.path.join(path, f"{name}.jsonl")))
+
+    listings = _dedupe(staged["listings"])
+    written = {str(row["id"]) for row in listings}
+    unchanged = sorted({str(row["id"]) for row in staged["touched"]} - written)
+
+    applied = db.sync_market_rows(
+        listings,
+        _dedupe(staged["players"]),
+        _dedupe(staged["financials"]),
+        unchanged,
+        last_updated=merged_at,
+        delete_stale=complete == total and not targeted and bool(listings or unchanged),
+    )
+    if applied is None:
+        logger.error("Merge failed; Supabase is unchanged and the staged shards are kept")
+        applied = dict.fromkeys(("listings", "players", "financials", "unchanged", "deleted"), 0)
+    counts = {**applied, "shards_complete": complete}
+    logger.info(
+        "Merged %(shards_complete)d complete shard(s): %(listings)d listings, %(players)d players, "
+        "%(financials)d financials-only, %(unchanged)d unchanged, %(deleted)d deleted",
+        counts,
+    )
+    return counts
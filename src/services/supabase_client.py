@@ -8,10 +8,16 @@ Provides :class:`SupabaseManager` which wraps all database operations
 
 All write methods coerce NumPy / Pandas types to native Python before
 sending to Supabase, since the client library rejects ``np.int64`` etc.
+
+Full-table refreshes go through :meth:`SupabaseManager.swap_table_rows`
+and incremental ones through :meth:`SupabaseManager.sync_table_rows`, which
+need the Postgres functions in ``db_schemas/swap_table_rows.sql``.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import math
 from datetime import datetime, timedelta, timezone
 from typing import Any
@@ -21,6 +27,11 @@ from supabase import create_client
 from src import constants
 from src.config import config
 from src.core.logger import logger
+from src.core.tiers import tier_rank
+from src.core.utils import format_deadline
+
+#: Integer tier ordinals stored next to the text tier columns.
+TIER_RANK_COLS: tuple[str, ...] = ("quality_rank", "potential_rank")
 
 
 class SupabaseManager:
@@ -68,8 +79,8 @@ class SupabaseManager:
 
         return val
 
+    @staticmethod
     def _coerce_record(
-        self,
         row: dict[str, Any],
         int_cols: tuple[str, ...] = (),
         float_cols: tuple[str, ...] = (),
@@ -78,7 +89,10 @@ class SupabaseManager:
 
         Converts integer columns from string/float to ``int`` and float
         columns from string to ``float``, handling empty strings and
-        ``ValueError`` / ``TypeError`` gracefully.
+        ``ValueError`` / ``TypeError`` gracefully.  ``age`` and the tier rank
+        columns are always coerced to ``int`` or ``None``, and ``deadline``
+        to a ``timestamptz`` string or ``None``
+        (:func:`~src.core.utils.format_deadline`).
 
         Args:
             row: Mutable dict of column → value pairs (modified in place).
@@ -94,6 +108,18 @@ class SupabaseManager:
             except (ValueError, TypeError):
                 row["age"] = None
 
+        # Tier ranks stay NULL when the tier is unknown — 0 would sort below
+        # "Terrible" in range filters.
+        for col in TIER_RANK_COLS:
+            if col in row:
+                try:
+                    row[col] = int(row[col]) if row[col] not in (None, "") else None
+                except (ValueError, TypeError):
+                    row[col] = None
+
+        if "deadline" in row:
+            row["deadline"] = format_deadline(row["deadline"])
+
         for col in int_cols:
             if col in row:
                 try:
@@ -110,13 +136,17 @@ class SupabaseManager:
 
         return row
 
-    def _upsert_batched(self, table: str, rows: list[dict[str, Any]]) -> None:
+    def _upsert_batched(self, table: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Upsert rows into a Supabase table in safe batch sizes.
 
         Args:
             table: Target table name.
             rows: List of row dicts to upsert.
+
+        Returns:
+            The rows of the batches that failed (logged), empty if all succeeded.
         """
+        failed: list[dict[str, Any]] = []
         batch_size = constants.DEFAULT_BATCH_SIZE
         for i in range(0, len(rows), batch_size):
             batch = rows[i : i + batch_size]
@@ -126,6 +156,82 @@ class SupabaseManager:
                 logger.error(
                     "Failed to upsert %s batch starting at row %d: %s", table, i, e
                 )
+                failed.extend(batch)
+        return failed
+
+    def swap_table_rows(
+        self,
+        table: str,
+        rows: list[dict[str, Any]],
+        scope: dict[str, Any] | None = None,
+    ) -> int | None:
+        """Atomically replace a table's rows in one server-side call.
+
+        Calls the ``swap_table_rows`` Postgres function
+        (``db_schemas/swap_table_rows.sql``), which stages ``rows`` and swaps
+        them in within one transaction: readers never see the table empty
+        or half written, and a failed call leaves it unchanged.
+
+        Args:
+            table: Target table; the function only accepts the full-refresh
+                tables (``transfer_listings``, ``bot_opportunities``,
+                ``my_squad``, ``upcoming_fixtures``).
+            rows: Native-typed rows, unique by primary key.
+            scope: Column values selecting the rows to replace, e.g.
+                ``{"season": "95"}``; every row when omitted.
+
+        Returns:
+            Number of rows inserted, or ``None`` on error.
+        """
+        try:
+            resp = self.client.rpc(
+                "swap_table_rows",
+                {"target_table": table, "new_rows": rows, "scope": scope or {}},
+            ).execute()
+        except Exception as e:
+            logger.error("Failed to swap rows into %s (table unchanged): %s", table, e)
+            return None
+        inserted = int(resp.data or 0)
+        logger.info("Swapped %d rows into '%s'", inserted, table)
+        return inserted
+
+    def sync_table_rows(
+        self, changes: list[tuple[str, str, list[dict[str, Any]]]]
+    ) -> list[int] | None:
+        """Apply row-level changes to id-keyed tables in one transaction.
+
+        Calls the ``sync_table_rows`` Postgres function
+        (``db_schemas/swap_table_rows.sql``): unlike :meth:`swap_table_rows`
+        only the given rows are written, and a failed call changes nothing.
+
+        Args:
+            changes: ``(table, op, rows)`` applied in order, where ``table``
+                is ``transfer_listings`` or ``players`` and ``op`` is
+                ``"upsert"``, ``"update"`` (existing ids only) or
+                ``"delete"`` (only the ``id`` of each row is read).  Rows are
+                native-typed and unique by ``id``; split rows that set
+                different columns with :meth:`_by_columns`.
+
+        Returns:
+            Number of rows each change affected, or ``None`` on error.
+        """
+        if not any(rows for _, _, rows in changes):
+            return [0] * len(changes)
+        payload = [{"table": table, "op": op, "rows": rows} for table, op, rows in changes]
+        try:
+            resp = self.client.rpc("sync_table_rows", {"changes": payload}).execute()
+        except Exception as e:
+            logger.error("Failed to sync %d row changes (tables unchanged): %s", len(changes), e)
+            return None
+        return [int(n) for n in resp.data or [0] * len(changes)]
+
+    @staticmethod
+    def _by_columns(rows: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Split rows into groups that set the same columns, in first-seen order."""
+        groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        return list(groups.values())
 
     # ------------------------------------------------------------------
     # players table
@@ -135,24 +241,39 @@ class SupabaseManager:
         """Batch upsert player records into the ``players`` table.
 
         Known schema columns are mapped to their DB column names; all other
-        keys are packed into the ``skills`` JSONB column.
+        keys are packed into the ``skills`` JSONB column.  ``updated_at`` is
+        set to now, marking the skills as fresh (see
+        :meth:`get_fresh_player_ids`).
 
         Args:
             records: List of raw player dicts from the scraper.
         """
+        rows = self._player_rows(records)
+        if not rows:
+            return
+
+        self._upsert_batched("players", rows)
+        logger.info("Upserted %d rows to 'players'", len(rows))
+
+    @classmethod
+    def _player_rows(cls, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map scraper records to ``players`` rows (see :meth:`upsert_players`)."""
         KNOWN_COLS = {
             "id", "name", "position", "age", "nationality",
             "Quality", "Potential", "Affected Quality",
+            "quality_rank", "potential_rank",
             "bids_count", "bids_avg", "deadline", "url",
             "last_transfer_price", "sale_to_bid_ratio",
         }
         KNOWN_DB_COLS = {
             "id", "name", "position", "age", "nationality",
             "quality", "potential", "affected_quality",
+            "quality_rank", "potential_rank",
             "bids_count", "bids_avg", "deadline", "url",
             "last_transfer_price", "sale_to_bid_ratio",
         }
 
+        updated_at = datetime.now(timezone.utc).isoformat()
         rows: list[dict[str, Any]] = []
         for rec in records:
             row: dict[str, Any] = {}
@@ -161,9 +282,9 @@ class SupabaseManager:
             for key, val in rec.items():
                 db_key = key.lower().replace(" ", "_")
                 if key in KNOWN_COLS or db_key in KNOWN_DB_COLS:
-                    row[db_key] = self._to_native(val)
+                    row[db_key] = cls._to_native(val)
                 else:
-                    skills[key] = self._to_native(val)
+                    skills[key] = cls._to_native(val)
 
             row["skills"] = skills
 
@@ -177,14 +298,82 @@ class SupabaseManager:
                 continue
 
             row["id"] = str(row["id"])
-            self._coerce_record(row)
+            row["updated_at"] = updated_at
+            cls._coerce_record(row)
             rows.append(row)
+        return rows
+
+    def update_player_financials(self, records: list[dict[str, Any]]) -> None:
+        """Update only the negotiation-page columns of already-known players.
+
+        Used for financials-only refreshes: ``skills`` and ``updated_at`` are
+        left untouched, so the skills keep their original freshness.  Rows
+        are written with update semantics (:meth:`sync_table_rows`), so an
+        ID missing from ``players`` is skipped rather than inserted as a row
+        without skills.
 
+        Args:
+            records: Player dicts with ``id`` and any of ``bids_count``,
+                ``bids_avg`` and ``deadline``.
+        """
+        rows = self._financial_rows(records)
         if not rows:
             return
 
-        self._upsert_batched("players", rows)
-        logger.info("Upserted %d rows to 'players'", len(rows))
+        updated = 0
+        batch_size = constants.DEFAULT_BATCH_SIZE
+        for i in range(0, len(rows), batch_size):
+            groups = self._by_columns(rows[i : i + batch_size])
+            applied = self.sync_table_rows([("players", "update", group) for group in groups])
+            if applied is None:
+                logger.error("Failed to update financials batch starting at row %d", i)
+                continue
+            updated += sum(applied)
+        logger.info("Updated financials of %d rows in 'players'", updated)
+
+    @classmethod
+    def _financial_rows(cls, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map records to ``players`` rows holding only the negotiation-page columns."""
+        cols = ("bids_count", "bids_avg", "deadline")
+        return [
+            cls._coerce_record(
+                {"id": str(rec["id"]), **{c: cls._to_native(rec[c]) for c in cols if c in rec}}
+            )
+            for rec in records
+            if rec.get("id")
+        ]
+
+    def get_fresh_player_ids(self, max_age_hours: float) -> set[str]:
+        """Return IDs of players whose skills were written in the last ``max_age_hours``.
+
+        Paginates in batches of 1000 to bypass PostgREST's default row limit.
+
+        Returns:
+            Set of player ID strings, or an empty set on error (every player
+            is then treated as stale).
+        """
+        since = (datetime.now(timezone.utc) - timedelta(hours=max_age_hours)).isoformat()
+        try:
+            ids: set[str] = set()
+            batch_size = 1000
+            offset = 0
+            while True:
+                resp = (
+                    self.client.table("players")
+                    .select("id")
+                    .gte("updated_at", since)
+                    .range(offset, offset + batch_size - 1)
+                    .execute()
+                )
+                batch = resp.data or []
+                ids.update(str(row["id"]) for row in batch)
+                if len(batch) < batch_size:
+                    break
+                offset += batch_size
+            return ids
+        except Exception as e:
+            logger.error("Failed to fetch fresh player ids: %s", e)
+            return set()
 
     def delete_zero_skill_players(self) -> int:
         """Remove players whose numeric skills are all zero (unscouted)."""
@@ -238,16 +427,24 @@ class SupabaseManager:
             logger.error("Failed to fetch players: %s", e)
             return []
 
-    def get_players_for_price_update(self, lookback_days: int = 7) -> list[dict[str, Any]]:
+    def get_players_for_price_update(
+        self, lookback_days: int = 7, changed_since: datetime | None = None
+    ) -> list[dict[str, Any]]:
         """Fetch only players relevant to the price updater.
 
         Returns active listings (future deadline) plus recently-completed
         listings (deadline within the past ``lookback_days`` days) that still
-        have no recorded sale price.  This avoids iterating over the full
-        historical player table.
+        have no recorded sale price.  ``deadline`` is a ``timestamptz``, so
+        both ranges are compared (and indexed) on the server; this avoids
+        iterating over the full historical player table.  With
+        ``changed_since`` only rows whose ``changed_at`` (maintained by a
+        trigger, see ``db_schemas/players_changed_at.sql``) is at or after
+        that time are returned, so a running updater reads just what changed.
 
         Args:
             lookback_days: How many days back to look for completed listings.
+            changed_since: Naive UTC+7 time of the previous load, or ``None``
+                for every matching row.
 
         Returns:
             List of matching player row dicts, or an empty list on error.
@@ -256,30 +453,34 @@ class SupabaseManager:
             cutoff = (
                 datetime.now(tz=timezone.utc) - timedelta(days=lookback_days)
             ).isoformat()
+            since = format_deadline(changed_since) if changed_since else None
 
             # Active listings: deadline in the future
-            active_resp = (
+            active_query = (
                 self.client.table("players")
                 .select("*")
                 .gt("deadline", datetime.now(tz=timezone.utc).isoformat())
-                .execute()
             )
-            active = active_resp.data or []
+            if since:
+                active_query = active_query.gte("changed_at", since)
+            active = active_query.execute().data or []
 
             # Completed listings within lookback window that still need a price
-            completed_resp = (
+            completed_query = (
                 self.client.table("players")
                 .select("*")
                 .gte("deadline", cutoff)
                 .lte("deadline", datetime.now(tz=timezone.utc).isoformat())
                 .or_("last_transfer_price.is.null,last_transfer_price.eq.0")
-                .execute()
             )
-            completed = completed_resp.data or []
+            if since:
+                completed_query = completed_query.gte("changed_at", since)
+            completed = completed_query.execute().data or []
 
             rows = {r["id"]: r for r in active + completed}
             logger.info(
-                "Price updater scope: %d active + %d completed = %d unique players",
+                "Price updater scope%s: %d active + %d completed = %d unique players",
+                f" (changed since {changed_since})" if changed_since else "",
                 len(active),
                 len(completed),
                 len(rows),
@@ -296,83 +497,369 @@ class SupabaseManager:
             player_id: Supabase row ID of the player.
             data: Dict of column → new value pairs.
         """
-        clean = {k: self._to_native(v) for k, v in data.items()}
+        clean = self._coerce_record({k: self._to_native(v) for k, v in data.items()})
         try:
             self.client.table("players").update(clean).eq("id", str(player_id)).execute()
         except Exception as e:
             logger.error("Failed to update player %s: %s", player_id, e)
 
+    def update_players(self, updates: dict[str, dict[str, Any]]) -> list[str]:
+        """Apply partial updates to many existing player rows in one call.
+
+        Rows are grouped by the set of columns they update, so a group never
+        nulls a column another row left out, and the groups are written with
+        update semantics in one :meth:`sync_table_rows` transaction: IDs
+        missing from ``players`` are skipped, never inserted.  If the call
+        fails, the rows are retried one by one with :meth:`update_player`
+        semantics.
+
+        Args:
+            updates: Player ID → column → new value.
+
+        Returns:
+            IDs of the players that could not be updated.
+        """
+        rows: list[dict[str, Any]] = []
+        for pid, data in updates.items():
+            row = self._coerce_record(
+                {k: self._to_native(v) for k, v in data.items() if k != "id"}
+            )
+            if row:
+                rows.append({"id": str(pid), **row})
+        if not rows:
+            return []
+
+        groups = self._by_columns(rows)
+        if self.sync_table_rows([("players", "update", group) for group in groups]) is not None:
+            return []
+
+        logger.warning("Bulk update of %d players failed; retrying row by row", len(rows))
+        failed: list[str] = []
+        for row in rows:
+            pid = row["id"]
+            data = {k: v for k, v in row.items() if k != "id"}
+            try:
+                self.client.table("players").update(data).eq("id", pid).execute()
+            except Exception as e:
+                logger.error("Failed to update player %s: %s", pid, e)
+                failed.append(pid)
+        return failed
+
     # ------------------------------------------------------------------
-    # transfer_listings table
+    # bid_history table
     # ------------------------------------------------------------------
 
-    def replace_transfer_listings(self, records: list[dict[str, Any]]) -> None:
-        """Full-replace the ``transfer_listings`` table with new data.
+    def insert_bid_history(self, rows: list[dict[str, Any]]) -> None:
+        """Append delta-encoded bid observations to ``bid_history``.
 
-        Deletes all existing rows, then inserts the provided records in batches.
+        Rows are upserted on ``(player_id, observed_at)``, so a batch
+        written twice does not duplicate observations.
 
         Args:
-            records: List of transfer listing dicts from the scraper.
+            rows: Rows as built by :class:`~src.services.bid_history.BidHistory`.
         """
-        COL_MAP = {
-            "id": "id",
-            "name": "name",
-            "position": "position",
-            "age": "age",
-            "Quality": "quality",
-            "Potential": "potential",
-            "estimated_value": "estimated_value",
-            "asking_price": "asking_price",
-            "value_diff": "value_diff",
-            "roi": "roi",
-            "forecast_sell": "forecast_sell",
-            "forecast_profit": "forecast_profit",
-            "deadline": "deadline",
-            "url": "url",
-            "last_updated": "last_updated",
-        }
+        if not rows:
+            return
+        self._upsert_batched("bid_history", [
+            {k: self._to_native(v) for k, v in row.items()} for row in rows
+        ])
+        logger.info("Recorded %d rows to 'bid_history'", len(rows))
+
+    # ------------------------------------------------------------------
+    # transfer_listings table
+    # ------------------------------------------------------------------
 
+    _TRANSFER_LISTING_COLS: dict[str, str] = {
+        "id": "id",
+        "name": "name",
+        "position": "position",
+        "age": "age",
+        "Quality": "quality",
+        "Potential": "potential",
+        "quality_rank": "quality_rank",
+        "potential_rank": "potential_rank",
+        "estimated_value": "estimated_value",
+        "asking_price": "asking_price",
+        "bids_count": "bids_count",
+        "value_diff": "value_diff",
+        "roi": "roi",
+        "forecast_sell": "forecast_sell",
+        "forecast_profit": "forecast_profit",
+        "deadline": "deadline",
+        "url": "url",
+        "search_profiles": "search_profiles",
+        "last_updated": "last_updated",
+    }
+
+    @classmethod
+    def _transfer_listing_rows(cls, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map scraper records to coerced ``transfer_listings`` rows."""
         rows: list[dict[str, Any]] = []
         for rec in records:
             row: dict[str, Any] = {}
-            for src_key, db_key in COL_MAP.items():
+            for src_key, db_key in cls._TRANSFER_LISTING_COLS.items():
                 if src_key in rec:
-                    row[db_key] = self._to_native(rec[src_key])
+                    row[db_key] = cls._to_native(rec[src_key])
 
             if "id" not in row or not row["id"]:
                 continue
             row["id"] = str(row["id"])
 
-            self._coerce_record(
+            cls._coerce_record(
                 row,
-                int_cols=("estimated_value", "asking_price", "value_diff"),
+                int_cols=("estimated_value", "asking_price", "bids_count", "value_diff"),
                 float_cols=("roi", "forecast_sell", "forecast_profit"),
             )
+            row["content_hash"] = cls._content_hash(row)
             rows.append(row)
+        return rows
+
+    @classmethod
+    def transfer_listing_hashes(cls, records: list[dict[str, Any]]) -> dict[str, str]:
+        """Return ``{id: content_hash}`` of the rows ``records`` would write.
+
+        Lets a caller compare a batch with :meth:`get_transfer_listing_snapshot`
+        and write only the listings that changed.
+        """
+        return {row["id"]: row["content_hash"] for row in cls._transfer_listing_rows(records)}
+
+    @staticmethod
+    def _content_hash(row: dict[str, Any]) -> str:
+        """Stable digest of a row's content, ignoring bookkeeping columns."""
+        content = {k: v for k, v in row.items() if k not in ("last_updated", "content_hash")}
+        payload = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _transfer_listing_hashes(self) -> dict[str, str | None]:
+        """Return ``{id: content_hash}`` for every current listing (paginated)."""
+        hashes: dict[str, str | None] = {}
+        batch_size = 1000
+        offset = 0
+        while True:
+            resp = (
+                self.client.table("transfer_listings")
+                .select("id, content_hash")
+                .order("id")
+                .range(offset, offset + batch_size - 1)
+                .execute()
+            )
+            batch = resp.data or []
+            for row in batch:
+                hashes[str(row["id"])] = row.get("content_hash")
+            if len(batch) < batch_size:
+                break
+            offset += batch_size
+        return hashes
+
+    def upsert_transfer_listings(self, records: list[dict[str, Any]]) -> list[str]:
+        """Batch upsert transfer listing records, keeping all other rows.
+
+        Used by the streaming market scrape, which writes listings as they
+        are scraped and removes expired ones at the end with
+        :meth:`delete_stale_transfer_listings`.  Rows are grouped by column
+        set, so a record without some columns leaves their stored values
+        alone.
+
+        Args:
+            records: List of transfer listing dicts from the scraper.
 
+        Returns:
+            IDs of the listings that could not be written.
+        """
+        rows = self._transfer_listing_rows(records)
         if not rows:
-            return
+            return []
+
+        failed: list[str] = []
+        for group in self._by_columns(rows):
+            failed.extend(row["id"] for row in self._upsert_batched("transfer_listings", group))
+        logger.info("Upserted %d rows to 'transfer_listings'", len(rows) - len(failed))
+        return failed
+
+    def delete_stale_transfer_listings(self, before: str) -> int:
+        """Delete listings whose ``last_updated`` is older than ``before``.
+
+        Args:
+            before: Run start timestamp, formatted like the ``last_updated``
+                values written by the same run.
 
+        Returns:
+            Number of listings deleted (0 on error).
+        """
         try:
-            # Delete all existing rows for a full replace.
-            # neq("id", "0") is a filter that matches every real row since
-            # no player ID will ever be the string "0".
-            logger.info("Clearing existing transfer listings...")
-            self.client.table("transfer_listings").delete().neq("id", "0").execute()
+            resp = (
+                self.client.table("transfer_listings")
+                .delete()
+                .lt("last_updated", before)
+                .execute()
+            )
+            deleted = len(resp.data or [])
+            logger.info("Removed %d transfer listings not seen since %s", deleted, before)
+            return deleted
         except Exception as e:
-            logger.error("Failed to clear old transfer_listings: %s", e)
+            logger.error("Failed to delete stale transfer_listings: %s", e)
+            return 0
 
+    def touch_transfer_listings(self, ids: list[str], last_updated: str) -> list[str]:
+        """Set ``last_updated`` on listings that were seen unchanged.
+
+        Args:
+            ids: Listing IDs to refresh.
+            last_updated: Timestamp in the format written by the scrape.
+
+        Returns:
+            IDs of the listings that could not be touched.
+        """
+        failed: list[str] = []
         batch_size = constants.DEFAULT_BATCH_SIZE
-        for i in range(0, len(rows), batch_size):
-            batch = rows[i : i + batch_size]
+        for i in range(0, len(ids), batch_size):
+            batch = [str(x) for x in ids[i : i + batch_size]]
             try:
-                self.client.table("transfer_listings").insert(batch).execute()
+                self.client.table("transfer_listings").update(
+                    {"last_updated": last_updated}
+                ).in_("id", batch).execute()
             except Exception as e:
                 logger.error(
-                    "Failed to insert transfer_listings batch starting at row %d: %s", i, e
+                    "Failed to touch transfer_listings batch starting at row %d: %s", i, e
                 )
+                failed.extend(batch)
+        return failed
 
-        logger.info("Replaced %d rows in 'transfer_listings'", len(rows))
+    def sync_market_rows(
+        self,
+        listings: list[dict[str, Any]],
+        players: list[dict[str, Any]],
+        financials: list[dict[str, Any]],
+        touched: list[str],
+        last_updated: str,
+        delete_stale: bool = False,
+    ) -> dict[str, int] | None:
+        """Apply one market scan's writes in a single transaction.
+
+        Listings and players are upserted, financials-only refreshes update
+        existing players, and ``touched`` listings get ``last_updated``, all
+        through one :meth:`sync_table_rows` call: either every write lands
+        or, on any error, none does.
+
+        Args:
+            listings: ``transfer_listings`` records; all get ``last_updated``.
+            players: Full player records (as for :meth:`upsert_players`).
+            financials: Records for :meth:`update_player_financials`.
+            touched: IDs of listings seen unchanged.
+            last_updated: Freshness timestamp of the scan.
+            delete_stale: Also delete the listings that are neither in
+                ``listings`` nor in ``touched`` (a complete, full-market scan).
+
+        Returns:
+            Rows written per kind (``listings``, ``players``, ``financials``,
+            ``unchanged``, ``deleted``), or ``None`` if nothing was applied.
+        """
+        listing_rows = self._transfer_listing_rows(
+            [{**rec, "last_updated": last_updated} for rec in listings]
+        )
+        kinds: list[str] = []
+        changes: list[tuple[str, str, list[dict[str, Any]]]] = []
+
+        def add(kind: str, table: str, op: str, rows: list[dict[str, Any]]) -> None:
+            for group in self._by_columns(rows):
+                kinds.append(kind)
+                changes.append((table, op, group))
+
+        add("listings", "transfer_listings", "upsert", listing_rows)
+        add("players", "players", "upsert", self._player_rows(players))
+        add("financials", "players", "update", self._financial_rows(financials))
+        add("unchanged", "transfer_listings", "update", [
+            {"id": str(pid), "last_updated": last_updated} for pid in touched
+        ])
+        if delete_stale:
+            try:
+                current = self._transfer_listing_hashes()
+            except Exception as e:
+                logger.error("Failed to read transfer_listings for the stale delete: %s", e)
+                return None
+            kept = {row["id"] for row in listing_rows} | {str(pid) for pid in touched}
+            add("deleted", "transfer_listings", "delete", [
+                {"id": pid} for pid in sorted(current.keys() - kept)
+            ])
+
+        applied = self.sync_table_rows(changes)
+        if applied is None:
+            return None
+        counts = dict.fromkeys(("listings", "players", "financials", "unchanged", "deleted"), 0)
+        for kind, n in zip(kinds, applied):
+            counts[kind] += n
+        return counts
+
+    def get_transfer_listing_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the previous run's listings by id.
+
+        Each entry has the ``asking_price``, ``deadline`` and ``bids_count``
+        shown on the search result page, plus ``estimated_value``,
+        ``quality_rank`` and ``content_hash``.  Used by the incremental market
+        scan to skip listings whose visible fields have not changed since the
+        previous run, and to skip writing
+        reloaded listings whose content hash is unchanged; and by its triage
+        (:mod:`src.services.market_triage`) to bound estimated values.  A
+        ``None`` estimated value marks a listing-only row.  Paginates in
+        batches of 1000, ordered by id, to bypass PostgREST's default row
+        limit.
+
+        Returns:
+            Snapshot dict, or an empty dict on error (forcing a full refresh).
+        """
+        try:
+            snapshot: dict[str, dict[str, Any]] = {}
+            batch_size = 1000
+            offset = 0
+            while True:
+                resp = (
+                    self.client.table("transfer_listings")
+                    .select(
+                        "id, asking_price, deadline, bids_count, estimated_value, quality_rank, "
+                        "content_hash"
+                    )
+                    .order("id")
+                    .range(offset, offset + batch_size - 1)
+                    .execute()
+                )
+                batch = resp.data or []
+                for row in batch:
+                    snapshot[str(row["id"])] = row
+                if len(batch) < batch_size:
+                    break
+                offset += batch_size
+            return snapshot
+        except Exception as e:
+            logger.error("Failed to fetch transfer_listings snapshot: %s", e)
+            return {}
+
+    def get_transfer_listings_ending_within(self, hours: float) -> list[dict[str, Any]]:
+        """Fetch the listings whose auction closes within the next ``hours``.
+
+        The range is evaluated on the server against the indexed
+        ``timestamptz`` deadline.
+
+        Args:
+            hours: Horizon from now.
+
+        Returns:
+            Matching transfer listing row dicts, soonest first, or an empty
+            list on error.
+        """
+        now = datetime.now(tz=timezone.utc)
+        try:
+            resp = (
+                self.client.table("transfer_listings")
+                .select("*")
+                .gt("deadline", now.isoformat())
+                .lt("deadline", (now + timedelta(hours=hours)).isoformat())
+                .order("deadline")
+                .execute()
+            )
+            return resp.data or []
+        except Exception as e:
+            logger.error("Failed to fetch transfer_listings ending within %sh: %s", hours, e)
+            return []
 
     def get_all_transfer_listings(self) -> list[dict[str, Any]]:
         """Fetch all transfer listing records.
@@ -391,18 +878,15 @@ class SupabaseManager:
     # bot_opportunities table
     # ------------------------------------------------------------------
 
-    def upsert_bot_opportunities(self, records: list[dict[str, Any]]) -> None:
-        """Batch upsert BOT opportunity records.
-
-        Args:
-            records: List of opportunity dicts from the scraper.
-        """
+    def _bot_opportunity_rows(self, records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Map opportunity records to coerced ``bot_opportunities`` rows."""
         COL_MAP = {
             "id": "id",
             "name": "name",
             "position": "position",
             "age": "age",
             "quality": "quality",
+            "quality_rank": "quality_rank",
             "team_name": "team_name",
             "estimated_value": "estimated_value",
             "asking_price": "asking_price",
@@ -429,13 +913,36 @@ class SupabaseManager:
                 float_cols=("profit_margin",),
             )
             rows.append(row)
+        return rows
 
+    def upsert_bot_opportunities(self, records: list[dict[str, Any]]) -> None:
+        """Batch upsert BOT opportunity records.
+
+        Args:
+            records: List of opportunity dicts from the scraper.
+        """
+        rows = self._bot_opportunity_rows(records)
         if not rows:
             return
 
         self._upsert_batched("bot_opportunities", rows)
         logger.info("Upserted %d rows to 'bot_opportunities'", len(rows))
 
+    def replace_bot_opportunities(self, records: list[dict[str, Any]]) -> None:
+        """Replace the ``bot_opportunities`` table with a fresh scout.
+
+        Swapped in atomically (:meth:`swap_table_rows`); an empty scout keeps
+        the current table.
+
+        Args:
+            records: The complete list of opportunity dicts from the scraper.
+        """
+        rows = list({row["id"]: row for row in self._bot_opportunity_rows(records)}.values())
+        if not rows:
+            logger.warning("replace_bot_opportunities called with no rows — keeping the table")
+            return
+        self.swap_table_rows("bot_opportunities", rows)
+
     def get_all_bot_opportunities(self) -> list[dict[str, Any]]:
         """Fetch all BOT opportunity records.
 
@@ -579,8 +1086,9 @@ class SupabaseManager:
     def upsert_my_squad(self, records: list[dict[str, Any]]) -> None:
         """Full-replace the ``my_squad`` table with fresh squad membership.
 
-        Deletes all existing rows, then inserts the provided records so that
-        players who left the squad are automatically removed.
+        The records are swapped in atomically (:meth:`swap_table_rows`), so
+        players who left the squad are removed and the table is never seen
+        empty.
 
         Args:
             records: List of dicts with keys ``player_id`` (str) and
@@ -590,21 +1098,11 @@ class SupabaseManager:
             logger.warning("upsert_my_squad called with empty records — skipping")
             return
 
-        try:
-            self.client.table("my_squad").delete().neq("player_id", "0").execute()
-            logger.info("Cleared all rows from 'my_squad'")
-        except Exception as e:
-            logger.error("Failed to clear my_squad: %s", e)
-
-        rows = [
-            {"player_id": str(r["player_id"]), "position": r["position"]}
+        rows = {
+            str(r["player_id"]): {"player_id": str(r["player_id"]), "position": r["position"]}
             for r in records
-        ]
-        try:
-            self.client.table("my_squad").insert(rows).execute()
-            logger.info("Inserted %d rows into 'my_squad'", len(rows))
-        except Exception as e:
-            logger.error("Failed to insert my_squad rows: %s", e)
+        }
+        self.swap_table_rows("my_squad", list(rows.values()))
 
     def get_my_squad_with_skills(self) -> list[dict[str, Any]]:
         """Fetch squad members joined with their player profiles.
@@ -645,25 +1143,23 @@ class SupabaseManager:
     # ------------------------------------------------------------------
 
     def upsert_upcoming_fixtures(self, fixtures: list[dict]) -> None:
-        """Replace all fixtures for a season (delete-then-insert to avoid stale PK duplicates).
+        """Replace all fixtures for a season (swap instead of upsert to avoid stale PK duplicates).
 
         Upcoming fixtures use a generated match_id; once a match result is
         available the scraper gets the real jogo_id, producing a different PK.
-        A plain upsert would leave both rows in the table.  Deleting the season
-        first ensures only the latest scrape survives.
+        A plain upsert would leave both rows in the table.  Swapping the
+        season's rows (:meth:`swap_table_rows`) ensures only the latest
+        scrape survives, without an empty window.
         """
         if not fixtures:
             return
-        season = fixtures[0].get("season")
-        if season:
-            try:
-                self.client.table("upcoming_fixtures").delete().eq("season", season).execute()
-                logger.info("Cleared existing fixtures for season %s", season)
-            except Exception as e:
-                logger.error("Failed to clear fixtures for season %s: %s", season, e)
         records = [{k: self._to_native(v) for k, v in f.items()} for f in fixtures]
-        self._upsert_batched("upcoming_fixtures", records)
-        logger.info("Inserted %d upcoming fixtures", len(records))
+        season = fixtures[0].get("season")
+        if not season:
+            self._upsert_batched("upcoming_fixtures", records)
+            logger.info("Inserted %d upcoming fixtures", len(records))
+            return
+        self.swap_table_rows("upcoming_fixtures", records, scope={"season": str(season)})
 
     def get_upcoming_fixtures(self, season: str) -> list[dict]:
         try:
@@ -1024,17 +1520,19 @@ class SupabaseManager:
         """Find similar players for skill estimation.
 
         position_prefix: 'GK', 'D', 'M', or 'F' (GK is exact; others use startswith in Python)
+        quality: Tier label; matched on the indexed ``quality_rank`` column
+            when recognised, otherwise on the raw text.
         archetype: 'speed' | 'strength'
         Returns up to `limit` player dicts with 'skills' key.
         """
         # Fetch candidates by age + quality (PostgREST can't do LIKE on position)
-        res = (
-            self.client.table("players")
-            .select("id, position, skills")
-            .eq("age", age)
-            .eq("quality", quality)
-            .execute()
-        )
+        query = self.client.table("players").select("id, position, skills").eq("age", age)
+        rank = tier_rank(quality)
+        if rank is not None:
+            query = query.eq("quality_rank", rank)
+        else:
+            query = query.eq("quality", quality)
+        res = query.execute()
         all_rows = res.data or []
 
         # Filter by position prefix
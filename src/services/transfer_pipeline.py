@@ -0,0 +1,574 @@
+"""
+Streaming producer/consumer pipeline for the transfer market scrape.
+
+``main_all_transfer.py`` used to keep every scraped player in memory and
+only wrote the CSV and Supabase once the whole market had been scraped.
+:class:`TransferPipeline` instead moves each listing through bounded stages
+as soon as its pages are fetched::
+
+    caller thread                 results thread           sink thread
+    discover IDs → fetch pages ─► parse result ─────────► ROI + archive + upserts
+                   (ParsePool)  ▲                       ▲
+                                └─ bounded queues ──────┘
+
+Playwright's sync API is bound to the thread that started it, so discovery
+and fetching stay on the caller's thread.  :meth:`TransferPipeline.submit`
+blocks while the downstream queues are full, which keeps memory flat however
+large the market is, and the sink flushes every
+:data:`~src.constants.PIPELINE_FLUSH_ROWS` listings or
+:data:`~src.constants.PIPELINE_FLUSH_SECONDS`, whichever comes first.
+Market metrics are computed per flushed batch by the vectorised engine in
+:mod:`src.services.market_metrics`, and each batch is archived to the Parquet
+market history (:mod:`src.services.market_history`) and/or a CSV.
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+import pandas as pd
+
+from src import constants
+from src.core.logger import logger
+from src.core.utils import GAME_TZ, normalise_deadline, parse_deadline
+from src.services.checkpoint import ScrapeCheckpoint
+from src.services.market_metrics import apply_market_metrics, normalise_deadlines
+from src.services.supabase_client import TIER_RANK_COLS, SupabaseManager
+
+if TYPE_CHECKING:
+    from src.services.market_history import MarketHistory
+    from src.services.shard_staging import ShardStage
+
+#: Columns written to ``transfer_listings`` (when present).
+MARKET_COLS: list[str] = [
+    "id", "name", "position", "age", "Quality", "Potential",
+    "quality_rank", "potential_rank",
+    "estimated_value", "asking_price", "bids_count", "value_diff", "roi",
+    "forecast_sell", "forecast_profit", "deadline", "url", "search_profiles",
+]
+
+#: Columns derived from the estimated value by :mod:`src.services.market_metrics`.
+METRIC_COLS: list[str] = ["value_diff", "roi", "forecast_sell", "forecast_profit"]
+
+#: Columns only a loaded negotiation page provides.
+DETAIL_COLS: list[str] = ["estimated_value", *METRIC_COLS]
+
+#: Financial columns kept out of the ``players`` table.
+PLAYER_DROP_COLS: list[str] = [
+    "estimated_value", "asking_price", "buy_price", "value_diff",
+    "roi", "bids_count", "forecast_sell", "forecast_profit", "search_profiles",
+]
+
+_STOP = object()
+
+
+class _Barrier:
+    """Queue marker: flush everything before it, then run ``callback``."""
+
+    def __init__(self, callback: Callable[[], Any]) -> None:
+        self.callback = callback
+
+
+# ---------------------------------------------------------------------------
+# Transforms
+# ---------------------------------------------------------------------------
+
+
+def listing_unchanged(row: dict[str, Any], previous: dict[str, Any] | None) -> bool:
+    """Return ``True`` if a listing row matches the previous run's snapshot.
+
+    Only the fields visible on the search result page are compared: the
+    asking price, the number of bids and the deadline (resolved to game
+    time).  A snapshot without a bid count (written before the column
+    existed) never matches.
+
+    Args:
+        row: Row from :func:`~src.scrapers.transfer.parse_listing_page`.
+        previous: The listing's ``transfer_listings`` snapshot entry, or
+            ``None`` if it was not listed last run.
+    """
+    if not previous:
+        return False
+
+    try:
+        if int(row.get("asking_price") or 0) != int(previous.get("asking_price") or 0):
+            return False
+        if previous.get("bids_count") is None:
+            return False
+        if int(row.get("bids_count") or 0) != int(previous["bids_count"]):
+            return False
+    except (ValueError, TypeError):
+        return False
+
+    parsed = parse_deadline(row.get("deadline"))
+    return parsed is not None and parsed == normalise_deadline(previous.get("deadline"))
+
+
+def order_by_urgency(
+    rows: list[dict[str, Any]],
+    snapshot: dict[str, dict[str, Any]] | None = None,
+    horizon_hours: float = constants.ALERT_HORIZON_HOURS,
+    now: datetime | None = None,
+) -> tuple[list[dict[str, Any]], int]:
+    """Order listing rows by auction deadline, soonest first.
+
+    The deadline text on the result row is used; if it cannot be parsed the
+    deadline stored by the previous run is used instead.  Rows with no known
+    deadline go last, in their original order.
+
+    Args:
+        rows: Rows from :func:`~src.scrapers.transfer.parse_listing_page`.
+        snapshot: Previous ``transfer_listings`` snapshot by ID.
+        horizon_hours: Rows closing within this many hours count as "hot".
+        now: Reference time (naive UTC+7); defaults to the current time.
+
+    Returns:
+        ``(ordered_rows, hot_count)``; the first ``hot_count`` rows close
+        within ``horizon_hours``.
+    """
+    if not rows:
+        return [], 0
+    snapshot = snapshot or {}
+    if now is None:
+        now = datetime.now(tz=GAME_TZ).replace(tzinfo=None)
+    deadlines = normalise_deadlines([row.get("deadline") for row in rows], now=now)
+    stored = normalise_deadlines(
+        [(snapshot.get(row["id"]) or {}).get("deadline") for row in rows], now=now,
+    )
+    deadlines = deadlines.fillna(stored)
+
+    order = np.argsort(deadlines.to_numpy(), kind="stable")  # NaT sorts last
+    cutoff = pd.Timestamp(now) + pd.Timedelta(hours=horizon_hours)
+    hot = int((deadlines <= cutoff).sum())
+    return [rows[i] for i in order], hot
+
+
+def iter_by_urgency(
+    rows: Iterable[dict[str, Any]],
+    snapshot: dict[str, dict[str, Any]] | None = None,
+    window: int = constants.URGENCY_WINDOW_ROWS,
+    horizon_hours: float = constants.ALERT_HORIZON_HOURS,
+    now: datetime | None = None,
+) -> Iterator[tuple[dict[str, Any], bool]]:
+    """Yield discovered rows soonest deadline first, a window at a time.
+
+    Every ``window`` rows are ordered with :func:`order_by_urgency` and
+    yielded before the next window is read, so detail loads start while the
+    crawl is still discovering listings.  The ordering is therefore only
+    exact within a window.
+
+    Yields:
+        ``(row, hot)`` pairs; ``hot`` is true when the row closes within
+        ``horizon_hours``.
+    """
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) < window:
+            continue
+        ordered, hot = order_by_urgency(batch, snapshot, horizon_hours, now)
+        yield from ((r, n < hot) for n, r in enumerate(ordered))
+        batch = []
+    ordered, hot = order_by_urgency(batch, snapshot, horizon_hours, now)
+    yield from ((r, n < hot) for n, r in enumerate(ordered))
+
+
+def frame_records(records: list[dict[str, Any]]) -> pd.DataFrame:
+    """Build a cleaned DataFrame from a batch of listings.
+
+    Market metrics are added and deadlines normalised with
+    :func:`~src.services.market_metrics.apply_market_metrics`.  Infinities
+    become 0, missing numeric values become 0 (tier ranks stay
+    missing so unknown tiers are stored as NULL), and any other missing
+    value becomes ``None``.
+    """
+    df = apply_market_metrics(pd.DataFrame(records))
+    df.replace([np.inf, -np.inf], 0, inplace=True)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns.difference(TIER_RANK_COLS)
+    df[numeric_cols] = df[numeric_cols].fillna(0)
+    return df.where(pd.notnull(df), other=None)
+
+
+# ---------------------------------------------------------------------------
+# Incremental CSV
+# ---------------------------------------------------------------------------
+
+
+class CsvAppender:
+    """Append DataFrame batches to one CSV whose header grows as needed.
+
+    Batches can carry columns the file has not seen yet (goalkeepers have
+    different skills from outfield players).  The header is then widened by
+    rewriting the file once, which happens at most a handful of times per
+    run.
+
+    Args:
+        path: CSV file.
+        append: Keep the rows already in ``path`` (a resumed run) instead of
+            starting from an empty file.
+    """
+
+    def __init__(self, path: str, append: bool = False) -> None:
+        self.path = path
+        self.columns: list[str] = []
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            self.columns = list(pd.read_csv(path, nrows=0).columns)
+        else:
+            open(path, "w", encoding="utf-8").close()
+
+    def append(self, df: pd.DataFrame) -> None:
+        """Append ``df``'s rows, widening the header first if necessary."""
+        new_cols = [c for c in df.columns if c not in self.columns]
+        if new_cols and self.columns:
+            self._widen(new_cols)
+        write_header = not self.columns
+        if write_header:
+            self.columns = list(df.columns)
+
+        df.reindex(columns=self.columns).to_csv(
+            self.path, mode="a", header=write_header, index=False
+        )
+
+    def _widen(self, new_cols: list[str]) -> None:
+        existing = pd.read_csv(self.path, dtype=str, keep_default_na=False)
+        self.columns.extend(new_cols)
+        tmp_path = f"{self.path}.tmp"
+        existing.reindex(columns=self.columns).to_csv(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+
+class TransferPipeline:
+    """Bounded producer/consumer pipeline from parse futures to Supabase.
+
+    Usage::
+
+        with ParsePool() as pool, TransferPipeline(db, "out.csv") as pipeline:
+            for pid in ids:
+                neg_html, profile_html = scraper.fetch_player_pages(pid)
+                pipeline.submit(pid, pool.submit(parse_player_page, pid, neg_html, profile_html))
+        print(pipeline.written)
+
+    Listings that did not change since the last run are passed to
+    :meth:`touch` instead; they only have their ``last_updated`` bumped.
+    Listings submitted with ``skills=False`` (financials-only refreshes)
+    update ``transfer_listings`` and the player's negotiation columns but
+    leave the stored skills alone.  Listing-only records
+    (:meth:`submit_listing`) only update ``transfer_listings``, without
+    metrics.  :meth:`when_flushed` queues a callback
+    that runs once everything submitted before it has been written.
+    Leaving the ``with`` block drains both queues and flushes the last
+    partial batch, including when the producer raised.
+
+    Flushed batches are appended to ``history`` and to the CSV at
+    ``csv_path`` (pass ``None`` for either to skip it).  Touched listings
+    are archived to ``history`` too when :meth:`touch` is given their
+    record, so the archive sees every listing a scan observes; they are
+    never written to the CSV.
+
+    Pass ``known_hashes`` (``{id: content_hash}`` of the rows already in
+    ``transfer_listings``) to write only the loaded listings whose content
+    changed: a listing whose hash matches is touched instead, and written
+    listings are split into ``inserted`` and ``updated``.  With a
+    ``checkpoint``, every listing that reaches Supabase (written or touched)
+    is marked processed in it, and it is saved once more on close.
+
+    Attributes:
+        written: Listings upserted to Supabase so far.
+        inserted: Written listings not in ``known_hashes``.
+        updated: Written listings whose stored hash differed.
+        touched: Unchanged listings whose freshness timestamp was bumped.
+        failed: Listings whose parse raised and were dropped.
+        unwritten: Listings whose Supabase write (upsert or touch) failed;
+            they are neither counted above nor marked processed.
+    """
+
+    def __init__(
+        self,
+        db: SupabaseManager | ShardStage,
+        csv_path: str | None,
+        queue_size: int = constants.PIPELINE_QUEUE_SIZE,
+        flush_rows: int = constants.PIPELINE_FLUSH_ROWS,
+        flush_seconds: float = constants.PIPELINE_FLUSH_SECONDS,
+        known_hashes: dict[str, str | None] | None = None,
+        checkpoint: ScrapeCheckpoint | None = None,
+        append_csv: bool = False,
+        history: MarketHistory | None = None,
+    ) -> None:
+        self.db = db
+        self.csv = CsvAppender(csv_path, append=append_csv) if csv_path else None
+        self.history = history
+        self.checkpoint = checkpoint
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.written = 0
+        self.inserted = 0
+        self.updated = 0
+        self.touched = 0
+        self.failed = 0
+        self.unwritten = 0
+
+        self._known_hashes = dict(known_hashes or {})
+        self._financials_only: set[str] = set()
+        self._listing_only: set[str] = set()
+        self._parsed: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._ready: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._threads = [
+            threading.Thread(target=self._results_stage, name="pipeline-results", daemon=True),
+            threading.Thread(target=self._sink_stage, name="pipeline-sink", daemon=True),
+        ]
+
+    def __enter__(self) -> TransferPipeline:
+        self.start()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the metrics and sink threads."""
+        for thread in self._threads:
+            thread.start()
+
+    def submit(
+        self,
+        player_id: str,
+        future: Future,
+        skills: bool = True,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue a pending parse; blocks while the pipeline is full.
+
+        Args:
+            player_id: Listing / player ID.
+            future: Resolves to the listing record.
+            skills: ``False`` when the record carries no profile skills, so
+                the ``players`` row must keep its stored ones.
+            extra: Fields added to the parsed record, e.g. the listing's
+                ``search_profiles``.
+        """
+        if not skills:
+            self._financials_only.add(str(player_id))
+        self._parsed.put((player_id, future, extra))
+
+    def submit_listing(self, player_id: str, record: dict[str, Any]) -> None:
+        """Queue a listing-only record built from its search result row.
+
+        Pass the listing's stored ``estimated_value`` in ``record`` if there
+        is one: the metrics are then recomputed for the current asking
+        price.  Without it the metrics are cleared and the stored estimated
+        value is left alone.  ``players`` is not touched.
+        """
+        future: Future = Future()
+        future.set_result(record)
+        self._listing_only.add(str(player_id))
+        self._parsed.put((player_id, future, None))
+
+    def touch(self, player_id: str, record: dict[str, Any] | None = None) -> None:
+        """Queue an unchanged listing for a ``last_updated`` bump only.
+
+        Args:
+            player_id: Listing ID.
+            record: The listing as observed (e.g. its search result row with
+                the stored estimated value), archived to ``history``.
+        """
+        self._parsed.put((player_id, None, record))
+
+    def when_flushed(self, callback: Callable[[], Any]) -> None:
+        """Run ``callback`` once everything queued so far has been written.
+
+        The sink flushes its buffers early when it reaches this point and
+        calls ``callback`` on its own thread; exceptions are logged.  Used to
+        start alerting on the most urgent listings mid-scan.
+        """
+        self._parsed.put(_Barrier(callback))
+
+    def close(self) -> None:
+        """Drain every stage, flush the final batch and stop the threads."""
+        self._parsed.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        if self.checkpoint:
+            self.checkpoint.save(force=True)
+        logger.info(
+            "Pipeline finished: %d listings written, %d unchanged, %d failed to parse, "
+            "%d failed to write",
+            self.written, self.touched, self.failed, self.unwritten,
+        )
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    def _results_stage(self) -> None:
+        while True:
+            item = self._parsed.get()
+            if item is _STOP:
+                self._ready.put(_STOP)
+                return
+            if isinstance(item, _Barrier):
+                self._ready.put(item)
+                continue
+
+            player_id, future, extra = item
+            if future is None:
+                self._ready.put((str(player_id), extra))
+                continue
+            try:
+                details = future.result()
+            except Exception as e:
+                logger.error("Failed to parse details for player %s: %s", player_id, e)
+                self.failed += 1
+                continue
+            if extra:
+                details = {**details, **extra}
+            self._ready.put(details)
+
+    def _sink_stage(self) -> None:
+        batch: list[dict[str, Any]] = []
+        unchanged: list[tuple[str, dict[str, Any] | None]] = []
+        flush_at = time.monotonic() + self.flush_seconds
+
+        while True:
+            try:
+                item = self._ready.get(timeout=max(0.0, flush_at - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                break
+            if isinstance(item, _Barrier):
+                if batch:
+                    self._flush(batch)
+                    batch = []
+                if unchanged:
+                    self._touch(unchanged)
+                    unchanged = []
+                try:
+                    item.callback()
+                except Exception as e:
+                    logger.error("Pipeline callback failed: %s", e, exc_info=True)
+                continue
+            if isinstance(item, tuple):
+                unchanged.append(item)
+            elif item is not None:
+                batch.append(item)
+
+            due = time.monotonic() >= flush_at
+            if len(batch) >= self.flush_rows or (due and batch):
+                self._flush(batch)
+                batch = []
+            if len(unchanged) >= constants.DEFAULT_BATCH_SIZE or (due and unchanged):
+                self._touch(unchanged)
+                unchanged = []
+            if due or not (batch or unchanged):
+                flush_at = time.monotonic() + self.flush_seconds
+
+        if batch:
+            self._flush(batch)
+        if unchanged:
+            self._touch(unchanged)
+
+    def _touch(self, items: list[tuple[str, dict[str, Any] | None]]) -> None:
+        ids = [pid for pid, _ in items]
+        records = [record for _, record in items if record]
+        if self.history is not None and records:
+            try:
+                self.history.append(frame_records(records))
+            except Exception as e:
+                logger.error("Failed to archive %d unchanged listings: %s", len(records), e)
+        try:
+            failed = set(self.db.touch_transfer_listings(
+                ids, datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            ))
+        except Exception as e:
+            logger.error("Failed to touch %d unchanged listings: %s", len(ids), e)
+            failed = set(ids)
+        done = [pid for pid in ids if pid not in failed]
+        self.touched += len(done)
+        self.unwritten += len(ids) - len(done)
+        if self.checkpoint:
+            self.checkpoint.mark_processed(done)
+
+    def _flush(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            df = frame_records(batch)
+            ids = df["id"].astype(str)
+            listing_only = ids.isin(self._listing_only)
+            # Listing-only rows without a known value get no metrics.
+            unvalued = listing_only & ids.isin([
+                str(rec["id"]) for rec in batch if not rec.get("estimated_value")
+            ])
+            if unvalued.any():
+                detail_cols = [c for c in DETAIL_COLS if c in df.columns]
+                df[detail_cols] = df[detail_cols].astype(object)
+                df.loc[unvalued, detail_cols] = None
+
+            if self.history is not None:
+                try:
+                    self.history.append(df)
+                except Exception as e:
+                    logger.error("Failed to archive batch: %s", e)
+            if self.csv is not None:
+                try:
+                    self.csv.append(df)
+                except OSError as e:
+                    logger.error("Failed to append CSV batch: %s", e)
+
+            df_market = df[[c for c in MARKET_COLS if c in df.columns]].copy()
+            df_market["last_updated"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            records = df_market.to_dict(orient="records")
+            # Stale metrics are cleared, but a stored value is never erased.
+            records = [
+                {k: v for k, v in rec.items() if k != "estimated_value"} if drop else rec
+                for rec, drop in zip(records, unvalued)
+            ]
+            hashes = SupabaseManager.transfer_listing_hashes(records)
+            known = self._known_hashes
+            same = {pid for pid, digest in hashes.items() if known.get(pid) == digest}
+            changed = [rec for rec in records if str(rec["id"]) not in same]
+            failed = set(self.db.upsert_transfer_listings(changed)) if changed else set()
+
+            # All players (attributes only — no financial columns)
+            financials_only = ids.isin(self._financials_only)
+            full = ~(financials_only | listing_only)
+            attr_cols = [c for c in df.columns if c not in PLAYER_DROP_COLS]
+            if full.any():
+                self.db.upsert_players(df.loc[full, attr_cols].to_dict(orient="records"))
+            if financials_only.any():
+                self.db.update_player_financials(df.loc[financials_only].to_dict(orient="records"))
+                self._financials_only.difference_update(ids[financials_only])
+            self._listing_only.difference_update(ids[listing_only])
+        except Exception as e:
+            logger.error("Failed to flush %d listings: %s", len(batch), e, exc_info=True)
+            self.unwritten += len(batch)
+            return
+
+        # Only listings that reached Supabase count as written or processed;
+        # a failed one is retried by the next (resumed) run.
+        written = hashes.keys() - same - failed
+        updated = sum(pid in known for pid in written)
+        self.written += len(written)
+        self.updated += updated
+        self.inserted += len(written) - updated
+        self.unwritten += len(failed)
+        known.update((pid, hashes[pid]) for pid in written)
+        if same:
+            self._touch([(pid, None) for pid in sorted(same)])
+        if self.checkpoint:
+            self.checkpoint.mark_processed(sorted(written))
+        logger.info(
+            "Flushed %d listings, %d of them unchanged, %d failed (%d written in total)",
+            len(batch), len(same), len(failed), self.written,
+        )
@@ -0,0 +1,108 @@
+"""
+Unit tests for src.services.auction_schedule.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src import constants
+from src.services.auction_schedule import AuctionSchedule
+
+NOW = datetime(2026, 3, 29, 10, 0, 0)
+
+
+def _row(pid: str, deadline: datetime, **extra) -> dict:
+    return {"id": pid, "deadline": deadline.strftime("%Y-%m-%d %H:%M:%S"), **extra}
+
+
+@pytest.fixture
+def schedule(tmp_path) -> AuctionSchedule:
+    return AuctionSchedule(str(tmp_path / "schedule.json"))
+
+
+class TestAuctionSchedule:
+    """Tests for AuctionSchedule."""
+
+    def test_running_auction_refreshed_then_settled(self, schedule: AuctionSchedule) -> None:
+        deadline = NOW + timedelta(minutes=90)
+        schedule.sync([_row("1", deadline)], NOW)
+
+        assert schedule.next_due() == NOW + timedelta(minutes=constants.BID_REFRESH_MINUTES)
+        (auction,) = schedule.pop_due(schedule.next_due())
+        assert not auction.settling
+
+        schedule.requeue(auction, auction.due)
+        last_refresh = deadline - timedelta(minutes=constants.BID_FINAL_REFRESH_MINUTES)
+        assert schedule.next_due() == last_refresh
+
+        (auction,) = schedule.pop_due(last_refresh)
+        schedule.requeue(auction, last_refresh)
+        assert schedule.next_due() == deadline + timedelta(hours=constants.FINAL_PRICE_GRACE_HOURS)
+        (auction,) = schedule.pop_due(schedule.next_due())
+        assert auction.settling
+
+    def test_bids_refreshed_only_near_the_close(self, schedule: AuctionSchedule) -> None:
+        deadline = NOW + timedelta(days=2)
+        schedule.sync([_row("1", deadline)], NOW)
+
+        window = deadline - timedelta(hours=constants.BID_REFRESH_WINDOW_HOURS)
+        assert schedule.next_due() == window
+        (auction,) = schedule.pop_due(window)
+        schedule.requeue(auction, window)
+        assert schedule.next_due() == window + timedelta(minutes=constants.BID_REFRESH_MINUTES)
+
+    def test_only_due_auctions_pop(self, schedule: AuctionSchedule) -> None:
+        schedule.sync([
+            _row("closed", NOW - timedelta(hours=3)),
+            _row("running", NOW + timedelta(hours=5)),
+        ], NOW)
+        assert [a.player_id for a in schedule.pop_due(NOW)] == ["closed"]
+        assert len(schedule) == 1 and "running" in schedule
+
+    def test_unsettled_auction_retried_then_given_up(self, schedule: AuctionSchedule) -> None:
+        schedule.sync([_row("1", NOW - timedelta(hours=3))], NOW)
+        now = NOW
+        for _ in range(constants.FINAL_PRICE_MAX_ATTEMPTS):
+            (auction,) = schedule.pop_due(now)
+            schedule.requeue(auction, now, settled_check=True)
+            now += timedelta(minutes=constants.FINAL_PRICE_RETRY_MINUTES)
+        assert len(schedule) == 0
+        # The same auction is not picked up again by the next sync...
+        assert schedule.sync([_row("1", NOW - timedelta(hours=3))], now) == 0
+        # ...unless the player is relisted.
+        assert schedule.sync([_row("1", now + timedelta(days=1))], now) == 1
+
+    def test_sync_converts_stored_timestamptz(self, schedule: AuctionSchedule) -> None:
+        schedule.sync([{"id": "1", "deadline": "2026-03-29T07:30:00+00:00"}], NOW)
+        (auction,) = schedule.pop_due(NOW + timedelta(hours=2))
+        assert auction.deadline == datetime(2026, 3, 29, 14, 30)
+
+    def test_sync_skips_sold_and_reschedules_moved_deadline(self, schedule: AuctionSchedule) -> None:
+        schedule.sync([
+            _row("sold", NOW - timedelta(hours=3), last_transfer_price=1_000_000),
+            _row("1", NOW + timedelta(hours=5)),
+        ], NOW)
+        assert "sold" not in schedule
+        assert schedule.sync([_row("1", NOW + timedelta(hours=5))], NOW) == 0
+        assert schedule.sync([_row("1", NOW + timedelta(minutes=30))], NOW) == 1
+        assert schedule.next_due() == NOW + timedelta(minutes=30 - constants.BID_FINAL_REFRESH_MINUTES)
+        assert [a.player_id for a in schedule.pop_due(NOW + timedelta(hours=1))] == ["1"]
+
+    def test_save_and_load(self, schedule: AuctionSchedule) -> None:
+        schedule.sync([_row("1", NOW + timedelta(hours=5), bids_avg="1.200.000 baht")], NOW)
+        schedule.finish(schedule.pop_due(NOW + timedelta(hours=2))[0])
+        schedule.sync([_row("2", NOW - timedelta(hours=3))], NOW)
+        schedule.save(NOW)
+
+        loaded = AuctionSchedule.load(schedule.path)
+        (auction,) = loaded.pop_due(NOW)
+        assert auction.player_id == "2"
+        assert loaded.synced_at == NOW
+        assert AuctionSchedule(schedule.path).synced_at is None
+        assert loaded.finished == {"1": (NOW + timedelta(hours=5)).strftime("%Y-%m-%d %H:%M:%S")}
+
+    def test_unreadable_file_gives_empty_schedule(self, tmp_path) -> None:
+        path = tmp_path / "schedule.json"
+        path.write_text("{not json", encoding="utf-8")
+        assert len(AuctionSchedule.load(str(path))) == 0
@@ -0,0 +1,88 @@
+"""
+Unit tests for src.services.bid_history — delta-encoded bid trajectories.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.services.bid_history import (
+    BidHistory,
+    bid_trajectories,
+    bid_values,
+    read_bid_history,
+)
+
+T0 = datetime(2026, 3, 29, 10, 0, 0)
+
+
+def _info(count: int, avg: str, deadline: str = "2026-03-29 14:30:00") -> dict:
+    return {"estimated_value": 1_500_000, "bids_count": count, "bids_avg": avg,
+            "deadline": deadline}
+
+
+class FakeDb:
+    def __init__(self) -> None:
+        self.rows: list[dict] = []
+
+    def insert_bid_history(self, rows: list[dict]) -> None:
+        self.rows.extend(rows)
+
+
+@pytest.fixture
+def db() -> FakeDb:
+    return FakeDb()
+
+
+class TestBidHistory:
+    """Tests for BidHistory."""
+
+    def test_only_changes_are_recorded(self, db: FakeDb, tmp_path) -> None:
+        bids = BidHistory(db, str(tmp_path), T0)
+        assert bids.record("1", T0, _info(1, "1.000.000 baht"))
+        assert not bids.record("1", T0 + timedelta(hours=1), _info(1, "1.000.000 baht"))
+        assert bids.record("1", T0 + timedelta(hours=2), _info(2, "1.100.000 baht"))
+        assert bids.record("1", T0 + timedelta(hours=3), _info(2, "1.100.000 baht",
+                                                               "2026-03-29 14:35:00"))
+        bids.flush()
+
+        assert [(r["bids_count"], r["bids_avg"], r["estimated_value"], r["deadline"])
+                for r in db.rows] == [
+            (1, 1_000_000, 1_500_000, "2026-03-29T14:30:00+07:00"),
+            (2, 1_100_000, None, None),
+            (None, None, None, "2026-03-29T14:35:00+07:00"),
+        ]
+        assert db.rows[0]["observed_at"] == "2026-03-29T10:00:00+07:00"
+
+    def test_missing_values_are_not_changes(self, db: FakeDb) -> None:
+        bids = BidHistory(db, None, T0)
+        bids.record("1", T0, _info(3, "900.000 baht"))
+        blank = {"estimated_value": 0, "bids_count": 0, "bids_avg": "0", "deadline": "N/A"}
+        assert not bids.record("1", T0 + timedelta(hours=1), blank)
+        assert bid_values(blank) == dict.fromkeys(("bids_count", "bids_avg",
+                                                   "estimated_value", "deadline"))
+
+    def test_flushes_when_full(self, db: FakeDb) -> None:
+        bids = BidHistory(db, None, T0, max_rows=2)
+        bids.record("1", T0, _info(1, "1.000 baht"))
+        assert not db.rows
+        bids.record("2", T0, _info(1, "1.000 baht"))
+        assert len(db.rows) == 2 and len(bids) == 0
+
+    def test_mirror_round_trip(self, tmp_path) -> None:
+        root = str(tmp_path / "bid_history")
+        with BidHistory(None, root, T0) as bids:
+            bids.record("1", T0, _info(1, "1.000.000 baht"))
+            bids.record("2", T0, _info(4, "2.000.000 baht"))
+            bids.flush()
+            bids.record("1", T0 + timedelta(minutes=55), _info(3, "1.200.000 baht"))
+
+        files = sorted(p.name for p in (tmp_path / "bid_history" / "date=2026-03-29").iterdir())
+        assert files == ["run-20260329T100000.parquet"]
+
+        df = bid_trajectories(read_bid_history(root, ids=["1"]))
+        assert df["bids_count"].tolist() == [1, 3]
+        assert df["estimated_value"].tolist() == [1_500_000, 1_500_000]
+        assert df["deadline"].tolist() == [datetime(2026, 3, 29, 14, 30)] * 2
+        assert read_bid_history(root, start="2026-03-30").empty
+        assert read_bid_history(str(tmp_path / "missing")).empty
@@ -0,0 +1,63 @@
+"""
+Unit tests for src.services.checkpoint — scrape checkpoint / resume.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from src.services.checkpoint import ScrapeCheckpoint
+
+RUN_STARTED = "2026-03-29 10:00:00"
+
+
+def _saved(path) -> dict:
+    return json.loads(path.read_text())
+
+
+class TestScrapeCheckpoint:
+    """Tests for ScrapeCheckpoint."""
+
+    def test_round_trip(self, tmp_path) -> None:
+        path = tmp_path / "cp.json"
+        cp = ScrapeCheckpoint(str(path), RUN_STARTED)
+        cp.discover("1")
+        cp.discover("2")
+        cp.mark_processed(["1"])
+        cp.save(force=True)
+
+        loaded = ScrapeCheckpoint.load(str(path))
+        assert loaded.run_started == RUN_STARTED
+        assert loaded.discovered == {"1", "2"}
+        assert loaded.is_processed("1") and not loaded.is_processed("2")
+
+    def test_saves_are_throttled(self, tmp_path) -> None:
+        path = tmp_path / "cp.json"
+        cp = ScrapeCheckpoint(str(path), RUN_STARTED, save_seconds=3600)
+        cp.mark_processed(["1"])
+        cp.mark_processed(["2"])
+        assert _saved(path)["processed"] == ["1"]
+
+        cp.save(force=True)
+        assert _saved(path)["processed"] == ["1", "2"]
+
+    def test_missing_or_corrupt_is_ignored(self, tmp_path) -> None:
+        assert ScrapeCheckpoint.load(str(tmp_path / "none.json")) is None
+        bad = tmp_path / "bad.json"
+        bad.write_text("{not json")
+        assert ScrapeCheckpoint.load(str(bad)) is None
+
+    def test_old_checkpoint_is_ignored(self, tmp_path) -> None:
+        path = tmp_path / "cp.json"
+        ScrapeCheckpoint(str(path), RUN_STARTED).save(force=True)
+        data = _saved(path)
+        data["saved_at"] = (datetime.now() - timedelta(hours=7)).strftime("%Y-%m-%d %H:%M:%S")
+        path.write_text(json.dumps(data))
+        assert ScrapeCheckpoint.load(str(path), max_age_hours=6) is None
+
+    def test_finished_checkpoint_is_not_resumed(self, tmp_path) -> None:
+        path = tmp_path / "cp.json"
+        cp = ScrapeCheckpoint(str(path), RUN_STARTED)
+        cp.mark_processed(["1"])
+        cp.finish()
+        assert _saved(path)["completed"] is True
+        assert ScrapeCheckpoint.load(str(path)) is None
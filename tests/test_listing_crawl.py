@@ -0,0 +1,344 @@
+"""
+Unit tests for the transfer listing crawl in src.scrapers.transfer.
+"""
+
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from src import constants
+from src.scrapers.transfer import (
+    SearchPartition,
+    TransferScraper,
+    crawl_listing_pages,
+    listing_page_url,
+    listing_record,
+    merge_profile_rows,
+    parse_history_page,
+    parse_listing_financials,
+    parse_listing_page,
+    sweep_listing_pages,
+    sweep_search_profiles,
+    with_search_filter,
+)
+
+CORPUS = Path(__file__).resolve().parent.parent / "benchmarks" / "corpus" / "v1"
+
+
+def _listing(ids: list[str], pages: range) -> str:
+    """A minimal procurar.asp result page with player rows and a pager."""
+    rows = "".join(
+        f'<tr class="list1"><td><a href="comprar_jog_lista.asp?jg_id={i}">P{i}</a></td>'
+        f'<td><img src="flag.gif" title="Brazil"></td><td><b>M</b> C</td><td>24</td><td>Excellent</td>'
+        f"<td>World Class</td><td>1.250.000 baht</td><td>Today at 14:15</td><td>2</td></tr>"
+        for i in ids
+    )
+    pager = " ".join(f'<a href="procurar.asp?action=proc_jog&amp;pid={n}&amp;sort=0">{n}</a>' for n in pages)
+    return f"<table><tr><th>Name</th></tr>{rows}</table><div class='paginacao'>Pages: {pager}</div>"
+
+
+def _ids(rows) -> list[str]:
+    return [row["id"] for row in rows]
+
+
+class TestListingPageUrl:
+    """Tests for listing_page_url()."""
+
+    def test_replaces_existing_pid(self) -> None:
+        url = "https://www.pmanager.org/procurar.asp?action=proc_jog&pid=1&sort=0"
+        assert listing_page_url(url, 7) == "https://www.pmanager.org/procurar.asp?action=proc_jog&pid=7&sort=0"
+
+    def test_appends_missing_pid(self) -> None:
+        assert listing_page_url("https://x/procurar.asp?a=1", 3) == "https://x/procurar.asp?a=1&pid=3"
+
+
+class TestParseListingPage:
+    """Tests for parse_listing_page()."""
+
+    def test_ids_in_order_without_repeats_and_last_page(self) -> None:
+        rows, last_page = parse_listing_page(_listing(["5", "3", "5"], range(2, 9)))
+        assert _ids(rows) == ["5", "3"]
+        assert last_page == 8
+
+    def test_row_fields(self) -> None:
+        (row,), _ = parse_listing_page(_listing(["7"], range(0)))
+        assert row == {
+            "id": "7",
+            "name": "P7",
+            "nationality": "Brazil",
+            "position": "M C",
+            "age": 24,
+            "Quality": "Excellent",
+            "Potential": "World Class",
+            "asking_price": 1_250_000.0,
+            "deadline": "Today at 14:15",
+            "bids_count": "2",
+        }
+
+    def test_layout_row_wrapping_results_is_ignored(self) -> None:
+        html = f"<table><tr><td>{_listing(['1', '2'], range(0))}</td></tr></table>"
+        rows, _ = parse_listing_page(html)
+        assert _ids(rows) == ["1", "2"]
+        assert rows[0]["age"] == 24
+
+    def test_no_pager(self) -> None:
+        assert parse_listing_page(_listing(["1"], range(0)))[1] == 0
+
+
+class TestCrawlListingPages:
+    """Tests for crawl_listing_pages()."""
+
+    def test_pages_revealed_by_later_pagers_are_fetched(self) -> None:
+        # Pager windows: page 1 links 2-3, page 3 reveals 4-5.
+        pages = {
+            1: _listing(["1", "2"], range(2, 4)),
+            2: _listing(["2", "3"], range(1, 4)),
+            3: _listing(["4"], range(1, 6)),
+            4: _listing(["5"], range(1, 6)),
+            5: _listing(["1", "6"], range(1, 5)),
+        }
+        fetched: list[int] = []
+        lock = threading.Lock()
+
+        def fetch(n: int) -> str:
+            with lock:
+                fetched.append(n)
+            return pages[n]
+
+        ids = _ids(crawl_listing_pages(fetch, max_pages=150, workers=3))
+        assert sorted(ids) == ["1", "2", "3", "4", "5", "6"]
+        assert sorted(fetched) == [1, 2, 3, 4, 5]
+
+    def test_max_pages_caps_fetches(self) -> None:
+        fetched: list[int] = []
+
+        def fetch(n: int) -> str:
+            fetched.append(n)
+            return _listing([str(n)], range(1, 20))
+
+        stats: dict = {}
+        assert _ids(crawl_listing_pages(fetch, max_pages=4, workers=1, stats=stats)) == ["1", "2", "3", "4"]
+        assert sorted(fetched) == [1, 2, 3, 4]
+        assert stats["truncated"] is True
+
+    def test_failed_page_is_skipped(self) -> None:
+        def fetch(n: int) -> str:
+            if n == 2:
+                raise ConnectionError("reset")
+            return _listing([str(n)], range(1, 4))
+
+        assert sorted(_ids(crawl_listing_pages(fetch, workers=2))) == ["1", "3"]
+
+
+class FakeMarket:
+    """Serves procurar.asp pages for a synthetic market, honouring the filters."""
+
+    OPS = {"<": int.__lt__, "<=": int.__le__, ">": int.__gt__, ">=": int.__ge__}
+    TIERS = ["Terrible", "Very Bad", "Bad", "Low", "Passable", "Good",
+             "Very Good", "Excellent", "Formidable", "World Class"]
+
+    def __init__(self, size: int, per_page: int = 3) -> None:
+        self.per_page = per_page
+        self.players = [
+            {"id": str(1000 + i), "qual": 1 + i % 10, "idd": 17 + i % 19,
+             "pre": 100_000 * (1 + i % 37), "prog": 1 + (i * 7) % 10}
+            for i in range(size)
+        ]
+        self.fetched: list[str] = []
+        self.lock = threading.Lock()
+
+    def fetch(self, url: str) -> str:
+        with self.lock:
+            self.fetched.append(url)
+        params = {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+        players = [
+            p for p in self.players
+            if all(params.get(f, "Any") == "Any" or self.OPS[params[f"{f}_op"]](p[f], int(params[f]))
+                   for f in ("qual", "idd", "pre", "prog"))
+        ]
+        page = int(params.get("pid", 1))
+        last = max(1, -(-len(players) // self.per_page))
+        rows = "".join(
+            f'<tr class="list1"><td><a href="comprar_jog_lista.asp?jg_id={p["id"]}">P</a></td>'
+            f'<td></td><td>M</td><td>{p["idd"]}</td><td>{self.TIERS[p["qual"] - 1]}</td>'
+            f'<td>{self.TIERS[p["prog"] - 1]}</td><td>{p["pre"]}</td><td>Today at 14:15</td><td>0</td></tr>'
+            for p in players[(page - 1) * self.per_page: page * self.per_page]
+        )
+        pager = " ".join(f'<a href="procurar.asp?pid={n}">{n}</a>'
+                         for n in range(max(1, page - 3), min(last, page + 3) + 1))
+        return f"<table>{rows}</table><div>{pager}</div>"
+
+
+class TestSweepListingPages:
+    """Tests for sweep_listing_pages() and SearchPartition."""
+
+    def test_small_search_is_one_slice(self) -> None:
+        market = FakeMarket(20)
+        ids = _ids(sweep_listing_pages(market.fetch, TransferScraper.SEARCH_URL_TEMPLATE, max_pages=10))
+        assert sorted(ids) == sorted(p["id"] for p in market.players)
+        # Seven result pages, plus page 10 probed for a truncation.
+        assert len(market.fetched) == 8
+
+    def test_search_past_the_cap_is_covered(self) -> None:
+        market = FakeMarket(150)
+        ids = _ids(sweep_listing_pages(market.fetch, TransferScraper.SEARCH_URL_TEMPLATE,
+                                       max_pages=10, workers=3))
+        assert len(ids) == len(set(ids)) == 150
+
+    def test_truncated_slice_splits_on_a_page_sample(self, monkeypatch) -> None:
+        monkeypatch.setattr(constants, "SWEEP_SAMPLE_PAGES", 3)
+        market = FakeMarket(150)
+        url = TransferScraper.SEARCH_URL_TEMPLATE
+        ids = _ids(sweep_listing_pages(market.fetch, url, max_pages=10))
+        assert len(ids) == len(set(ids))
+        pages = {listing_page_url(url, n): n for n in range(1, 11)}
+        assert sorted(pages[f] for f in market.fetched if f in pages) == [1, 5, 10]
+
+    def test_rows_stream_before_the_sweep_ends(self) -> None:
+        market = FakeMarket(20)
+        url = TransferScraper.SEARCH_URL_TEMPLATE
+        release = threading.Event()
+
+        def fetch(page_url: str) -> str:
+            if page_url == listing_page_url(url, 7):
+                release.wait(5)
+            return market.fetch(page_url)
+
+        rows = sweep_listing_pages(fetch, url, max_pages=10)
+        try:
+            assert next(rows)["id"] == "1000"
+            assert not release.is_set()
+        finally:
+            release.set()
+        assert len(_ids(rows)) == 19
+
+    def test_split_is_disjoint_and_skips_filtered_fields(self) -> None:
+        rows = [{"age": a, "Quality": "Good", "asking_price": 0} for a in (18, 20, 25, 30)]
+        url = with_search_filter(TransferScraper.SEARCH_URL_TEMPLATE, "pre", "<=", 5)
+        lower, upper = SearchPartition().split(rows, url)
+        assert lower.filters == (("idd", "<=", 20),) and upper.filters == (("idd", ">", 20),)
+        assert SearchPartition((("idd", "<=", 20),)).split(rows, url) is None
+
+    def test_partition_url(self) -> None:
+        url = SearchPartition((("qual", "<=", 6), ("idd", ">", 24))).url(TransferScraper.SEARCH_URL_TEMPLATE)
+        assert "qual_op=%3C%3D&qual=6" in url and "idd_op=%3E&idd=24" in url
+
+
+class TestSweepSearchProfiles:
+    """Tests for sweep_search_profiles() and merge_profile_rows()."""
+
+    def test_overlapping_profiles_are_merged_and_tagged(self) -> None:
+        market = FakeMarket(60)
+        base = TransferScraper.SEARCH_URL_TEMPLATE
+        searches = {
+            "good": with_search_filter(base, "qual", ">=", 6),
+            "young": with_search_filter(base, "idd", "<=", 20),
+        }
+
+        rows = sweep_search_profiles(market.fetch, searches, max_pages=50)
+
+        by_id = {row["id"]: row for row in rows}
+        assert len(by_id) == len(rows)
+        for p in market.players:
+            expected = [n for n, hit in (("good", p["qual"] >= 6), ("young", p["idd"] <= 20)) if hit]
+            assert by_id.get(p["id"], {}).get("search_profiles", []) == expected
+
+    def test_failed_profile_is_skipped(self) -> None:
+        market = FakeMarket(6)
+
+        def fetch(url: str) -> str:
+            if "idd=20" in url:
+                raise OSError("boom")
+            return market.fetch(url)
+
+        base = TransferScraper.SEARCH_URL_TEMPLATE
+        rows = sweep_search_profiles(
+            fetch, {"all": base, "young": with_search_filter(base, "idd", "<=", 20)},
+        )
+        assert len(rows) == 6
+        assert all(row["search_profiles"] == ["all"] for row in rows)
+
+    def test_merge_keeps_first_row(self) -> None:
+        rows = merge_profile_rows({
+            "a": [{"id": "1", "age": 20}],
+            "b": [{"id": "1", "age": 21}, {"id": "2", "age": 30}],
+        })
+        assert rows == [
+            {"id": "1", "age": 20, "search_profiles": ["a", "b"]},
+            {"id": "2", "age": 30, "search_profiles": ["b"]},
+        ]
+
+
+class TestParseHistoryPage:
+    """Tests for parse_history_page() and TransferScraper.iter_final_prices()."""
+
+    def test_corpus_page(self) -> None:
+        html = (CORPUS / "history.html").read_text(encoding="utf-8")
+        assert parse_history_page(html) == 21_250_000.0
+
+    def test_other_markup_falls_back_to_full_parse(self) -> None:
+        html = (
+            "<div class='x' id='tabela_titulo'>Transfers</div>"
+            "<table class='table_border'><tr><th>Date</th></tr>"
+            "<tr class='list2'><td>1/1/26</td><td>A</td><td>B</td><td>3.400.000 baht</td></tr>"
+            "</table>"
+        )
+        assert parse_history_page(html) == 3_400_000.0
+
+    def test_no_transfers(self) -> None:
+        html = (
+            '<div id="tabela_titulo">Transfers</div><table class="table_border"></table>'
+            '<table><tr class="list1"><td>1</td><td>2</td><td>3</td><td>9.000 baht</td></tr></table>'
+        )
+        assert parse_history_page(html) == 0.0
+        assert parse_history_page("<html></html>") == 0.0
+
+    def test_iter_final_prices_falls_back_to_browser(self) -> None:
+        html = (CORPUS / "history.html").read_text(encoding="utf-8")
+
+        class Response:
+            text = html
+
+            def raise_for_status(self) -> None:
+                pass
+
+        class Session:
+            def get(self, url: str, timeout: float) -> Response:
+                if url.endswith("=2"):
+                    raise OSError("boom")
+                return Response()
+
+        class Scraper(TransferScraper):
+            def http_session(self) -> Session:
+                return Session()
+
+            def get_player_history(self, player_id: str) -> float:
+                return 1.0
+
+        prices = dict(Scraper(base_url="https://example.test").iter_final_prices(["1", "2", "3"]))
+        assert prices == {"1": 21_250_000.0, "2": 1.0, "3": 21_250_000.0}
+
+
+def test_parse_listing_financials_uses_row_for_profile_fields() -> None:
+    (row,), _ = parse_listing_page(_listing(["7"], range(0)))
+    neg_html = (CORPUS / "negotiation.html").read_text(encoding="utf-8")
+
+    data = parse_listing_financials("7", neg_html, row)
+
+    assert data["name"] == "P7" and data["age"] == 24
+    assert data["Quality"] == "Excellent" and data["quality_rank"] == 8
+    assert data["potential_rank"] == 10
+    assert data["estimated_value"] > 0
+    assert data["url"].endswith("jog_id=7")
+
+
+
+def test_listing_record_from_row_only() -> None:
+    (row,), _ = parse_listing_page(_listing(["7"], range(0)))
+
+    data = listing_record(row)
+
+    assert data["id"] == "7" and data["url"].endswith("jog_id=7")
+    assert data["nationality"] == "Brazil" and data["asking_price"] == 1_250_000.0
+    assert data["quality_rank"] == 8 and data["potential_rank"] == 10
+    assert "estimated_value" not in data
@@ -0,0 +1,85 @@
+"""
+Unit tests for src.services.market_history — the Parquet market archive.
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.services.market_history import (
+    HISTORY_SCHEMA,
+    MarketHistory,
+    history_table,
+    read_history,
+)
+from src.services.transfer_pipeline import frame_records
+
+SCAN = "2026-03-29 10:00:00"
+OBSERVED = datetime(2026, 3, 29, 10, 5)
+
+
+def _batch(sample_player: dict, *ids: str, **extra) -> pd.DataFrame:
+    return frame_records([{**sample_player, "id": i, **extra} for i in ids])
+
+
+class TestHistoryTable:
+    """Tests for history_table()."""
+
+    def test_fixed_schema(self, sample_player: dict) -> None:
+        record = {**sample_player, "Speed": 14, "Out of Area": 7, "Fitness": "98%", "deadline": "Today at 14:30"}
+        table = history_table(pd.DataFrame([record]), datetime(2026, 3, 29, 10), OBSERVED)
+
+        assert table.schema == HISTORY_SCHEMA
+        assert pa.types.is_dictionary(table.schema.field("quality").type)
+        row = table.to_pylist()[0]
+        assert row["speed"] == 14 and row["out_of_area"] == 7 and row["handling"] is None
+        assert row["quality"] == "Excellent" and row["age"] == 25
+        assert row["bids_avg"] == 2_500_000
+        assert row["deadline"] == datetime(2026, 3, 29, 14, 30)
+
+    def test_out_of_range_numbers_become_null(self, sample_player: dict) -> None:
+        df = _batch(sample_player, "1", Speed=10**6, bids_count="many")
+        row = history_table(df, datetime(2026, 3, 29, 10), OBSERVED).to_pylist()[0]
+        assert row["speed"] is None and row["bids_count"] is None
+
+
+class TestMarketHistory:
+    """Tests for MarketHistory + read_history()."""
+
+    def test_parts_compacted_on_close(self, tmp_path, sample_player: dict) -> None:
+        history = MarketHistory(str(tmp_path), SCAN)
+        history.append(_batch(sample_player, "1", "2"))
+        history.append(_batch(sample_player, "3"))
+        assert len(list(tmp_path.glob("date=2026-03-29/*.part-*.parquet"))) == 2
+
+        history.close()
+        files = list(tmp_path.glob("date=2026-03-29/*.parquet"))
+        assert [f.name for f in files] == ["scan-20260329T100000.parquet"]
+        assert pq.read_table(files[0]).num_rows == 3
+
+    def test_resumed_scan_extends_compacted_file(self, tmp_path, sample_player: dict) -> None:
+        first = MarketHistory(str(tmp_path), SCAN)
+        first.append(_batch(sample_player, "1"))
+        first.close()
+        resumed = MarketHistory(str(tmp_path), SCAN)
+        resumed.append(_batch(sample_player, "2"))
+        resumed.close()
+
+        assert sorted(read_history(str(tmp_path), ["id"])["id"]) == ["1", "2"]
+
+    def test_read_columns_dates_and_ids(self, tmp_path, sample_player: dict) -> None:
+        for scan, ids in (("2026-03-28 10:00:00", ("1", "2")), (SCAN, ("1",))):
+            history = MarketHistory(str(tmp_path), scan)
+            history.append(_batch(sample_player, *ids))
+            history.close()
+
+        df = read_history(str(tmp_path), ["id", "asking_price"], start="2026-03-29")
+        assert list(df.columns) == ["id", "asking_price"] and df["id"].tolist() == ["1"]
+        assert len(read_history(str(tmp_path), ["id"], ids=["1"])) == 2
+        assert read_history(str(tmp_path), ["scan_started"], end="2026-03-28")["scan_started"].nunique() == 1
+
+    def test_missing_archive_reads_empty(self, tmp_path) -> None:
+        df = read_history(str(tmp_path / "none"), ["id"])
+        assert df.empty and list(df.columns) == ["id"]
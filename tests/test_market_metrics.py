@@ -0,0 +1,117 @@
+"""
+Unit tests for src.services.market_metrics — the vectorised metrics engine.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.bench_metrics import per_listing_metrics
+from src.core.utils import clean_currency, parse_deadline
+from src.services.market_metrics import (
+    apply_market_metrics,
+    market_metrics,
+    normalise_deadlines,
+    parse_currency,
+)
+
+NOW = pd.Timestamp("2026-03-29 10:00")
+
+
+class TestApplyMarketMetrics:
+    """Tests for apply_market_metrics() on a single listing."""
+
+    def test_metrics_added(self, sample_player: dict) -> None:
+        out = apply_market_metrics(pd.DataFrame([sample_player])).iloc[0]
+        assert out["value_diff"] == 3_000_000
+        assert out["roi"] == 150.0
+        assert out["forecast_sell"] == 2_000_000.0
+        assert out["forecast_profit"] == 2_000_000.0 - 2_500_000
+
+    def test_zero_asking_price(self, sample_player: dict) -> None:
+        out = apply_market_metrics(pd.DataFrame([{**sample_player, "asking_price": 0}])).iloc[0]
+        assert out["roi"] == 0
+
+    def test_unparseable_deadline_becomes_none(self, sample_player: dict) -> None:
+        out = apply_market_metrics(pd.DataFrame([{**sample_player, "deadline": "N/A"}])).iloc[0]
+        assert out["deadline"] is None
+
+
+class TestParseCurrency:
+    """Tests for parse_currency()."""
+
+    def test_matches_clean_currency_for_strings(self) -> None:
+        values = ["1.250.000 baht", "$500,000", "", "abc", "2500000"]
+        assert parse_currency(values).tolist() == [clean_currency(v) for v in values]
+
+    def test_numbers_and_missing(self) -> None:
+        assert parse_currency([2.5e6, None, "7", 3]).tolist() == [2_500_000.0, 0.0, 7.0, 3.0]
+        assert parse_currency(np.array([1, 2])).tolist() == [1.0, 2.0]
+
+
+class TestNormaliseDeadlines:
+    """Tests for normalise_deadlines()."""
+
+    def test_matches_parse_deadline(self) -> None:
+        values = ["Today at 14:30", "Tomorrow at 08:00", "5/4/26 at 09:15", "31/12/2027 at 23:59",
+                  "N/A", "", None, "Today"]
+        out = normalise_deadlines(values)
+        expected = [parse_deadline(v) for v in values]
+        assert [None if pd.isna(t) else t.to_pydatetime() for t in out] == expected
+
+    def test_relative_to_given_now(self) -> None:
+        out = normalise_deadlines(["today at 14:30", " Tomorrow at 08:00 "], now=NOW)
+        assert out.tolist() == [pd.Timestamp("2026-03-29 14:30"), pd.Timestamp("2026-03-30 08:00")]
+
+    def test_per_row_now(self) -> None:
+        out = normalise_deadlines(["Today at 09:00"] * 2, now=[NOW, NOW + pd.Timedelta(days=1)])
+        assert out.dt.day.tolist() == [29, 30]
+
+    def test_stored_timestamps_pass_through(self) -> None:
+        assert normalise_deadlines(["2026-04-01 10:00:00"], now=NOW)[0] == pd.Timestamp("2026-04-01 10:00")
+
+    def test_timestamptz_converted_to_game_time(self) -> None:
+        out = normalise_deadlines(["2026-04-01T03:00:00+00:00", "2026-04-01T10:00:00+07:00"], now=NOW)
+        assert out.tolist() == [pd.Timestamp("2026-04-01 10:00")] * 2
+
+    @pytest.mark.parametrize("raw", ["Today at 25:00", "31/2/26 at 10:00", 5])
+    def test_invalid_becomes_nat(self, raw) -> None:
+        assert pd.isna(normalise_deadlines([raw], now=NOW)[0])
+
+
+class TestMarketMetrics:
+    """Tests for market_metrics() and apply_market_metrics()."""
+
+    def test_zero_and_negative_asking_price(self) -> None:
+        out = market_metrics([100, 100], [0, -5])
+        assert out["roi"].tolist() == [0.0, 0.0]
+
+    def test_bids_above_asking_price_raise_cost(self) -> None:
+        out = market_metrics([5_000_000], [2_000_000], ["2.500.000 baht"])
+        assert out["forecast_profit"][0] == 2_000_000.0 - 2_500_000
+
+    def test_batch_matches_per_listing(self, sample_player: dict) -> None:
+        rng = np.random.default_rng(0)
+        records = [
+            {
+                **sample_player,
+                "id": str(i),
+                "estimated_value": int(rng.integers(0, 50_000_000)),
+                "asking_price": int(rng.integers(0, 20_000_000)),
+                "bids_avg": f"{int(rng.integers(0, 30_000_000)):,}".replace(",", "."),
+                "deadline": rng.choice(["Today at 14:30", "Tomorrow at 08:00", "5/4/26 at 09:15", "N/A"]),
+            }
+            for i in range(200)
+        ]
+        expected = [per_listing_metrics(dict(r)) for r in records]
+        out = apply_market_metrics(pd.DataFrame(records)).to_dict(orient="records")
+
+        for got, want in zip(out, expected):
+            for col in ("value_diff", "roi", "forecast_sell", "forecast_profit"):
+                assert got[col] == pytest.approx(want[col]), col
+            assert got["deadline"] == want["deadline"]
+
+    def test_no_financial_columns(self) -> None:
+        df = apply_market_metrics(pd.DataFrame([{"id": "1", "deadline": "N/A"}]))
+        assert "roi" not in df.columns
+        assert df.loc[0, "deadline"] is None
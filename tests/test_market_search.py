@@ -0,0 +1,100 @@
+"""
+Unit tests for src.scrapers.market_search — filtered market searches.
+"""
+
+import argparse
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from src import constants
+from src.core.tiers import Tier
+from src.scrapers.market_search import (
+    SEARCH_PROFILES,
+    MarketSearch,
+    parse_profiles,
+    profile_url,
+    with_search_filter,
+)
+from src.scrapers.transfer import TransferScraper
+
+
+def _params(url: str) -> dict[str, str]:
+    return {k: v[0] for k, v in parse_qs(urlsplit(url).query).items()}
+
+
+class TestWithSearchFilter:
+    """Tests for with_search_filter()."""
+
+    def test_replaces_operator_and_value(self) -> None:
+        url = with_search_filter(TransferScraper.SEARCH_URL_TEMPLATE, "pre", "<=", 5_000_000)
+        params = _params(url)
+        assert params["pre_op"] == "<=" and params["pre"] == "5000000"
+        assert url.count("pre_op=") == 1 and url.count("&pre=") == 1
+
+    def test_leaves_other_fields_alone(self) -> None:
+        url = with_search_filter(TransferScraper.SEARCH_URL_TEMPLATE, "qual", ">=", 8)
+        before, after = _params(TransferScraper.SEARCH_URL_TEMPLATE), _params(url)
+        assert {k for k in after if after[k] != before[k]} == {"qual_op", "qual"}
+
+    def test_appends_missing_field(self) -> None:
+        url = with_search_filter("https://x/procurar.asp?action=proc_jog", "idd", "<", 20)
+        assert url == "https://x/procurar.asp?action=proc_jog&idd_op=%3C&idd=20"
+
+
+class TestMarketSearch:
+    """Tests for MarketSearch."""
+
+    def test_unfiltered_url_is_the_template(self) -> None:
+        assert MarketSearch().url() == TransferScraper.SEARCH_URL_TEMPLATE
+
+    def test_url_filters(self) -> None:
+        search = MarketSearch(max_price=12_000_000, min_quality=Tier.EXCELLENT,
+                              min_potential=7, min_age=18, max_age=30)
+        params = _params(search.url())
+        assert (params["pre_op"], params["pre"]) == ("<=", "12000000")
+        assert (params["qual_op"], params["qual"]) == (">=", "8")
+        assert (params["prog_op"], params["prog"]) == (">=", "7")
+        assert (params["idd_op"], params["idd"]) == ("<=", "30")
+
+    @pytest.mark.parametrize("row, expected", [
+        ({"age": 25, "Quality": "Excellent", "asking_price": 9_000_000}, True),
+        ({"age": 17, "Quality": "Excellent", "asking_price": 9_000_000}, False),
+        ({"age": 33, "Quality": "Excellent", "asking_price": 9_000_000}, False),
+        ({"age": 25, "Quality": "Very Good", "asking_price": 9_000_000}, False),
+        ({"age": 25, "Quality": "Excellent", "asking_price": 11_000_000}, False),
+        ({"age": None, "Quality": "", "asking_price": None}, True),
+    ])
+    def test_matches(self, row: dict, expected: bool) -> None:
+        search = MarketSearch(max_price=10_000_000, min_quality=Tier.EXCELLENT, min_age=18, max_age=30)
+        assert search.matches(row) is expected
+
+    def test_targeted_uses_available_funds(self) -> None:
+        search = MarketSearch.targeted({"available_funds": "12.500.000 baht"})
+        assert search.max_price == 12_500_000
+        assert search.min_quality == constants.TARGETED_MIN_QUALITY
+        assert (search.min_age, search.max_age) == (constants.TARGETED_MIN_AGE, constants.TARGETED_MAX_AGE)
+
+    @pytest.mark.parametrize("team_info", [None, {"available_funds": "0"}, {"available_funds": "999.999.999"}])
+    def test_targeted_budget_capped(self, team_info) -> None:
+        assert MarketSearch.targeted(team_info).max_price == constants.MAX_BUDGET
+
+
+class TestSearchProfiles:
+    """Tests for SEARCH_PROFILES and parse_profiles()."""
+
+    def test_profiles_filter_server_side(self) -> None:
+        for name, profile in SEARCH_PROFILES.items():
+            assert profile_url(profile) != TransferScraper.SEARCH_URL_TEMPLATE, name
+
+    def test_raw_url_profile(self) -> None:
+        assert profile_url("https://example.test/procurar.asp") == "https://example.test/procurar.asp"
+
+    def test_parse_profiles(self) -> None:
+        assert parse_profiles("all") == list(SEARCH_PROFILES)
+        assert parse_profiles("bargains, high_quality,bargains") == ["bargains", "high_quality"]
+
+    @pytest.mark.parametrize("value", ["", "bogus", "high_quality,bogus"])
+    def test_parse_profiles_rejects_unknown(self, value: str) -> None:
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_profiles(value)
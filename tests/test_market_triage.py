@@ -0,0 +1,68 @@
+"""
+Unit tests for src.services.market_triage — listing row triage.
+"""
+
+import pytest
+
+from src import constants
+from src.core.tiers import Tier
+from src.scrapers.market_search import MarketSearch
+from src.services.market_triage import Triage, has_details, value_ceilings
+
+SNAPSHOT = {
+    "1": {"id": "1", "estimated_value": 10_000_000, "quality_rank": 8},
+    "2": {"id": "2", "estimated_value": 16_000_000, "quality_rank": 8},
+    "3": {"id": "3", "estimated_value": None, "quality_rank": 9},
+}
+
+ROW = {"id": "9", "age": 24, "Quality": "Excellent", "asking_price": 3_000_000}
+
+
+def _triage(**search) -> Triage:
+    criteria = {"max_price": 20_000_000, "min_quality": Tier.EXCELLENT, "min_age": 18, "max_age": 30}
+    return Triage(MarketSearch(**{**criteria, **search}), value_ceilings(SNAPSHOT), margin=1.0)
+
+
+def _forecast(value: float) -> float:
+    return value / constants.FORECAST_SELL_DIVISOR * constants.FORECAST_SELL_MULTIPLIER
+
+
+def test_value_ceilings_ignore_listing_only_rows() -> None:
+    assert value_ceilings(SNAPSHOT) == {8: 16_000_000.0}
+
+
+def test_has_details() -> None:
+    assert has_details(SNAPSHOT["1"]) and not has_details(SNAPSHOT["3"]) and not has_details(None)
+
+
+class TestTriage:
+    """Tests for Triage."""
+
+    def test_bound_from_tier_ceiling(self) -> None:
+        assert _triage().profit_bound(ROW) == _forecast(16_000_000) - 3_000_000
+
+    def test_bound_from_previous_value(self) -> None:
+        assert _triage().profit_bound(ROW, SNAPSHOT["1"]) == _forecast(10_000_000) - 3_000_000
+
+    def test_unknown_tier_has_no_bound(self) -> None:
+        assert _triage().profit_bound({**ROW, "Quality": "World Class"}) is None
+
+    @pytest.mark.parametrize("row, reason", [
+        (ROW, None),
+        ({**ROW, "asking_price": 25_000_000}, "criteria"),
+        ({**ROW, "age": 35}, "criteria"),
+        ({**ROW, "Quality": "Good"}, "criteria"),
+        ({**ROW, "asking_price": 7_000_000}, "profit"),
+        ({**ROW, "Quality": "World Class", "asking_price": 19_000_000}, None),
+    ])
+    def test_reject(self, row: dict, reason: str | None) -> None:
+        assert _triage().reject(row) == reason
+
+    def test_margin_widens_bound(self) -> None:
+        row = {**ROW, "asking_price": 7_000_000}
+        assert Triage(_triage().search, value_ceilings(SNAPSHOT), margin=1.5).reject(row) is None
+
+    def test_build_uses_funds(self) -> None:
+        triage = Triage.build({"available_funds": "5.000.000"}, SNAPSHOT)
+        assert triage.search.max_price == 5_000_000
+        assert triage.reject({**ROW, "asking_price": 6_000_000}) == "criteria"
@@ -0,0 +1,87 @@
+"""
+Unit tests for src.scrapers.parse_pool and the pure parse functions it runs.
+"""
+
+import pytest
+
+from src.scrapers.league_stats import parse_standings
+from src.scrapers.parse_pool import ParsePool
+from src.scrapers.transfer import parse_player_page
+
+STANDINGS_HTML = """
+<table>
+  <tr><th>Pos</th><th>Team</th><th>G</th><th>W</th><th>D</th><th>L</th>
+      <th>GS</th><th>GC</th><th>GD</th><th>Pts</th></tr>
+  <tr><td>1.</td><td>Team 01</td><td>10</td><td>8</td><td>1</td><td>1</td>
+      <td>20</td><td>5</td><td>+15</td><td>25</td></tr>
+  <tr><td>2.</td><td>Team 02</td><td>10</td><td>6</td><td>2</td><td>2</td>
+      <td>15</td><td>9</td><td>+6</td><td>20</td></tr>
+</table>
+"""
+
+NEGOTIATION_HTML = """
+<table>
+  <tr><td>Estimated Transfer Value</td><td>1.250.000 baht</td></tr>
+  <tr><td>Asking Price for Bid</td><td>900.000 baht</td></tr>
+  <tr><td>Deadline</td><td>Today<br>14:30</td></tr>
+  <tr><td>Bids</td><td>3</td></tr>
+</table>
+"""
+
+PROFILE_HTML = """
+<font size="+1">Player 01</font>
+<table>
+  <tr><td><b>Position</b></td><td class="team_players">M C</td></tr>
+  <tr><td><b>Age</b></td><td class="team_players">24 Years</td></tr>
+  <tr><td class="list1"><b>Passing</b></td><td>12</td></tr>
+</table>
+"""
+
+
+def _fail(message: str) -> None:
+    raise ValueError(message)
+
+
+class TestParsePool:
+    """Tests for ParsePool."""
+
+    def test_inline_pool_returns_completed_future(self) -> None:
+        with ParsePool(workers=0) as pool:
+            future = pool.submit(parse_standings, STANDINGS_HTML)
+            assert future.done()
+            assert len(future.result()) == 2
+
+    def test_inline_pool_captures_exceptions(self) -> None:
+        with ParsePool(workers=0) as pool:
+            future = pool.submit(_fail, "bad page")
+        with pytest.raises(ValueError, match="bad page"):
+            future.result()
+
+    def test_worker_pool_matches_inline_result(self) -> None:
+        with ParsePool(workers=1) as pool:
+            remote = pool.submit(parse_standings, STANDINGS_HTML).result(timeout=60)
+        assert remote == parse_standings(STANDINGS_HTML)
+
+
+class TestPureParsers:
+    """Tests for the HTML-in, dict-out parse functions."""
+
+    def test_parse_standings(self) -> None:
+        rows = parse_standings(STANDINGS_HTML)
+        assert rows[0]["position"] == "1"
+        assert rows[0]["team"] == "Team 01"
+        assert rows[0]["points"] == 25
+        assert rows[1]["gd"] == "+6"
+
+    def test_parse_player_page(self) -> None:
+        data = parse_player_page("42", NEGOTIATION_HTML, PROFILE_HTML)
+        assert data["id"] == "42"
+        assert data["url"].endswith("ver_jogador.asp?jog_id=42")
+        assert data["estimated_value"] == 1_250_000
+        assert data["asking_price"] == 900_000
+        assert data["deadline"] == "Today 14:30"
+        assert data["bids_count"] == "3"
+        assert data["name"] == "Player 01"
+        assert data["position"] == "M C"
+        assert data["age"] == "24"
+        assert data["Passing"] == 12
@@ -0,0 +1,95 @@
+"""
+Unit tests for src.scrapers.parsers — offline HTML parsing helpers.
+"""
+
+from bs4 import BeautifulSoup
+
+from src.scrapers.parsers import RowIndex, parse_profile_tiers, parse_skill_table
+
+PROFILE_HTML = """
+<table>
+  <tr>
+    <td class="list1"><b>Handling</b></td><td><img src="bar.gif"></td><td>15</td>
+    <td class="list1"><b>Tackling</b></td><td><img src="bar.gif"></td><td>7</td>
+  </tr>
+  <tr>
+    <td class="list2"><b>Speed</b></td><td></td><td>0</td>
+    <td class="list2"><b>Strength</b></td><td></td><td>18</td>
+  </tr>
+  <tr>
+    <td class="list1"><b>Fitness</b></td><td>94%</td>
+  </tr>
+  <tr>
+    <td class="list2"><b>Injury Fitness</b></td><td>-</td>
+  </tr>
+  <tr>
+    <td class="comentarios"><b>Quality</b></td><td><img src="q.gif"></td><td>Excellent</td>
+  </tr>
+  <tr>
+    <td class="comentarios"><b>Potential</b></td><td></td><td>World Class</td>
+  </tr>
+</table>
+"""
+
+
+def _soup(html: str = PROFILE_HTML) -> BeautifulSoup:
+    return BeautifulSoup(html, "html.parser")
+
+
+class TestParseSkillTable:
+    """Tests for parse_skill_table()."""
+
+    def test_numeric_skills_across_two_column_rows(self) -> None:
+        skills = parse_skill_table(_soup())
+        assert skills["Handling"] == 15
+        assert skills["Tackling"] == 7
+        assert skills["Strength"] == 18
+
+    def test_zero_skill_is_kept(self) -> None:
+        assert parse_skill_table(_soup())["Speed"] == 0
+
+    def test_fitness_string_is_kept_as_text(self) -> None:
+        assert parse_skill_table(_soup())["Fitness"] == "94%"
+
+    def test_fitness_fallback_uses_next_cell(self) -> None:
+        assert parse_skill_table(_soup())["Injury Fitness"] == "-"
+
+    def test_fitness_fallback_disabled(self) -> None:
+        assert "Injury Fitness" not in parse_skill_table(_soup(), fitness_fallback=False)
+
+    def test_label_without_value_is_skipped(self) -> None:
+        html = '<table><tr><td class="list1"><b>Heading</b></td><td>n/a</td></tr></table>'
+        assert parse_skill_table(_soup(html)) == {}
+
+    def test_first_following_value_wins(self) -> None:
+        """A label takes the nearest value, even one belonging to the next label."""
+        html = (
+            '<table><tr><td class="list1"><b>Passing</b></td><td></td>'
+            '<td class="list1"><b>Technique</b></td><td>11</td></tr></table>'
+        )
+        assert parse_skill_table(_soup(html)) == {"Passing": 11, "Technique": 11}
+
+    def test_later_duplicate_overwrites(self) -> None:
+        html = (
+            '<table><tr><td class="list1"><b>Speed</b></td><td>3</td></tr>'
+            '<tr><td class="list2"><b>Speed</b></td><td>9</td></tr></table>'
+        )
+        assert parse_skill_table(_soup(html)) == {"Speed": 9}
+
+
+class TestParseProfileTiers:
+    """Tests for parse_profile_tiers()."""
+
+    def test_tiers_skip_empty_and_image_cells(self) -> None:
+        tiers = parse_profile_tiers(_soup())
+        assert tiers == {"Quality": "Excellent", "Potential": "World Class"}
+
+    def test_skip_existing_labels(self) -> None:
+        tiers = parse_profile_tiers(_soup(), skip={"Quality": "Good"})
+        assert "Quality" not in tiers
+
+    def test_shared_index_gives_same_result(self) -> None:
+        soup = _soup()
+        index = RowIndex()
+        skills = parse_skill_table(soup, index=index)
+        assert parse_profile_tiers(soup, skip=skills, index=index) == parse_profile_tiers(soup)
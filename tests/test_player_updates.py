@@ -0,0 +1,52 @@
+"""
+Unit tests for src.services.player_updates.PlayerUpdateBuffer.
+"""
+
+from src.services.player_updates import PlayerUpdateBuffer
+
+
+class RecordingDB:
+    """Records update_players() calls; fails the IDs in ``failing``."""
+
+    def __init__(self, failing: tuple[str, ...] = ()) -> None:
+        self.calls: list[dict[str, dict]] = []
+        self.failing = failing
+
+    def update_players(self, updates: dict[str, dict]) -> list[str]:
+        self.calls.append(updates)
+        return [pid for pid in updates if pid in self.failing]
+
+
+class TestPlayerUpdateBuffer:
+    """Tests for PlayerUpdateBuffer."""
+
+    def test_flushes_by_size(self) -> None:
+        db = RecordingDB()
+        with PlayerUpdateBuffer(db, max_rows=2) as updates:
+            for pid in "12345":
+                updates.add(pid, {"bids_count": pid})
+            assert [len(call) for call in db.calls] == [2, 2]
+        assert [len(call) for call in db.calls] == [2, 2, 1]
+        assert updates.written == 5
+
+    def test_flushes_by_age(self) -> None:
+        db = RecordingDB()
+        updates = PlayerUpdateBuffer(db, max_seconds=0)
+        updates.add("1", {"bids_count": "1"})
+        assert db.calls == [{"1": {"bids_count": "1"}}]
+        assert len(updates) == 0
+
+    def test_changes_to_one_player_are_merged(self) -> None:
+        db = RecordingDB()
+        with PlayerUpdateBuffer(db) as updates:
+            updates.add(7, {"bids_count": "1", "bids_avg": 10})
+            updates.add("7", {"bids_avg": 20})
+            updates.add("8", {})
+        assert db.calls == [{"7": {"bids_count": "1", "bids_avg": 20}}]
+
+    def test_failed_ids_are_reported(self) -> None:
+        db = RecordingDB(failing=("2",))
+        with PlayerUpdateBuffer(db) as updates:
+            updates.add("1", {"last_transfer_price": 1})
+            updates.add("2", {"last_transfer_price": 2})
+        assert updates.written == 1 and updates.failed == {"2"}
@@ -0,0 +1,75 @@
+"""
+Tests for the players.changed_at trigger (db_schemas/players_changed_at.sql).
+
+Run against a disposable local Postgres, see tests/test_swap_table_rows.py.
+Skipped unless ``TEST_DATABASE_URL`` is set and psycopg is installed.  Every
+test runs in its own schema, dropped afterwards.
+"""
+
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+SQL = Path(__file__).resolve().parent.parent / "db_schemas" / "players_changed_at.sql"
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+TABLES = """
+CREATE TABLE players (
+    id TEXT PRIMARY KEY,
+    bids_count TEXT,
+    updated_at TIMESTAMPTZ DEFAULT now()
+);
+"""
+
+UPSERT = """
+INSERT INTO players (id, bids_count, updated_at) VALUES ('1', %s, now())
+ON CONFLICT (id) DO UPDATE SET bids_count = EXCLUDED.bids_count, updated_at = EXCLUDED.updated_at
+"""
+
+
+@pytest.fixture
+def conn():
+    schema = f"changed_test_{uuid.uuid4().hex[:8]}"
+    with psycopg.connect(DATABASE_URL, autocommit=True) as admin:
+        admin.execute(f"CREATE SCHEMA {schema}")
+        try:
+            with psycopg.connect(
+                DATABASE_URL, autocommit=True, options=f"-c search_path={schema}",
+            ) as conn:
+                conn.execute(TABLES)
+                conn.execute(SQL.read_text(encoding="utf-8"))
+                conn.execute(UPSERT, ("2",))
+                yield conn
+        finally:
+            admin.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def _changed_since(conn, since) -> list[str]:
+    rows = conn.execute("SELECT id FROM players WHERE changed_at >= %s", (since,)).fetchall()
+    return [pid for (pid,) in rows]
+
+
+def _now(conn):
+    (now,) = conn.execute("SELECT clock_timestamp()").fetchone()
+    return now
+
+
+def test_rescan_with_same_data_is_not_a_change(conn) -> None:
+    since = _now(conn)
+    conn.execute(UPSERT, ("2",))
+    assert _changed_since(conn, since) == []
+    # updated_at still records the scrape.
+    (updated_at,) = conn.execute("SELECT updated_at FROM players").fetchone()
+    assert updated_at >= since
+
+
+def test_changed_column_bumps_changed_at(conn) -> None:
+    since = _now(conn)
+    conn.execute(UPSERT, ("3",))
+    assert _changed_since(conn, since) == ["1"]
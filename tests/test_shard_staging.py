@@ -0,0 +1,141 @@
+"""
+Unit tests for src.services.shard_staging — sharded scrapes and the merge.
+"""
+
+import argparse
+
+import numpy as np
+import pytest
+
+from src.services.shard_staging import ShardStage, in_shard, merge_shards, parse_shard
+
+RUN_STARTED = "2026-03-29 10:00:00"
+
+
+class RecordingDB:
+    """Collects the writes merge_shards() sends to Supabase in one call."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.listings: list[dict] = []
+        self.players: list[dict] = []
+        self.financials: list[dict] = []
+        self.touched: list[str] = []
+        self.last_updated: str | None = None
+        self.delete_stale: bool | None = None
+        self.calls = 0
+        self.fail = fail
+
+    def sync_market_rows(
+        self,
+        listings: list[dict],
+        players: list[dict],
+        financials: list[dict],
+        touched: list[str],
+        last_updated: str,
+        delete_stale: bool = False,
+    ) -> dict[str, int] | None:
+        self.calls += 1
+        if self.fail:
+            return None
+        self.listings, self.players, self.financials = listings, players, financials
+        self.touched, self.last_updated, self.delete_stale = touched, last_updated, delete_stale
+        return {
+            "listings": len(listings),
+            "players": len(players),
+            "financials": len(financials),
+            "unchanged": len(touched),
+            "deleted": 3 if delete_stale else 0,
+        }
+
+
+class TestParseShard:
+    """Tests for parse_shard()."""
+
+    def test_valid(self) -> None:
+        assert parse_shard("2/4") == (2, 4)
+
+    @pytest.mark.parametrize("spec", ["0/4", "5/4", "1/0", "x/4", "2"])
+    def test_invalid(self, spec: str) -> None:
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(spec)
+
+
+def test_every_id_lands_in_exactly_one_shard() -> None:
+    for pid in ["1000001", "1000002", "77", "abc"]:
+        assert sum(in_shard(pid, i, 3) for i in range(1, 4)) == 1
+
+
+class TestMergeShards:
+    """Tests for ShardStage + merge_shards()."""
+
+    def _stage(self, tmp_path, index: int, finish: bool = True) -> ShardStage:
+        stage = ShardStage(str(tmp_path), index, 2, RUN_STARTED)
+        if finish:
+            stage.finish()
+        return stage
+
+    def test_merges_and_dedupes(self, tmp_path) -> None:
+        one = self._stage(tmp_path, 1)
+        one.upsert_transfer_listings([{"id": "2", "roi": np.float64(1.5), "last_updated": "x"}])
+        one.upsert_transfer_listings([{"id": "2", "roi": 2.5, "last_updated": "x"}])
+        one.upsert_players([{"id": "2", "Speed": np.int64(14)}])
+        two = self._stage(tmp_path, 2)
+        two.upsert_transfer_listings([{"id": "3", "roi": float("nan")}])
+        two.update_player_financials([{"id": "3", "bids_count": "1"}])
+        two.touch_transfer_listings(["5", "7"], "x")
+
+        db = RecordingDB()
+        counts = merge_shards(db, str(tmp_path), 2)
+
+        assert db.calls == 1
+        assert [(r["id"], r["roi"]) for r in db.listings] == [("2", 2.5), ("3", None)]
+        assert db.players == [{"id": "2", "Speed": 14}]
+        assert [r["id"] for r in db.financials] == ["3"]
+        assert db.touched == ["5", "7"]
+        assert db.delete_stale
+        assert counts["deleted"] == 3 and counts["shards_complete"] == 2
+
+    def test_failed_merge_reports_nothing_written(self, tmp_path) -> None:
+        self._stage(tmp_path, 1).upsert_transfer_listings([{"id": "2"}])
+        self._stage(tmp_path, 2)
+
+        counts = merge_shards(RecordingDB(fail=True), str(tmp_path), 2)
+
+        assert counts["listings"] == 0 and counts["deleted"] == 0
+        assert counts["shards_complete"] == 2
+
+    def test_incomplete_shard_keeps_stale_listings(self, tmp_path) -> None:
+        self._stage(tmp_path, 1).upsert_transfer_listings([{"id": "2"}])
+        self._stage(tmp_path, 2, finish=False)
+
+        db = RecordingDB()
+        counts = merge_shards(db, str(tmp_path), 2)
+
+        assert [r["id"] for r in db.listings] == ["2"]
+        assert not db.delete_stale
+        assert counts["shards_complete"] == 1
+
+    def test_missing_shard_keeps_stale_listings(self, tmp_path) -> None:
+        self._stage(tmp_path, 1).touch_transfer_listings(["9"], "x")
+        db = RecordingDB()
+        merge_shards(db, str(tmp_path), 2)
+        assert db.touched == ["9"] and not db.delete_stale
+
+    def test_resumed_shard_keeps_staged_rows(self, tmp_path) -> None:
+        self._stage(tmp_path, 1, finish=False).upsert_transfer_listings([{"id": "2"}])
+        resumed = ShardStage(str(tmp_path), 1, 2, RUN_STARTED, append=True)
+        resumed.upsert_transfer_listings([{"id": "4"}])
+
+        db = RecordingDB()
+        merge_shards(db, str(tmp_path), 2)
+        assert [r["id"] for r in db.listings] == ["2", "4"]
+
+    def test_targeted_shards_keep_stale_listings(self, tmp_path) -> None:
+        for index in (1, 2):
+            stage = ShardStage(str(tmp_path), index, 2, RUN_STARTED, targeted=True)
+            stage.upsert_transfer_listings([{"id": str(index)}])
+            stage.finish()
+
+        db = RecordingDB()
+        counts = merge_shards(db, str(tmp_path), 2)
+        assert counts["shards_complete"] == 2 and not db.delete_stale
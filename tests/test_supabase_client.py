@@ -0,0 +1,302 @@
+"""
+Unit tests for src.services.supabase_client.SupabaseManager.
+
+A fake PostgREST client stands in for Supabase; only the query builder calls
+the tested methods use are implemented.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.services.supabase_client import SupabaseManager
+
+
+class FakeTable:
+    """Minimal in-memory stand-in for a PostgREST table query builder."""
+
+    def __init__(self, rows: dict[str, dict]) -> None:
+        self.rows = rows
+        self.upserted: list[dict] = []
+        self.deleted: list[str] = []
+        self.updated: list[str] = []
+        self.fail_upserts = False
+        self.filters: list[tuple[str, str, str | None]] = []
+        self._op = "select"
+        self._range = (0, 999)
+        self._ids: list[str] = []
+        self._payload: list[dict] = []
+
+    def select(self, *_):
+        self._op = "select"
+        return self
+
+    def range(self, start: int, end: int):
+        self._range = (start, end)
+        return self
+
+    def order(self, column: str):
+        self.ordered_by = column
+        return self
+
+    def upsert(self, payload: list[dict]):
+        self._op, self._payload = "upsert", payload
+        return self
+
+    def delete(self):
+        self._op = "delete"
+        return self
+
+    def update(self, payload: dict):
+        self._op, self._payload = "update", [payload]
+        return self
+
+    def eq(self, _col: str, value: str):
+        self._ids = [value]
+        return self
+
+    def in_(self, _col: str, ids: list[str]):
+        self._ids = ids
+        return self
+
+    def gt(self, col: str, value: str):
+        self.filters.append(("gt", col, value))
+        return self
+
+    def gte(self, col: str, value: str):
+        self.filters.append(("gte", col, value))
+        return self
+
+    def lte(self, col: str, value: str):
+        self.filters.append(("lte", col, value))
+        return self
+
+    def or_(self, condition: str):
+        self.filters.append(("or", condition, None))
+        return self
+
+    def execute(self):
+        class Resp:
+            data: list = []
+
+        resp = Resp()
+        if self._op == "select":
+            start, end = self._range
+            rows = sorted(self.rows.values(), key=lambda row: row["id"])
+            resp.data = rows[start : end + 1]
+        elif self._op == "upsert":
+            if any(set(row) != set(self._payload[0]) for row in self._payload):
+                raise ValueError("All object keys must match")
+            if self.fail_upserts:
+                raise RuntimeError("upsert failed")
+            self.upserted.extend(self._payload)
+            for row in self._payload:
+                self.rows[row["id"]] = {**self.rows.get(row["id"], {}), **row}
+        elif self._op == "update":
+            (pid,) = self._ids
+            if "bad" in self._payload[0]:
+                raise RuntimeError("column bad does not exist")
+            self.updated.append(pid)
+            self.rows[pid] = {**self.rows.get(pid, {}), **self._payload[0]}
+        else:
+            self.deleted.extend(self._ids)
+            resp.data = [self.rows.pop(i) for i in self._ids if i in self.rows]
+        return resp
+
+
+class FakeRpc:
+    def __init__(self, client: "FakeClient", name: str, params: dict) -> None:
+        self.client, self.name, self.params = client, name, params
+
+    def execute(self):
+        if self.client.rpc_error:
+            raise self.client.rpc_error
+        self.client.calls.append((self.name, self.params))
+        rows = self.client._table.rows
+
+        class Resp:
+            data: object = None
+
+        resp = Resp()
+        if self.name == "sync_table_rows":
+            resp.data = [self._apply(rows, change) for change in self.params["changes"]]
+            return resp
+        rows.clear()
+        rows.update({row.get("id", i): row for i, row in enumerate(self.params["new_rows"])})
+        resp.data = len(self.params["new_rows"])
+        return resp
+
+    @staticmethod
+    def _apply(rows: dict, change: dict) -> int:
+        if change["op"] == "delete":
+            return len([rows.pop(row["id"]) for row in change["rows"] if row["id"] in rows])
+        if any(set(row) != set(change["rows"][0]) for row in change["rows"]):
+            raise ValueError("All object keys must match")
+        applied = 0
+        for row in change["rows"]:
+            if change["op"] == "upsert" or row["id"] in rows:
+                rows[row["id"]] = {**rows.get(row["id"], {}), **row}
+                applied += 1
+        return applied
+
+
+class FakeClient:
+    def __init__(self, table: FakeTable) -> None:
+        self._table = table
+        self.calls: list[tuple[str, dict]] = []
+        self.rpc_error: Exception | None = None
+
+    def table(self, _name: str) -> FakeTable:
+        return self._table
+
+    def rpc(self, name: str, params: dict) -> FakeRpc:
+        return FakeRpc(self, name, params)
+
+
+def _manager(table: FakeTable) -> SupabaseManager:
+    manager = SupabaseManager.__new__(SupabaseManager)
+    manager.client = FakeClient(table)
+    return manager
+
+
+def test_replace_bot_opportunities_dedupes_and_swaps() -> None:
+    manager = _manager(FakeTable({"old": {"id": "old"}}))
+    manager.replace_bot_opportunities([
+        {"id": 1, "name": "A", "asking_price": "1.000 baht"},
+        {"id": 1, "name": "A2"},
+        {"id": 2, "name": "B"},
+    ])
+    ((_, params),) = manager.client.calls
+    assert params["target_table"] == "bot_opportunities" and params["scope"] == {}
+    assert [(r["id"], r["name"]) for r in params["new_rows"]] == [("1", "A2"), ("2", "B")]
+
+
+def test_upcoming_fixtures_swap_only_their_season() -> None:
+    manager = _manager(FakeTable({}))
+    manager.upsert_upcoming_fixtures([{"match_id": "m1", "season": 95}])
+    ((_, params),) = manager.client.calls
+    assert params["target_table"] == "upcoming_fixtures"
+    assert params["scope"] == {"season": "95"}
+
+
+class TestUpdatePlayers:
+    """Tests for the bulk update_players()."""
+
+    def test_grouped_by_columns(self) -> None:
+        table = FakeTable({str(i): {"id": str(i), "bids_count": "1"} for i in range(1, 4)})
+        manager = _manager(table)
+        failed = manager.update_players({
+            "1": {"bids_avg": 10, "deadline": "2026-03-29 14:30:00"},
+            "2": {"deadline": "2026-03-29T08:00:00+00:00"},
+            "3": {"bids_avg": 30, "deadline": "2026-03-29 16:00:00"},
+            "4": {},
+        })
+        assert failed == []
+        ((name, params),) = manager.client.calls
+        assert name == "sync_table_rows"
+        assert [change["op"] for change in params["changes"]] == ["update", "update"]
+        assert table.rows["1"] == {"id": "1", "bids_count": "1", "bids_avg": 10,
+                                   "deadline": "2026-03-29T14:30:00+07:00"}
+        assert table.rows["2"]["deadline"] == "2026-03-29T15:00:00+07:00"
+        assert table.updated == []
+
+    def test_unknown_ids_not_inserted(self) -> None:
+        table = FakeTable({"1": {"id": "1"}})
+        failed = _manager(table).update_players({
+            "1": {"bids_avg": 10},
+            "9": {"bids_avg": 90},
+        })
+        assert failed == []
+        assert sorted(table.rows) == ["1"]
+        assert table.upserted == []
+
+    def test_failed_call_retried_row_by_row(self) -> None:
+        table = FakeTable({})
+        manager = _manager(table)
+        manager.client.rpc_error = RuntimeError("statement timeout")
+        failed = manager.update_players({
+            "1": {"bids_avg": 10, "bad": 1},
+            "2": {"bids_avg": 20, "bad": 2},
+            "3": {"bids_avg": 30},
+        })
+        assert failed == ["1", "2"]
+        assert table.updated == ["3"]
+
+    def test_financials_skip_unknown_ids(self) -> None:
+        table = FakeTable({"1": {"id": "1", "skills": {"x": 1}}})
+        _manager(table).update_player_financials([
+            {"id": "1", "bids_count": 2, "bids_avg": "1,000"},
+            {"id": "9", "bids_count": 5, "bids_avg": "9,000"},
+        ])
+        assert sorted(table.rows) == ["1"]
+        assert table.rows["1"]["skills"] == {"x": 1}
+        assert table.rows["1"]["bids_count"] == 2
+
+
+def test_listing_only_upsert_keeps_stored_details(sample_transfer_listing: dict) -> None:
+    table = FakeTable({"1": {"id": "1", "estimated_value": 5_000_000, "roi": 150.0}})
+    _manager(table).upsert_transfer_listings([
+        {"id": "1", "asking_price": 900_000, "deadline": "2026-04-01 10:00:00"},
+        {**sample_transfer_listing, "id": "2"},
+    ])
+    assert table.rows["1"]["estimated_value"] == 5_000_000
+    assert table.rows["1"]["roi"] == 150.0
+    assert table.rows["1"]["asking_price"] == 900_000
+    assert sorted(table.rows) == ["1", "2"]
+
+
+def test_price_update_scope_reads_only_changed_rows() -> None:
+    table = FakeTable({"1": {"id": "1"}})
+    manager = _manager(table)
+
+    assert [r["id"] for r in manager.get_players_for_price_update(7)] == ["1"]
+    assert not any(col == "changed_at" for _, col, _ in table.filters)
+
+    table.filters.clear()
+    manager.get_players_for_price_update(7, changed_since=datetime(2026, 3, 29, 10, 0))
+    changed = [f for f in table.filters if f[1] == "changed_at"]
+    assert changed == [("gte", "changed_at", "2026-03-29T10:00:00+07:00")] * 2
+
+
+def test_failed_price_update_read_returns_empty() -> None:
+    table = FakeTable({"1": {"id": "1"}})
+
+    def timeout():
+        raise RuntimeError("timeout")
+
+    table.execute = timeout
+    assert _manager(table).get_players_for_price_update(7) == []
+
+
+def test_failed_listing_upsert_returns_its_ids(sample_transfer_listing: dict) -> None:
+    table = FakeTable({})
+    table.fail_upserts = True
+    failed = _manager(table).upsert_transfer_listings([
+        {**sample_transfer_listing, "id": "1"}, {**sample_transfer_listing, "id": "2"},
+    ])
+    assert failed == ["1", "2"]
+    assert table.rows == {}
+
+
+def test_content_hash_ignores_bookkeeping_columns() -> None:
+    row = {"id": "1", "asking_price": 100, "deadline": "2026-04-01 10:00:00"}
+    digest = SupabaseManager._content_hash(row)
+    assert SupabaseManager._content_hash({**row, "last_updated": "now"}) == digest
+    assert SupabaseManager._content_hash(dict(reversed(row.items()))) == digest
+    assert SupabaseManager._content_hash({**row, "asking_price": 101}) != digest
+
+
+def test_sync_market_rows_applies_one_transaction(sample_transfer_listing: dict) -> None:
+    table = FakeTable({str(i): {"id": str(i), "last_updated": "old"} for i in range(1, 4)})
+    manager = _manager(table)
+
+    counts = manager.sync_market_rows(
+        [{**sample_transfer_listing, "id": "4"}], [], [], ["1"],
+        last_updated="2026-04-01 10:00:00", delete_stale=True,
+    )
+
+    assert counts == {"listings": 1, "players": 0, "financials": 0, "unchanged": 1, "deleted": 2}
+    ((name, _),) = manager.client.calls
+    assert name == "sync_table_rows"
+    assert sorted(table.rows) == ["1", "4"]
+    assert {row["last_updated"] for row in table.rows.values()} == {"2026-04-01 10:00:00"}
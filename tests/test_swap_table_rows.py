@@ -0,0 +1,169 @@
+"""
+Tests for the swap_table_rows and sync_table_rows Postgres functions
+(db_schemas/swap_table_rows.sql).
+
+Run against a disposable local Postgres, e.g.::
+
+    docker run --rm -e POSTGRES_PASSWORD=pg -p 5432:5432 postgres:16
+    TEST_DATABASE_URL=postgresql://postgres:pg@localhost:5432/postgres pytest tests/test_swap_table_rows.py
+
+Skipped unless ``TEST_DATABASE_URL`` is set and psycopg is installed.  Every
+test runs in its own schema, dropped afterwards.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+
+psycopg = pytest.importorskip("psycopg")
+
+DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+SQL = Path(__file__).resolve().parent.parent / "db_schemas" / "swap_table_rows.sql"
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="TEST_DATABASE_URL not set")
+
+TABLES = """
+CREATE TABLE transfer_listings (
+    id TEXT PRIMARY KEY,
+    asking_price BIGINT DEFAULT 0,
+    last_updated TIMESTAMPTZ DEFAULT now()
+);
+CREATE TABLE upcoming_fixtures (
+    match_id TEXT PRIMARY KEY,
+    season TEXT
+);
+CREATE TABLE players (id TEXT PRIMARY KEY, bids_count TEXT, deadline TIMESTAMPTZ);
+"""
+
+
+@pytest.fixture
+def conn():
+    schema = f"swap_test_{uuid.uuid4().hex[:8]}"
+    with psycopg.connect(DATABASE_URL, autocommit=True) as admin:
+        admin.execute(f"CREATE SCHEMA {schema}")
+        try:
+            with psycopg.connect(DATABASE_URL, options=f"-c search_path={schema}") as conn:
+                conn.execute(TABLES)
+                conn.execute(SQL.read_text(encoding="utf-8"))
+                conn.execute(
+                    "INSERT INTO transfer_listings (id, asking_price) VALUES ('1', 10), ('2', 20)"
+                )
+                conn.commit()
+                yield conn
+        finally:
+            admin.execute(f"DROP SCHEMA {schema} CASCADE")
+
+
+def _swap(conn, table: str, rows: list[dict], scope: dict | None = None) -> int:
+    (inserted,) = conn.execute(
+        "SELECT swap_table_rows(%s, %s::jsonb, %s::jsonb)",
+        (table, json.dumps(rows), json.dumps(scope or {})),
+    ).fetchone()
+    return inserted
+
+
+def _listings(conn) -> list[tuple]:
+    return conn.execute("SELECT id, asking_price FROM transfer_listings ORDER BY id").fetchall()
+
+
+def test_rows_replaced_and_defaults_kept(conn) -> None:
+    assert _swap(conn, "transfer_listings", [{"id": "2", "asking_price": 25}, {"id": "3"}]) == 2
+    conn.commit()
+    assert _listings(conn) == [("2", 25), ("3", 0)]
+    assert conn.execute(
+        "SELECT count(*) FROM transfer_listings WHERE last_updated IS NULL"
+    ).fetchone() == (0,)
+
+
+def test_readers_see_old_rows_until_commit(conn) -> None:
+    _swap(conn, "transfer_listings", [{"id": "9", "asking_price": 90}])
+    with psycopg.connect(DATABASE_URL, options=f"-c search_path={_schema(conn)}") as reader:
+        assert _listings(reader) == [("1", 10), ("2", 20)]
+        conn.commit()
+        assert _listings(reader) == [("9", 90)]
+
+
+def test_failed_swap_leaves_table_unchanged(conn) -> None:
+    with pytest.raises(psycopg.errors.UniqueViolation):
+        _swap(conn, "transfer_listings", [{"id": "5"}, {"id": "5"}])
+    conn.rollback()
+    with pytest.raises(psycopg.errors.InvalidTextRepresentation):
+        _swap(conn, "transfer_listings", [{"id": "5", "asking_price": "lots"}])
+    conn.rollback()
+    assert _listings(conn) == [("1", 10), ("2", 20)]
+
+
+def test_scope_limits_the_replaced_rows(conn) -> None:
+    _swap(conn, "upcoming_fixtures", [{"match_id": "a", "season": "94"}, {"match_id": "b", "season": "95"}])
+    _swap(conn, "upcoming_fixtures", [{"match_id": "c", "season": "95"}], scope={"season": "95"})
+    rows = conn.execute("SELECT match_id FROM upcoming_fixtures ORDER BY match_id").fetchall()
+    assert rows == [("a",), ("c",)]
+
+
+def test_other_tables_are_refused(conn) -> None:
+    with pytest.raises(psycopg.errors.RaiseException):
+        _swap(conn, "players", [{"id": "1"}])
+
+
+def _sync(conn, *changes: tuple[str, str, list[dict]]) -> list[int]:
+    payload = [{"table": table, "op": op, "rows": rows} for table, op, rows in changes]
+    (counts,) = conn.execute(
+        "SELECT sync_table_rows(%s::jsonb)", (json.dumps(payload),)
+    ).fetchone()
+    return counts
+
+
+def test_sync_applies_only_the_given_rows(conn) -> None:
+    counts = _sync(
+        conn,
+        ("transfer_listings", "upsert", [
+            {"id": "2", "asking_price": 25},
+            {"id": "3", "asking_price": 30},
+        ]),
+        ("transfer_listings", "delete", [{"id": "1"}]),
+    )
+    conn.commit()
+    assert counts == [2, 1]
+    assert _listings(conn) == [("2", 25), ("3", 30)]
+
+
+def test_sync_upsert_keeps_columns_it_does_not_set(conn) -> None:
+    conn.execute("UPDATE transfer_listings SET last_updated = '2026-01-01' WHERE id = '1'")
+    _sync(conn, ("transfer_listings", "upsert", [{"id": "1", "asking_price": 11}]))
+    (last_updated,) = conn.execute(
+        "SELECT last_updated::date::text FROM transfer_listings WHERE id = '1'"
+    ).fetchone()
+    assert last_updated == "2026-01-01"
+
+
+def test_sync_update_skips_unknown_ids(conn) -> None:
+    conn.execute("INSERT INTO players (id, bids_count) VALUES ('1', '2')")
+    counts = _sync(conn, ("players", "update", [
+        {"id": "1", "bids_count": "5"},
+        {"id": "9", "bids_count": "1"},
+    ]))
+    assert counts == [1]
+    assert conn.execute("SELECT id, bids_count FROM players ORDER BY id").fetchall() == [("1", "5")]
+
+
+def test_failed_sync_changes_nothing(conn) -> None:
+    with pytest.raises(psycopg.errors.InvalidTextRepresentation):
+        _sync(
+            conn,
+            ("transfer_listings", "delete", [{"id": "1"}]),
+            ("transfer_listings", "upsert", [{"id": "5", "asking_price": "lots"}]),
+        )
+    conn.rollback()
+    assert _listings(conn) == [("1", 10), ("2", 20)]
+
+
+def test_sync_refuses_other_tables(conn) -> None:
+    with pytest.raises(psycopg.errors.RaiseException):
+        _sync(conn, ("upcoming_fixtures", "delete", [{"id": "1"}]))
+
+
+def _schema(conn) -> str:
+    return conn.execute("SELECT current_schema()").fetchone()[0]
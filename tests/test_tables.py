@@ -0,0 +1,109 @@
+"""
+Unit tests for src.scrapers.tables — declarative table extraction.
+"""
+
+from src.scrapers.tables import (
+    ROW,
+    Column,
+    TablePlan,
+    int_or,
+    link_param,
+    reset_table_timings,
+    rows_with_class,
+    table_soup,
+    table_timings,
+    tables_with_header,
+    text,
+    text_sep,
+    to_float,
+    to_int,
+    whole_document,
+)
+
+PAGE_HTML = """
+<div class="menu"><a href="index.asp">Home</a></div>
+<table><tr><td>Season selector</td></tr></table>
+<table>
+  <tr><th>#</th><th>Name</th><th>Age</th><th>Rating</th></tr>
+  <tr class="list1"><td>1.</td><td><a href="ver_jogador.asp?jog_id=11">Player <b>A</b></a></td>
+      <td>24</td><td>7,5</td></tr>
+  <tr class="list2"><td>2.</td><td><a href="ver_jogador.asp?jog_id=12">Player B</a></td>
+      <td>n/a</td></tr>
+  <tr class="list1"><td>3.</td><td>No link</td><td>30</td><td>6,0</td></tr>
+  <tr class="list2"><td>4.</td><td><a href="ver_jogador.asp?jog_id=11">Player A</a></td>
+      <td>24</td><td>7,5</td></tr>
+</table>
+"""
+
+PLAN = TablePlan(
+    name="test_players",
+    tables=tables_with_header("Name"),
+    min_cells=3,
+    columns=(
+        Column("player_id", 1, link_param("jog_id"), required=True),
+        Column("name",      1, text_sep),
+        Column("age",       2, to_int),
+        Column("rating",    3, to_float, default=None),
+    ),
+)
+
+
+class TestTablePlan:
+    """Tests for TablePlan extraction."""
+
+    def test_extracts_rows_in_document_order(self) -> None:
+        rows = PLAN.extract(table_soup(PAGE_HTML))
+        assert [r["player_id"] for r in rows] == ["11", "12", "11"]
+        assert rows[0] == {"player_id": "11", "name": "Player A", "age": 24, "rating": 7.5}
+
+    def test_missing_cell_uses_default_and_bad_number_is_none(self) -> None:
+        rows = PLAN.extract(table_soup(PAGE_HTML))
+        assert rows[1]["age"] is None
+        assert rows[1]["rating"] is None
+
+    def test_unique_drops_repeated_keys(self) -> None:
+        plan = TablePlan(
+            name="test_unique", tables=PLAN.tables, columns=PLAN.columns,
+            min_cells=3, unique="player_id",
+        )
+        rows = plan.extract(table_soup(PAGE_HTML))
+        assert [r["player_id"] for r in rows] == ["11", "12"]
+
+    def test_row_column_and_row_classes(self) -> None:
+        plan = TablePlan(
+            name="test_row",
+            tables=whole_document,
+            rows=rows_with_class("list2"),
+            columns=(
+                Column("rank", 0, text),
+                Column("player_id", ROW, link_param("jog_id", r"ver_jogador")),
+            ),
+        )
+        rows = plan.extract(table_soup(PAGE_HTML))
+        assert rows == [{"rank": "2.", "player_id": "12"}, {"rank": "4.", "player_id": "11"}]
+
+    def test_min_cells_per_column(self) -> None:
+        plan = TablePlan(
+            name="test_min_cells",
+            tables=PLAN.tables,
+            columns=(Column("age", 2, int_or(0), default=-1, min_cells=4),),
+        )
+        assert [r["age"] for r in plan.extract(table_soup(PAGE_HTML))] == [24, -1, 30, 24]
+
+    def test_negative_index_reads_last_cell(self) -> None:
+        plan = TablePlan(name="test_last", tables=PLAN.tables, columns=(Column("last", -1, text),))
+        assert plan.extract(table_soup(PAGE_HTML))[0]["last"] == "7,5"
+
+    def test_table_soup_drops_non_table_markup(self) -> None:
+        soup = table_soup(PAGE_HTML)
+        assert soup.find("div") is None
+        assert len(soup.find_all("table")) == 2
+
+    def test_timings_are_recorded_per_plan(self) -> None:
+        reset_table_timings()
+        PLAN.extract(table_soup(PAGE_HTML))
+        PLAN.extract(table_soup(PAGE_HTML))
+        stats = table_timings()["test_players"]
+        assert stats["calls"] == 2
+        assert stats["rows"] == 6
+        assert stats["seconds"] >= 0
@@ -0,0 +1,52 @@
+"""
+Unit tests for src.core.tiers — ordinal quality / potential tiers.
+"""
+
+import pandas as pd
+import pytest
+
+from src import constants
+from src.core.tiers import TIER_RANKS, Tier, parse_tier, tier_rank, tiers_at_least
+
+
+class TestParseTier:
+    """Tests for parse_tier() and tier_rank()."""
+
+    @pytest.mark.parametrize("label", list(TIER_RANKS))
+    def test_every_label_round_trips(self, label: str) -> None:
+        assert parse_tier(label).label == label
+
+    def test_case_spacing_and_hyphens_ignored(self) -> None:
+        assert parse_tier("  world-CLASS ") is Tier.WORLD_CLASS
+        assert parse_tier("Very  Good") is Tier.VERY_GOOD
+
+    @pytest.mark.parametrize("raw", [None, "", "—", "?", "Superb"])
+    def test_unknown_returns_none(self, raw) -> None:
+        assert parse_tier(raw) is None
+        assert tier_rank(raw) is None
+
+    def test_ranks_are_ordered(self) -> None:
+        assert tier_rank("Terrible") == 1
+        assert tier_rank("Excellent") == 8
+        assert tier_rank("World Class") == 10
+        assert Tier.FORMIDABLE > Tier.EXCELLENT > Tier.VERY_GOOD
+
+
+class TestTiersAtLeast:
+    """Tests for tiers_at_least()."""
+
+    def test_best_first(self) -> None:
+        assert tiers_at_least(Tier.EXCELLENT) == ("World Class", "Formidable", "Excellent")
+
+    def test_lowest_tier_includes_all(self) -> None:
+        assert len(tiers_at_least(Tier.TERRIBLE)) == len(Tier)
+
+    def test_bot_accepted_qualities_unchanged(self) -> None:
+        assert constants.BOT_ACCEPTED_QUALITIES == ("World Class", "Formidable", "Excellent")
+
+
+def test_series_map_vectorises() -> None:
+    ranks = pd.Series(["Good", "World Class", None, "Low"]).map(TIER_RANKS)
+    assert ranks.tolist()[:2] == [6, 10]
+    assert pd.isna(ranks[2])
+    assert (ranks >= Tier.GOOD).tolist() == [True, True, False, False]
@@ -0,0 +1,378 @@
+"""
+Unit tests for src.services.transfer_pipeline — the streaming market scrape.
+
+A recording stand-in replaces SupabaseManager so the stages can be driven
+without a database.
+"""
+
+from concurrent.futures import Future
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from src.core.utils import parse_deadline
+from src.services.checkpoint import ScrapeCheckpoint
+from src.services.market_history import MarketHistory, read_history
+from src.services.supabase_client import SupabaseManager
+from src.services.transfer_pipeline import (
+    CsvAppender,
+    TransferPipeline,
+    frame_records,
+    iter_by_urgency,
+    listing_unchanged,
+    order_by_urgency,
+)
+
+
+class RecordingDB:
+    """Collects the batches the pipeline sends to Supabase."""
+
+    def __init__(self) -> None:
+        self.listings: list[list[dict]] = []
+        self.players: list[list[dict]] = []
+        self.touched: list[str] = []
+        self.financials: list[list[dict]] = []
+        self.failing: set[str] = set()
+
+    def upsert_transfer_listings(self, records: list[dict]) -> list[str]:
+        self.listings.append(records)
+        return [str(r["id"]) for r in records if str(r["id"]) in self.failing]
+
+    def upsert_players(self, records: list[dict]) -> None:
+        self.players.append(records)
+
+    def update_player_financials(self, records: list[dict]) -> None:
+        self.financials.append(records)
+
+    def touch_transfer_listings(self, ids: list[str], last_updated: str) -> list[str]:
+        self.touched.extend(pid for pid in ids if pid not in self.failing)
+        return [pid for pid in ids if pid in self.failing]
+
+
+def _done(value) -> Future:
+    future: Future = Future()
+    future.set_result(value)
+    return future
+
+
+def _failed(exc: Exception) -> Future:
+    future: Future = Future()
+    future.set_exception(exc)
+    return future
+
+
+class TestListingUnchanged:
+    """Tests for listing_unchanged()."""
+
+    ROW = {
+        "id": "1", "asking_price": 2_000_000.0, "deadline": "Tomorrow at 08:00", "bids_count": "2",
+    }
+
+    @pytest.fixture
+    def previous(self) -> dict:
+        stored = parse_deadline("Tomorrow at 08:00").strftime("%Y-%m-%d %H:%M:%S")
+        return {"id": "1", "asking_price": 2_000_000, "deadline": stored, "bids_count": 2}
+
+    def test_same_price_and_deadline(self, previous: dict) -> None:
+        assert listing_unchanged(self.ROW, previous)
+
+    def test_new_listing(self) -> None:
+        assert not listing_unchanged(self.ROW, None)
+
+    def test_price_changed(self, previous: dict) -> None:
+        assert not listing_unchanged({**self.ROW, "asking_price": 2_100_000.0}, previous)
+
+    def test_deadline_changed(self, previous: dict) -> None:
+        assert not listing_unchanged({**self.ROW, "deadline": "Tomorrow at 09:00"}, previous)
+
+    def test_new_bid(self, previous: dict) -> None:
+        assert not listing_unchanged({**self.ROW, "bids_count": "3"}, previous)
+
+    def test_snapshot_without_bids_count(self, previous: dict) -> None:
+        assert not listing_unchanged(self.ROW, {**previous, "bids_count": None})
+
+    def test_unparseable_deadline_refreshes(self, previous: dict) -> None:
+        assert not listing_unchanged({**self.ROW, "deadline": "N/A"}, previous)
+
+
+class TestOrderByUrgency:
+    """Tests for order_by_urgency()."""
+
+    NOW = datetime(2026, 3, 29, 10, 0)
+
+    def test_soonest_first_with_hot_prefix(self) -> None:
+        rows = [
+            {"id": "1", "deadline": "Tomorrow at 08:00"},
+            {"id": "2", "deadline": "N/A"},
+            {"id": "3", "deadline": "Today at 10:30"},
+            {"id": "4", "deadline": "Today at 18:00"},
+        ]
+        ordered, hot = order_by_urgency(rows, horizon_hours=12, now=self.NOW)
+        assert [r["id"] for r in ordered] == ["3", "4", "1", "2"]
+        assert hot == 2
+
+    def test_snapshot_deadline_used_when_row_unparseable(self) -> None:
+        rows = [{"id": "1", "deadline": "Today at 20:00"}, {"id": "2", "deadline": ""}]
+        snapshot = {"2": {"deadline": "2026-03-29 11:00:00"}}
+        ordered, hot = order_by_urgency(rows, snapshot, horizon_hours=1, now=self.NOW)
+        assert [r["id"] for r in ordered] == ["2", "1"]
+        assert hot == 1
+
+    def test_empty(self) -> None:
+        assert order_by_urgency([]) == ([], 0)
+
+    def test_windows_are_ordered_as_they_stream(self) -> None:
+        rows = [
+            {"id": "1", "deadline": "Tomorrow at 08:00"},
+            {"id": "2", "deadline": "Today at 10:30"},
+            {"id": "3", "deadline": "Today at 18:00"},
+        ]
+        seen: list[str] = []
+
+        def discover():
+            for row in rows:
+                seen.append(row["id"])
+                yield row
+
+        ordered = iter_by_urgency(discover(), window=2, horizon_hours=12, now=self.NOW)
+        assert next(ordered) == (rows[1], True)
+        assert seen == ["1", "2"]  # the third row is not discovered yet
+        assert list(ordered) == [(rows[0], False), (rows[2], True)]
+
+
+def test_frame_records_keeps_unknown_tier_rank_missing() -> None:
+    df = frame_records([
+        {"id": "1", "roi": float("inf"), "quality_rank": 8},
+        {"id": "2", "quality_rank": None},
+    ])
+    assert df.loc[0, "roi"] == 0
+    assert df.loc[1, "roi"] == 0
+    assert pd.isna(df.loc[1, "quality_rank"])
+
+
+class TestCsvAppender:
+    """Tests for CsvAppender."""
+
+    def test_header_widens_for_new_columns(self, tmp_path) -> None:
+        path = tmp_path / "out.csv"
+        csv = CsvAppender(str(path))
+        csv.append(pd.DataFrame([{"id": "1", "Speed": 10}]))
+        csv.append(pd.DataFrame([{"id": "2", "Handling": 12}]))
+
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        assert list(df.columns) == ["id", "Speed", "Handling"]
+        assert df.to_dict(orient="records") == [
+            {"id": "1", "Speed": "10", "Handling": ""},
+            {"id": "2", "Speed": "", "Handling": "12"},
+        ]
+
+    def test_previous_run_truncated(self, tmp_path) -> None:
+        path = tmp_path / "out.csv"
+        path.write_text("stale\n")
+        CsvAppender(str(path))
+        assert path.read_text() == ""
+
+
+class TestTransferPipeline:
+    """End-to-end tests for TransferPipeline."""
+
+    def test_flushes_in_batches(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, str(tmp_path / "out.csv"), queue_size=2, flush_rows=2) as pipeline:
+            for i in range(5):
+                pipeline.submit(str(i), _done({**sample_player, "id": str(i)}))
+
+        assert pipeline.written == 5
+        assert [len(b) for b in db.listings] == [2, 2, 1]
+        assert len(pd.read_csv(tmp_path / "out.csv")) == 5
+
+    def test_financials_kept_out_of_players(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, str(tmp_path / "out.csv")) as pipeline:
+            pipeline.submit("1", _done(dict(sample_player)))
+
+        listing = db.listings[0][0]
+        player = db.players[0][0]
+        assert listing["roi"] == 150.0 and "last_updated" in listing
+        assert "roi" not in player and "asking_price" not in player
+        assert player["Quality"] == "Excellent"
+
+    def test_unchanged_listings_are_only_touched(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, str(tmp_path / "out.csv")) as pipeline:
+            pipeline.touch("7")
+            pipeline.submit("1", _done(dict(sample_player)))
+            pipeline.touch("8")
+
+        assert db.touched == ["7", "8"]
+        assert pipeline.touched == 2
+        assert pipeline.written == 1
+
+    def test_financials_only_listing_keeps_stored_skills(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, str(tmp_path / "out.csv")) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1", "Speed": 14}))
+            pipeline.submit("2", _done({**sample_player, "id": "2"}), skills=False)
+
+        assert [r["id"] for r in db.listings[0]] == ["1", "2"]
+        assert [r["id"] for r in db.players[0]] == ["1"]
+        assert [r["id"] for r in db.financials[0]] == ["2"]
+
+    def test_search_profiles_reach_listings_only(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, None) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}),
+                            extra={"search_profiles": ["bargains", "high_quality"]})
+
+        assert db.listings[0][0]["search_profiles"] == ["bargains", "high_quality"]
+        assert "search_profiles" not in db.players[0][0]
+
+    def test_parse_failure_is_skipped(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, str(tmp_path / "out.csv")) as pipeline:
+            pipeline.submit("1", _failed(ValueError("bad page")))
+            pipeline.submit("2", _done({**sample_player, "id": "2"}))
+
+        assert pipeline.failed == 1
+        assert pipeline.written == 1
+
+    def test_partial_batch_flushed_when_producer_raises(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with pytest.raises(RuntimeError):
+            with TransferPipeline(db, str(tmp_path / "out.csv")) as pipeline:
+                pipeline.submit("1", _done(dict(sample_player)))
+                raise RuntimeError("browser crashed")
+
+        assert pipeline.written == 1
+
+    def test_written_split_by_known_hashes(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, None, known_hashes={"1": "stale"}) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.submit("2", _done({**sample_player, "id": "2"}))
+
+        assert (pipeline.inserted, pipeline.updated) == (1, 1)
+
+    def test_row_without_stored_hash_is_rewritten(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, None, known_hashes={"1": None}) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+
+        assert (pipeline.written, pipeline.updated, pipeline.touched) == (1, 1, 0)
+
+    def test_unchanged_hash_is_touched_not_written(self, tmp_path, sample_player: dict) -> None:
+        first = RecordingDB()
+        with TransferPipeline(first, None) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+        hashes = SupabaseManager.transfer_listing_hashes(first.listings[0])
+
+        db = RecordingDB()
+        with TransferPipeline(db, None, known_hashes=hashes) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.submit("2", _done({**sample_player, "id": "2"}))
+
+        assert [rec["id"] for batch in db.listings for rec in batch] == ["2"]
+        assert db.touched == ["1"]
+        assert (pipeline.written, pipeline.inserted, pipeline.touched) == (1, 1, 1)
+        assert len(db.players[0]) == 2
+
+    def test_checkpoint_marks_written_and_touched(self, tmp_path, sample_player: dict) -> None:
+        checkpoint = ScrapeCheckpoint(str(tmp_path / "cp.json"), "2026-03-29 10:00:00")
+        with TransferPipeline(RecordingDB(), str(tmp_path / "out.csv"), checkpoint=checkpoint) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.submit("2", _failed(ValueError("bad page")))
+            pipeline.touch("3")
+
+        assert checkpoint.processed == {"1", "3"}
+        assert ScrapeCheckpoint.load(checkpoint.path).processed == {"1", "3"}
+
+    def test_failed_writes_are_not_counted_or_processed(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        db.failing = {"2", "4"}
+        checkpoint = ScrapeCheckpoint(str(tmp_path / "cp.json"), "2026-03-29 10:00:00")
+        with TransferPipeline(db, None, checkpoint=checkpoint) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.submit("2", _done({**sample_player, "id": "2"}))
+            pipeline.touch("3")
+            pipeline.touch("4")
+
+        assert (pipeline.written, pipeline.inserted, pipeline.touched) == (1, 1, 1)
+        assert pipeline.unwritten == 2
+        assert checkpoint.processed == {"1", "3"}
+        assert set(pipeline._known_hashes) == {"1"}
+
+    def test_resumed_run_appends_csv(self, tmp_path, sample_player: dict) -> None:
+        path = str(tmp_path / "out.csv")
+        with TransferPipeline(RecordingDB(), path) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+        with TransferPipeline(RecordingDB(), path, append_csv=True) as pipeline:
+            pipeline.submit("2", _done({**sample_player, "id": "2", "Speed": 14}))
+
+        df = pd.read_csv(path, dtype=str)
+        assert df["id"].tolist() == ["1", "2"]
+        assert "Speed" in df.columns
+
+    def test_listing_only_rows_skip_players_and_metrics(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        with TransferPipeline(db, None) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.submit_listing("2", {"id": "2", "asking_price": 900_000, "deadline": "N/A"})
+            pipeline.submit_listing("3", {
+                "id": "3", "asking_price": 900_000, "deadline": "N/A", "estimated_value": 1_500_000,
+            })
+
+        rows = {r["id"]: r for r in db.listings[0]}
+        assert rows["1"]["roi"] == 150.0
+        # No stored value: metrics cleared, the stored value left alone.
+        assert "estimated_value" not in rows["2"] and rows["2"]["roi"] is None
+        assert rows["2"]["forecast_profit"] is None
+        assert rows["2"]["asking_price"] == 900_000
+        # A stored value: metrics recomputed for the new asking price.
+        assert rows["3"]["estimated_value"] == 1_500_000
+        assert rows["3"]["value_diff"] == 600_000
+        assert [r["id"] for r in db.players[0]] == ["1"]
+        assert db.financials == []
+
+    def test_archives_to_history_without_csv(self, tmp_path, sample_player: dict) -> None:
+        history = MarketHistory(str(tmp_path / "history"), "2026-03-29 10:00:00")
+        with TransferPipeline(RecordingDB(), None, history=history) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.touch("2")
+        history.close()
+
+        assert read_history(str(tmp_path / "history"), ["id"])["id"].tolist() == ["1"]
+        assert list(tmp_path.glob("*.csv")) == []
+
+    def test_touched_listings_with_a_record_are_archived(self, tmp_path) -> None:
+        history = MarketHistory(str(tmp_path / "history"), "2026-03-29 10:00:00")
+        with TransferPipeline(RecordingDB(), None, history=history) as pipeline:
+            pipeline.touch("2", {"id": "2", "asking_price": 900_000, "estimated_value": 1_000_000})
+            pipeline.touch("3")
+        history.close()
+
+        df = read_history(str(tmp_path / "history"), ["id", "asking_price", "roi"])
+        assert df["id"].tolist() == ["2"]
+        assert df["asking_price"].tolist() == [900_000]
+
+    def test_when_flushed_runs_after_earlier_listings_are_written(self, tmp_path, sample_player: dict) -> None:
+        db = RecordingDB()
+        seen: list[tuple[int, list[str]]] = []
+        with TransferPipeline(db, str(tmp_path / "out.csv"), flush_rows=100) as pipeline:
+            pipeline.submit("1", _done({**sample_player, "id": "1"}))
+            pipeline.touch("2")
+            pipeline.when_flushed(lambda: seen.append((pipeline.written, list(db.touched))))
+            pipeline.submit("3", _done({**sample_player, "id": "3"}))
+
+        assert seen == [(1, ["2"])]
+        assert pipeline.written == 2
+
+    def test_failing_callback_does_not_stop_the_sink(self, tmp_path, sample_player: dict) -> None:
+        def boom() -> None:
+            raise RuntimeError("alert failed")
+
+        with TransferPipeline(RecordingDB(), str(tmp_path / "out.csv")) as pipeline:
+            pipeline.when_flushed(boom)
+            pipeline.submit("1", _done(dict(sample_player)))
+
+        assert pipeline.written == 1
@@ -1,12 +1,18 @@
 """
-Unit tests for src.core.utils — clean_currency() and parse_deadline().
+Unit tests for src.core.utils — clean_currency() and the deadline helpers.
 """
 
 from datetime import date, datetime, timedelta, timezone
 
 import pytest
 
-from src.core.utils import clean_currency, parse_deadline
+from src.core.utils import (
+    GAME_TZ,
+    clean_currency,
+    format_deadline,
+    normalise_deadline,
+    parse_deadline,
+)
 
 
 class TestCleanCurrency:
@@ -98,3 +104,23 @@ class TestParseDeadline:
         assert result is not None
         assert result.hour == 15
         assert result.minute == 45
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("2026-03-29 14:30:00", datetime(2026, 3, 29, 14, 30)),
+    ("2026-03-29T14:30:00+07:00", datetime(2026, 3, 29, 14, 30)),
+    ("2026-03-29T07:30:00+00:00", datetime(2026, 3, 29, 14, 30)),
+    (datetime(2026, 3, 29, 7, 30, tzinfo=timezone.utc), datetime(2026, 3, 29, 14, 30)),
+    (datetime(2026, 3, 29, 14, 30), datetime(2026, 3, 29, 14, 30)),
+    ("5/4/26 at 09:15", datetime(2026, 4, 5, 9, 15)),
+    ("N/A", None),
+    (None, None),
+])
+def test_normalise_deadline(value, expected) -> None:
+    assert normalise_deadline(value) == expected
+
+
+def test_format_deadline_adds_game_offset() -> None:
+    assert format_deadline("2026-03-29T07:30:00Z") == "2026-03-29T14:30:00+07:00"
+    assert datetime.fromisoformat(format_deadline("Today at 10:00")).tzinfo == GAME_TZ
+    assert format_deadline("N/A") is None
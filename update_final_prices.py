@@ -1,113 +1,226 @@
 """
 Final price updater entry point.
 
-Runs hourly to keep player data in Supabase fresh:
-
-- **Active listings** (deadline in the future): refreshes bid count, bid
-  average, and estimated value from the negotiation page.
-- **Completed listings** (deadline passed by ≥
-  :data:`~src.constants.FINAL_PRICE_GRACE_HOURS` hours): fetches the final
-  sale price from the player's transfer history and calculates the
-  sale-to-bid ratio.
+Keeps player data in Supabase fresh by visiting each tracked auction only
+when it is due (see :mod:`src.services.auction_schedule`):
+
+- **Active listings** (deadline in the future): from
+  :data:`~src.constants.BID_REFRESH_WINDOW_HOURS` before the close, bid
+  count, bid average and estimated value are refreshed from the negotiation
+  page every :data:`~src.constants.BID_REFRESH_MINUTES`, and once more just
+  before the auction closes.  Each refresh that changed something is appended to the
+  auction's bid trajectory (``bid_history`` table and the Parquet mirror in
+  ``bid_history/``, see :mod:`src.services.bid_history`).
+- **Completed listings** (deadline passed by
+  :data:`~src.constants.FINAL_PRICE_GRACE_HOURS` hours): the final sale price
+  is read from the player's transfer history and the sale-to-bid ratio
+  calculated.  The history pages of all auctions due together are fetched
+  concurrently over HTTP; unsettled auctions are retried a few times.
+
+The schedule is kept in ``auction_schedule.json`` between runs, and newly
+listed players are loaded from Supabase every
+:data:`~src.constants.SCHEDULE_SYNC_MINUTES`; after the first full load only
+rows changed since the previous one are read.  Player updates are buffered
+and written in bulk (see :mod:`src.services.player_updates`).  With ``--duration`` the
+updater sleeps until the next auction is due instead of exiting, so final
+prices are recorded minutes after settlement.
 
 Usage::
 
-    python update_final_prices.py
+    python update_final_prices.py                 # handle what is due now
+    python update_final_prices.py --duration 230  # keep running for 230 minutes
 """
 
+import argparse
+import time
 from datetime import datetime, timedelta
+from typing import Any
 
 from src import constants
 from src.config import config
 from src.core.logger import logger
-from src.core.utils import clean_currency, parse_deadline
+from src.core.utils import GAME_TZ, clean_currency, format_deadline, normalise_deadline
 from src.scrapers.transfer import TransferScraper
+from src.services.auction_schedule import Auction, AuctionSchedule
+from src.services.bid_history import BidHistory
+from src.services.player_updates import PlayerUpdateBuffer
 from src.services.supabase_client import SupabaseManager
 
+SCHEDULE_FILE = "auction_schedule.json"
+BID_HISTORY_DIR = "bid_history"
+
+
+def now_th() -> datetime:
+    """Current time in the game's timezone (naive UTC+7)."""
+    return datetime.now(tz=GAME_TZ).replace(tzinfo=None)
+
+
+def refresh_bids(
+    scraper: TransferScraper,
+    updates: PlayerUpdateBuffer,
+    bids: BidHistory,
+    schedule: AuctionSchedule,
+    auction: Auction,
+) -> bool:
+    """Refresh a running auction's bids, record them in its trajectory and requeue it.
+
+    Returns:
+        ``True`` if changes to the player row were queued.
+    """
+    pid = auction.player_id
+    logger.debug("Active: %s, ends %s", pid, auction.deadline)
+    update_data: dict[str, Any] = {}
+    try:
+        bid_info = scraper.get_bid_info(pid)
+        bids.record(pid, now_th(), bid_info)
+        if bid_info["bids_count"]:
+            update_data["bids_count"] = str(bid_info["bids_count"])
+        if bid_info["bids_avg"]:
+            update_data["bids_avg"] = bid_info["bids_avg"]
+            auction.bids_avg = clean_currency(str(bid_info["bids_avg"]))
+        deadline = normalise_deadline(bid_info["deadline"])
+        if deadline:
+            update_data["deadline"] = format_deadline(deadline)
+            auction.deadline = deadline
+        updates.add(pid, update_data)
+    except Exception as e:
+        logger.debug("Error updating active player %s: %s", pid, e)
+    schedule.requeue(auction, now_th())
+    return bool(update_data)
+
+
+def record_final_prices(
+    scraper: TransferScraper,
+    updates: PlayerUpdateBuffer,
+    schedule: AuctionSchedule,
+    auctions: list[Auction],
+) -> int:
+    """Record closed auctions' final prices; requeue those that have not settled.
+
+    The history pages are fetched concurrently (see
+    :meth:`TransferScraper.iter_final_prices`).
+
+    Returns:
+        Number of final prices recorded.
+    """
+    if not auctions:
+        return 0
+    logger.info("Checking final prices of %d closed auctions...", len(auctions))
+    by_id = {auction.player_id: auction for auction in auctions}
+    recorded = 0
+    try:
+        for pid, price in scraper.iter_final_prices(by_id):
+            auction = by_id.pop(pid)
+            if price <= 0:
+                logger.debug("  -> No transfer found for %s.", pid)
+                schedule.requeue(auction, now_th(), settled_check=True)
+                continue
+            updates.add(pid, {
+                "last_transfer_price": price,
+                "sale_to_bid_ratio": (
+                    round(price / auction.bids_avg, 2) if auction.bids_avg > 0 else 0
+                ),
+            })
+            schedule.finish(auction)
+            recorded += 1
+            logger.info("  -> Sold: %s for %s", pid, price)
+    except Exception as e:
+        logger.error("Error checking final prices: %s", e, exc_info=True)
+    for auction in by_id.values():
+        schedule.requeue(auction, now_th(), settled_check=True)
+    return recorded
+
 
 def main() -> None:
-    """Update active and recently-completed player listings in Supabase."""
+    """Visit due auctions and update their players in Supabase."""
+    parser = argparse.ArgumentParser(description="Record bids and final prices of auctions.")
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=0,
+        metavar="MINUTES",
+        help="Keep running and wake for each due auction for this long (default: handle "
+             "what is due now, then exit).",
+    )
+    parser.add_argument("--schedule", default=SCHEDULE_FILE, help="Auction schedule file.")
+    parser.add_argument(
+        "--bid-history-dir", default=BID_HISTORY_DIR, help="Parquet mirror of bid trajectories."
+    )
+    args = parser.parse_args()
+
     config.validate()
 
     logger.info("Starting Price Updater...")
     db = SupabaseManager()
-
-    records = db.get_players_for_price_update()
-    logger.info("Loaded %d players for price update.", len(records))
+    schedule = AuctionSchedule.load(args.schedule)
+    logger.info("Loaded schedule with %d tracked auctions.", len(schedule))
 
     scraper = TransferScraper(base_url="https://www.pmanager.org")
     scraper.start(headless=config.HEADLESS_MODE)
 
-    updates_count = 0
-    now_th = datetime.utcnow() + timedelta(hours=constants.UTC_OFFSET_HOURS)
+    refreshed = settled = 0
+    stop_at = now_th() + timedelta(minutes=args.duration)
+    sync_at = now_th()
 
+    updates = PlayerUpdateBuffer(db)
+    bids = BidHistory(db, args.bid_history_dir, now_th())
     try:
         scraper.login(config.PM_USERNAME, config.PM_PASSWORD)
 
-        for row in records:
-            pid = str(row.get("id", ""))
-            if not pid:
-                continue
-
-            deadline_str = str(row.get("deadline", ""))
-            last_price = row.get("last_transfer_price", 0)
-
-            dead_dt = parse_deadline(deadline_str)
-            if not dead_dt:
-                continue
-
-            diff = now_th - dead_dt
-            diff_hours = diff.total_seconds() / 3600
-
-            # --- Active listing (deadline still in the future) ---
-            if diff_hours < 0:
-                logger.debug("Active: %s, ends in %.1fh", pid, -diff_hours)
-                try:
-                    bid_info = scraper.get_bid_info(pid)
-                    update_data = {}
-                    if bid_info["estimated_value"] > 0:
-                        update_data["estimated_value"] = bid_info["estimated_value"]
-                    if bid_info["bids_count"]:
-                        update_data["bids_count"] = str(bid_info["bids_count"])
-                    if bid_info["bids_avg"]:
-                        update_data["bids_avg"] = bid_info["bids_avg"]
-                    if bid_info["deadline"] != "N/A":
-                        update_data["deadline"] = bid_info["deadline"]
-
-                    if update_data:
-                        db.update_player(pid, update_data)
-                        updates_count += 1
-                except Exception as e:
-                    logger.debug("Error updating active player %s: %s", pid, e)
-
-            # --- Completed listing (enough time has passed to record sale price) ---
-            elif diff_hours > constants.FINAL_PRICE_GRACE_HOURS:
-                if not last_price or str(last_price) == "0":
+        while True:
+            now = now_th()
+            if now >= sync_at:
+                since = schedule.synced_at and schedule.synced_at - timedelta(
+                    minutes=constants.SCHEDULE_SYNC_OVERLAP_MINUTES
+                )
+                records = db.get_players_for_price_update(
+                    constants.FINAL_PRICE_LOOKBACK_DAYS, changed_since=since,
+                )
+                # A failed read also comes back empty; keep synced_at so the
+                # next sync reads the same window again.
+                if records:
+                    added = schedule.sync(records, now)
                     logger.info(
-                        "Checking final price: %s (expired %.1fh ago)", pid, diff_hours
+                        "Schedule: %d auctions tracked, %d new or moved.", len(schedule), added,
                     )
-                    price = scraper.get_player_history(pid)
-
-                    if price > 0:
-                        update_data = {"last_transfer_price": price}
-
-                        clean_avg = clean_currency(str(row.get("bids_avg", "0")))
-                        update_data["sale_to_bid_ratio"] = (
-                            round(price / clean_avg, 2) if clean_avg > 0 else 0
-                        )
-
-                        db.update_player(pid, update_data)
-                        updates_count += 1
-                        logger.info("  -> Sold: %s", price)
-                    else:
-                        logger.debug("  -> No transfer found for %s.", pid)
+                sync_at = now + timedelta(minutes=constants.SCHEDULE_SYNC_MINUTES)
+
+            due = schedule.pop_due(now)
+            if due:
+                logger.info("%d auctions due.", len(due))
+            closed = [auction for auction in due if auction.settling]
+            settled += record_final_prices(scraper, updates, schedule, closed)
+            for auction in due:
+                if auction.settling:
+                    continue
+                if now >= auction.deadline:
+                    # A bid refresh missed while the updater was not running.
+                    schedule.requeue(auction, now)
+                else:
+                    refreshed += refresh_bids(scraper, updates, bids, schedule, auction)
+            schedule.save(now)
+
+            if now >= stop_at:
+                break
+            # Nothing is written while asleep, so don't hold changes back.
+            updates.flush()
+            bids.flush()
+            wake = min(filter(None, (schedule.next_due(), sync_at, stop_at)))
+            time.sleep(max(0.0, (wake - now_th()).total_seconds()))
 
     except Exception as e:
         logger.error("Updater error: %s", e, exc_info=True)
     finally:
         scraper.stop()
-
-    logger.info("Updated %d players in Supabase.", updates_count)
+        updates.flush()
+        bids.close()
+        schedule.save(now_th())
+
+    logger.info(
+        "Updated %d players in Supabase (%d bid refreshes, %d final prices, %d failed); "
+        "%d bid history rows.",
+        updates.written, refreshed, settled, len(updates.failed), bids.rows,
+    )
 
 
 if __name__ == "__main__":
@@ -66,7 +66,7 @@ export default function TransfersClient() {
         if (filterPlusOnly) {
           query = query.gt("forecast_profit", 0);
         }
-        query = query.not("deadline", "is", null).neq("deadline", "");
+        query = query.not("deadline", "is", null);
 
         query = query.order(sortField, { ascending: sortOrder === "asc", nullsFirst: false });
         if (sortField !== "id") {
@@ -233,13 +233,8 @@ export default function TransfersClient() {
             </thead>
             <tbody className="divide-y divide-neutral-800/60">
               {transfers.map((tx) => {
-                const isExpired = tx.deadline
-                  ? (() => {
-                      let iso = tx.deadline.replace(" ", "T");
-                      if (!/Z$|[+-]\d{2}:\d{2}$/.test(iso)) iso += "+01:00";
-                      return new Date(iso) < new Date();
-                    })()
-                  : false;
+                // deadline is a TIMESTAMPTZ, serialised with its offset
+                const isExpired = tx.deadline ? new Date(tx.deadline) < new Date() : false;
                 const profit = tx.forecast_profit ?? 0;
                 const tier = profit >= 10_000_000 ? "superb" : profit >= 5_000_000 ? "great" : profit >= 3_000_000 ? "good" : "normal";
                 return (
@@ -19,8 +19,10 @@ const BKK = "Asia/Bangkok"; // display timezone UTC+7
 /**
  * Parse and format a PManager deadline string into Bangkok time.
  *
- * Accepts ISO strings, PostgreSQL timestamps ("2026-03-30 14:30:00"),
- * and TIMESTAMPTZ strings. Returns "—" for null/unparseable values.
+ * Deadlines are TIMESTAMPTZ columns, returned as ISO strings with an offset.
+ * Naive timestamps and raw scraped texts from before the migration
+ * (db_schemas/deadline_timestamptz.sql) are still accepted.
+ * Returns "—" for null/unparseable values.
  *
  * @param value - Raw deadline string from Supabase.
  * @returns Formatted string like "30/03/2026, 14:30" or "—".
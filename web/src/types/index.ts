@@ -21,7 +21,8 @@ export interface Player {
   bids_avg: number;
   last_transfer_price: number;
   sale_to_bid_ratio: number;
-  deadline: string;
+  /** Auction close, TIMESTAMPTZ as ISO 8601 with offset. */
+  deadline: string | null;
   url?: string;
 }
 
@@ -35,12 +36,16 @@ export interface Transfer {
   potential?: string;
   estimated_value: number;
   asking_price: number;
+  /** Bids shown on the search result page. */
+  bids_count?: number | null;
   value_diff: number;
   roi: number;
   forecast_sell: number;
   forecast_profit: number;
-  deadline: string;
+  /** Auction close, TIMESTAMPTZ as ISO 8601 with offset. */
+  deadline: string | null;
   url: string;
+  search_profiles?: string[] | null;
   last_updated: string;
 }
 